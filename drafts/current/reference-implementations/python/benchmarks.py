@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+BOOST Python Reference Implementation - Scale Benchmarks
+
+This module measures the hot paths of the reference implementation at
+scale: SchemaLoader cold and warm startup, validate_entity throughput per
+entity type, comprehensive_validation, BOOSTClient.validate_all and
+get_supply_chain, and JSON-LD import/export. Every case runs in a fresh
+interpreter so startup costs and peak RSS are measured in isolation.
+Results are written as JSON and can be compared against a stored baseline
+to catch regressions before they ship.
+
+Usage:
+    python benchmarks.py --sizes 10000 100000 1000000 --output results.json
+    python benchmarks.py --save-baseline benchmark_baseline.json
+    python benchmarks.py --baseline benchmark_baseline.json   # exits 1 on regression
+"""
+
+import argparse
+import copy
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    from .schema_loader import SchemaLoader, resolve_schema_path
+except ImportError:
+    from schema_loader import SchemaLoader, resolve_schema_path
+
+# Entity counts for the scale cases
+DEFAULT_SIZES = (10000, 100000, 1000000)
+
+# Records validated per entity type by the validate_entity case
+DEFAULT_RECORDS_PER_TYPE = 1000
+
+# get_supply_chain calls timed per size
+SUPPLY_CHAIN_LOOKUPS = 1000
+
+# A metric may grow by this fraction over its baseline before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Timing differences below this many seconds are treated as noise
+MIN_SECONDS_DELTA = 0.05
+
+# Entity types of one synthetic supply chain link, in the order records are generated
+_CHAIN_TYPES = ('organization', 'traceable_unit', 'transaction', 'material_processing', 'claim')
+
+# Organizations are shared by this many chain links
+_LINKS_PER_ORGANIZATION = 10
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _timed(function: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _result(name: str, seconds: float, items: Optional[int] = None, **extra) -> Dict[str, Any]:
+    result = {'name': name, 'seconds': round(seconds, 6)}
+    if items is not None:
+        result['items'] = items
+        result['items_per_second'] = round(items / seconds, 1) if seconds > 0 else None
+    result.update(extra)
+    return result
+
+
+def load_example(schema_loader: SchemaLoader, entity_type: str) -> Optional[Dict[str, Any]]:
+    """Load the example record shipped with an entity schema, if there is one."""
+    example_file = schema_loader.schema_base_path / entity_type / f"{entity_type}_example.json"
+    if not example_file.exists():
+        return None
+    with open(example_file, 'r') as f:
+        return json.load(f)
+
+
+def build_dataset(schema_loader: SchemaLoader, size: int) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build a linked supply chain of exactly ``size`` entities from the schema examples.
+    
+    Each chain link is a TraceableUnit with the Transaction that sold it,
+    the MaterialProcessing that produced it from the previous link's TRU
+    and a Claim on it; one Organization harvests and sells every tenth link.
+    Every reference resolves, whatever the size.
+    
+    Args:
+        schema_loader: SchemaLoader whose example records are used as templates
+        size: Total number of entities to generate
+    
+    Returns:
+        Dictionary with entity_type -> list of JSON-LD records
+    """
+    templates = {entity_type: load_example(schema_loader, entity_type) for entity_type in _CHAIN_TYPES}
+    dataset: Dict[str, List[Dict[str, Any]]] = {entity_type: [] for entity_type in _CHAIN_TYPES}
+    
+    # Bring the examples in line with the current schemas
+    templates['traceable_unit']['qualityGrade'] = 'Grade-A'
+    templates['traceable_unit'].pop('processingHistory', None)
+    for field_name in ('inputPlantParts', 'outputPlantParts'):
+        templates['material_processing'].pop(field_name, None)
+    for field_name in ('traceableUnitId', 'certificationSchemeId'):
+        templates['claim'].pop(field_name, None)
+    
+    def record(entity_type: str, entity_id: str, **fields) -> Dict[str, Any]:
+        data = copy.deepcopy(templates[entity_type])
+        data[schema_loader.get_primary_key(entity_type)] = entity_id
+        data['@id'] = data['@id'].rsplit('/', 1)[0] + '/' + entity_id
+        data.update(fields)
+        return data
+    
+    count = 0
+    for link in itertools.count():
+        organization_id = f"ORG-BENCH-{link // _LINKS_PER_ORGANIZATION:07d}"
+        tru_id = f"TRU-BENCH-{link:07d}"
+        generated = []
+        if link % _LINKS_PER_ORGANIZATION == 0:
+            generated.append(record('organization', organization_id))
+        generated.append(record('traceable_unit', tru_id, harvesterId=organization_id))
+        generated.append(record('transaction', f"TXN-BENCH-{link:07d}",
+                                OrganizationId=organization_id, traceableUnitIds=[tru_id]))
+        if link > 0:
+            # The previous link's TRU is processed into this one
+            generated.append(record('material_processing', f"MP-BENCH-{link:07d}",
+                                    inputTraceableUnitId=f"TRU-BENCH-{link - 1:07d}",
+                                    outputTraceableUnitId=tru_id))
+        generated.append(record('claim', f"CLA-BENCH-{link:07d}", TraceableUnitId=tru_id))
+        for data in generated:
+            if count == size:
+                return dataset
+            dataset[schema_loader.get_entity_type_for_jsonld(data['@type'])].append(data)
+            count += 1
+
+
+def _flatten(dataset: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return [data for records in dataset.values() for data in records]
+
+
+# Benchmark cases: name -> function(size, schema_path) returning a list of results
+
+def bench_schema_load(size: int, schema_path: Optional[str]) -> List[Dict[str, Any]]:
+    """SchemaLoader startup with an empty and with a populated model cache."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        loader = SchemaLoader(schema_path, cache_dir=cache_dir)
+        cold = _timed(loader.preload)
+        entity_count = len(loader.get_all_entity_types())
+        warm_loader = SchemaLoader(schema_path, cache_dir=cache_dir)
+        warm = _timed(warm_loader.preload)
+    return [_result('schema_load_cold', cold, entity_count),
+            _result('schema_load_warm', warm, entity_count)]
+
+
+def bench_validate_entity(size: int, schema_path: Optional[str]) -> List[Dict[str, Any]]:
+    """validate_entity throughput for every entity type that ships an example record."""
+    try:
+        from .dynamic_validation import DynamicBOOSTValidator
+    except ImportError:
+        from dynamic_validation import DynamicBOOSTValidator
+    
+    validator = DynamicBOOSTValidator(SchemaLoader(schema_path))
+    results = []
+    for entity_type in validator.schema_loader.get_all_entity_types():
+        example = load_example(validator.schema_loader, entity_type)
+        if example is None:
+            continue
+        # Some examples predate their schema; their timings include the error path
+        is_valid, _ = validator.validate_entity(entity_type, example)
+        seconds = _timed(lambda: [validator.validate_entity(entity_type, example) for _ in range(size)])
+        results.append(_result(f'validate_entity[{entity_type}]', seconds, size, valid=is_valid))
+    return results
+
+
+def bench_comprehensive_validation(size: int, schema_path: Optional[str]) -> List[Dict[str, Any]]:
+    """DynamicBOOSTValidator.comprehensive_validation over a linked dataset."""
+    try:
+        from .dynamic_validation import DynamicBOOSTValidator
+    except ImportError:
+        from dynamic_validation import DynamicBOOSTValidator
+    
+    validator = DynamicBOOSTValidator(SchemaLoader(schema_path))
+    dataset = build_dataset(validator.schema_loader, size)
+    seconds = _timed(lambda: validator.comprehensive_validation(dataset))
+    return [_result(f'comprehensive_validation[{size}]', seconds, size)]
+
+
+def _loaded_client(size: int, schema_path: Optional[str]):
+    try:
+        from .boost_client import BOOSTClient
+    except ImportError:
+        from boost_client import BOOSTClient
+    
+    client = BOOSTClient(schema_path=schema_path)
+    records = _flatten(build_dataset(client.schema_loader, size))
+    return client, records
+
+
+def bench_client(size: int, schema_path: Optional[str]) -> List[Dict[str, Any]]:
+    """BOOSTClient JSON-LD import, validate_all, get_supply_chain and JSON-LD export."""
+    client, records = _loaded_client(size, schema_path)
+    import_seconds = _timed(lambda: client.import_from_jsonld(records))
+    entity_count = sum(len(collection) for collection in client.store.collections.values())
+    
+    validate_seconds = _timed(client.validate_all)
+    tru_ids = list(client.traceable_units)
+    step = max(1, len(tru_ids) // SUPPLY_CHAIN_LOOKUPS)
+    sample = tru_ids[::step][:SUPPLY_CHAIN_LOOKUPS]
+    lookup_seconds = _timed(lambda: [client.get_supply_chain(tru_id) for tru_id in sample])
+    
+    exported = []
+    export_seconds = _timed(lambda: exported.append(client.export_to_jsonld()))
+    return [
+        _result(f'jsonld_import[{size}]', import_seconds, entity_count),
+        _result(f'validate_all[{size}]', validate_seconds, entity_count),
+        _result(f'get_supply_chain[{size}]', lookup_seconds, len(sample)),
+        _result(f'jsonld_export[{size}]', export_seconds, entity_count, bytes=len(exported[0]))
+    ]
+
+
+# Cases run once, and cases run once per size
+FIXED_CASES = {
+    'schema_load': bench_schema_load,
+    'validate_entity': bench_validate_entity
+}
+SCALE_CASES = {
+    'comprehensive_validation': bench_comprehensive_validation,
+    'client': bench_client
+}
+
+
+def run_case(case: str, size: int, schema_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Run one benchmark case in the current process.
+    
+    Peak RSS covers the whole process, so run_benchmarks() starts a new
+    interpreter for every case.
+    
+    Args:
+        case: Name from FIXED_CASES or SCALE_CASES
+        size: Entity count (records per entity type for validate_entity)
+        schema_path: Path to BOOST schema directory (optional)
+    
+    Returns:
+        Results with 'name', 'seconds', 'items', 'items_per_second' and 'peak_rss_mb'
+    """
+    cases = {**FIXED_CASES, **SCALE_CASES}
+    if case not in cases:
+        raise ValueError(f"Unknown benchmark case '{case}'. Available cases: {list(cases)}")
+    results = cases[case](size, schema_path)
+    peak_rss = _peak_rss_mb()
+    for result in results:
+        result['peak_rss_mb'] = peak_rss
+    return results
+
+
+def run_benchmarks(sizes: Iterable[int] = DEFAULT_SIZES,
+                   records_per_type: int = DEFAULT_RECORDS_PER_TYPE,
+                   cases: Optional[Iterable[str]] = None,
+                   schema_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run benchmark cases, each in its own interpreter.
+    
+    Args:
+        sizes: Entity counts for the scale cases
+        records_per_type: Records validated per entity type by validate_entity
+        cases: Case names to run (default: all)
+        schema_path: Path to BOOST schema directory (optional)
+    
+    Returns:
+        Report with 'environment' and 'results' keyed by benchmark name
+    """
+    selected = list(cases) if cases is not None else list(FIXED_CASES) + list(SCALE_CASES)
+    runs = [(case, records_per_type if case == 'validate_entity' else 0) for case in selected if case in FIXED_CASES]
+    runs += [(case, size) for size in sizes for case in selected if case in SCALE_CASES]
+    unknown = set(selected) - set(FIXED_CASES) - set(SCALE_CASES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {sorted(unknown)}. "
+                         f"Available cases: {list(FIXED_CASES) + list(SCALE_CASES)}")
+    
+    results = {}
+    for case, size in runs:
+        command = [sys.executable, str(Path(__file__).resolve()), '--case', case, '--size', str(size)]
+        if schema_path:
+            command += ['--schema-path', str(schema_path)]
+        completed = subprocess.run(command, capture_output=True, text=True, cwd=str(Path(__file__).parent))
+        if completed.returncode != 0:
+            raise RuntimeError(f"Benchmark case '{case}' (size {size}) failed:\n{completed.stderr}")
+        for result in json.loads(completed.stdout.strip().splitlines()[-1]):
+            results[result.pop('name')] = result
+    
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'schema_path': str(resolve_schema_path(schema_path)),
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        },
+        'results': results
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE,
+                        min_seconds_delta: float = MIN_SECONDS_DELTA) -> List[Dict[str, Any]]:
+    """
+    Find benchmarks that got slower or used more memory than their baseline.
+    
+    A timing counts as a regression when it exceeds the baseline by more
+    than ``tolerance`` and by more than ``min_seconds_delta`` seconds; peak
+    RSS only has to exceed the tolerance. Benchmarks missing from either
+    report are skipped.
+    
+    Args:
+        report: Report from run_benchmarks()
+        baseline: Earlier report to compare against
+        tolerance: Allowed relative growth (0.25 = 25%)
+        min_seconds_delta: Timing differences ignored as noise
+    
+    Returns:
+        Regressions with 'name', 'metric', 'baseline', 'current' and 'ratio'
+    """
+    regressions = []
+    for name, current in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        for metric in ('seconds', 'peak_rss_mb'):
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None or new <= old * (1 + tolerance):
+                continue
+            if metric == 'seconds' and new - old <= min_seconds_delta:
+                continue
+            regressions.append({'name': name, 'metric': metric, 'baseline': old, 'current': new,
+                                'ratio': round(new / old, 3)})
+    return regressions
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"{'benchmark':<48} {'seconds':>10} {'items/s':>12} {'peak MiB':>9}")
+    for name, result in report['results'].items():
+        rate = result.get('items_per_second')
+        rss = result.get('peak_rss_mb')
+        print(f"{name:<48} {result['seconds']:>10.3f} {rate if rate is not None else '':>12} "
+              f"{rss if rss is not None else '':>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the BOOST scale benchmarks.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="entity counts for the scale cases")
+    parser.add_argument('--records-per-type', type=int, default=DEFAULT_RECORDS_PER_TYPE,
+                        help="records validated per entity type by validate_entity")
+    parser.add_argument('--cases', nargs='+', help="cases to run (default: all)")
+    parser.add_argument('--schema-path', help="path to the BOOST schema directory")
+    parser.add_argument('--output', help="write the report as JSON to this file")
+    parser.add_argument('--baseline', help="compare against this report; exit 1 on regression")
+    parser.add_argument('--save-baseline', help="write the report as the new baseline to this file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative growth before a metric counts as a regression")
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.case:
+        # Child process: run one case and print its results as the last line
+        print(json.dumps(run_case(args.case, args.size, args.schema_path)))
+        return 0
+    
+    report = run_benchmarks(args.sizes, args.records_per_type, args.cases, args.schema_path)
+    _print_report(report)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression['name']} {regression['metric']}: "
+                      f"{regression['baseline']} → {regression['current']} ({regression['ratio']}x)")
+            return 1
+        print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,43 +6,145 @@ biomass chain of custody data, including entity management, validation,
 and supply chain tracking.
 """
 
-import json
+import io
 import uuid
+from collections import ChainMap
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable, Set, Tuple, Mapping
 from pathlib import Path
 
 try:
-    from .schema_loader import SchemaLoader
+    from .schema_loader import get_shared_loader
     from .dynamic_validation import DynamicBOOSTValidator
+    from .business_rules import check_fields
+    from .entity_store import EntityStore, COLLECTIONS, ENTITY_COLLECTIONS, INDEXES
+    from .incremental_validation import ValidationCache, CheckOutcome
+    from .lineage import LineageGraph
+    from .mass_balance import MassBalanceLedger
+    from .temporal import parse_timestamp
+    from .jsonld_stream import JSONLDGraphReader, JSONLDGraphWriter, JSONLDSource
+    from .columnar import ColumnarDataset, write_entity_table, COLUMNAR_FORMATS, DEFAULT_ROW_GROUP_SIZE
+    from .sqlite_store import SQLiteEntityStore
+    from .instrumentation import ValidationStats, StatsHook
+    from .edit_session import EditSession, EditedEntity
 except ImportError:
     # Handle absolute imports when run directly
-    from schema_loader import SchemaLoader
+    from schema_loader import get_shared_loader
     from dynamic_validation import DynamicBOOSTValidator
+    from business_rules import check_fields
+    from entity_store import EntityStore, COLLECTIONS, ENTITY_COLLECTIONS, INDEXES
+    from incremental_validation import ValidationCache, CheckOutcome
+    from lineage import LineageGraph
+    from mass_balance import MassBalanceLedger
+    from temporal import parse_timestamp
+    from jsonld_stream import JSONLDGraphReader, JSONLDGraphWriter, JSONLDSource
+    from columnar import ColumnarDataset, write_entity_table, COLUMNAR_FORMATS, DEFAULT_ROW_GROUP_SIZE
+    from sqlite_store import SQLiteEntityStore
+    from instrumentation import ValidationStats, StatsHook
+    from edit_session import EditSession, EditedEntity
+
+# Entity type stored in each collection
+COLLECTION_ENTITY_TYPES = {collection: entity_type for entity_type, collection in ENTITY_COLLECTIONS.items()}
+
+# Foreign keys checked by validate_all: collection -> (attribute, referenced collection, error)
+FOREIGN_KEYS = {
+    'traceable_units': (
+        ('harvester_id', 'organizations', 'Referenced organization not found'),
+        ('operator_id', 'organizations', 'Referenced organization not found')
+    ),
+    'transactions': (
+        ('traceable_unit_ids', 'traceable_units', 'Referenced traceable unit not found'),
+    ),
+    'material_processing': (
+        ('input_traceable_unit_id', 'traceable_units', 'Referenced input TRU not found'),
+        ('output_traceable_unit_id', 'traceable_units', 'Referenced output TRU not found')
+    )
+}
+
+# ID pattern checks for references to entities without a collection: collection -> (attribute, prefix, error)
+FOREIGN_KEY_PATTERNS = {
+    'tracking_points': (
+        ('geographic_data_id', 'GEO-', 'Invalid GeographicData ID pattern (must start with GEO-)'),
+        ('operator_id', 'OP-', 'Invalid Operator ID pattern (must start with OP-)')
+    )
+}
+
+# Realistic volume change tolerances based on process type
+VOLUME_TOLERANCES = {
+    'drying': 0.15,      # 15% volume loss typical
+    'chipping': 0.08,    # 8% volume loss from processing
+    'pelletizing': 0.12, # 12% volume loss from compression
+    'sawmill': 0.35,     # 35% volume loss from lumber production
+    'transport': 0.02,   # 2% acceptable measurement variance
+    'default': 0.10      # 10% default tolerance
+}
+
+# validate_all() checks rerun when an edit session commits: check name -> (collection checked,
+# attributes read from its entities, index from a TRU to those entities, attributes read from the TRUs)
+EDIT_RULES = {
+    'volume_conservation': ('material_processing',
+                            frozenset({'input_traceable_unit_id', 'output_traceable_unit_id', 'process_type'}),
+                            'processing_by_tru', frozenset({'total_volume_m3'})),
+    'tolerance_compliance': ('transactions', frozenset({'quantity_m3', 'measured_volume_m3'}), None, frozenset()),
+    'temporal_consistency': ('material_processing', frozenset({'input_traceable_unit_id', 'process_timestamp'}),
+                             'processing_by_tru', frozenset({'created_timestamp'}))
+}
 
 
 class BOOSTClient:
     """Main client for BOOST biomass chain of custody operations."""
     
-    def __init__(self, context_url: Optional[str] = None, schema_path: Optional[str] = None):
+    def __init__(self, context_url: Optional[str] = None, schema_path: Optional[str] = None,
+                 database: Optional[Union[str, Path]] = None, stats_hook: Optional[StatsHook] = None):
         """
         Initialize BOOST client.
         
         Args:
             context_url: URL to JSON-LD context (optional)
             schema_path: Path to BOOST schema directory (optional)
+            database: SQLite database file to persist entities in (optional, in memory by default)
+            stats_hook: Called with ('validate_all', stats) after every validate_all() (optional)
         """
         self.context_url = context_url or "https://github.com/carbondirect/BOOST/context"
-        self.schema_loader = SchemaLoader(schema_path)
+        self.stats_hook = stats_hook
+        self.schema_loader = get_shared_loader(schema_path)
         self.validator = DynamicBOOSTValidator(self.schema_loader)
         
-        # Entity storage
-        self.organizations: Dict[str, Any] = {}
-        self.traceable_units: Dict[str, Any] = {}
-        self.transactions: Dict[str, Any] = {}
-        self.material_processing: Dict[str, Any] = {}
-        self.claims: Dict[str, Any] = {}
-        self.tracking_points: Dict[str, Any] = {}
+        # Entity storage, indexed by relationship on every write
+        if database is not None:
+            self.store = SQLiteEntityStore(database, self.schema_loader)
+        else:
+            self.store = EntityStore()
+        self.organizations: Dict[str, Any] = self.store.collections['organizations']
+        self.traceable_units: Dict[str, Any] = self.store.collections['traceable_units']
+        self.transactions: Dict[str, Any] = self.store.collections['transactions']
+        self.material_processing: Dict[str, Any] = self.store.collections['material_processing']
+        self.claims: Dict[str, Any] = self.store.collections['claims']
+        self.tracking_points: Dict[str, Any] = self.store.collections['tracking_points']
+        
+        # Transitive TRU lineage, rebuilt when a write changes a lineage edge
+        self.lineage = LineageGraph(self.store)
+        
+        # Per-entity validate_all() outcomes, re-checked only for entities written since the last call
+        self._reference_attributes: Dict[Any, tuple] = {}
+        self._validation_cache = ValidationCache(self.store, COLLECTIONS, {
+            'schema_validation': dict.fromkeys(COLLECTIONS, self._check_schema),
+            'foreign_key_integrity': dict.fromkeys(('traceable_units', 'transactions', 'material_processing',
+                                                    'tracking_points'), self._check_foreign_keys),
+            'volume_conservation': {'material_processing': self._check_volume_conservation},
+            'tolerance_compliance': {'transactions': self._check_tolerance_compliance},
+            'temporal_consistency': {'material_processing': self._check_temporal_consistency}
+        }, self._entity_references)
+        self._business_rule_cache = ValidationCache(self.store, COLLECTIONS, {
+            'supply_chain_continuity': {'traceable_units': self._check_supply_chain_continuity},
+            'regulatory_compliance': {'traceable_units': self._check_regulatory_compliance}
+        }, self._entity_references)
+        self._edit_rule_checks = {
+            'volume_conservation': self._check_volume_conservation,
+            'tolerance_compliance': self._check_tolerance_compliance,
+            'temporal_consistency': self._check_temporal_consistency
+        }
         
         # Default context for JSON-LD
         self.default_context = {
@@ -374,7 +476,7 @@ class BOOSTClient:
             'entity_id': getattr(entity, f"{entity_type.replace('_', '')}_id", "unknown")
         }
     
-    def validate_all(self) -> Dict[str, Any]:
+    def validate_all(self, full: bool = False) -> Dict[str, Any]:
         """
         Comprehensive validation including business logic, tolerance checking, and relationships.
         
@@ -382,6 +484,19 @@ class BOOSTClient:
         feedback about missing validation logic. Includes realistic error detection and
         correction guidance.
         
+        Per-entity outcomes are kept between calls: only entities written to
+        the collections since the last call, plus the entities they reference
+        or are referenced by, are re-checked. Entities modified in place
+        rather than re-assigned are not seen; pass full=True after such edits.
+        
+        The time, calls and failures of the checks run, per check name and
+        collection, are returned as plain data (ValidationStats.as_dict())
+        under 'stats', so the results stay JSON-serializable; the
+        ValidationStats itself is passed to the client's stats_hook, if set.
+        
+        Args:
+            full: Re-check every entity instead of only the changed ones
+        
         Returns:
             Detailed validation results with actionable feedback
         """
@@ -411,23 +526,18 @@ class BOOSTClient:
             'recommendations': []
         }
         
-        # 1. Schema validation for all entities
-        self._validate_schemas(validation_results)
-        
-        # 2. Foreign key integrity checking
-        self._validate_foreign_keys(validation_results)
-        
-        # 3. Volume conservation validation (addresses tolerance concerns)
-        self._validate_volume_conservation(validation_results)
-        
-        # 4. Tolerance compliance validation
-        self._validate_tolerance_compliance(validation_results)
-        
-        # 5. Temporal consistency validation
-        self._validate_temporal_consistency(validation_results)
+        # 1-5. Schema, foreign key, volume conservation, tolerance and temporal checks
+        if full:
+            self._validation_cache.invalidate()
+            self._business_rule_cache.invalidate()
+        stats = ValidationStats()
+        self._validation_cache.refresh(token=self.schema_loader.schemas, stats=stats)
+        for check_name, check_results in validation_results['validation_checks'].items():
+            check_results['passed'], check_results['failed'] = self._validation_cache.totals[check_name]
+            check_results['errors'] = self._validation_cache.items(check_name)
         
         # 6. Business rule validation
-        self._validate_business_rules(validation_results)
+        self._validate_business_rules(validation_results, stats)
         
         # 7. Generate practical recommendations
         self._generate_recommendations(validation_results)
@@ -441,6 +551,10 @@ class BOOSTClient:
             validation_results['business_rules']['regulatory_compliance']['valid']
         ])
         
+        validation_results['stats'] = stats.as_dict()
+        if self.stats_hook is not None:
+            self.stats_hook('validate_all', stats)
+        
         return validation_results
     
     def get_supply_chain(self, traceable_unit_id: str) -> Dict[str, Any]:
@@ -465,34 +579,74 @@ class BOOSTClient:
             'child_units': []
         }
         
-        # Find related processing operations
-        for proc_id, processing in self.material_processing.items():
-            if (processing.input_traceable_unit_id == traceable_unit_id or 
-                processing.output_traceable_unit_id == traceable_unit_id):
-                supply_chain['processing_history'].append(processing)
-        
-        # Find related transactions
-        for txn_id, transaction in self.transactions.items():
-            if hasattr(transaction, 'traceable_unit_id') and transaction.traceable_unit_id == traceable_unit_id:
-                supply_chain['transactions'].append(transaction)
-        
-        # Find related claims
-        for claim_id, claim in self.claims.items():
-            if claim.traceable_unit_id == traceable_unit_id:
-                supply_chain['claims'].append(claim)
+        # Related processing operations, transactions and claims come from the store indexes
+        supply_chain['processing_history'] = self.store.related('processing_by_tru', traceable_unit_id)
+        supply_chain['transactions'] = self.store.related('transactions_by_tru', traceable_unit_id)
+        supply_chain['claims'] = self.store.related('claims_by_tru', traceable_unit_id)
         
         # Find parent and child units
         tru = self.traceable_units[traceable_unit_id]
         if tru.parent_traceable_unit_id and tru.parent_traceable_unit_id in self.traceable_units:
             supply_chain['parent_units'].append(self.traceable_units[tru.parent_traceable_unit_id])
         
-        if tru.child_traceable_unit_ids:
-            for child_id in tru.child_traceable_unit_ids:
-                if child_id in self.traceable_units:
-                    supply_chain['child_units'].append(self.traceable_units[child_id])
+        # Children listed on the TRU itself, then TRUs naming it as their parent
+        child_ids = list(tru.child_traceable_unit_ids or [])
+        child_ids += [child_id for child_id in self.store.related_ids('children_by_parent', traceable_unit_id)
+                      if child_id not in child_ids]
+        for child_id in child_ids:
+            if child_id in self.traceable_units:
+                supply_chain['child_units'].append(self.traceable_units[child_id])
         
         return supply_chain
     
+    def get_lineage(self, traceable_unit_id: str, max_depth: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the full upstream and downstream lineage of a traceable unit.
+        
+        Follows parent/child links, material processing and processing
+        history across any number of hops, unlike get_supply_chain() which
+        returns direct relations only.
+        
+        Args:
+            traceable_unit_id: Starting TRU ID
+            max_depth: Maximum number of hops to follow (None for no limit)
+        
+        Returns:
+            Lineage information; upstream and downstream map TRU IDs to their distance in hops
+        """
+        if traceable_unit_id not in self.traceable_units:
+            return {'error': f'TraceableUnit {traceable_unit_id} not found'}
+        
+        return {
+            'traceable_unit': self.traceable_units[traceable_unit_id],
+            'upstream': self.lineage.upstream(traceable_unit_id, max_depth),
+            'downstream': self.lineage.downstream(traceable_unit_id, max_depth),
+            'path_to_origin': self.lineage.path_to_origin(traceable_unit_id)
+        }
+    
+    def close_mass_balance_period(self, ledger: MassBalanceLedger, period: str) -> Dict[str, Any]:
+        """
+        Close a mass balance period and store the resulting MassBalanceAccount entities.
+        
+        Args:
+            ledger: Ledger the period's transactions and processing were booked to
+            period: Period label, e.g. '2024-Q1'
+        
+        Returns:
+            Closing results with the stored account IDs and over-crediting errors
+        """
+        accounts, over_crediting = ledger.close_period(period)
+        results = self._new_import_results()
+        for account_data in accounts:
+            self._import_entity(account_data, results)
+        
+        return {
+            'period': period,
+            'accounts': [account_data['accountId'] for account_data in accounts],
+            'over_crediting': over_crediting,
+            'errors': results['errors']
+        }
+    
     def export_to_jsonld(self, include_context: bool = True) -> str:
         """
         Export all entities to JSON-LD format.
@@ -503,44 +657,182 @@ class BOOSTClient:
         Returns:
             JSON-LD string representation
         """
-        export_data = []
+        output = io.StringIO()
+        self.export_to_jsonld_stream(output, include_context=include_context, indent=2)
+        return output.getvalue()
+    
+    def export_to_jsonld_stream(self, target: JSONLDSource, format: str = 'json',
+                                include_context: bool = True, indent: Optional[int] = None,
+                                compress: Optional[bool] = None) -> int:
+        """
+        Export all entities to a JSON-LD file or stream one entity at a time.
+        
+        Each entity is serialized and written before the next is read, so
+        memory use does not grow with the number of entities exported.
+        
+        Args:
+            target: Path to write to (gzip-compressed if it ends in '.gz'),
+                    or a text or binary file-like object
+            format: 'json' for a JSON-LD document with an @graph array,
+                    'ndjson' for one entity per line after a shared @context line
+            include_context: Whether to include @context in output
+            indent: Indentation of the 'json' format (default: compact)
+            compress: Gzip the output (default: only for paths ending in '.gz')
+        
+        Returns:
+            Number of entities written
+        """
+        collections = [collection for collection in self.store.collections.values() if collection]
+        # An empty 'json' export is a plain '[]'; NDJSON always starts with its @context header line
+        context = self.default_context["@context"] if include_context and (collections or format == 'ndjson') else None
+        
+        def entity_records():
+            for collection in collections:
+                for entity in collection.values():
+                    # Fix: Use proper serialization for JSON-LD export
+                    entity_data = entity.model_dump(by_alias=True, exclude_none=True, mode='json')
+                    if not include_context and '@context' in entity_data:
+                        del entity_data['@context']
+                    yield entity_data
+        
+        with JSONLDGraphWriter(target, context, format=format, indent=indent, compress=compress) as writer:
+            return writer.write_many(entity_records())
+    
+    def export_to_columnar(self, directory: Union[str, Path], format: str = 'parquet',
+                           include_context: bool = True,
+                           row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> Dict[str, int]:
+        """
+        Export each entity type to its own Parquet or Arrow table (requires pyarrow).
         
-        # Add all entities
-        for entity_dict in [self.organizations, self.traceable_units, self.transactions, 
-                           self.material_processing, self.claims]:
-            for entity in entity_dict.values():
-                # Fix: Use proper serialization for JSON-LD export
+        Column types are derived from the entity schemas; see columnar.py.
+        
+        Args:
+            directory: Directory to write '<entity_type>.parquet' or '<entity_type>.arrow' files to
+            format: 'parquet' or 'arrow' (Arrow IPC file)
+            include_context: Whether to include each entity's JSON-LD @context
+            row_group_size: Rows per Parquet row group or Arrow record batch
+        
+        Returns:
+            Number of rows written per entity type
+        """
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown columnar format '{format}'. Available: {list(COLUMNAR_FORMATS)}")
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        def entity_records(collection):
+            for entity in collection.values():
                 entity_data = entity.model_dump(by_alias=True, exclude_none=True, mode='json')
                 if not include_context and '@context' in entity_data:
                     del entity_data['@context']
-                export_data.append(entity_data)
-        
-        if include_context and export_data:
-            # Add global context
-            result = {
-                "@context": self.default_context["@context"],
-                "@graph": export_data
-            }
-            return json.dumps(result, indent=2, default=str)
-        else:
-            return json.dumps(export_data, indent=2, default=str)
+                yield entity_data
+        
+        counts = {}
+        for collection_name, collection in self.store.collections.items():
+            if not collection:
+                continue
+            entity_type = COLLECTION_ENTITY_TYPES.get(collection_name, collection_name)
+            counts[entity_type] = write_entity_table(
+                entity_records(collection), directory / f"{entity_type}{COLUMNAR_FORMATS[format]}",
+                entity_type, self.schema_loader, format=format, row_group_size=row_group_size
+            )
+        return counts
     
-    def import_from_jsonld(self, jsonld_data: Union[str, Dict]) -> Dict[str, Any]:
+    def import_from_jsonld(self, jsonld_data: Union[str, Dict, List]) -> Dict[str, Any]:
         """
         Import entities from JSON-LD data.
         
         Args:
-            jsonld_data: JSON-LD string or dictionary
+            jsonld_data: JSON-LD string, dictionary or list of entities
             
         Returns:
             Import results with counts and errors
         """
         if isinstance(jsonld_data, str):
-            data = json.loads(jsonld_data)
+            return self.import_from_jsonld_stream(io.StringIO(jsonld_data))
+        
+        # Handle both @graph format and direct array
+        if isinstance(jsonld_data, list):
+            entities = jsonld_data
         else:
-            data = jsonld_data
+            entities = jsonld_data.get('@graph', [jsonld_data])
+        
+        results = self._new_import_results()
+        for entity_data in entities:
+            self._import_entity(entity_data, results)
+        return results
+    
+    def import_from_jsonld_stream(self, source: JSONLDSource,
+                                  progress_callback: Optional[Callable[[Dict[str, int]], None]] = None,
+                                  progress_every: int = 1000) -> Dict[str, Any]:
+        """
+        Import entities from a JSON-LD file or stream one entity at a time.
+        
+        The document is parsed incrementally, so memory use does not grow
+        with the size of the input beyond the imported entities themselves.
+        Entities before a syntax error are imported; the error is raised
+        as a ValueError.
+        
+        Args:
+            source: Path to a JSON-LD file (gzip-compressed if it ends in '.gz'),
+                    or a text or binary file-like object
+            progress_callback: Called every `progress_every` entities and once at the end
+                               with 'processed', 'imported', 'errors' and 'chars_read' counts
+            progress_every: Number of entities between progress callbacks
+        
+        Returns:
+            Import results with counts and errors
+        """
+        if progress_every <= 0:
+            raise ValueError(f"progress_every must be positive, got {progress_every}")
+        
+        reader = JSONLDGraphReader(source)
+        results = self._new_import_results()
+        processed = 0
+        
+        def report_progress():
+            progress_callback({
+                'processed': processed,
+                'imported': sum(results['imported'].values()),
+                'errors': len(results['errors']),
+                'chars_read': reader.chars_read
+            })
+        
+        for entity_data in reader:
+            self._import_entity(entity_data, results)
+            processed += 1
+            if progress_callback and processed % progress_every == 0:
+                report_progress()
+        
+        if progress_callback and processed % progress_every:
+            report_progress()
+        return results
+    
+    def import_from_columnar(self, source: Union[str, Path, ColumnarDataset],
+                             batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> Dict[str, Any]:
+        """
+        Import entities from the Parquet or Arrow tables written by export_to_columnar().
+        
+        Tables are read one batch of rows at a time and each row is
+        validated against the schema model of its entity type.
         
-        results = {
+        Args:
+            source: Directory of entity tables, or an opened ColumnarDataset
+            batch_size: Rows decoded at a time
+        
+        Returns:
+            Import results with counts and errors
+        """
+        dataset = source if isinstance(source, ColumnarDataset) else ColumnarDataset(source)
+        results = self._new_import_results()
+        for table in dataset:
+            for entity_data in table.iter_records(batch_size):
+                self._import_entity(entity_data, results)
+        return results
+    
+    def _new_import_results(self) -> Dict[str, Any]:
+        """Empty import results; counts for other entity types are added as they are imported."""
+        return {
             'imported': {
                 'organizations': 0,
                 'traceable_units': 0,
@@ -548,60 +840,35 @@ class BOOSTClient:
                 'material_processing': 0,
                 'claims': 0
             },
+            'skipped': 0,
             'errors': []
         }
+    
+    def _import_entity(self, entity_data: Any, results: Dict[str, Any]) -> None:
+        """
+        Validate one JSON-LD entity against the schema model for its @type and store it.
         
-        # Handle both @graph format and direct array
-        entities = data.get('@graph', data if isinstance(data, list) else [data])
-        
-        for entity_data in entities:
-            try:
-                entity_type = entity_data.get('@type', '').lower()
-                
-                if entity_type == 'organization':
-                    OrganizationModel = self.schema_loader.get_model('organization')
-                    if OrganizationModel:
-                        org = OrganizationModel(**entity_data)
-                        org_data = org.model_dump(by_alias=True)
-                        self.organizations[org_data['organizationId']] = org
-                        results['imported']['organizations'] += 1
-                    
-                elif entity_type == 'traceableunit':
-                    TraceableUnitModel = self.schema_loader.get_model('traceable_unit')
-                    if TraceableUnitModel:
-                        tru = TraceableUnitModel(**entity_data)
-                        tru_data = tru.model_dump(by_alias=True)
-                        self.traceable_units[tru_data['traceableUnitId']] = tru
-                        results['imported']['traceable_units'] += 1
-                    
-                elif entity_type == 'transaction':
-                    TransactionModel = self.schema_loader.get_model('transaction')
-                    if TransactionModel:
-                        txn = TransactionModel(**entity_data)
-                        txn_data = txn.model_dump(by_alias=True)
-                        self.transactions[txn_data['transactionId']] = txn
-                        results['imported']['transactions'] += 1
-                    
-                elif entity_type == 'materialprocessing':
-                    MaterialProcessingModel = self.schema_loader.get_model('material_processing')
-                    if MaterialProcessingModel:
-                        proc = MaterialProcessingModel(**entity_data)
-                        proc_data = proc.model_dump(by_alias=True)
-                        self.material_processing[proc_data['processingId']] = proc
-                        results['imported']['material_processing'] += 1
-                    
-                elif entity_type == 'claim':
-                    ClaimModel = self.schema_loader.get_model('claim')
-                    if ClaimModel:
-                        claim = ClaimModel(**entity_data)
-                        claim_data = claim.model_dump(by_alias=True)
-                        self.claims[claim_data['claimId']] = claim
-                        results['imported']['claims'] += 1
-                    
-            except Exception as e:
-                results['errors'].append(f"Error importing {entity_type}: {str(e)}")
+        Entities whose @type no schema declares are counted as skipped.
+        """
+        jsonld_type = entity_data.get('@type', '') if isinstance(entity_data, dict) else ''
+        try:
+            entity_type = self.schema_loader.get_entity_type_for_jsonld(jsonld_type)
+            if entity_type is None:
+                results['skipped'] += 1
+                return
+            
+            entity = self.schema_loader.get_model(entity_type)(**entity_data)
+            primary_key = self.schema_loader.get_primary_key(entity_type)
+            entity_id = entity_data.get(primary_key) or entity_data.get('@id')
+            if entity_id is None:
+                raise ValueError(f"missing primary key '{primary_key}'")
+            
+            collection = self.store.collection_for(entity_type)
+            collection[entity_id] = entity
+            results['imported'][collection.name] = results['imported'].get(collection.name, 0) + 1
         
-        return results
+        except Exception as e:
+            results['errors'].append(f"Error importing {str(jsonld_type).lower()}: {str(e)}")
     
     def generate_id(self, entity_type: str, prefix: Optional[str] = None) -> str:
         """
@@ -658,18 +925,108 @@ class BOOSTClient:
     def refresh_schemas(self):
         """
         Reload schemas and update dynamic models.
+        
+        The schema loader is shared process-wide, so every client and
+        validator using the same schema directory sees the new schemas.
         """
         self.schema_loader.refresh_schemas()
         # Validator will automatically use updated schema_loader
 
     
-    def add_tru_to_transaction(self, transaction_id: str, tru_id: str) -> bool:
+    def edit(self) -> EditSession:
+        """
+        Start an edit session for batched updates to stored entities.
+        
+        Updates are staged copy-on-write. When the session commits, each
+        touched field is validated against its schema type and constraints,
+        and the business rules that read a touched field (see _check_edits)
+        run once per affected entity; other rules and checks that only
+        validate_all() runs, such as foreign keys, are not rerun. If all pass,
+        each edited entity is written back to the store once. Used as a
+        context manager the session commits on exit:
+            
+            with client.edit() as session:
+                for tru_id in tru_ids:
+                    client.add_tru_to_transaction(transaction_id, tru_id, session=session)
+        
+        Returns:
+            New EditSession over this client's entity store
+        """
+        return EditSession(self.store, self._check_edits)
+    
+    def _check_edits(self, edits: List[EditedEntity]) -> List[str]:
+        """
+        Check the entities of an edit session commit against the business rules reading their touched fields.
+        
+        Business logic rules of an edited entity's type run when they read
+        one of its touched fields. The validate_all() checks in EDIT_RULES
+        run on each entity whose checked attributes were touched, and on the
+        entities referencing a TRU whose checked attributes were touched.
+        Each rule runs once per entity, against the session's edited
+        versions of the entities it reads.
+        
+        Args:
+            edits: Entities the commit would write
+        
+        Returns:
+            Error messages; empty if the commit may proceed
+        """
+        errors = []
+        edited = {(collection_name, entity_id): entity for collection_name, entity_id, entity, _ in edits}
+        traceable_units = ChainMap({entity_id: entity for (collection_name, entity_id), entity in edited.items()
+                                    if collection_name == 'traceable_units'}, self.traceable_units)
+        plan = self.validator.get_categorized_business_rule_plan()
+        # (check name, collection, entity ID) of the validate_all() checks to rerun, in order
+        reruns: Dict[Tuple[str, str, str], None] = {}
+        
+        for collection_name, entity_id, entity, fields in edits:
+            checks = plan.get(COLLECTION_ENTITY_TYPES.get(collection_name, collection_name), ())
+            if checks:
+                model_fields = type(entity).model_fields
+                aliases = {model_fields[name].alias or name for name in fields}
+                entity_data = None
+                for category, check in checks:
+                    read = check_fields(check)
+                    if read is not None and not read & aliases:
+                        continue
+                    if entity_data is None:
+                        entity_data = entity.model_dump(by_alias=True, exclude_none=True, mode='json')
+                    errors.extend(f"{collection_name} '{entity_id}': {category}: {message}"
+                                  for message in check(entity_data))
+            
+            for check_name, (checked_collection, attributes, tru_index, tru_attributes) in EDIT_RULES.items():
+                if collection_name == checked_collection and fields & attributes:
+                    reruns[(check_name, collection_name, entity_id)] = None
+                elif collection_name == 'traceable_units' and fields & tru_attributes:
+                    for related_id in self.store.related_ids(tru_index, entity_id):
+                        reruns[(check_name, checked_collection, related_id)] = None
+        
+        for check_name, collection_name, entity_id in reruns:
+            entity = edited.get((collection_name, entity_id)) or self.store.collections[collection_name].get(entity_id)
+            if entity is None:
+                continue
+            check = self._edit_rule_checks[check_name]
+            if EDIT_RULES[check_name][2] is None:
+                _, _, check_errors = check(collection_name, entity_id, entity)
+            else:
+                _, _, check_errors = check(collection_name, entity_id, entity, traceable_units)
+            errors.extend(f"{collection_name} '{entity_id}': {check_name}: {error['error']}"
+                          for error in check_errors)
+        return errors
+    
+    def _edit(self, session: Optional[EditSession]):
+        """Use the given edit session, or a new one committed when the block exits."""
+        return nullcontext(session) if session is not None else self.edit()
+    
+    def add_tru_to_transaction(self, transaction_id: str, tru_id: str,
+                               session: Optional[EditSession] = None) -> bool:
         """
         Add a TracableUnit ID to a transaction's TRU array.
         
         Args:
             transaction_id: ID of the transaction to update
             tru_id: ID of the TRU to add
+            session: Edit session to stage the update in (optional, applied immediately by default)
             
         Returns:
             True if successfully added, False if transaction not found
@@ -677,32 +1034,21 @@ class BOOSTClient:
         if transaction_id not in self.transactions:
             return False
         
-        transaction = self.transactions[transaction_id]
-        transaction_data = transaction.model_dump(by_alias=True, exclude_none=True)
-        
-        # Initialize array if it doesn't exist or is None
-        if 'traceableUnitIds' not in transaction_data or transaction_data['traceableUnitIds'] is None:
-            transaction_data['traceableUnitIds'] = []
-        
         # Add TRU ID if not already present
-        if tru_id not in transaction_data['traceableUnitIds']:
-            transaction_data['traceableUnitIds'].append(tru_id)
-            transaction_data['lastUpdated'] = datetime.now(timezone.utc)
-            
-            # Recreate the model with updated data
-            TransactionModel = self.schema_loader.get_model('transaction')
-            updated_transaction = TransactionModel(**transaction_data)
-            self.transactions[transaction_id] = updated_transaction
+        with self._edit(session) as edit:
+            edit.append('transactions', transaction_id, 'traceable_unit_ids', tru_id)
         
         return True
     
-    def add_tru_to_organization(self, org_id: str, tru_id: str) -> bool:
+    def add_tru_to_organization(self, org_id: str, tru_id: str,
+                                session: Optional[EditSession] = None) -> bool:
         """
         Add a TraceableUnit ID to an organization's managed TRUs array.
         
         Args:
             org_id: ID of the organization to update
             tru_id: ID of the TRU to add
+            session: Edit session to stage the update in (optional, applied immediately by default)
             
         Returns:
             True if successfully added, False if organization not found
@@ -710,32 +1056,24 @@ class BOOSTClient:
         if org_id not in self.organizations:
             return False
         
-        organization = self.organizations[org_id]
-        org_data = organization.model_dump(by_alias=True, exclude_none=True)
-        
-        # Initialize array if it doesn't exist or is None
-        if 'traceableUnitIds' not in org_data or org_data['traceableUnitIds'] is None:
-            org_data['traceableUnitIds'] = []
-        
-        # Add TRU ID if not already present
-        if tru_id not in org_data['traceableUnitIds']:
-            org_data['traceableUnitIds'].append(tru_id)
-            org_data['lastUpdated'] = datetime.now(timezone.utc)
-            
-            # Recreate the model with updated data
-            OrganizationModel = self.schema_loader.get_model('organization')
-            updated_organization = OrganizationModel(**org_data)
-            self.organizations[org_id] = updated_organization
+        with self._edit(session) as edit:
+            if edit.has_field('organizations', org_id, 'traceableUnitIds'):
+                edit.append('organizations', org_id, 'traceableUnitIds', tru_id)
+            else:
+                # Organization schemas without the array only record the update time
+                edit.touch('organizations', org_id)
         
         return True
     
-    def add_equipment_to_organization(self, org_id: str, equipment_id: str) -> bool:
+    def add_equipment_to_organization(self, org_id: str, equipment_id: str,
+                                      session: Optional[EditSession] = None) -> bool:
         """
         Add an equipment ID to an organization's equipment array.
         
         Args:
             org_id: ID of the organization to update
             equipment_id: ID of the equipment to add
+            session: Edit session to stage the update in (optional, applied immediately by default)
             
         Returns:
             True if successfully added, False if organization not found
@@ -743,26 +1081,17 @@ class BOOSTClient:
         if org_id not in self.organizations:
             return False
         
-        organization = self.organizations[org_id]
-        org_data = organization.model_dump(by_alias=True, exclude_none=True)
-        
-        # Initialize array if it doesn't exist or is None
-        if 'equipmentIds' not in org_data or org_data['equipmentIds'] is None:
-            org_data['equipmentIds'] = []
-        
-        # Add equipment ID if not already present
-        if equipment_id not in org_data['equipmentIds']:
-            org_data['equipmentIds'].append(equipment_id)
-            org_data['lastUpdated'] = datetime.now(timezone.utc)
-            
-            # Recreate the model with updated data
-            OrganizationModel = self.schema_loader.get_model('organization')
-            updated_organization = OrganizationModel(**org_data)
-            self.organizations[org_id] = updated_organization
+        with self._edit(session) as edit:
+            if edit.has_field('organizations', org_id, 'equipmentIds'):
+                edit.append('organizations', org_id, 'equipmentIds', equipment_id)
+            else:
+                # Organization schemas without the array only record the update time
+                edit.touch('organizations', org_id)
         
         return True
     
-    def set_reconciliation_status(self, transaction_id: str, status: str, timestamp: Optional[datetime] = None) -> bool:
+    def set_reconciliation_status(self, transaction_id: str, status: str, timestamp: Optional[datetime] = None,
+                                  session: Optional[EditSession] = None) -> bool:
         """
         Set the reconciliation status for a transaction.
         
@@ -770,6 +1099,7 @@ class BOOSTClient:
             transaction_id: ID of the transaction to update
             status: Reconciliation status ('pending', 'resolved', 'disputed')
             timestamp: Optional timestamp (defaults to current time)
+            session: Edit session to stage the update in (optional, applied immediately by default)
             
         Returns:
             True if successfully updated, False if transaction not found or invalid status
@@ -782,26 +1112,23 @@ class BOOSTClient:
         if status not in valid_statuses:
             raise ValueError(f"Invalid reconciliation status '{status}'. Valid statuses: {valid_statuses}")
         
-        transaction = self.transactions[transaction_id]
-        transaction_data = transaction.model_dump(by_alias=True, exclude_none=True)
-        
-        transaction_data['reconciliationStatus'] = status
-        transaction_data['lastUpdated'] = timestamp or datetime.now(timezone.utc)
-        
-        # Recreate the model with updated data
-        TransactionModel = self.schema_loader.get_model('transaction')
-        updated_transaction = TransactionModel(**transaction_data)
-        self.transactions[transaction_id] = updated_transaction
+        fields = {'reconciliation_status': status}
+        if timestamp is not None:
+            fields['last_updated'] = timestamp
+        with self._edit(session) as edit:
+            edit.update('transactions', transaction_id, **fields)
         
         return True
     
-    def add_manipulation_timestamp(self, transaction_id: str, timestamp: datetime) -> bool:
+    def add_manipulation_timestamp(self, transaction_id: str, timestamp: datetime,
+                                   session: Optional[EditSession] = None) -> bool:
         """
         Add a manipulation timestamp to a transaction's timeline.
         
         Args:
             transaction_id: ID of the transaction to update
             timestamp: Processing step timestamp
+            session: Edit session to stage the update in (optional, applied immediately by default)
             
         Returns:
             True if successfully added, False if transaction not found
@@ -809,360 +1136,313 @@ class BOOSTClient:
         if transaction_id not in self.transactions:
             return False
         
-        transaction = self.transactions[transaction_id]
-        transaction_data = transaction.model_dump(by_alias=True, exclude_none=True)
-        
-        # Initialize array if it doesn't exist or is None
-        if 'manipulationTimestamps' not in transaction_data or transaction_data['manipulationTimestamps'] is None:
-            transaction_data['manipulationTimestamps'] = []
-        
-        # Ensure all existing timestamps are strings
-        timestamp_list = []
-        for ts in transaction_data['manipulationTimestamps']:
-            if isinstance(ts, datetime):
-                timestamp_list.append(ts.isoformat())
-            elif isinstance(ts, str):
-                timestamp_list.append(ts)
-            else:
-                # Convert other types to string representation
-                timestamp_list.append(str(ts))
-        
-        # Add new timestamp (convert to ISO string for JSON compatibility)
-        timestamp_str = timestamp.isoformat()
-        timestamp_list.append(timestamp_str)
-        
-        # Sort timestamps chronologically and update
-        timestamp_list.sort()
-        transaction_data['manipulationTimestamps'] = timestamp_list
-        transaction_data['lastUpdated'] = datetime.now(timezone.utc)
-        
-        # Recreate the model with updated data
-        TransactionModel = self.schema_loader.get_model('transaction')
-        updated_transaction = TransactionModel(**transaction_data)
-        self.transactions[transaction_id] = updated_transaction
+        with self._edit(session) as edit:
+            timestamps = edit.working_list('transactions', transaction_id, 'manipulation_timestamps')
+            timestamps.append(timestamp)
+            
+            # Keep the timeline chronological, ordered by ISO string
+            timestamps.sort(key=lambda ts: ts.isoformat() if isinstance(ts, datetime) else str(ts))
         
         return True
 
-    def _validate_schemas(self, validation_results: Dict[str, Any]) -> None:
+    def _validate_business_rules(self, validation_results: Dict[str, Any],
+                                 stats: Optional[ValidationStats] = None) -> None:
         """
-        Validate all entities against their JSON schemas.
+        Validate business logic and supply chain rules.
         
         Args:
             validation_results: Results dictionary to update
+            stats: Stats to record the business rule checks in
         """
-        # Validate all entity collections
-        entity_collections = [
-            ('organizations', self.organizations),
-            ('traceable_units', self.traceable_units), 
-            ('transactions', self.transactions),
-            ('material_processing', self.material_processing),
-            ('claims', self.claims),
-            ('tracking_points', self.tracking_points)
-        ]
-        
-        for collection_name, collection in entity_collections:
-            for entity_id, entity in collection.items():
-                try:
-                    # Use existing validate_entity method
-                    result = self.validate_entity(entity)
-                    
-                    if result['valid']:
-                        validation_results['validation_checks']['schema_validation']['passed'] += 1
-                    else:
-                        validation_results['validation_checks']['schema_validation']['failed'] += 1
-                        validation_results['validation_checks']['schema_validation']['errors'].append({
-                            'entity_type': result['entity_type'],
-                            'entity_id': entity_id,
-                            'schema_errors': result['schema_errors'],
-                            'business_errors': result['business_logic_errors']
-                        })
-                        
-                except Exception as e:
-                    validation_results['validation_checks']['schema_validation']['failed'] += 1
-                    validation_results['validation_checks']['schema_validation']['errors'].append({
-                        'entity_type': collection_name,
-                        'entity_id': entity_id,
-                        'error': f"Validation exception: {str(e)}"
-                    })
+        cache = self._business_rule_cache
+        cache.refresh(token=self.schema_loader.schemas, stats=stats)
+        
+        # Supply chain continuity validation
+        # Check if each TRU has any transactions or processing operations
+        orphaned_count = cache.failing_count('supply_chain_continuity')
+        if orphaned_count:
+            validation_results['business_rules']['supply_chain_continuity']['valid'] = False
+            validation_results['business_rules']['supply_chain_continuity']['issues'].append({
+                'type': 'orphaned_trus',
+                'count': orphaned_count,
+                'tru_ids': cache.items('supply_chain_continuity', limit=5),  # Limit to first 5 for readability
+                'warning': f'{orphaned_count} TracableUnits have no associated transactions or processing'
+            })
+        
+        # Regulatory compliance validation
+        # Check if each TRU has required sustainability claims
+        missing_count = cache.failing_count('regulatory_compliance')
+        if missing_count:
+            validation_results['business_rules']['regulatory_compliance']['valid'] = False
+            validation_results['business_rules']['regulatory_compliance']['issues'].append({
+                'type': 'missing_sustainability_claims',
+                'count': missing_count, 
+                'tru_ids': cache.items('regulatory_compliance', limit=5),
+                'warning': f'{missing_count} TraceableUnits missing sustainability claims'
+            })
 
-    def _validate_foreign_keys(self, validation_results: Dict[str, Any]) -> None:
+    def _check_schema(self, collection_name: str, entity_id: str, entity: Any) -> CheckOutcome:
         """
-        Validate foreign key relationships between entities.
+        Validate one entity against its JSON schema and business logic rules.
         
         Args:
-            validation_results: Results dictionary to update
+            collection_name: Collection holding the entity
+            entity_id: Entity ID
+            entity: Entity to validate
+        
+        Returns:
+            (passed, failed, errors) for the schema_validation check
         """
-        # Check TracableUnit -> Organization references
-        for tru_id, tru in self.traceable_units.items():
-            if hasattr(tru, 'harvester_id') and tru.harvester_id:
-                if tru.harvester_id not in self.organizations:
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'traceable_unit',
-                        'entity_id': tru_id,
-                        'field': 'harvester_id',
-                        'referenced_id': tru.harvester_id,
-                        'error': 'Referenced organization not found'
-                    })
-                else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
+        try:
+            # Use existing validate_entity method
+            result = self.validate_entity(entity)
+        except Exception as e:
+            return 0, 1, ({
+                'entity_type': collection_name,
+                'entity_id': entity_id,
+                'error': f"Validation exception: {str(e)}"
+            },)
+        
+        if result['valid']:
+            return 1, 0, ()
+        return 0, 1, ({
+            'entity_type': result['entity_type'],
+            'entity_id': entity_id,
+            'schema_errors': result['schema_errors'],
+            'business_errors': result['business_logic_errors']
+        },)
+    
+    def _check_foreign_keys(self, collection_name: str, entity_id: str, entity: Any) -> CheckOutcome:
+        """
+        Validate the foreign key references of one entity.
+        
+        Args:
+            collection_name: Collection holding the entity
+            entity_id: Entity ID
+            entity: Entity to validate
             
-            if hasattr(tru, 'operator_id') and tru.operator_id:
-                if tru.operator_id not in self.organizations:
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'traceable_unit',
-                        'entity_id': tru_id,
-                        'field': 'operator_id', 
-                        'referenced_id': tru.operator_id,
-                        'error': 'Referenced organization not found'
-                    })
-                else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
-        
-        # Check Transaction -> TraceableUnit references  
-        for txn_id, txn in self.transactions.items():
-            if hasattr(txn, 'traceable_unit_ids') and txn.traceable_unit_ids:
-                for tru_id in txn.traceable_unit_ids:
-                    if tru_id not in self.traceable_units:
-                        validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                        validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                            'entity_type': 'transaction',
-                            'entity_id': txn_id,
-                            'field': 'traceable_unit_ids',
-                            'referenced_id': tru_id,
-                            'error': 'Referenced traceable unit not found'
-                        })
-                    else:
-                        validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
-        
-        # Check MaterialProcessing -> TraceableUnit references
-        for proc_id, proc in self.material_processing.items():
-            if hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id:
-                if proc.input_traceable_unit_id not in self.traceable_units:
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'material_processing',
-                        'entity_id': proc_id,
-                        'field': 'input_traceable_unit_id',
-                        'referenced_id': proc.input_traceable_unit_id,
-                        'error': 'Referenced input TRU not found'
-                    })
-                else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
-                    
-            if hasattr(proc, 'output_traceable_unit_id') and proc.output_traceable_unit_id:
-                if proc.output_traceable_unit_id not in self.traceable_units:
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'material_processing',
-                        'entity_id': proc_id,
-                        'field': 'output_traceable_unit_id',
-                        'referenced_id': proc.output_traceable_unit_id,
-                        'error': 'Referenced output TRU not found'
-                    })
-                else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
-        
-        # Check TrackingPoint -> GeographicData and TrackingPoint -> Operator references
-        for tp_id, tp in self.tracking_points.items():
-            if hasattr(tp, 'geographic_data_id') and tp.geographic_data_id:
-                # Note: GeographicData entities would be stored in a separate collection
-                # For now, we'll validate pattern compliance and note missing collection
-                if not tp.geographic_data_id.startswith('GEO-'):
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'tracking_point',
-                        'entity_id': tp_id,
-                        'field': 'geographic_data_id',
-                        'referenced_id': tp.geographic_data_id,
-                        'error': 'Invalid GeographicData ID pattern (must start with GEO-)'
-                    })
+        Returns:
+            (passed, failed, errors) for the foreign_key_integrity check
+        """
+        passed = 0
+        errors = []
+        entity_type = COLLECTION_ENTITY_TYPES[collection_name]
+        
+        # TracableUnit -> Organization, Transaction -> TraceableUnit and MaterialProcessing -> TraceableUnit
+        for field, target_collection, error in FOREIGN_KEYS.get(collection_name, ()):
+            value = getattr(entity, field, None)
+            if not value:
+                continue
+            referenced = self.store.collections[target_collection]
+            for referenced_id in (value if isinstance(value, (list, tuple)) else (value,)):
+                if referenced_id in referenced:
+                    passed += 1
                 else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
-            
-            if hasattr(tp, 'operator_id') and tp.operator_id:
-                if not tp.operator_id.startswith('OP-'):
-                    validation_results['validation_checks']['foreign_key_integrity']['failed'] += 1
-                    validation_results['validation_checks']['foreign_key_integrity']['errors'].append({
-                        'entity_type': 'tracking_point',
-                        'entity_id': tp_id,
-                        'field': 'operator_id',
-                        'referenced_id': tp.operator_id,
-                        'error': 'Invalid Operator ID pattern (must start with OP-)'
+                    errors.append({
+                        'entity_type': entity_type,
+                        'entity_id': entity_id,
+                        'field': field,
+                        'referenced_id': referenced_id,
+                        'error': error
                     })
-                else:
-                    validation_results['validation_checks']['foreign_key_integrity']['passed'] += 1
+        
+        # TrackingPoint -> GeographicData and TrackingPoint -> Operator references
+        # Note: GeographicData and Operator entities would be stored in separate collections
+        # For now, we validate pattern compliance
+        for field, prefix, error in FOREIGN_KEY_PATTERNS.get(collection_name, ()):
+            value = getattr(entity, field, None)
+            if not value:
+                continue
+            if value.startswith(prefix):
+                passed += 1
+            else:
+                errors.append({
+                    'entity_type': entity_type,
+                    'entity_id': entity_id,
+                    'field': field,
+                    'referenced_id': value,
+                    'error': error
+                })
+        
+        return passed, len(errors), tuple(errors)
 
-    def _validate_volume_conservation(self, validation_results: Dict[str, Any]) -> None:
+    def _check_volume_conservation(self, collection_name: str, proc_id: str, proc: Any,
+                                   traceable_units: Optional[Mapping[str, Any]] = None) -> CheckOutcome:
         """
-        Validate volume conservation in processing operations.
+        Validate volume conservation in one processing operation.
         
         Args:
-            validation_results: Results dictionary to update
+            collection_name: Collection holding the operation
+            proc_id: Processing ID
+            proc: MaterialProcessing entity
+            traceable_units: TRUs by ID to read volumes from (default: the stored TRUs)
+        
+        Returns:
+            (passed, failed, errors) for the volume_conservation check
         """
-        for proc_id, proc in self.material_processing.items():
-            if (hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id and
+        if not (hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id and
                 hasattr(proc, 'output_traceable_unit_id') and proc.output_traceable_unit_id):
-                
-                input_tru = self.traceable_units.get(proc.input_traceable_unit_id)
-                output_tru = self.traceable_units.get(proc.output_traceable_unit_id)
-                
-                if input_tru and output_tru:
-                    input_volume = getattr(input_tru, 'total_volume_m3', 0)
-                    output_volume = getattr(output_tru, 'total_volume_m3', 0)
-                    
-                    if input_volume > 0:
-                        # Calculate volume change percentage
-                        volume_change = abs(output_volume - input_volume) / input_volume
-                        
-                        # Get process type for tolerance determination
-                        process_type = getattr(proc, 'process_type', 'unknown')
-                        
-                        # Define realistic tolerances based on process type
-                        tolerances = {
-                            'drying': 0.15,      # 15% volume loss typical
-                            'chipping': 0.08,    # 8% volume loss from processing
-                            'pelletizing': 0.12, # 12% volume loss from compression
-                            'sawmill': 0.35,     # 35% volume loss from lumber production
-                            'transport': 0.02,   # 2% acceptable measurement variance
-                            'default': 0.10      # 10% default tolerance
-                        }
-                        
-                        allowed_tolerance = tolerances.get(process_type, tolerances['default'])
-                        
-                        if volume_change > allowed_tolerance:
-                            validation_results['validation_checks']['volume_conservation']['failed'] += 1
-                            validation_results['validation_checks']['volume_conservation']['errors'].append({
-                                'processing_id': proc_id,
-                                'process_type': process_type,
-                                'input_volume': input_volume,
-                                'output_volume': output_volume,
-                                'volume_change_percent': volume_change * 100,
-                                'allowed_tolerance_percent': allowed_tolerance * 100,
-                                'error': f'Volume change ({volume_change:.1%}) exceeds tolerance ({allowed_tolerance:.1%}) for {process_type}'
-                            })
-                        else:
-                            validation_results['validation_checks']['volume_conservation']['passed'] += 1
+            return 0, 0, ()
+        
+        if traceable_units is None:
+            traceable_units = self.traceable_units
+        input_tru = traceable_units.get(proc.input_traceable_unit_id)
+        output_tru = traceable_units.get(proc.output_traceable_unit_id)
+        if not (input_tru and output_tru):
+            return 0, 0, ()
+        
+        input_volume = getattr(input_tru, 'total_volume_m3', 0)
+        output_volume = getattr(output_tru, 'total_volume_m3', 0)
+        if not input_volume > 0:
+            return 0, 0, ()
+        
+        # Calculate volume change percentage
+        volume_change = abs(output_volume - input_volume) / input_volume
+        
+        # Get process type for tolerance determination
+        process_type = getattr(proc, 'process_type', 'unknown')
+        allowed_tolerance = VOLUME_TOLERANCES.get(process_type, VOLUME_TOLERANCES['default'])
+        
+        if volume_change > allowed_tolerance:
+            return 0, 1, ({
+                'processing_id': proc_id,
+                'process_type': process_type,
+                'input_volume': input_volume,
+                'output_volume': output_volume,
+                'volume_change_percent': volume_change * 100,
+                'allowed_tolerance_percent': allowed_tolerance * 100,
+                'error': f'Volume change ({volume_change:.1%}) exceeds tolerance ({allowed_tolerance:.1%}) for {process_type}'
+            },)
+        return 1, 0, ()
 
-    def _validate_tolerance_compliance(self, validation_results: Dict[str, Any]) -> None:
+    def _check_tolerance_compliance(self, collection_name: str, txn_id: str, txn: Any) -> CheckOutcome:
         """
-        Validate compliance with industry-standard tolerances.
+        Validate one transaction against the CARB LCFS volume tolerance (±0.5%).
         
         Args:
-            validation_results: Results dictionary to update
+            collection_name: Collection holding the transaction
+            txn_id: Transaction ID
+            txn: Transaction entity
+        
+        Returns:
+            (passed, failed, errors) for the tolerance_compliance check
         """
-        # Validate CARB LCFS volume tolerance (±0.5%)
-        for txn_id, txn in self.transactions.items():
-            if hasattr(txn, 'quantity_m3') and hasattr(txn, 'measured_volume_m3'):
-                reported_volume = getattr(txn, 'quantity_m3', 0)
-                measured_volume = getattr(txn, 'measured_volume_m3', 0)
-                
-                if reported_volume > 0 and measured_volume > 0:
-                    variance = abs(measured_volume - reported_volume) / reported_volume
-                    carb_tolerance = 0.005  # 0.5% as per CARB requirements
-                    
-                    if variance > carb_tolerance:
-                        validation_results['validation_checks']['tolerance_compliance']['failed'] += 1
-                        validation_results['validation_checks']['tolerance_compliance']['errors'].append({
-                            'transaction_id': txn_id,
-                            'reported_volume': reported_volume,
-                            'measured_volume': measured_volume,
-                            'variance_percent': variance * 100,
-                            'allowed_tolerance_percent': carb_tolerance * 100,
-                            'regulation': 'CARB LCFS',
-                            'error': f'Volume variance ({variance:.2%}) exceeds CARB LCFS tolerance (±{carb_tolerance:.1%})'
-                        })
-                    else:
-                        validation_results['validation_checks']['tolerance_compliance']['passed'] += 1
+        if not (hasattr(txn, 'quantity_m3') and hasattr(txn, 'measured_volume_m3')):
+            return 0, 0, ()
+        
+        reported_volume = getattr(txn, 'quantity_m3', 0)
+        measured_volume = getattr(txn, 'measured_volume_m3', 0)
+        if not (reported_volume > 0 and measured_volume > 0):
+            return 0, 0, ()
+        
+        variance = abs(measured_volume - reported_volume) / reported_volume
+        carb_tolerance = 0.005  # 0.5% as per CARB requirements
+        
+        if variance > carb_tolerance:
+            return 0, 1, ({
+                'transaction_id': txn_id,
+                'reported_volume': reported_volume,
+                'measured_volume': measured_volume,
+                'variance_percent': variance * 100,
+                'allowed_tolerance_percent': carb_tolerance * 100,
+                'regulation': 'CARB LCFS',
+                'error': f'Volume variance ({variance:.2%}) exceeds CARB LCFS tolerance (±{carb_tolerance:.1%})'
+            },)
+        return 1, 0, ()
 
-    def _validate_temporal_consistency(self, validation_results: Dict[str, Any]) -> None:
+    def _check_temporal_consistency(self, collection_name: str, proc_id: str, proc: Any,
+                                    traceable_units: Optional[Mapping[str, Any]] = None) -> CheckOutcome:
         """
-        Validate temporal consistency of timestamps.
+        Validate that one processing operation does not precede its input TRU.
         
         Args:
-            validation_results: Results dictionary to update
+            collection_name: Collection holding the operation
+            proc_id: Processing ID
+            proc: MaterialProcessing entity
+            traceable_units: TRUs by ID to read creation times from (default: the stored TRUs)
+        
+        Returns:
+            (passed, failed, errors) for the temporal_consistency check
         """
-        # Check processing operation temporal sequence
-        for proc_id, proc in self.material_processing.items():
-            if (hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id and
+        if not (hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id and
                 hasattr(proc, 'process_timestamp') and proc.process_timestamp):
-                
-                input_tru = self.traceable_units.get(proc.input_traceable_unit_id)
-                if input_tru and hasattr(input_tru, 'created_timestamp'):
-                    input_created = getattr(input_tru, 'created_timestamp')
-                    process_time = getattr(proc, 'process_timestamp')
-                    
-                    # Convert to datetime objects for comparison
-                    if isinstance(input_created, str):
-                        input_created = datetime.fromisoformat(input_created.replace('Z', '+00:00'))
-                    if isinstance(process_time, str):
-                        process_time = datetime.fromisoformat(process_time.replace('Z', '+00:00'))
-                    
-                    if process_time < input_created:
-                        validation_results['validation_checks']['temporal_consistency']['failed'] += 1
-                        validation_results['validation_checks']['temporal_consistency']['errors'].append({
-                            'processing_id': proc_id,
-                            'input_tru_id': proc.input_traceable_unit_id,
-                            'input_created': input_created.isoformat(),
-                            'process_timestamp': process_time.isoformat(),
-                            'error': 'Processing timestamp precedes input TRU creation'
-                        })
-                    else:
-                        validation_results['validation_checks']['temporal_consistency']['passed'] += 1
+            return 0, 0, ()
+        
+        if traceable_units is None:
+            traceable_units = self.traceable_units
+        input_tru = traceable_units.get(proc.input_traceable_unit_id)
+        if not (input_tru and hasattr(input_tru, 'created_timestamp')):
+            return 0, 0, ()
+        
+        input_created = getattr(input_tru, 'created_timestamp')
+        process_time = getattr(proc, 'process_timestamp')
+        
+        # Convert to datetime objects for comparison; a TRU's creation time is parsed once
+        input_created = parse_timestamp(input_created)
+        process_time = parse_timestamp(process_time)
+        
+        if process_time < input_created:
+            return 0, 1, ({
+                'processing_id': proc_id,
+                'input_tru_id': proc.input_traceable_unit_id,
+                'input_created': input_created.isoformat(),
+                'process_timestamp': process_time.isoformat(),
+                'error': 'Processing timestamp precedes input TRU creation'
+            },)
+        return 1, 0, ()
 
-    def _validate_business_rules(self, validation_results: Dict[str, Any]) -> None:
+    def _check_supply_chain_continuity(self, collection_name: str, tru_id: str, tru: Any) -> CheckOutcome:
+        """Report a TRU that has no transactions or processing operations."""
+        if (self.store.has_related('transactions_by_tru', tru_id)
+                or self.store.has_related('processing_by_tru', tru_id)):
+            return 0, 0, ()
+        return 0, 0, (tru_id,)
+    
+    def _check_regulatory_compliance(self, collection_name: str, tru_id: str, tru: Any) -> CheckOutcome:
+        """Report a TRU that has no sustainability claims."""
+        if self.store.has_related('claims_by_tru', tru_id):
+            return 0, 0, ()
+        return 0, 0, (tru_id,)
+    
+    def _entity_references(self, collection_name: str, entity: Any) -> Set[str]:
         """
-        Validate business logic and supply chain rules.
+        Get the IDs an entity refers to, for incremental revalidation.
+        
+        Combines the relationship fields declared in the entity's schema
+        metadata with the relationships the entity store indexes.
         
         Args:
-            validation_results: Results dictionary to update
+            collection_name: Collection holding the entity
+            entity: Stored entity
+        
+        Returns:
+            Referenced entity IDs
         """
-        # Supply chain continuity validation
-        orphaned_trus = []
-        for tru_id, tru in self.traceable_units.items():
-            # Check if TRU has any transactions or processing operations
-            has_transactions = any(
-                hasattr(txn, 'traceable_unit_ids') and tru_id in getattr(txn, 'traceable_unit_ids', [])
-                for txn in self.transactions.values()
+        model = type(entity)
+        attributes = self._reference_attributes.get((collection_name, model))
+        if attributes is None:
+            entity_type = COLLECTION_ENTITY_TYPES.get(collection_name, collection_name)
+            aliases = {(field.alias or name): name for name, field in getattr(model, 'model_fields', {}).items()}
+            attributes = tuple(
+                aliases[relationship['field']]
+                for relationship in self.schema_loader.get_relationships(entity_type)
+                if relationship.get('field') in aliases
             )
-            
-            has_processing = any(
-                (hasattr(proc, 'input_traceable_unit_id') and proc.input_traceable_unit_id == tru_id) or
-                (hasattr(proc, 'output_traceable_unit_id') and proc.output_traceable_unit_id == tru_id)
-                for proc in self.material_processing.values()
-            )
-            
-            if not has_transactions and not has_processing:
-                orphaned_trus.append(tru_id)
-        
-        if orphaned_trus:
-            validation_results['business_rules']['supply_chain_continuity']['valid'] = False
-            validation_results['business_rules']['supply_chain_continuity']['issues'].append({
-                'type': 'orphaned_trus',
-                'count': len(orphaned_trus),
-                'tru_ids': orphaned_trus[:5],  # Limit to first 5 for readability
-                'warning': f'{len(orphaned_trus)} TracableUnits have no associated transactions or processing'
-            })
-        
-        # Regulatory compliance validation
-        missing_claims = []
-        for tru_id, tru in self.traceable_units.items():
-            # Check if TRU has required sustainability claims
-            tru_claims = [claim for claim in self.claims.values() 
-                         if hasattr(claim, 'traceable_unit_id') and claim.traceable_unit_id == tru_id]
-            
-            if not tru_claims:
-                missing_claims.append(tru_id)
-        
-        if missing_claims:
-            validation_results['business_rules']['regulatory_compliance']['valid'] = False
-            validation_results['business_rules']['regulatory_compliance']['issues'].append({
-                'type': 'missing_sustainability_claims',
-                'count': len(missing_claims), 
-                'tru_ids': missing_claims[:5],
-                'warning': f'{len(missing_claims)} TraceableUnits missing sustainability claims'
-            })
+            self._reference_attributes[(collection_name, model)] = attributes
+        
+        values = [getattr(entity, attribute, None) for attribute in attributes]
+        for index_collection, extract in INDEXES.values():
+            if index_collection == collection_name:
+                values.extend(extract(entity))
+        
+        references = set()
+        for value in values:
+            if isinstance(value, str):
+                references.add(value)
+            elif isinstance(value, (list, tuple)):
+                references.update(v for v in value if isinstance(v, str))
+        references.discard('')
+        return references
 
     def _generate_recommendations(self, validation_results: Dict[str, Any]) -> None:
         """
@@ -1220,15 +1500,19 @@ class BOOSTClient:
         validation_results['recommendations'] = recommendations
 
 
-def create_client(context_url: Optional[str] = None, schema_path: Optional[str] = None) -> BOOSTClient:
+def create_client(context_url: Optional[str] = None, schema_path: Optional[str] = None,
+                  database: Optional[Union[str, Path]] = None,
+                  stats_hook: Optional[StatsHook] = None) -> BOOSTClient:
     """
     Factory function to create a BOOST client.
     
     Args:
         context_url: Optional JSON-LD context URL
         schema_path: Optional path to schema directory
+        database: Optional SQLite database file to persist entities in
+        stats_hook: Optional callback receiving the stats of every validate_all()
         
     Returns:
         BOOSTClient instance
     """
-    return BOOSTClient(context_url, schema_path)
\ No newline at end of file
+    return BOOSTClient(context_url, schema_path, database, stats_hook)
\ No newline at end of file
@@ -0,0 +1,441 @@
+"""
+BOOST Python Reference Implementation - Compiled Business Rules
+
+This module compiles business logic rule configuration into a per-entity-type
+plan of bound checks. Every rule is read once at compile time: thresholds,
+formulas and lookup tables are pulled out of the nested rule dicts and
+closed over, and rules that can never report an error for a given entity
+type are left out of its plan. Validating a record then only runs the checks
+compiled for its type. Each compiled check lists the record fields it reads
+in its ``fields`` attribute, so an update can rerun only the checks that
+read the fields it changed.
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterator, Iterable, FrozenSet
+
+# A compiled check takes one entity record and returns its error messages
+BusinessRuleCheck = Callable[[Dict[str, Any]], List[str]]
+
+
+def _reads(fields: Iterable[str]) -> Callable[[BusinessRuleCheck], BusinessRuleCheck]:
+    """Record the record fields a compiled check reads in its ``fields`` attribute."""
+    def decorate(check: BusinessRuleCheck) -> BusinessRuleCheck:
+        check.fields = frozenset(fields)
+        return check
+    return decorate
+
+
+def check_fields(check: BusinessRuleCheck) -> Optional[FrozenSet[str]]:
+    """Fields a business rule check reads, or None if it does not declare them (it may read any)."""
+    return getattr(check, 'fields', None)
+
+
+# Execution order used when the configuration does not declare one
+DEFAULT_EXECUTION_ORDER = [
+    'volumeMassConservation', 'temporalLogicRules', 'geographicLogicRules',
+    'speciesCompositionRules', 'certificationLogicRules', 'regulatoryComplianceRules',
+    'economicLogicRules', 'qualityAssuranceRules'
+]
+
+
+def _compile_volume_conservation(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile inputVolume >= outputVolume + volumeLoss and per-process volume increase limits."""
+    volume_conservation = rules.get('volumeConservation', {})
+    if not volume_conservation:
+        return None
+    
+    validation = volume_conservation.get('validation', {})
+    check_conservation = 'inputVolume >= (outputVolume + volumeLoss)' in validation.get('formula', '')
+    tolerance = validation.get('tolerance', 0.001)
+    max_increases: Dict[Any, List[Any]] = {}
+    for exception in volume_conservation.get('exceptions', []):
+        max_increases.setdefault(exception.get('processType'), []).append(exception.get('maxVolumeIncrease', 1.0))
+    if not check_conservation and not max_increases:
+        return None
+    
+    @_reads(('inputVolume', 'outputVolume', 'volumeLoss', 'processType'))
+    def check(processing_data: Dict[str, Any]) -> List[str]:
+        errors = []
+        input_vol = processing_data.get('inputVolume')
+        output_vol = processing_data.get('outputVolume')
+        if input_vol is None or output_vol is None:
+            return errors
+        
+        vol_loss = processing_data.get('volumeLoss', 0)
+        if check_conservation and input_vol < (output_vol + vol_loss):
+            if abs(input_vol - (output_vol + vol_loss)) > tolerance:
+                errors.append(
+                    f"Volume conservation violation: input ({input_vol}) < "
+                    f"output ({output_vol}) + loss ({vol_loss})"
+                )
+        
+        process_type = processing_data.get('processType')
+        for max_increase in max_increases.get(process_type, ()):
+            if output_vol > input_vol * max_increase:
+                errors.append(
+                    f"Volume increase exceeds limit for {process_type}: "
+                    f"max {max_increase}x allowed"
+                )
+        return errors
+    
+    return check
+
+
+def _compile_mass_conservation(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile inputMass >= outputMass and the typical loss rate range per process type."""
+    mass_conservation = rules.get('massConservation', {})
+    if not mass_conservation:
+        return None
+    
+    validation = mass_conservation.get('validation', {})
+    check_conservation = 'inputMass >= outputMass' in validation.get('formula', '')
+    tolerance = validation.get('tolerance', 0.001)
+    loss_ranges = {
+        process_type: (rates.get('min', 0), rates.get('max', 1))
+        for process_type, rates in mass_conservation.get('typicalLossRates', {}).items() if rates
+    }
+    if not check_conservation and not loss_ranges:
+        return None
+    
+    @_reads(('inputMass', 'outputMass', 'processType'))
+    def check(processing_data: Dict[str, Any]) -> List[str]:
+        errors = []
+        input_mass = processing_data.get('inputMass')
+        output_mass = processing_data.get('outputMass')
+        if input_mass is None or output_mass is None:
+            return errors
+        
+        if check_conservation and input_mass < output_mass and abs(input_mass - output_mass) > tolerance:
+            errors.append(
+                f"Mass conservation violation: input ({input_mass}) < output ({output_mass})"
+            )
+        
+        process_type = processing_data.get('processType')
+        if process_type and process_type in loss_ranges:
+            min_loss, max_loss = loss_ranges[process_type]
+            loss_rate = (input_mass - output_mass) / input_mass if input_mass > 0 else 0
+            if loss_rate < min_loss or loss_rate > max_loss:
+                errors.append(
+                    f"Mass loss rate {loss_rate:.3f} outside typical range for {process_type}: "
+                    f"[{min_loss}, {max_loss}]"
+                )
+        return errors
+    
+    return check
+
+
+def _compile_density_consistency(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the realistic wood density range, widened over all configured species."""
+    density_rules = rules.get('densityConsistency', {})
+    if not density_rules:
+        return None
+    
+    # Species is only known from the linked TRU, so check against the widest range
+    species_ranges = density_rules.get('validation', {}).get('speciesRanges', {})
+    general_min = min(r['min'] for r in species_ranges.values()) if species_ranges else 0.2
+    general_max = max(r['max'] for r in species_ranges.values()) if species_ranges else 1.0
+    
+    @_reads(('inputMass', 'inputVolume'))
+    def check(processing_data: Dict[str, Any]) -> List[str]:
+        input_mass = processing_data.get('inputMass')
+        input_volume = processing_data.get('inputVolume')
+        if all(v is not None and v > 0 for v in [input_mass, input_volume]):
+            density = input_mass / input_volume
+            if density < general_min or density > general_max:
+                return [f"Calculated density {density:.3f} outside realistic range [{general_min}, {general_max}]"]
+        return []
+    
+    return check
+
+
+def _compile_transaction_quantities(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the positive quantity check and the minimum transaction size."""
+    if not rules.get('availabilityCheck', {}):
+        return None
+    
+    min_transaction = rules.get('minimumTransactionSize', {})
+    min_validation = min_transaction.get('validation', {}) if min_transaction else {}
+    min_volume = min_validation.get('minimumVolume', 0)
+    min_value = min_validation.get('minimumValue', 0)
+    
+    @_reads(('quantity', 'contractValue'))
+    def check(transaction_data: Dict[str, Any]) -> List[str]:
+        errors = []
+        quantity = transaction_data.get('quantity')
+        if quantity is None:
+            return errors
+        
+        if quantity <= 0:
+            errors.append("Transaction quantity must be greater than 0")
+        if min_transaction:
+            if quantity < min_volume:
+                errors.append(f"Transaction quantity {quantity} below minimum {min_volume}")
+            contract_value = transaction_data.get('contractValue', 0)
+            if contract_value < min_value:
+                errors.append(f"Transaction value {contract_value} below minimum {min_value}")
+        return errors
+    
+    return check
+
+
+def _compile_species_composition(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the percentage sum tolerance and individual species bounds."""
+    composition_math = rules.get('compositionMath', {})
+    percentage_sum_rule = composition_math.get('percentageSum', {})
+    if not percentage_sum_rule:
+        return None
+    
+    tolerance = percentage_sum_rule.get('validation', {}).get('tolerance', 0.01)
+    target_sum = 100.0
+    individual_bounds = composition_math.get('individualBounds', {})
+    bounds = None
+    if individual_bounds:
+        bounds_validation = individual_bounds.get('validation', {})
+        bounds = (bounds_validation.get('minPercentage', 0.0), bounds_validation.get('maxPercentage', 100.0))
+    
+    @_reads(('speciesComposition',))
+    def check(tru_data: Dict[str, Any]) -> List[str]:
+        errors = []
+        species_composition = tru_data.get('speciesComposition', [])
+        if not species_composition:
+            return errors
+        
+        total_percentage = sum(species.get('percentage', 0) for species in species_composition)
+        if abs(total_percentage - target_sum) > tolerance:
+            errors.append(
+                f"Species composition percentages sum to {total_percentage}%, "
+                f"must equal {target_sum}% (tolerance: ±{tolerance}%)"
+            )
+        
+        if bounds is not None:
+            min_pct, max_pct = bounds
+            for species in species_composition:
+                pct = species.get('percentage', 0)
+                if pct < min_pct or pct > max_pct:
+                    errors.append(
+                        f"Species percentage {pct}% outside valid range "
+                        f"[{min_pct}%, {max_pct}%]"
+                    )
+        return errors
+    
+    return check
+
+
+def _compile_species_compatibility(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the ecosystem species lists, lowercased once."""
+    ecosystem_rules = rules.get('speciesCompatibility', {}).get('ecosystemConsistency', {})
+    if not ecosystem_rules:
+        return None
+    
+    ecosystems = [
+        (ecosystem, [species.lower() for species in compatible_species])
+        for ecosystem, compatible_species in ecosystem_rules.get('validation', {}).items()
+        if isinstance(compatible_species, list)
+    ]
+    if not ecosystems:
+        return None
+    
+    @_reads(('speciesComposition',))
+    def check(tru_data: Dict[str, Any]) -> List[str]:
+        species_composition = tru_data.get('speciesComposition', [])
+        if len(species_composition) <= 1:
+            return []
+        
+        # The first ecosystem naming any of the species must cover all of them
+        species_names = [s.get('speciesName', '').lower() for s in species_composition]
+        for ecosystem, compatible_species in ecosystems:
+            if any(species in compatible_species for species in species_names):
+                incompatible = [s for s in species_names if s not in compatible_species]
+                if incompatible:
+                    return [f"Species {incompatible} not compatible with {ecosystem} ecosystem"]
+                break
+        return []
+    
+    return check
+
+
+def _compile_certificate_validity(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the claim certificate expiry check."""
+    if not rules.get('chainOfCustodyRules', {}).get('certificateValidity', {}):
+        return None
+    
+    @_reads(('claimExpiry',))
+    def check(claim_data: Dict[str, Any]) -> List[str]:
+        claim_expiry = claim_data.get('claimExpiry')
+        if claim_expiry:
+            try:
+                if isinstance(claim_expiry, str):
+                    expiry_dt = datetime.fromisoformat(claim_expiry.replace('Z', '+00:00'))
+                    if expiry_dt < datetime.now(expiry_dt.tzinfo):
+                        return ["Claim certificate has expired"]
+            except (ValueError, TypeError):
+                return ["Invalid claim expiry date format"]
+        return []
+    
+    return check
+
+
+def _compile_market_price_range(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the price-per-unit reasonableness bounds."""
+    market_price_rules = rules.get('pricingReasonableness', {}).get('marketPriceRange', {})
+    if not market_price_rules:
+        return None
+    
+    # Price ranges depend on a material classification not carried by transactions,
+    # so a general reasonable range (10 to 500) is widened by the configured tolerance
+    tolerance = market_price_rules.get('validation', {}).get('tolerance', 0.5)
+    low_price = 10 * (1 - tolerance)
+    high_price = 500 * (1 + tolerance)
+    
+    @_reads(('contractValue', 'quantity'))
+    def check(transaction_data: Dict[str, Any]) -> List[str]:
+        contract_value = transaction_data.get('contractValue')
+        quantity = transaction_data.get('quantity')
+        if all(v is not None and v > 0 for v in [contract_value, quantity]):
+            price_per_unit = contract_value / quantity
+            if price_per_unit < low_price:
+                return [f"Price per unit {price_per_unit} seems unreasonably low"]
+            if price_per_unit > high_price:
+                return [f"Price per unit {price_per_unit} seems unreasonably high"]
+        return []
+    
+    return check
+
+
+def _compile_quality_assurance(rules: Dict[str, Any]) -> Optional[BusinessRuleCheck]:
+    """Compile the moisture content range and the per-contaminant maximum levels."""
+    check_moisture = bool(rules.get('moistureContentLimits', {}))
+    contamination_rules = rules.get('contaminationLimits', {})
+    contaminant_limits = []
+    if contamination_rules:
+        acceptable_levels = contamination_rules.get('acceptableLevels', {}).get('validation', {})
+        contaminant_limits = [
+            (f'{contaminant}Contamination', contaminant.title(), max_level)
+            for contaminant, max_level in acceptable_levels.items() if contaminant != 'units'
+        ]
+    if not check_moisture and not contaminant_limits:
+        return None
+    
+    # Species-specific moisture limits need the species; use general limits
+    general_min = 5
+    general_max = 70
+    
+    @_reads(['moistureContent'] + [field_name for field_name, _, _ in contaminant_limits])
+    def check(entity_data: Dict[str, Any]) -> List[str]:
+        errors = []
+        if check_moisture:
+            moisture_content = entity_data.get('moistureContent')
+            if moisture_content is not None and (moisture_content < general_min or moisture_content > general_max):
+                errors.append(
+                    f"Moisture content {moisture_content}% outside reasonable range "
+                    f"[{general_min}%, {general_max}%]"
+                )
+        for field_name, label, max_level in contaminant_limits:
+            contamination_level = entity_data.get(field_name)
+            if contamination_level is not None and contamination_level > max_level:
+                errors.append(
+                    f"{label} contamination {contamination_level}% exceeds "
+                    f"maximum allowed {max_level}%"
+                )
+        return errors
+    
+    return check
+
+
+def _volume_mass_conservation_checks(rules: Dict[str, Any]) -> Iterator[Tuple[str, Optional[BusinessRuleCheck]]]:
+    processing_rules = rules.get('materialProcessing', {})
+    yield 'material_processing', _compile_volume_conservation(processing_rules)
+    yield 'material_processing', _compile_mass_conservation(processing_rules)
+    yield 'material_processing', _compile_density_consistency(processing_rules)
+    yield 'transaction', _compile_transaction_quantities(rules.get('transactionQuantities', {}))
+
+
+def _species_composition_checks(rules: Dict[str, Any]) -> Iterator[Tuple[str, Optional[BusinessRuleCheck]]]:
+    yield 'traceable_unit', _compile_species_composition(rules)
+    yield 'traceable_unit', _compile_species_compatibility(rules)
+
+
+def _certification_logic_checks(rules: Dict[str, Any]) -> Iterator[Tuple[str, Optional[BusinessRuleCheck]]]:
+    yield 'claim', _compile_certificate_validity(rules)
+
+
+def _economic_logic_checks(rules: Dict[str, Any]) -> Iterator[Tuple[str, Optional[BusinessRuleCheck]]]:
+    yield 'transaction', _compile_market_price_range(rules)
+
+
+def _quality_assurance_checks(rules: Dict[str, Any]) -> Iterator[Tuple[str, Optional[BusinessRuleCheck]]]:
+    quality_check = _compile_quality_assurance(rules)
+    yield 'traceable_unit', quality_check
+    yield 'material_processing', quality_check
+
+
+# Rule category -> compiler yielding (entity_type, check) pairs. Temporal,
+# geographic and regulatory rules only need data from linked entities and
+# report nothing per record, so they compile to no checks.
+CATEGORY_COMPILERS: Dict[str, Callable[[Dict[str, Any]], Iterator[Tuple[str, Optional[BusinessRuleCheck]]]]] = {
+    'volumeMassConservation': _volume_mass_conservation_checks,
+    'speciesCompositionRules': _species_composition_checks,
+    'certificationLogicRules': _certification_logic_checks,
+    'economicLogicRules': _economic_logic_checks,
+    'qualityAssuranceRules': _quality_assurance_checks
+}
+
+
+def compile_categorized_business_rule_plan(
+        business_rules: Dict[str, Any],
+        category_checks: Optional[Dict[str, Dict[str, BusinessRuleCheck]]] = None
+) -> Dict[str, Tuple[Tuple[str, BusinessRuleCheck], ...]]:
+    """
+    Compile business logic rules into (category, check) pairs per entity type.
+    
+    Categories run in the configured executionOrder and only when the
+    configuration has rules for them, as in per-record rule evaluation.
+    
+    Args:
+        business_rules: Parsed business logic rule configuration
+        category_checks: Additional categories backed by fixed checks,
+            category -> {entity_type: check}
+    
+    Returns:
+        Dictionary with entity_type -> (category, check) pairs in execution
+        order; entity types without applicable rules are absent
+    """
+    category_checks = category_checks or {}
+    execution_order = business_rules.get('validationExecution', {}).get('executionOrder', DEFAULT_EXECUTION_ORDER)
+    
+    plan: Dict[str, List[Tuple[str, BusinessRuleCheck]]] = {}
+    for category in execution_order:
+        if category not in business_rules:
+            continue
+        if category in CATEGORY_COMPILERS:
+            compiled = CATEGORY_COMPILERS[category](business_rules[category])
+        else:
+            compiled = category_checks.get(category, {}).items()
+        for entity_type, check in compiled:
+            if check is not None:
+                plan.setdefault(entity_type, []).append((category, check))
+    
+    return {entity_type: tuple(checks) for entity_type, checks in plan.items()}
+
+
+def compile_business_rule_plan(
+        business_rules: Dict[str, Any],
+        category_checks: Optional[Dict[str, Dict[str, BusinessRuleCheck]]] = None
+) -> Dict[str, Tuple[BusinessRuleCheck, ...]]:
+    """
+    Compile business logic rules into the checks to run per entity type.
+    
+    Args:
+        business_rules: Parsed business logic rule configuration
+        category_checks: Additional categories backed by fixed checks,
+            category -> {entity_type: check}
+    
+    Returns:
+        Dictionary with entity_type -> checks in execution order; entity
+        types without applicable rules are absent
+    """
+    return {
+        entity_type: tuple(check for _, check in checks)
+        for entity_type, checks in compile_categorized_business_rule_plan(business_rules, category_checks).items()
+    }
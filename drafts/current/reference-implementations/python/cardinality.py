@@ -0,0 +1,180 @@
+"""
+BOOST Python Reference Implementation - Cardinality Constraints
+
+This module evaluates the cardinalityConstraints declared in
+cross_entity_validation.json over instance data. Each parent/child field
+pair is checked with one hash join: parent keys are hashed once, child
+foreign keys are grouped and counted, and only the distinct child keys are
+probed against the parents, so a constraint costs O(parents + children).
+"""
+
+import re
+from collections import Counter
+from operator import methodcaller
+from typing import Dict, Any, List, Optional, Tuple
+
+# Relationship kinds declared under cardinalityConstraints, in evaluation order
+CARDINALITY_KINDS = ('oneToMany', 'manyToOne')
+
+# Multiplicity notation used in reports, written parent side first
+CARDINALITY_NOTATION = {'oneToMany': '1:N', 'manyToOne': 'N:1'}
+
+
+def entity_type_key(entity_name: str) -> str:
+    """
+    Convert a schema entity name to its key in an entities dictionary.
+    
+    Args:
+        entity_name: Entity name as written in the rules, e.g. 'TraceableUnit'
+    
+    Returns:
+        Entity type key, e.g. 'traceable_unit'
+    """
+    result = re.sub('([A-Z]+)([A-Z][a-z])', r'\1_\2', entity_name)
+    result = re.sub('([a-z\\d])([A-Z])', r'\1_\2', result)
+    return result.lower()
+
+
+def cardinality_constraints(cross_entity_rules: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    List the parent/child field pairs declared in cardinalityConstraints.
+    
+    Args:
+        cross_entity_rules: Parsed cross_entity_validation.json
+    
+    Returns:
+        One dict per declared pair with 'kind', 'parentEntity', 'parentField',
+        'childEntity', 'childField' and 'description'
+    """
+    declared = (cross_entity_rules.get('properties', {})
+                .get('cardinalityConstraints', {}).get('properties', {}))
+    constraints = []
+    for kind in CARDINALITY_KINDS:
+        for pair in declared.get(kind, {}).get('default', []):
+            if all(pair.get(key) for key in ('parentEntity', 'parentField', 'childEntity', 'childField')):
+                constraints.append({
+                    'kind': kind,
+                    'parentEntity': pair['parentEntity'],
+                    'parentField': pair['parentField'],
+                    'childEntity': pair['childEntity'],
+                    'childField': pair['childField'],
+                    'description': pair.get('description', '')
+                })
+    return constraints
+
+
+def _count_keys(records: List[Dict[str, Any]], field_name: str) -> Counter:
+    """Count the non-null scalar values of a field across records."""
+    try:
+        # One C-level pass when every value is hashable, as in schema-valid data
+        counts = Counter(map(methodcaller('get', field_name), records))
+    except TypeError:
+        counts = Counter(record.get(field_name) for record in records
+                         if not isinstance(record.get(field_name), (list, dict)))
+    counts.pop(None, None)
+    return counts
+
+
+def _count_foreign_keys(children: List[Dict[str, Any]],
+                        child_field: str) -> Tuple[Counter, List[Tuple[int, List[Any]]]]:
+    """Count children per foreign key, collecting array-valued keys that name several parents."""
+    try:
+        counts = Counter(map(methodcaller('get', child_field), children))
+        counts.pop(None, None)
+        return counts, []
+    except TypeError:
+        pass
+    
+    counts = Counter()
+    multi_parent_children = []
+    for index, child in enumerate(children):
+        key = child.get(child_field)
+        if isinstance(key, list):
+            distinct = list(dict.fromkeys(item for item in key if not isinstance(item, (list, dict))))
+            if len(distinct) > 1:
+                multi_parent_children.append((index, distinct))
+                continue
+            key = distinct[0] if distinct else None
+        if key is not None and not isinstance(key, dict):
+            counts[key] += 1
+    return counts, multi_parent_children
+
+
+def join_cardinality(parents: Optional[List[Dict[str, Any]]], parent_field: str,
+                     children: List[Dict[str, Any]], child_field: str,
+                     parent_counts: Optional[Counter] = None) -> Dict[str, Any]:
+    """
+    Hash-join one parent/child field pair and count children per parent.
+    
+    Every child with a foreign key must reference exactly one parent, and
+    every parent key must identify exactly one parent record. Children
+    without the foreign key are not constrained.
+    
+    Args:
+        parents: Parent records, or None if the parent collection is absent
+            (orphans are then not checked, as in foreign key validation)
+        parent_field: Key field on the parent records
+        children: Child records
+        child_field: Foreign key field on the child records
+        parent_counts: Parent key counts already computed for the same
+            parents and parent_field, to share between constraints
+    
+    Returns:
+        Dictionary with 'parent_count', 'child_count' (children with a
+        foreign key), 'child_counts' (parent key -> number of children),
+        'duplicate_parents' (parent key -> number of records sharing it),
+        'multi_parent_children' ((child index, parent keys) pairs) and
+        'orphans' (missing parent key -> number of children, None when
+        parents is None)
+    """
+    if parent_counts is None:
+        parent_counts = _count_keys(parents, parent_field) if parents is not None else Counter()
+    child_counts, multi_parent_children = _count_foreign_keys(children, child_field)
+    
+    return {
+        'parent_count': sum(parent_counts.values()),
+        'child_count': sum(child_counts.values()) + len(multi_parent_children),
+        'child_counts': child_counts,
+        'duplicate_parents': {key: count for key, count in parent_counts.items() if count > 1},
+        'multi_parent_children': multi_parent_children,
+        'orphans': ({key: count for key, count in child_counts.items() if key not in parent_counts}
+                    if parents is not None else None)
+    }
+
+
+def evaluate_cardinality(entities: Dict[str, List[Dict[str, Any]]],
+                         cross_entity_rules: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Check entity data against the cardinalityConstraints.
+    
+    Args:
+        entities: Dictionary with entity_type -> list of entities
+        cross_entity_rules: Parsed cross_entity_validation.json
+    
+    Returns:
+        One report per constraint whose parent or child collection is
+        present: the constraint fields, 'notation' ('1:N' or 'N:1') and the
+        join_cardinality() results
+    """
+    reports = []
+    # Parent keys hashed once per (entity, field), however many constraints share them
+    parent_key_counts: Dict[Tuple[str, str], Counter] = {}
+    for constraint in cardinality_constraints(cross_entity_rules):
+        parent_type = entity_type_key(constraint['parentEntity'])
+        parents = entities.get(parent_type)
+        children = entities.get(entity_type_key(constraint['childEntity']))
+        if parents is None and children is None:
+            continue
+        
+        parent_counts = None
+        if parents is not None:
+            cache_key = (parent_type, constraint['parentField'])
+            if cache_key not in parent_key_counts:
+                parent_key_counts[cache_key] = _count_keys(parents, constraint['parentField'])
+            parent_counts = parent_key_counts[cache_key]
+        
+        report = dict(constraint, notation=CARDINALITY_NOTATION[constraint['kind']])
+        report.update(join_cardinality(parents, constraint['parentField'], children or [],
+                                       constraint['childField'], parent_counts))
+        reports.append(report)
+    return reports
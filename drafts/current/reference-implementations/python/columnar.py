@@ -0,0 +1,440 @@
+"""
+BOOST Python Reference Implementation - Columnar Import/Export
+
+This module stores the entities of each type in their own Apache Parquet
+or Arrow IPC table, with the column types derived from the entity's JSON
+schema: strings, numbers, integers and booleans map to Arrow scalars,
+arrays to list columns and objects with declared properties to struct
+columns. Values a derived column cannot hold (free-form objects, objects
+with undeclared keys, mismatched types) are stored as JSON text instead.
+Tables are read back lazily, one column at a time, and validate_columnar()
+checks entities straight from those columns without building Pydantic
+models.
+
+Requires pyarrow, which is an optional dependency.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pc = pq = None
+    PYARROW_AVAILABLE = False
+
+# Table file suffix per format
+COLUMNAR_FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+# Rows per Parquet row group / Arrow record batch, and per batch read back
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+# Schema metadata keys of a BOOST table
+_ENTITY_TYPE_KEY = b'boost.entity_type'
+_CONTEXT_KEY = b'boost.context'
+_JSON_COLUMNS_KEY = b'boost.json_columns'
+
+_SCALAR_TYPES = {
+    'string': lambda: pa.string(),
+    'number': lambda: pa.float64(),
+    'integer': lambda: pa.int64(),
+    'boolean': lambda: pa.bool_()
+}
+
+PathLike = Union[str, Path]
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for columnar import/export")
+
+
+def arrow_type_for(field_schema: Dict[str, Any]) -> Optional['pa.DataType']:
+    """
+    Derive the Arrow type of a JSON schema field.
+    
+    Args:
+        field_schema: JSON schema of the field
+    
+    Returns:
+        Arrow type, or None when the field is stored as JSON text
+        (free-form objects, unions, unknown types)
+    """
+    _require_pyarrow()
+    schema_type = field_schema.get('type')
+    if isinstance(schema_type, list):
+        types = [t for t in schema_type if t != 'null']
+        schema_type = types[0] if len(types) == 1 else None
+    elif schema_type is None:
+        # Untyped const/enum fields such as '@type'
+        values = field_schema.get('enum', [field_schema['const']] if 'const' in field_schema else [])
+        if values and all(isinstance(value, str) for value in values):
+            schema_type = 'string'
+    
+    if schema_type in _SCALAR_TYPES:
+        return _SCALAR_TYPES[schema_type]()
+    if schema_type == 'array':
+        items = field_schema.get('items')
+        item_type = arrow_type_for(items) if isinstance(items, dict) else None
+        return pa.list_(item_type) if item_type is not None else None
+    if schema_type == 'object' and field_schema.get('properties'):
+        fields = []
+        for name, property_schema in field_schema['properties'].items():
+            property_type = arrow_type_for(property_schema)
+            if property_type is None:
+                return None
+            fields.append(pa.field(name, property_type))
+        return pa.struct(fields)
+    return None
+
+
+def _fits(value: Any, field_schema: Dict[str, Any]) -> bool:
+    """Check that a value has no object keys its schema does not declare, at any depth."""
+    if isinstance(value, dict):
+        properties = field_schema.get('properties') or {}
+        return all(key in properties and (item is None or _fits(item, properties[key]))
+                   for key, item in value.items())
+    if isinstance(value, list):
+        items = field_schema.get('items')
+        return not isinstance(items, dict) or all(item is None or _fits(item, items) for item in value)
+    return True
+
+
+def _has_struct(arrow_type: 'pa.DataType') -> bool:
+    """Check whether a column type holds struct values, at any depth."""
+    if pa.types.is_struct(arrow_type):
+        return True
+    if pa.types.is_list(arrow_type):
+        return _has_struct(arrow_type.value_type)
+    return False
+
+
+def _drop_nulls(value: Any) -> Any:
+    """Remove the null fields a struct column fills in for absent object keys."""
+    if isinstance(value, dict):
+        return {key: _drop_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_drop_nulls(item) for item in value]
+    return value
+
+
+def write_entity_table(records: Iterable[Dict[str, Any]], path: PathLike, entity_type: str,
+                       schema_loader: Any, format: str = 'parquet',
+                       row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> int:
+    """
+    Write the entities of one type to a Parquet or Arrow IPC table.
+    
+    Columns follow the order of the schema properties, followed by any
+    fields the records carry that the schema does not declare. A JSON-LD
+    @context shared by every record is kept once in the table metadata
+    rather than per row.
+    
+    Args:
+        records: Entities of the type with JSON-LD field names (e.g. model_dump(by_alias=True, mode='json'))
+        path: Table file to write
+        entity_type: Schema entity type (e.g. 'traceable_unit')
+        schema_loader: SchemaLoader providing the entity's JSON schema
+        format: 'parquet' or 'arrow' (Arrow IPC file, memory-mapped when read)
+        row_group_size: Rows per Parquet row group or Arrow record batch
+    
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format '{format}'. Available: {list(COLUMNAR_FORMATS)}")
+    
+    properties = (schema_loader.get_schema(entity_type) or {}).get('properties', {})
+    records = list(records)
+    context = records[0].get('@context') if records else None
+    shared_context = bool(records) and all(record.get('@context') == context for record in records)
+    if not shared_context:
+        context = None
+    
+    names = [name for name in properties if name != '@context' or not shared_context]
+    seen = set(names)
+    present = set()
+    for record in records:
+        present.update(record)
+        for name in record:
+            if name not in seen and (name != '@context' or not shared_context):
+                names.append(name)
+                seen.add(name)
+    
+    fields = []
+    arrays = []
+    json_columns = []
+    for name in names:
+        field_schema = properties.get(name)
+        arrow_type = arrow_type_for(field_schema) if field_schema is not None else None
+        if name not in present:
+            # Declared but unused fields cost one all-null column
+            array = pa.nulls(len(records), type=arrow_type or pa.string())
+            if arrow_type is None:
+                json_columns.append(name)
+            fields.append(pa.field(name, array.type))
+            arrays.append(array)
+            continue
+        
+        values = [record.get(name) for record in records]
+        array = None
+        if arrow_type is not None and (not _has_struct(arrow_type) or
+                                       all(value is None or _fits(value, field_schema) for value in values)):
+            try:
+                array = pa.array(values, type=arrow_type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                array = None
+        if array is None:
+            json_columns.append(name)
+            array = pa.array([None if value is None else json.dumps(value) for value in values], type=pa.string())
+        fields.append(pa.field(name, array.type))
+        arrays.append(array)
+    
+    metadata = {
+        _ENTITY_TYPE_KEY: entity_type.encode(),
+        _CONTEXT_KEY: json.dumps(context).encode(),
+        _JSON_COLUMNS_KEY: json.dumps(json_columns).encode()
+    }
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+    if format == 'parquet':
+        pq.write_table(table, str(path), row_group_size=row_group_size)
+    else:
+        with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=row_group_size)
+    return table.num_rows
+
+
+class ColumnarTable:
+    """One entity type's table, read lazily one column at a time."""
+    
+    def __init__(self, path: PathLike):
+        """
+        Open a table written by write_entity_table(); only its metadata is read.
+        
+        Args:
+            path: '.parquet' or '.arrow' table file
+        """
+        _require_pyarrow()
+        self.path = Path(path)
+        self._parquet = None
+        self._ipc = None
+        if self.path.suffix == COLUMNAR_FORMATS['parquet']:
+            self._parquet = pq.ParquetFile(str(self.path))
+            self.schema = self._parquet.schema_arrow
+            self.num_rows = self._parquet.metadata.num_rows
+        else:
+            # Memory-mapped; columns are sliced from the file without copying
+            self._ipc = pa.ipc.open_file(pa.memory_map(str(self.path), 'r'))
+            self.schema = self._ipc.schema
+            self.num_rows = sum(self._ipc.get_batch(i).num_rows for i in range(self._ipc.num_record_batches))
+        
+        metadata = self.schema.metadata or {}
+        if _ENTITY_TYPE_KEY not in metadata:
+            raise ValueError(f"{self.path} is not a BOOST entity table")
+        self.entity_type = metadata[_ENTITY_TYPE_KEY].decode()
+        self.context = json.loads(metadata.get(_CONTEXT_KEY, b'null'))
+        self.json_columns = set(json.loads(metadata.get(_JSON_COLUMNS_KEY, b'[]')))
+        self._columns: Dict[str, Any] = {}
+    
+    @property
+    def column_names(self) -> List[str]:
+        """Column names in table order."""
+        return list(self.schema.names)
+    
+    def column(self, name: str) -> 'pa.ChunkedArray':
+        """
+        Read one column, keeping it for later calls.
+        
+        JSON text columns are returned as stored; use values() to decode them.
+        
+        Raises:
+            KeyError: If the table has no such column
+        """
+        if name not in self._columns:
+            if name not in self.schema.names:
+                raise KeyError(f"{self.entity_type} table has no column '{name}'")
+            if self._parquet is not None:
+                column = self._parquet.read(columns=[name]).column(0)
+            else:
+                index = self.schema.get_field_index(name)
+                column = pa.chunked_array(
+                    [self._ipc.get_batch(i).column(index) for i in range(self._ipc.num_record_batches)],
+                    type=self.schema.field(index).type
+                )
+            self._columns[name] = column
+        return self._columns[name]
+    
+    def values(self, name: str) -> List[Any]:
+        """Read one column as Python values, decoding JSON text columns."""
+        return self._decode(name, self.column(name).to_pylist())
+    
+    def _decode(self, name: str, values: List[Any]) -> List[Any]:
+        if name in self.json_columns:
+            return [None if value is None else json.loads(value) for value in values]
+        if pa.types.is_nested(self.schema.field(name).type):
+            return [_drop_nulls(value) for value in values]
+        return values
+    
+    def iter_records(self, batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the rows as entity records with JSON-LD field names.
+        
+        Null columns are left out of the records and the table's @context is
+        restored, so records match what was written.
+        
+        Args:
+            batch_size: Rows decoded at a time
+        
+        Yields:
+            Entity records
+        """
+        if self._parquet is not None:
+            batches = self._parquet.iter_batches(batch_size=batch_size)
+        else:
+            batches = (self._ipc.get_batch(i) for i in range(self._ipc.num_record_batches))
+        
+        for batch in batches:
+            columns = [(name, self._decode(name, batch.column(index).to_pylist()))
+                       for index, name in enumerate(batch.schema.names)
+                       if batch.column(index).null_count < batch.num_rows]
+            for row in range(batch.num_rows):
+                record = {'@context': self.context} if self.context is not None else {}
+                for name, values in columns:
+                    if values[row] is not None:
+                        record[name] = values[row]
+                yield record
+    
+    def __len__(self) -> int:
+        return self.num_rows
+
+
+class ColumnarDataset:
+    """The entity tables written to one directory, opened as they are first used."""
+    
+    def __init__(self, directory: PathLike):
+        """
+        Find the entity tables in a directory.
+        
+        Args:
+            directory: Directory holding '<entity_type>.parquet' or '<entity_type>.arrow' files
+        """
+        _require_pyarrow()
+        self.directory = Path(directory)
+        suffixes = set(COLUMNAR_FORMATS.values())
+        self._paths = {
+            path.stem: path for path in sorted(self.directory.iterdir())
+            if path.suffix in suffixes and path.is_file()
+        }
+        self._tables: Dict[str, ColumnarTable] = {}
+    
+    @property
+    def entity_types(self) -> List[str]:
+        """Entity types with a table in the directory."""
+        return list(self._paths)
+    
+    def table(self, entity_type: str) -> Optional[ColumnarTable]:
+        """Get the table of an entity type, or None if there is none."""
+        if entity_type not in self._tables:
+            if entity_type not in self._paths:
+                return None
+            self._tables[entity_type] = ColumnarTable(self._paths[entity_type])
+        return self._tables[entity_type]
+    
+    def __iter__(self) -> Iterator[ColumnarTable]:
+        for entity_type in self._paths:
+            yield self.table(entity_type)
+
+
+def _flat_values(column: 'pa.ChunkedArray') -> 'pa.ChunkedArray':
+    """Flatten list columns down to their scalar items."""
+    while pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+        column = pc.list_flatten(column)
+    return column
+
+
+def _value_counts(column: 'pa.ChunkedArray') -> List[Tuple[Any, int]]:
+    counts = pc.value_counts(column.drop_null())
+    return [(item['values'], item['counts']) for item in counts.to_pylist() if item['values'] is not None]
+
+
+def validate_columnar(dataset: ColumnarDataset, schema_loader: Any) -> Tuple[bool, List[str]]:
+    """
+    Validate entity tables column by column, without building Pydantic models.
+    
+    Checks required fields, enum values, numeric minimum/maximum, unique
+    primary keys, and foreign keys between the tables in the dataset.
+    Each problem is reported once per column and value with the number of
+    records affected.
+    
+    Args:
+        dataset: Entity tables to validate
+        schema_loader: SchemaLoader providing the entity schemas and relationships
+    
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    errors = []
+    primary_keys: Dict[str, Any] = {}
+    
+    for table in dataset:
+        entity_type = table.entity_type
+        schema = schema_loader.get_schema(entity_type) or {}
+        properties = schema.get('properties', {})
+        
+        for field_name in schema.get('required', []):
+            if field_name == '@context':
+                continue
+            missing = table.num_rows if field_name not in table.column_names else table.column(field_name).null_count
+            if missing:
+                errors.append(f"Missing required field '{field_name}' in {missing} {entity_type} records")
+        
+        for field_name, field_schema in properties.items():
+            if field_name not in table.column_names or field_name in table.json_columns:
+                continue
+            constraints = field_schema.get('items', field_schema) if field_schema.get('type') == 'array' else field_schema
+            if not isinstance(constraints, dict):
+                continue
+            if 'enum' in constraints:
+                valid = set(constraints['enum'])
+                for value, count in _value_counts(_flat_values(table.column(field_name))):
+                    if value not in valid:
+                        errors.append(f"Invalid enum value '{value}' for field '{field_name}' in {count} "
+                                      f"{entity_type} records. Valid values: {constraints['enum']}")
+            column = _flat_values(table.column(field_name))
+            if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+                continue
+            for keyword, compare, relation in (('minimum', pc.less, 'below minimum'),
+                                               ('maximum', pc.greater, 'above maximum')):
+                if keyword in constraints:
+                    count = pc.sum(compare(column, constraints[keyword])).as_py() or 0
+                    if count:
+                        errors.append(f"Field '{field_name}' {relation} {constraints[keyword]} in {count} "
+                                      f"{entity_type} records")
+        
+        primary_key = schema_loader.get_primary_key(entity_type)
+        if primary_key and primary_key in table.column_names:
+            keys = table.column(primary_key)
+            primary_keys[entity_type] = keys
+            for value, count in _value_counts(keys):
+                if count > 1:
+                    errors.append(f"Duplicate {entity_type}.{primary_key} '{value}' in {count} records")
+    
+    for table in dataset:
+        for relationship in schema_loader.get_relationships(table.entity_type):
+            field_name = relationship.get('field')
+            target_type = schema_loader.get_entity_type_for_jsonld(relationship.get('targetEntity', ''))
+            if (field_name not in table.column_names or field_name in table.json_columns
+                    or target_type not in primary_keys):
+                continue
+            references = _flat_values(table.column(field_name))
+            known = pc.is_in(references, value_set=primary_keys[target_type].combine_chunks())
+            unresolved = pc.filter(references, pc.invert(known))
+            for value, count in _value_counts(unresolved):
+                errors.append(f"Foreign key violation: {table.entity_type}.{field_name} references "
+                              f"non-existent {target_type}: {value} ({count} records)")
+    
+    return len(errors) == 0, errors
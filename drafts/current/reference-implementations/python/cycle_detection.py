@@ -0,0 +1,384 @@
+"""
+BOOST Python Reference Implementation - Cycle Detection
+
+This module enforces the circularReferenceRules declared in
+cross_entity_validation.json over instance data. Entity IDs are interned
+to integers and the reference graph is stored as compressed adjacency
+arrays; acyclic parts are peeled off with Kahn's algorithm and the rest is
+split into strongly connected components with an iterative Tarjan search,
+so detection is linear in the number of references and never recurses.
+"""
+
+from array import array
+from itertools import accumulate
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable, Iterator
+
+# Longest cycle spelled out in full in an error message
+MAX_REPORTED_CYCLE_LENGTH = 20
+
+
+class ReferenceGraph:
+    """Directed graph over entity IDs, interned to integers in first-seen order."""
+    
+    def __init__(self):
+        """Initialize an empty graph."""
+        # entity ID -> node index; dict order is node order
+        self._node_index: Dict[str, int] = {}
+        self._node_ids: List[str] = []
+        self.sources = array('q')
+        self.targets = array('q')
+        self.edge_labels: List[Optional[str]] = []
+    
+    @property
+    def node_ids(self) -> List[str]:
+        """Entity ID of each node index."""
+        if len(self._node_ids) != len(self._node_index):
+            self._node_ids = list(self._node_index)
+        return self._node_ids
+    
+    def node(self, node_id: str) -> int:
+        """Get the integer index of an entity ID, adding it on first use."""
+        return self._node_index.setdefault(node_id, len(self._node_index))
+    
+    def find_node(self, node_id: str) -> Optional[int]:
+        """Get the integer index of an entity ID, or None if no edge mentions it."""
+        return self._node_index.get(node_id)
+    
+    def add_edge(self, source_id: str, target_id: str, label: Optional[str] = None):
+        """
+        Add a reference from one entity ID to another.
+        
+        Args:
+            source_id: Referencing side (e.g. a parent TRU, or a processing input)
+            target_id: Referenced side (e.g. a child TRU, or a processing output)
+            label: ID of the entity that declares the reference (optional)
+        """
+        self.add_edges([(source_id, target_id, label)])
+    
+    def add_edges(self, edges: Iterable[Tuple[str, str, Optional[str]]]):
+        """
+        Add references in bulk.
+        
+        Args:
+            edges: (source ID, target ID, label) triples, as for add_edge()
+        """
+        node_index = self._node_index
+        intern = node_index.setdefault
+        add_source = self.sources.append
+        add_target = self.targets.append
+        add_label = self.edge_labels.append
+        for source_id, target_id, label in edges:
+            add_source(intern(source_id, len(node_index)))
+            add_target(intern(target_id, len(node_index)))
+            add_label(label)
+    
+    def find_cycles(self) -> List[List[int]]:
+        """
+        Find one cycle in every strongly connected component that has one.
+        
+        Returns:
+            Cycles as lists of edge indexes, each starting at its earliest-added node
+        """
+        return find_cycles(len(self._node_index), self.sources, self.targets)
+    
+    def describe_cycle(self, cycle: List[int]) -> str:
+        """Render a cycle as 'A -> B -> A', naming edge labels when present."""
+        steps = [self.node_ids[self.sources[cycle[0]]]]
+        for edge in cycle[:MAX_REPORTED_CYCLE_LENGTH]:
+            label = self.edge_labels[edge]
+            arrow = f" -[{label}]-> " if label else " -> "
+            steps.append(arrow + self.node_ids[self.targets[edge]])
+        if len(cycle) > MAX_REPORTED_CYCLE_LENGTH:
+            steps.append(f" -> ... ({len(cycle)} references in cycle)")
+        return ''.join(steps)
+
+
+def find_cycles(num_nodes: int, sources: array, targets: array) -> List[List[int]]:
+    """
+    Find one cycle in every strongly connected component of a directed graph.
+    
+    Args:
+        num_nodes: Number of nodes, numbered 0..num_nodes-1
+        sources: Source node of each edge
+        targets: Target node of each edge
+    
+    Returns:
+        Cycles as lists of edge indexes, in order of their earliest node
+    """
+    parent_edges = _single_parent_edges(num_nodes, sources, targets)
+    if parent_edges is not None:
+        cycles = _find_parent_pointer_cycles(num_nodes, sources, parent_edges)
+    else:
+        cycles = _find_component_cycles(num_nodes, sources, targets)
+    cycles = [_rotate_to_earliest_node(cycle, sources) for cycle in cycles]
+    cycles.sort(key=lambda cycle: sources[cycle[0]])
+    return cycles
+
+
+def _rotate_to_earliest_node(cycle: List[int], sources: array) -> List[int]:
+    """Start a cycle at its earliest-added node."""
+    first = min(range(len(cycle)), key=lambda i: sources[cycle[i]])
+    return cycle[first:] + cycle[:first]
+
+
+def _single_parent_edges(num_nodes: int, sources: array, targets: array) -> Optional[array]:
+    """
+    Get each node's incoming edge if no node is referenced from two different nodes.
+    
+    Repeated references between the same pair of nodes (e.g. a parent link
+    declared from both the child and the parent) count once.
+    
+    Returns:
+        Incoming edge index per node (-1 for none), or None if some node has several sources
+    """
+    parent_edges = array('q', [-1]) * num_nodes
+    for edge, (source, target) in enumerate(zip(sources, targets)):
+        parent_edge = parent_edges[target]
+        if parent_edge == -1:
+            parent_edges[target] = edge
+        elif sources[parent_edge] != source:
+            return None
+    return parent_edges
+
+
+def _find_parent_pointer_cycles(num_nodes: int, sources: array, parent_edges: array) -> List[List[int]]:
+    """
+    Find cycles when every node has at most one incoming edge.
+    
+    Each walk follows parent pointers from an unvisited node, stamping the
+    nodes it passes with its start node, and stops at the first stamped
+    node; a cycle exists exactly when that node carries the walk's own stamp.
+    """
+    walk = array('q', [-1]) * num_nodes
+    cycles = []
+    for start in range(num_nodes):
+        if walk[start] != -1:
+            continue
+        node = start
+        while walk[node] == -1:
+            walk[node] = start
+            parent_edge = parent_edges[node]
+            if parent_edge == -1:
+                break
+            node = sources[parent_edge]
+        else:
+            if walk[node] == start:
+                cycle = []
+                cycle_node = node
+                while True:
+                    parent_edge = parent_edges[cycle_node]
+                    cycle.append(parent_edge)
+                    cycle_node = sources[parent_edge]
+                    if cycle_node == node:
+                        break
+                cycle.reverse()
+                cycles.append(cycle)
+    return cycles
+
+
+def compressed_adjacency(num_nodes: int, sources: array, targets: array) -> Tuple[array, array, array]:
+    """
+    Counting-sort edges by source into compressed sparse row arrays.
+    
+    Args:
+        num_nodes: Number of nodes, numbered 0..num_nodes-1
+        sources: Source node of each edge
+        targets: Target node of each edge
+    
+    Returns:
+        (offsets, adjacent, edge_order): the targets of node n are
+        adjacent[offsets[n]:offsets[n + 1]], and edge_order gives the edge
+        index of each adjacent slot; edges keep their insertion order per node
+    """
+    counts = array('q', bytes(8 * num_nodes))
+    for source in sources:
+        counts[source] += 1
+    offsets = array('q', accumulate(counts, initial=0))
+    position = offsets[:-1]
+    adjacent = array('q', bytes(8 * len(sources)))
+    edge_order = array('q', bytes(8 * len(sources)))
+    for edge, (source, target) in enumerate(zip(sources, targets)):
+        slot = position[source]
+        adjacent[slot] = target
+        edge_order[slot] = edge
+        position[source] = slot + 1
+    return offsets, adjacent, edge_order
+
+
+def _find_component_cycles(num_nodes: int, sources: array, targets: array) -> List[List[int]]:
+    """Find one cycle per strongly connected component of a general directed graph."""
+    offsets, adjacent, edge_order = compressed_adjacency(num_nodes, sources, targets)
+    
+    # Kahn: repeatedly drop nodes without incoming edges; what remains lies on or behind a cycle
+    in_degree = array('q', bytes(8 * num_nodes))
+    for target in targets:
+        in_degree[target] += 1
+    queue = [node for node, degree in enumerate(in_degree) if not degree]
+    for node in queue:
+        for target in adjacent[offsets[node]:offsets[node + 1]]:
+            degree = in_degree[target] - 1
+            in_degree[target] = degree
+            if not degree:
+                queue.append(target)
+    if len(queue) == num_nodes:
+        return []
+    
+    # Iterative Tarjan over the remaining nodes
+    unvisited = -1
+    index = array('q', [unvisited]) * num_nodes
+    lowlink = array('q', bytes(8 * num_nodes))
+    component = array('q', [unvisited]) * num_nodes
+    on_stack = bytearray(num_nodes)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    
+    for root in range(num_nodes):
+        if in_degree[root] == 0 or index[root] != unvisited:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [[root, offsets[root]]]
+        
+        while work:
+            frame = work[-1]
+            node, slot = frame
+            if slot < offsets[node + 1]:
+                frame[1] = slot + 1
+                target = adjacent[slot]
+                if in_degree[target] == 0:
+                    continue
+                if index[target] == unvisited:
+                    index[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work.append([target, offsets[target]])
+                elif on_stack[target] and index[target] < lowlink[node]:
+                    lowlink[node] = index[target]
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index[node]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component[member] = len(components)
+                    members.append(member)
+                    if member == node:
+                        break
+                components.append(members)
+    
+    # Walk edges inside each component until a node repeats
+    cycles = []
+    for component_id, members in enumerate(components):
+        path: List[int] = []
+        seen: Dict[int, int] = {}
+        node = min(members)
+        while node not in seen:
+            seen[node] = len(path)
+            for slot in range(offsets[node], offsets[node + 1]):
+                if component[adjacent[slot]] == component_id:
+                    path.append(edge_order[slot])
+                    node = adjacent[slot]
+                    break
+            else:
+                break  # single node without a self-reference
+        else:
+            cycles.append(path[seen[node]:])
+    return cycles
+
+
+def _traceable_unit_edges(entities: Dict[str, List[Dict[str, Any]]]) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Parent -> child references declared by TraceableUnits from either side."""
+    for tru in entities.get('traceable_unit', []):
+        tru_id = tru.get('traceableUnitId')
+        if not tru_id or not isinstance(tru_id, str):
+            continue
+        parent_id = tru.get('parentTraceableUnitId')
+        if parent_id and isinstance(parent_id, str):
+            yield parent_id, tru_id, None
+        child_ids = tru.get('childTraceableUnitIds')
+        if isinstance(child_ids, list):
+            for child_id in child_ids:
+                if child_id and isinstance(child_id, str):
+                    yield tru_id, child_id, None
+
+
+def _material_processing_edges(entities: Dict[str, List[Dict[str, Any]]]) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Input TRU -> output TRU references, labelled with the processing ID."""
+    for processing in entities.get('material_processing', []):
+        input_id = processing.get('inputTraceableUnitId')
+        output_id = processing.get('outputTraceableUnitId')
+        # Malformed (non-string) IDs are left to schema validation
+        if input_id and output_id and isinstance(input_id, str) and isinstance(output_id, str):
+            yield input_id, output_id, processing.get('processingId')
+
+
+# Reference graph builders for circularReferenceRules: (entity, rule) -> edges
+CYCLE_RULE_EDGES: Dict[Tuple[str, str], Callable[[Dict[str, List[Dict[str, Any]]]], Iterator]] = {
+    ('TraceableUnit', 'parentChildCycles'): _traceable_unit_edges,
+    ('MaterialProcessing', 'processingChainCycles'): _material_processing_edges
+}
+
+
+def enabled_cycle_rules(cross_entity_rules: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """
+    List the no_cycles rules of cross_entity_validation.json that can be checked on instance data.
+    
+    Args:
+        cross_entity_rules: Parsed cross_entity_validation.json
+    
+    Returns:
+        (entity, rule name, description) for each enforceable rule
+    """
+    circular_rules = (cross_entity_rules.get('properties', {})
+                      .get('circularReferenceRules', {}).get('properties', {}))
+    rules = []
+    for entity_name, entity_rules in circular_rules.items():
+        for rule_name, rule in entity_rules.get('properties', {}).items():
+            rule_properties = rule.get('properties', {})
+            if rule_properties.get('rule', {}).get('const') != 'no_cycles':
+                continue
+            if (entity_name, rule_name) in CYCLE_RULE_EDGES:
+                rules.append((entity_name, rule_name, rule_properties.get('description', '')))
+    return rules
+
+
+def detect_circular_references(entities: Dict[str, List[Dict[str, Any]]],
+                               cross_entity_rules: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Check entity data against the circularReferenceRules.
+    
+    Args:
+        entities: Dictionary with entity_type -> list of entities
+        cross_entity_rules: Parsed cross_entity_validation.json
+    
+    Returns:
+        One violation per offending cycle, with 'entity', 'rule', 'ids' (the
+        entity IDs around the cycle), 'labels' (declaring entity IDs, if any)
+        and a readable 'cycle'
+    """
+    violations = []
+    for entity_name, rule_name, description in enabled_cycle_rules(cross_entity_rules):
+        graph = ReferenceGraph()
+        graph.add_edges(CYCLE_RULE_EDGES[(entity_name, rule_name)](entities))
+        
+        node_ids = graph.node_ids
+        for cycle in graph.find_cycles():
+            violations.append({
+                'entity': entity_name,
+                'rule': rule_name,
+                'description': description,
+                'ids': [node_ids[graph.sources[edge]] for edge in cycle],
+                'labels': [graph.edge_labels[edge] for edge in cycle],
+                'cycle': graph.describe_cycle(cycle)
+            })
+    return violations
@@ -13,9 +13,9 @@ from enum import Enum
 from pathlib import Path
 
 try:
-    from .schema_loader import SchemaLoader
+    from .schema_loader import get_shared_loader
 except ImportError:
-    from schema_loader import SchemaLoader
+    from schema_loader import get_shared_loader
 
 
 class DynamicModels:
@@ -28,9 +28,7 @@ class DynamicModels:
         Args:
             schema_path: Path to BOOST schema directory
         """
-        self.schema_loader = SchemaLoader(schema_path)
-        self._models_cache = {}
-        self._enums_cache = {}
+        self.schema_loader = get_shared_loader(schema_path)
     
     def get_model(self, entity_name: str) -> Type[BaseModel]:
         """
@@ -45,15 +43,11 @@ class DynamicModels:
         Raises:
             ValueError: If entity not found in schemas
         """
-        if entity_name in self._models_cache:
-            return self._models_cache[entity_name]
-        
-        if entity_name in self.schema_loader.dynamic_models:
-            model = self.schema_loader.dynamic_models[entity_name]
-            self._models_cache[entity_name] = model
+        model = self.schema_loader.get_model(entity_name)
+        if model is not None:
             return model
         
-        raise ValueError(f"Entity '{entity_name}' not found in schemas. Available entities: {list(self.schema_loader.schemas.keys())}")
+        raise ValueError(f"Entity '{entity_name}' not found in schemas. Available entities: {self.schema_loader.get_all_entity_types()}")
     
     def get_enum(self, entity_name: str, field_name: str) -> Type[Enum]:
         """
@@ -69,17 +63,11 @@ class DynamicModels:
         Raises:
             ValueError: If enum not found
         """
-        enum_key = f"{entity_name}.{field_name}"
-        
-        if enum_key in self._enums_cache:
-            return self._enums_cache[enum_key]
-        
-        if enum_key in self.schema_loader.enums:
-            enum_class = self.schema_loader.enums[enum_key]
-            self._enums_cache[enum_key] = enum_class
+        enum_class = self.schema_loader.get_enum(entity_name, field_name)
+        if enum_class is not None:
             return enum_class
         
-        raise ValueError(f"Enum '{enum_key}' not found in schemas")
+        raise ValueError(f"Enum '{entity_name}.{field_name}' not found in schemas")
     
     def get_enum_values(self, entity_name: str, field_name: str) -> List[str]:
         """
@@ -96,11 +84,11 @@ class DynamicModels:
     
     def list_entities(self) -> List[str]:
         """List all available entity names."""
-        return list(self.schema_loader.schemas.keys())
+        return self.schema_loader.get_all_entity_types()
     
     def list_enums(self) -> List[str]:
         """List all available enum keys (entity.field format)."""
-        return list(self.schema_loader.enums.keys())
+        return list(self.schema_loader.get_all_enums().keys())
     
     def validate_entity_data(self, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
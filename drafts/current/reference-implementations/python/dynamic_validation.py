@@ -5,31 +5,52 @@ This module provides schema-driven validation utilities that automatically
 adapt to schema changes without requiring code modifications.
 """
 
-import json
-import re
+import bisect
+import heapq
+import os
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple, Type
-from pathlib import Path
-import jsonschema
-from jsonschema import validate, ValidationError
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from jsonschema.exceptions import best_match
 
 try:
     from .schema_loader import SchemaLoader
+    from .cycle_detection import detect_circular_references
+    from .cardinality import evaluate_cardinality
+    from .business_rules import BusinessRuleCheck, compile_categorized_business_rule_plan
+    from .instrumentation import ValidationStats, StatsHook, ALL_ENTITY_TYPES, business_rule_phase
+    from .temporal import TimestampColumn, parse_timestamp, compare_joined, adjacent_before, dates_before, MISSING, AWARE, NAIVE, INVALID
 except ImportError:
     from schema_loader import SchemaLoader
+    from cycle_detection import detect_circular_references
+    from cardinality import evaluate_cardinality
+    from business_rules import BusinessRuleCheck, compile_categorized_business_rule_plan
+    from instrumentation import ValidationStats, StatsHook, ALL_ENTITY_TYPES, business_rule_phase
+    from temporal import TimestampColumn, parse_timestamp, compare_joined, adjacent_before, dates_before, MISSING, AWARE, NAIVE, INVALID
+
+
+def _json_pointer(path: Iterable[Any]) -> str:
+    """Format a jsonschema error path as an RFC 6901 JSON pointer."""
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in path)
 
 
 class DynamicBOOSTValidator:
     """Schema-driven validator that adapts to schema changes automatically."""
     
-    def __init__(self, schema_loader: Optional[SchemaLoader] = None, schema_path: Optional[str] = None):
+    def __init__(self, schema_loader: Optional[SchemaLoader] = None, schema_path: Optional[str] = None,
+                 stats_hook: Optional[StatsHook] = None):
         """
         Initialize dynamic validator.
         
         Args:
             schema_loader: Pre-configured schema loader
             schema_path: Path to schema directory (if schema_loader not provided)
+            stats_hook: Called with ('comprehensive_validation', stats) after every
+                comprehensive validation, e.g. to feed a metrics collector
         """
+        self.stats_hook = stats_hook
+        
         if schema_loader is not None:
             self.schema_loader = schema_loader
         else:
@@ -38,6 +59,11 @@ class DynamicBOOSTValidator:
             except ImportError:
                 from schema_loader import create_schema_loader
             self.schema_loader = create_schema_loader(schema_path)
+        
+        # Business rules compiled per entity type, rebuilt when the loader's rules change
+        self._business_rule_source: Optional[Dict[str, Any]] = None
+        self._business_rule_plan: Dict[str, Tuple[BusinessRuleCheck, ...]] = {}
+        self._categorized_business_rule_plan: Dict[str, Tuple[Tuple[str, BusinessRuleCheck], ...]] = {}
     
     def validate_entity(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -54,14 +80,89 @@ class DynamicBOOSTValidator:
         if not schema:
             return False, [f"Unknown entity type: {entity_type}"]
         
+        validator = self.schema_loader.get_validator(entity_type)
+        if validator is None:
+            return False, [f"Validation error: no valid schema validator for {entity_type}"]
+        
         try:
-            validate(instance=entity_data, schema=schema)
-            return True, []
-        except ValidationError as e:
-            return False, [str(e)]
+            error = best_match(validator.iter_errors(entity_data))
+            if error is None:
+                return True, []
+            return False, [str(error)]
         except Exception as e:
             return False, [f"Validation error: {str(e)}"]
     
+    def validate_many(self, entity_type: str, entities: Iterable[Dict[str, Any]],
+                      errors_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Validate a stream of entities of one type, reporting every error per record.
+        
+        Records are pulled from the iterable one at a time and results are
+        yielded as they are produced, so a generator over millions of rows
+        validates in constant memory. Each record is checked in a single
+        pass with ``iter_errors``, collecting all schema violations instead
+        of stopping at the first one.
+        
+        Args:
+            entity_type: Type of entity
+            entities: Iterable (list, generator, file reader) of entity data
+            errors_only: Only yield results for records with errors or warnings
+        
+        Yields:
+            Dictionary per record with 'index', 'primary_key', 'valid' and
+            'errors', where each error has 'path' (JSON pointer), 'rule',
+            'severity' and 'message'
+        
+        Raises:
+            ValueError: If entity type is unknown
+        """
+        schema = self.schema_loader.get_schema(entity_type)
+        validator = self.schema_loader.get_validator(entity_type)
+        if not schema or validator is None:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+        
+        return self._iter_record_results(
+            validator,
+            self.schema_loader.get_primary_key(entity_type),
+            frozenset(schema.get('properties', {})),
+            entities,
+            errors_only
+        )
+    
+    def _iter_record_results(self, validator, primary_key: Optional[str], known_fields: frozenset,
+                             entities: Iterable[Dict[str, Any]], errors_only: bool) -> Iterator[Dict[str, Any]]:
+        """Yield structured validation results for each record of a stream."""
+        for index, entity_data in enumerate(entities):
+            issues = []
+            
+            for error in validator.iter_errors(entity_data):
+                issues.append({
+                    'path': _json_pointer(error.absolute_path),
+                    'rule': f"schema.{error.validator}",
+                    'severity': 'error',
+                    'message': error.message
+                })
+            
+            if isinstance(entity_data, dict):
+                for field_name in entity_data:
+                    if field_name not in known_fields:
+                        issues.append({
+                            'path': _json_pointer([field_name]),
+                            'rule': 'compatibility.unknownField',
+                            'severity': 'warning',
+                            'message': f"Unknown field '{field_name}' - may be from newer schema version"
+                        })
+            
+            if errors_only and not issues:
+                continue
+            
+            yield {
+                'index': index,
+                'primary_key': entity_data.get(primary_key) if primary_key and isinstance(entity_data, dict) else None,
+                'valid': not any(issue['severity'] == 'error' for issue in issues),
+                'errors': issues
+            }
+    
     def validate_required_fields(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate that all required fields are present.
@@ -99,30 +200,8 @@ class DynamicBOOSTValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        constraints = self.schema_loader.get_field_constraints(entity_type, field_name)
-        errors = []
-        
-        # String length constraints
-        if isinstance(field_value, str):
-            if 'min_length' in constraints and len(field_value) < constraints['min_length']:
-                errors.append(f"Field '{field_name}' too short (min: {constraints['min_length']})")
-            if 'max_length' in constraints and len(field_value) > constraints['max_length']:
-                errors.append(f"Field '{field_name}' too long (max: {constraints['max_length']})")
-            if 'pattern' in constraints:
-                if not re.match(constraints['pattern'], field_value):
-                    errors.append(f"Field '{field_name}' doesn't match pattern: {constraints['pattern']}")
-        
-        # Numeric constraints
-        if isinstance(field_value, (int, float)):
-            if 'minimum' in constraints and field_value < constraints['minimum']:
-                errors.append(f"Field '{field_name}' below minimum: {constraints['minimum']}")
-            if 'maximum' in constraints and field_value > constraints['maximum']:
-                errors.append(f"Field '{field_name}' above maximum: {constraints['maximum']}")
-        
-        # Enum constraints
-        if 'enum' in constraints and field_value not in constraints['enum']:
-            errors.append(f"Field '{field_name}' has invalid value. Valid options: {constraints['enum']}")
-        
+        field_checker = self.schema_loader.get_field_checker(entity_type, field_name)
+        errors = field_checker.check(field_value) if field_checker is not None else []
         return len(errors) == 0, errors
     
     def validate_foreign_keys(self, entities: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
@@ -183,469 +262,126 @@ class DynamicBOOSTValidator:
         
         return len(errors) == 0, errors
     
-    def validate_business_logic(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def validate_business_logic(self, entity_type: str, entity_data: Dict[str, Any],
+                                stats: Optional[ValidationStats] = None) -> Tuple[bool, List[str]]:
         """
         Validate business logic rules dynamically loaded from configuration.
         
+        Runs the checks compiled for the entity type from the business logic
+        configuration, in the configured execution order.
+        
         Args:
             entity_type: Type of entity
             entity_data: Entity data to validate
+            stats: Stats to record the time and errors of each rule category in
             
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
-        business_rules = self.schema_loader.business_logic_rules
-        
-        # Get execution order from configuration
-        execution_order = business_rules.get('validationExecution', {}).get('executionOrder', [
-            'volumeMassConservation', 'temporalLogicRules', 'geographicLogicRules',
-            'speciesCompositionRules', 'certificationLogicRules', 'regulatoryComplianceRules',
-            'economicLogicRules', 'qualityAssuranceRules'
-        ])
-        
-        # Execute validation rules in configured order
-        for rule_category in execution_order:
-            if rule_category in business_rules:
-                category_errors = self._validate_business_rule_category(
-                    entity_type, entity_data, rule_category, business_rules[rule_category]
-                )
-                errors.extend(category_errors)
+        if stats is None:
+            for check in self.get_business_rule_plan().get(entity_type, ()):
+                errors.extend(check(entity_data))
+        else:
+            clock = time.perf_counter
+            for category, check in self.get_categorized_business_rule_plan().get(entity_type, ()):
+                started = clock()
+                check_errors = check(entity_data)
+                stats.record(business_rule_phase(category), entity_type, clock() - started, len(check_errors))
+                errors.extend(check_errors)
         
         return len(errors) == 0, errors
     
-    def _validate_business_rule_category(self, entity_type: str, entity_data: Dict[str, Any], 
-                                       category: str, rules: Dict[str, Any]) -> List[str]:
+    def get_business_rule_plan(self) -> Dict[str, Tuple[BusinessRuleCheck, ...]]:
         """
-        Validate a specific category of business rules.
+        Get the business logic rules compiled per entity type.
+        
+        The plan is compiled once per loaded rule configuration and again
+        only after the schema loader reloads its rules.
         
-        Args:
-            entity_type: Type of entity
-            entity_data: Entity data to validate
-            category: Rule category name
-            rules: Rules configuration for this category
-            
         Returns:
-            List of validation errors
+            Dictionary with entity_type -> checks in execution order
         """
-        errors = []
-        
-        if category == 'volumeMassConservation':
-            if entity_type == 'material_processing':
-                volume_rules = rules.get('materialProcessing', {})
-                errors.extend(self._validate_volume_conservation(entity_data, volume_rules))
-                errors.extend(self._validate_mass_conservation(entity_data, volume_rules))
-                errors.extend(self._validate_density_consistency(entity_data, volume_rules))
-            elif entity_type == 'transaction':
-                transaction_rules = rules.get('transactionQuantities', {})
-                errors.extend(self._validate_transaction_quantities(entity_data, transaction_rules))
-        
-        elif category == 'temporalLogicRules':
-            errors.extend(self._validate_temporal_business_logic(entity_type, entity_data, rules))
-        
-        elif category == 'geographicLogicRules':
-            errors.extend(self._validate_geographic_business_logic(entity_type, entity_data, rules))
-        
-        elif category == 'speciesCompositionRules':
-            if entity_type == 'traceable_unit':
-                errors.extend(self._validate_species_composition(entity_data, rules))
-                errors.extend(self._validate_species_compatibility(entity_data, rules))
-        
-        elif category == 'certificationLogicRules':
-            if entity_type == 'claim':
-                errors.extend(self._validate_certification_logic(entity_data, rules))
-        
-        elif category == 'economicLogicRules':
-            if entity_type == 'transaction':
-                errors.extend(self._validate_economic_logic(entity_data, rules))
-        
-        elif category == 'qualityAssuranceRules':
-            if entity_type in ['traceable_unit', 'material_processing']:
-                errors.extend(self._validate_quality_assurance(entity_data, rules))
-        
-        elif category == 'regulatoryComplianceRules':
-            errors.extend(self._validate_regulatory_compliance(entity_type, entity_data, rules))
-        
-        # New validation categories for enhanced entities
-        elif category == 'truTransactionConsistency':
-            # This is handled at the comprehensive validation level, not per-entity
-            pass
-        
-        elif category == 'reconciliationWorkflow':
-            is_valid, rule_errors = self.validate_reconciliation_workflow(entity_type, entity_data)
-            if not is_valid:
-                errors.extend(rule_errors)
-        
-        elif category == 'timestampChronology':
-            is_valid, rule_errors = self.validate_timestamp_chronology(entity_type, entity_data)
-            if not is_valid:
-                errors.extend(rule_errors)
-        
-        elif category == 'organizationalConsistency':
-            is_valid, rule_errors = self.validate_organization_operational_consistency(entity_type, entity_data)
-            if not is_valid:
-                errors.extend(rule_errors)
-        
-        return errors
-    
-    def _validate_volume_conservation(self, processing_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate volume conservation using dynamic rules."""
-        errors = []
-        
-        volume_conservation = rules.get('volumeConservation', {})
-        if not volume_conservation:
-            return errors
-        
-        input_vol = processing_data.get('inputVolume')
-        output_vol = processing_data.get('outputVolume')
-        vol_loss = processing_data.get('volumeLoss', 0)
-        
-        if all(v is not None for v in [input_vol, output_vol]):
-            # Check basic conservation rule
-            rule_formula = volume_conservation.get('validation', {}).get('formula', '')
-            if 'inputVolume >= (outputVolume + volumeLoss)' in rule_formula:
-                if input_vol < (output_vol + vol_loss):
-                    tolerance = volume_conservation.get('validation', {}).get('tolerance', 0.001)
-                    if abs(input_vol - (output_vol + vol_loss)) > tolerance:
-                        errors.append(
-                            f"Volume conservation violation: input ({input_vol}) < "
-                            f"output ({output_vol}) + loss ({vol_loss})"
-                        )
-            
-            # Check for process-specific exceptions
-            process_type = processing_data.get('processType')
-            exceptions = volume_conservation.get('exceptions', [])
-            
-            for exception in exceptions:
-                if exception.get('processType') == process_type:
-                    max_increase = exception.get('maxVolumeIncrease', 1.0)
-                    if output_vol > input_vol * max_increase:
-                        errors.append(
-                            f"Volume increase exceeds limit for {process_type}: "
-                            f"max {max_increase}x allowed"
-                        )
-        
-        return errors
+        self.get_categorized_business_rule_plan()
+        return self._business_rule_plan
     
-    def _validate_species_composition(self, tru_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate species composition using dynamic rules."""
-        errors = []
-        
-        composition_math = rules.get('compositionMath', {})
-        percentage_sum_rule = composition_math.get('percentageSum', {})
-        
-        if not percentage_sum_rule:
-            return errors
-        
-        species_composition = tru_data.get('speciesComposition', [])
-        if species_composition:
-            total_percentage = sum(
-                species.get('percentage', 0) for species in species_composition
-            )
-            
-            # Get tolerance from rules
-            tolerance = percentage_sum_rule.get('validation', {}).get('tolerance', 0.01)
-            target_sum = 100.0
-            
-            if abs(total_percentage - target_sum) > tolerance:
-                errors.append(
-                    f"Species composition percentages sum to {total_percentage}%, "
-                    f"must equal {target_sum}% (tolerance: ±{tolerance}%)"
-                )
-            
-            # Validate individual bounds
-            individual_bounds = composition_math.get('individualBounds', {})
-            if individual_bounds:
-                min_pct = individual_bounds.get('validation', {}).get('minPercentage', 0.0)
-                max_pct = individual_bounds.get('validation', {}).get('maxPercentage', 100.0)
-                
-                for species in species_composition:
-                    pct = species.get('percentage', 0)
-                    if pct < min_pct or pct > max_pct:
-                        errors.append(
-                            f"Species percentage {pct}% outside valid range "
-                            f"[{min_pct}%, {max_pct}%]"
-                        )
-        
-        return errors
-    
-    def _validate_transaction_quantities(self, transaction_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate transaction quantities using dynamic rules."""
-        errors = []
-        
-        availability_check = rules.get('availabilityCheck', {})
-        if not availability_check:
-            return errors
-        
-        quantity = transaction_data.get('quantity')
-        if quantity is not None:
-            # Basic quantity validation
-            if quantity <= 0:
-                errors.append("Transaction quantity must be greater than 0")
-            
-            # Check minimum transaction size if configured
-            min_transaction = rules.get('minimumTransactionSize', {})
-            if min_transaction:
-                min_volume = min_transaction.get('validation', {}).get('minimumVolume', 0)
-                min_value = min_transaction.get('validation', {}).get('minimumValue', 0)
-                
-                if quantity < min_volume:
-                    errors.append(f"Transaction quantity {quantity} below minimum {min_volume}")
-                
-                contract_value = transaction_data.get('contractValue', 0)
-                if contract_value < min_value:
-                    errors.append(f"Transaction value {contract_value} below minimum {min_value}")
-        
-        return errors
-    
-    def _validate_mass_conservation(self, processing_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate mass conservation using dynamic rules."""
-        errors = []
-        
-        mass_conservation = rules.get('massConservation', {})
-        if not mass_conservation:
-            return errors
-        
-        input_mass = processing_data.get('inputMass')
-        output_mass = processing_data.get('outputMass')
-        
-        if all(v is not None for v in [input_mass, output_mass]):
-            rule_formula = mass_conservation.get('validation', {}).get('formula', '')
-            if 'inputMass >= outputMass' in rule_formula:
-                tolerance = mass_conservation.get('validation', {}).get('tolerance', 0.001)
-                if input_mass < output_mass and abs(input_mass - output_mass) > tolerance:
-                    errors.append(
-                        f"Mass conservation violation: input ({input_mass}) < output ({output_mass})"
-                    )
-            
-            # Check typical loss rates
-            process_type = processing_data.get('processType')
-            if process_type:
-                typical_rates = mass_conservation.get('typicalLossRates', {}).get(process_type, {})
-                if typical_rates:
-                    loss_rate = (input_mass - output_mass) / input_mass if input_mass > 0 else 0
-                    min_loss = typical_rates.get('min', 0)
-                    max_loss = typical_rates.get('max', 1)
-                    
-                    if loss_rate < min_loss or loss_rate > max_loss:
-                        errors.append(
-                            f"Mass loss rate {loss_rate:.3f} outside typical range for {process_type}: "
-                            f"[{min_loss}, {max_loss}]"
-                        )
-        
-        return errors
-    
-    def _validate_density_consistency(self, processing_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate density consistency using dynamic rules."""
-        errors = []
-        
-        density_rules = rules.get('densityConsistency', {})
-        if not density_rules:
-            return errors
-        
-        input_mass = processing_data.get('inputMass')
-        input_volume = processing_data.get('inputVolume')
-        
-        if all(v is not None and v > 0 for v in [input_mass, input_volume]):
-            density = input_mass / input_volume
-            
-            # Check species ranges - this would need species info from linked TRU
-            species_ranges = density_rules.get('validation', {}).get('speciesRanges', {})
-            
-            # For now, check against general wood density range
-            general_min = min(r['min'] for r in species_ranges.values()) if species_ranges else 0.2
-            general_max = max(r['max'] for r in species_ranges.values()) if species_ranges else 1.0
-            
-            if density < general_min or density > general_max:
-                errors.append(
-                    f"Calculated density {density:.3f} outside realistic range [{general_min}, {general_max}]"
-                )
-        
-        return errors
-    
-    def _validate_temporal_business_logic(self, entity_type: str, entity_data: Dict[str, Any], 
-                                        rules: Dict[str, Any]) -> List[str]:
-        """Validate temporal business logic rules."""
-        errors = []
-        
-        # Processing timeframes validation
-        if entity_type == 'material_processing':
-            processing_timeframes = rules.get('processingTimeframes', {})
-            
-            # Freshness degradation check
-            freshness_rules = processing_timeframes.get('freshnessDegradation', {})
-            if freshness_rules:
-                process_timestamp = entity_data.get('processTimestamp')
-                if process_timestamp:
-                    # This would require harvest date from linked TRU - placeholder for now
-                    material_type = entity_data.get('materialType', 'unknown')
-                    freshness_limits = freshness_rules.get('validation', {})
-                    
-                    if material_type in freshness_limits:
-                        max_days = freshness_limits[material_type].get('maxDays', 365)
-                        # Implementation would check against harvest date
-        
-        return errors
-    
-    def _validate_geographic_business_logic(self, entity_type: str, entity_data: Dict[str, Any], 
-                                          rules: Dict[str, Any]) -> List[str]:
-        """Validate geographic business logic rules."""
-        errors = []
-        
-        # Transportation distance validation
-        if entity_type == 'transaction':
-            transport_rules = rules.get('transportationDistance', {})
-            economic_viability = transport_rules.get('economicViability', {})
-            
-            if economic_viability:
-                # This would require geographic data - placeholder for implementation
-                pass
+    def get_categorized_business_rule_plan(self) -> Dict[str, Tuple[Tuple[str, BusinessRuleCheck], ...]]:
+        """
+        Get the business logic rules compiled per entity type, labelled with their category.
         
-        return errors
+        Returns:
+            Dictionary with entity_type -> (category, check) pairs in execution order
+        """
+        business_rules = self.schema_loader.business_logic_rules
+        if self._business_rule_source is not business_rules:
+            plan = compile_categorized_business_rule_plan(business_rules, {
+                'reconciliationWorkflow': {
+                    'transaction': lambda data: self.validate_reconciliation_workflow('transaction', data)[1]
+                },
+                'timestampChronology': {
+                    'transaction': lambda data: self.validate_timestamp_chronology('transaction', data)[1]
+                },
+                'organizationalConsistency': {
+                    'organization': lambda data: self.validate_organization_operational_consistency('organization', data)[1]
+                }
+            })
+            self._categorized_business_rule_plan = plan
+            self._business_rule_plan = {entity_type: tuple(check for _, check in checks)
+                                        for entity_type, checks in plan.items()}
+            self._business_rule_source = business_rules
+        return self._categorized_business_rule_plan
     
-    def _validate_species_compatibility(self, tru_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate species compatibility using dynamic rules."""
-        errors = []
+    def validate_circular_references(self, entities: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
+        """
+        Validate the circularReferenceRules of the cross-entity rules against entity data.
         
-        species_compatibility = rules.get('speciesCompatibility', {})
-        ecosystem_rules = species_compatibility.get('ecosystemConsistency', {})
-        
-        if ecosystem_rules:
-            species_composition = tru_data.get('speciesComposition', [])
-            if len(species_composition) > 1:  # Mixed species
-                ecosystems = ecosystem_rules.get('validation', {})
-                
-                # Check if all species are from compatible ecosystems
-                species_names = [s.get('speciesName', '').lower() for s in species_composition]
-                
-                for ecosystem, compatible_species in ecosystems.items():
-                    if isinstance(compatible_species, list):
-                        compatible_species = [s.lower() for s in compatible_species]
-                        if any(species in compatible_species for species in species_names):
-                            # Check if ALL species are compatible
-                            incompatible = [s for s in species_names if s not in compatible_species]
-                            if incompatible:
-                                errors.append(
-                                    f"Species {incompatible} not compatible with {ecosystem} ecosystem"
-                                )
-                            break
-        
-        return errors
-    
-    def _validate_certification_logic(self, claim_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate certification logic rules."""
-        errors = []
+        Covers TraceableUnit parent/child links and MaterialProcessing
+        input -> output chains; one error is reported per offending cycle.
         
-        chain_rules = rules.get('chainOfCustodyRules', {})
-        certificate_validity = chain_rules.get('certificateValidity', {})
+        Args:
+            entities: Dictionary with entity_type -> list of entities
         
-        if certificate_validity:
-            # Check certificate expiry
-            claim_expiry = claim_data.get('claimExpiry')
-            if claim_expiry:
-                try:
-                    from datetime import datetime
-                    if isinstance(claim_expiry, str):
-                        expiry_dt = datetime.fromisoformat(claim_expiry.replace('Z', '+00:00'))
-                        if expiry_dt < datetime.now(expiry_dt.tzinfo):
-                            errors.append("Claim certificate has expired")
-                except (ValueError, TypeError):
-                    errors.append("Invalid claim expiry date format")
-        
-        return errors
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        errors = [
+            f"Circular reference violation ({violation['entity']}.{violation['rule']}): {violation['cycle']}"
+            for violation in detect_circular_references(entities, self.schema_loader.cross_entity_rules)
+        ]
+        return len(errors) == 0, errors
     
-    def _validate_economic_logic(self, transaction_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate economic logic rules."""
-        errors = []
-        
-        pricing_rules = rules.get('pricingReasonableness', {})
-        market_price_rules = pricing_rules.get('marketPriceRange', {})
+    def validate_cardinality(self, entities: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
+        """
+        Validate the cardinalityConstraints of the cross-entity rules against entity data.
         
-        if market_price_rules:
-            contract_value = transaction_data.get('contractValue')
-            quantity = transaction_data.get('quantity')
-            
-            if all(v is not None and v > 0 for v in [contract_value, quantity]):
-                price_per_unit = contract_value / quantity
-                
-                # Check against market ranges - would need material type classification
-                price_ranges = market_price_rules.get('validation', {}).get('pricePerUnit', {})
-                tolerance = market_price_rules.get('validation', {}).get('tolerance', 0.5)
-                
-                # For now, use a general reasonable range
-                general_min = 10  # Minimum reasonable price
-                general_max = 500  # Maximum reasonable price
-                
-                if price_per_unit < general_min * (1 - tolerance):
-                    errors.append(f"Price per unit {price_per_unit} seems unreasonably low")
-                elif price_per_unit > general_max * (1 + tolerance):
-                    errors.append(f"Price per unit {price_per_unit} seems unreasonably high")
-        
-        return errors
-    
-    def _validate_quality_assurance(self, entity_data: Dict[str, Any], rules: Dict[str, Any]) -> List[str]:
-        """Validate quality assurance rules."""
-        errors = []
+        Each declared parent/child pair is checked with one hash join: a
+        parent key may identify only one parent record, and a child foreign
+        key must reference exactly one existing parent.
         
-        moisture_rules = rules.get('moistureContentLimits', {})
-        if moisture_rules:
-            moisture_content = entity_data.get('moistureContent')
-            if moisture_content is not None:
-                species_limits = moisture_rules.get('speciesSpecificLimits', {}).get('validation', {})
-                
-                # Use general limits if species-specific not available
-                general_min = 5  # Minimum reasonable moisture
-                general_max = 70  # Maximum reasonable moisture
-                
-                if moisture_content < general_min or moisture_content > general_max:
-                    errors.append(
-                        f"Moisture content {moisture_content}% outside reasonable range "
-                        f"[{general_min}%, {general_max}%]"
-                    )
+        Args:
+            entities: Dictionary with entity_type -> list of entities
         
-        contamination_rules = rules.get('contaminationLimits', {})
-        if contamination_rules:
-            acceptable_levels = contamination_rules.get('acceptableLevels', {}).get('validation', {})
-            
-            for contaminant, max_level in acceptable_levels.items():
-                if contaminant != 'units':
-                    contamination_level = entity_data.get(f'{contaminant}Contamination')
-                    if contamination_level is not None and contamination_level > max_level:
-                        errors.append(
-                            f"{contaminant.title()} contamination {contamination_level}% exceeds "
-                            f"maximum allowed {max_level}%"
-                        )
-        
-        return errors
-    
-    def _validate_regulatory_compliance(self, entity_type: str, entity_data: Dict[str, Any], 
-                                      rules: Dict[str, Any]) -> List[str]:
-        """Validate regulatory compliance rules."""
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
         errors = []
+        reported_parent_keys = set()
+        for report in evaluate_cardinality(entities, self.schema_loader.cross_entity_rules):
+            parent, child = report['parentEntity'], report['childEntity']
+            parent_field, child_field = report['parentField'], report['childField']
+            prefix = f"Cardinality violation ({parent} {report['notation']} {child}): "
+            
+            # A duplicated parent key breaks every constraint on it; report it once
+            if (parent, parent_field) not in reported_parent_keys:
+                reported_parent_keys.add((parent, parent_field))
+                for key, count in report['duplicate_parents'].items():
+                    errors.append(f"{prefix}{parent}.{parent_field} {key} is shared by {count} {parent} records")
+            for index, keys in report['multi_parent_children']:
+                errors.append(f"{prefix}{child}[{index}].{child_field} references {len(keys)} {parent} records: {keys}")
+            for key, count in (report['orphans'] or {}).items():
+                errors.append(f"{prefix}{child}.{child_field} references non-existent {parent}: {key} ({count} records)")
         
-        # LCFS compliance for claims
-        if entity_type == 'claim':
-            lcfs_rules = rules.get('lcfsCompliance', {})
-            pathway_validity = lcfs_rules.get('pathwayValidity', {})
-            
-            if pathway_validity:
-                claim_type = entity_data.get('claimType', '')
-                if 'LCFS' in claim_type or 'lcfs' in claim_type.lower():
-                    # Check pathway certification
-                    validation_config = pathway_validity.get('validation', {})
-                    if validation_config.get('carbCertified'):
-                        # Implementation would check CARB certification status
-                        pass
-        
-        # EU RED compliance
-        red_rules = rules.get('euRedCompliance', {})
-        if red_rules and entity_type == 'claim':
-            sustainability_criteria = red_rules.get('sustainabilityCriteria', {})
-            if sustainability_criteria:
-                # Implementation would check RED sustainability criteria
-                pass
-        
-        return errors
+        return len(errors) == 0, errors
     
     def validate_temporal_consistency(self, entities: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
         """
@@ -667,53 +403,90 @@ class DynamicBOOSTValidator:
         chronological_order = processing_timeframes.get('chronologicalOrder', {})
         
         if chronological_order and 'material_processing' in entities and 'traceable_unit' in entities:
-            # Build TRU lookup
-            tru_lookup = {}
-            for tru in entities['traceable_unit']:
-                tru_id_field = self.schema_loader.get_primary_key('traceable_unit')
-                if tru_id_field and tru_id_field in tru:
-                    tru_lookup[tru[tru_id_field]] = tru
+            # Row of each TRU (the last TRU listed under an ID wins)
+            tru_id_field = self.schema_loader.get_primary_key('traceable_unit')
+            trus = entities['traceable_unit']
+            tru_rows = {}
+            if tru_id_field:
+                for row, tru in enumerate(trus):
+                    if tru_id_field in tru:
+                        tru_rows[tru[tru_id_field]] = row
+            
+            # Parse each timestamp once, however many operations consume a TRU
+            processing = entities['material_processing']
+            harvest = TimestampColumn([tru.get('createdTimestamp') for tru in trus])
+            process = TimestampColumn([proc.get('processTimestamp') for proc in processing])
+            
+            # Join processing operations to their input TRUs
+            process_rows = []
+            harvest_rows = []
+            for row, proc in enumerate(processing):
+                input_tru_id = proc.get('inputTraceableUnitId')
+                if input_tru_id and input_tru_id in tru_rows and process.kinds[row] != MISSING:
+                    tru_row = tru_rows[input_tru_id]
+                    if harvest.kinds[tru_row] != MISSING:
+                        process_rows.append(row)
+                        harvest_rows.append(tru_row)
             
             # Validate processing vs harvest dates
-            for processing in entities['material_processing']:
-                input_tru_id = processing.get('inputTraceableUnitId')
-                process_time = processing.get('processTimestamp')
-                
-                if input_tru_id and input_tru_id in tru_lookup and process_time:
-                    harvest_date = tru_lookup[input_tru_id].get('createdTimestamp')
-                    if harvest_date:
-                        try:
-                            if isinstance(process_time, str):
-                                process_dt = datetime.fromisoformat(process_time.replace('Z', '+00:00'))
-                            else:
-                                process_dt = process_time
-                                
-                            if isinstance(harvest_date, str):
-                                harvest_dt = datetime.fromisoformat(harvest_date.replace('Z', '+00:00'))
-                            else:
-                                harvest_dt = harvest_date
-                            
-                            buffer_days = chronological_order.get('validation', {}).get('bufferDays', 0)
-                            if process_dt < harvest_dt:
-                                errors.append(
-                                    f"Processing timestamp ({process_time}) is before "
-                                    f"harvest timestamp ({harvest_date}) for TRU {input_tru_id}"
-                                )
-                        except (ValueError, TypeError) as e:
-                            errors.append(f"Invalid timestamp format: {str(e)}")
+            before, incomparable = compare_joined(process, process_rows, harvest, harvest_rows)
+            incomparable_positions = set(incomparable)
+            for position in heapq.merge(before, incomparable):
+                row, tru_row = process_rows[position], harvest_rows[position]
+                process_time = processing[row].get('processTimestamp')
+                harvest_date = trus[tru_row].get('createdTimestamp')
+                input_tru_id = processing[row].get('inputTraceableUnitId')
+                try:
+                    if position in incomparable_positions:
+                        # Unparseable, not a timestamp, or naive vs timezone-aware
+                        if row in process.errors:
+                            raise process.errors[row]
+                        if tru_row in harvest.errors:
+                            raise harvest.errors[tru_row]
+                        if not parse_timestamp(process_time) < parse_timestamp(harvest_date):
+                            continue
+                    errors.append(
+                        f"Processing timestamp ({process_time}) is before "
+                        f"harvest timestamp ({harvest_date}) for TRU {input_tru_id}"
+                    )
+                except (ValueError, TypeError) as e:
+                    errors.append(f"Invalid timestamp format: {str(e)}")
         
         return len(errors) == 0, errors
     
-    def comprehensive_validation(self, entities: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def comprehensive_validation(self, entities: Dict[str, List[Dict[str, Any]]],
+                                 workers: Optional[int] = 1, chunk_size: int = 1000) -> Dict[str, Any]:
         """
         Run comprehensive validation on a set of entities using dynamic schemas.
         
+        The per-entity phase (schema, compatibility and business logic checks)
+        can be spread over a process pool. Each worker process builds its own
+        validator once at startup; entity lists are split into chunks of
+        ``chunk_size`` records and the chunk results are merged back in input
+        order, so the output is identical to serial mode. Cross-entity phases
+        run after the merge in the calling process.
+        
+        Wall time, call and error counts of every phase are collected in a
+        ValidationStats (business rule categories per entity type,
+        cross-entity phases under '*'). Its plain-data form
+        (ValidationStats.as_dict()) is returned under results['stats'], so the
+        results stay JSON-serializable; the ValidationStats itself is passed
+        to the validator's stats_hook, if set.
+        
         Args:
             entities: Dictionary with entity_type -> list of entities
+            workers: Number of worker processes (1 = serial, None = all CPU cores)
+            chunk_size: Number of entities per worker task (at least 1)
             
         Returns:
             Dictionary with validation results
+        
+        Raises:
+            ValueError: If chunk_size is less than 1
         """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        
         results = {
             'valid': True,
             'errors': [],
@@ -726,28 +499,35 @@ class DynamicBOOSTValidator:
         }
         
         # Validate individual entities
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        tasks = [
+            (entity_type, start, entity_list[start:start + chunk_size])
+            for entity_type, entity_list in entities.items()
+            for start in range(0, len(entity_list), chunk_size)
+        ]
+        
+        stats = ValidationStats()
+        if workers > 1 and len(tasks) > 1:
+            chunk_results = []
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_validation_worker,
+                                     initargs=(str(self.schema_loader.schema_base_path),)) as executor:
+                for chunk_errors, chunk_warnings, chunk_stats in executor.map(_validate_chunk_in_worker, tasks):
+                    chunk_results.append((chunk_errors, chunk_warnings))
+                    stats.merge(chunk_stats)
+        else:
+            chunk_results = [self._validate_entity_chunk(entity_type, chunk, start, stats)
+                             for entity_type, start, chunk in tasks]
+        
+        entity_messages = {entity_type: ([], []) for entity_type in entities}
+        for (entity_type, _, _), (chunk_errors, chunk_warnings) in zip(tasks, chunk_results):
+            entity_messages[entity_type][0].extend(chunk_errors)
+            entity_messages[entity_type][1].extend(chunk_warnings)
+        
         for entity_type, entity_list in entities.items():
-            entity_errors = []
-            entity_warnings = []
-            
-            for i, entity in enumerate(entity_list):
-                # Schema validation
-                is_valid, errors = self.validate_entity(entity_type, entity)
-                if not is_valid:
-                    entity_errors.extend([f"Entity {i}: {error}" for error in errors])
-                
-                # Schema compatibility check
-                is_compatible, compat_messages = self.schema_loader.validate_schema_compatibility(entity_type, entity)
-                for msg in compat_messages:
-                    if 'Unknown field' in msg:
-                        entity_warnings.append(f"Entity {i}: {msg}")
-                    else:
-                        entity_errors.append(f"Entity {i}: {msg}")
-                
-                # Business logic validation
-                is_valid, errors = self.validate_business_logic(entity_type, entity)
-                if not is_valid:
-                    entity_errors.extend([f"Entity {i}: {error}" for error in errors])
+            entity_errors, entity_warnings = entity_messages[entity_type]
             
             results['entity_results'][entity_type] = {
                 'valid': len(entity_errors) == 0,
@@ -762,25 +542,97 @@ class DynamicBOOSTValidator:
             
             results['warnings'].extend(entity_warnings)
         
-        # Cross-entity validation
-        is_valid, errors = self.validate_foreign_keys(entities)
-        if not is_valid:
-            results['valid'] = False
-            results['errors'].extend(errors)
+        # Cross-entity validation: foreign keys, circular references, cardinality,
+        # temporal and TRU-Transaction consistency
+        cross_entity_phases = (
+            ('foreign_keys', self.validate_foreign_keys),
+            ('circular_references', self.validate_circular_references),
+            ('cardinality', self.validate_cardinality),
+            ('temporal_consistency', self.validate_temporal_consistency),
+            ('tru_transaction_consistency', self.validate_tru_transaction_consistency)
+        )
+        for phase, check in cross_entity_phases:
+            started = time.perf_counter()
+            is_valid, errors = check(entities)
+            stats.record(phase, ALL_ENTITY_TYPES, time.perf_counter() - started, len(errors))
+            if not is_valid:
+                results['valid'] = False
+                results['errors'].extend(errors)
         
-        # Temporal validation
-        is_valid, errors = self.validate_temporal_consistency(entities)
-        if not is_valid:
-            results['valid'] = False
-            results['errors'].extend(errors)
+        results['stats'] = stats.as_dict()
+        if self.stats_hook is not None:
+            self.stats_hook('comprehensive_validation', stats)
+        
+        return results
+    
+    def validate_record(self, entity_type: str, entity_data: Dict[str, Any],
+                        stats: Optional[ValidationStats] = None) -> Tuple[List[str], List[str]]:
+        """
+        Run the per-entity checks of comprehensive validation on one record.
+        
+        Args:
+            entity_type: Type of entity
+            entity_data: Entity data to validate
+            stats: Stats to record the schema, compatibility and business rule phases in
         
-        # TRU-Transaction consistency validation
-        is_valid, errors = self.validate_tru_transaction_consistency(entities)
+        Returns:
+            Tuple of (list_of_errors, list_of_warnings)
+        """
+        clock = time.perf_counter
+        
+        # Schema validation
+        started = clock()
+        is_valid, errors = self.validate_entity(entity_type, entity_data)
+        checked = clock()
+        entity_errors = list(errors) if not is_valid else []
+        entity_warnings = []
+        
+        # Schema compatibility check
+        is_compatible, compat_messages = self.schema_loader.validate_schema_compatibility(entity_type, entity_data)
+        compared = clock()
+        compatibility_errors = 0
+        for msg in compat_messages:
+            if 'Unknown field' in msg:
+                entity_warnings.append(msg)
+            else:
+                compatibility_errors += 1
+                entity_errors.append(msg)
+        
+        if stats is not None:
+            stats.record('schema', entity_type, checked - started, len(entity_errors) - compatibility_errors)
+            stats.record('schema_compatibility', entity_type, compared - checked, compatibility_errors)
+        
+        # Business logic validation
+        is_valid, errors = self.validate_business_logic(entity_type, entity_data, stats)
         if not is_valid:
-            results['valid'] = False
-            results['errors'].extend(errors)
+            entity_errors.extend(errors)
         
-        return results
+        return entity_errors, entity_warnings
+    
+    def _validate_entity_chunk(self, entity_type: str, entity_list: List[Dict[str, Any]],
+                               start_index: int = 0,
+                               stats: Optional[ValidationStats] = None) -> Tuple[List[str], List[str]]:
+        """
+        Run the per-entity validation phase over a slice of an entity list.
+        
+        Args:
+            entity_type: Type of entity
+            entity_list: Entities to validate
+            start_index: Position of the first entity in the full list
+            stats: Stats to record the schema, compatibility and business rule phases in
+        
+        Returns:
+            Tuple of (list_of_errors, list_of_warnings)
+        """
+        entity_errors = []
+        entity_warnings = []
+        
+        for i, entity in enumerate(entity_list, start_index):
+            errors, warnings = self.validate_record(entity_type, entity, stats)
+            entity_errors.extend([f"Entity {i}: {error}" for error in errors])
+            entity_warnings.extend([f"Entity {i}: {warning}" for warning in warnings])
+        
+        return entity_errors, entity_warnings
     
     def validate_tru_transaction_consistency(self, entities: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
         """
@@ -889,13 +741,7 @@ class DynamicBOOSTValidator:
             # Convert timestamps to datetime objects for comparison
             datetime_objects = []
             for ts in timestamps:
-                if isinstance(ts, str):
-                    # Handle different timestamp formats
-                    ts_clean = ts.replace('Z', '+00:00')
-                    dt = datetime.fromisoformat(ts_clean)
-                    datetime_objects.append(dt)
-                else:
-                    datetime_objects.append(ts)
+                datetime_objects.append(parse_timestamp(ts))
             
             # Check chronological order
             for i in range(1, len(datetime_objects)):
@@ -908,7 +754,7 @@ class DynamicBOOSTValidator:
             # Validate against transaction date if available
             if transaction_date:
                 try:
-                    tx_date = datetime.fromisoformat(f"{transaction_date}T00:00:00+00:00")
+                    tx_date = parse_timestamp(f"{transaction_date}T00:00:00+00:00")
                     for i, dt in enumerate(datetime_objects):
                         if dt.date() < tx_date.date():
                             errors.append(
@@ -922,6 +768,72 @@ class DynamicBOOSTValidator:
         
         return len(errors) == 0, errors
     
+    def validate_timestamp_chronology_batch(self, transactions: List[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Validate the chronological order of timestamps in many transactions at once.
+        
+        The manipulation timestamps of all transactions are parsed into one
+        column and compared element-wise; transactions with a timestamp that
+        does not parse, or with naive and timezone-aware timestamps mixed,
+        are checked one by one.
+        
+        Args:
+            transactions: Transaction data to validate
+        
+        Returns:
+            Errors per transaction, as validate_timestamp_chronology() reports them
+        """
+        results: List[List[str]] = [[] for _ in transactions]
+        values = []
+        offsets = [0]
+        groups = []
+        for index, transaction in enumerate(transactions):
+            timestamps = transaction.get('manipulationTimestamps', [])
+            if timestamps:
+                values.extend(timestamps)
+                offsets.append(len(values))
+                groups.append(index)
+        column = TimestampColumn(values)
+        
+        # Groups of anything but timezone-aware timestamps only, or naive ones only, are checked one by one
+        kinds = column.kinds
+        mixed = MISSING in kinds or INVALID in kinds or (AWARE in kinds and NAIVE in kinds)
+        clean = [True] * len(groups)
+        group_dates = []
+        for group, index in enumerate(groups):
+            if mixed:
+                group_kinds = set(kinds[offsets[group]:offsets[group + 1]])
+                if group_kinds != {AWARE} and group_kinds != {NAIVE}:
+                    clean[group] = False
+                    group_dates.append(0)
+                    results[index] = self.validate_timestamp_chronology('transaction', transactions[index])[1]
+                    continue
+            # Date ordinal 0 precedes every timestamp date, skipping the check
+            transaction_date = transactions[index].get('transactionDate')
+            try:
+                tx_date = parse_timestamp(f"{transaction_date}T00:00:00+00:00") if transaction_date else None
+            except ValueError:
+                tx_date = None  # Skip if transaction date format is invalid
+            group_dates.append(tx_date.toordinal() if tx_date else 0)
+        
+        # Order errors are reported before transaction date errors
+        for row in adjacent_before(column, offsets):
+            group = bisect.bisect_right(offsets, row) - 1
+            if clean[group]:
+                results[groups[group]].append(
+                    f"Manipulation timestamps not in chronological order: "
+                    f"{values[row]} is before {values[row - 1]}"
+                )
+        for row in dates_before(column, group_dates, offsets):
+            group = bisect.bisect_right(offsets, row) - 1
+            if clean[group]:
+                transaction_date = transactions[groups[group]].get('transactionDate')
+                results[groups[group]].append(
+                    f"Manipulation timestamp {values[row]} is before transaction date {transaction_date}"
+                )
+        
+        return results
+    
     def validate_organization_operational_consistency(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate operational consistency for enhanced organization fields.
@@ -970,7 +882,27 @@ class DynamicBOOSTValidator:
         self.schema_loader.refresh_schemas()
 
 
+# Per-process validator used by comprehensive_validation worker pools
+_worker_validator: Optional[DynamicBOOSTValidator] = None
+
+
+def _init_validation_worker(schema_path: str):
+    """Build the worker's validator once when the pool process starts."""
+    global _worker_validator
+    _worker_validator = DynamicBOOSTValidator(schema_path=schema_path)
+
+
+def _validate_chunk_in_worker(task: Tuple[str, int, List[Dict[str, Any]]]) -> Tuple[List[str], List[str], ValidationStats]:
+    """Validate one (entity_type, start_index, entities) chunk in a worker process."""
+    entity_type, start_index, entity_list = task
+    stats = ValidationStats()
+    entity_errors, entity_warnings = _worker_validator._validate_entity_chunk(entity_type, entity_list,
+                                                                              start_index, stats)
+    return entity_errors, entity_warnings, stats
+
+
 def create_dynamic_validator(schema_loader: Optional[SchemaLoader] = None, 
-                           schema_path: Optional[str] = None) -> DynamicBOOSTValidator:
+                           schema_path: Optional[str] = None,
+                           stats_hook: Optional[StatsHook] = None) -> DynamicBOOSTValidator:
     """Factory function to create a dynamic BOOST validator."""
-    return DynamicBOOSTValidator(schema_loader, schema_path)
\ No newline at end of file
+    return DynamicBOOSTValidator(schema_loader, schema_path, stats_hook)
\ No newline at end of file
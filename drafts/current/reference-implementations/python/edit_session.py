@@ -0,0 +1,303 @@
+"""
+BOOST Python Reference Implementation - Entity Edit Sessions
+
+This module stages field updates to stored entities and applies them
+copy-on-write. Untouched fields stay shared with the stored model, a list
+field is copied once per session however many items are appended to it,
+and only the touched fields are validated, once each, when the session
+commits. A business rule callback can then check the edited entities
+against the rules that read their touched fields. Every edited entity is
+written back to its collection in one store write, so indexes, lineage and
+the validation caches see one change per entity instead of one per update.
+"""
+
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Set, FrozenSet, Callable
+
+from pydantic import ValidationError
+
+# (collection name, entity ID, edited entity, touched Python field names) of one entity a commit would write
+EditedEntity = Tuple[str, str, Any, FrozenSet[str]]
+
+# Checks the entities of a commit before they are written; returns error messages
+BusinessRuleHook = Callable[[List[EditedEntity]], List[str]]
+
+
+class _StagedEntity:
+    """Field updates staged for one stored entity."""
+    
+    __slots__ = ('collection_name', 'entity_id', 'model', 'changes', 'members')
+    
+    def __init__(self, collection_name: str, entity_id: str, model: type):
+        self.collection_name = collection_name
+        self.entity_id = entity_id
+        self.model = model
+        # Python field name -> new value
+        self.changes: Dict[str, Any] = {}
+        # List field -> its items as a set, for unique appends (None until first needed)
+        self.members: Dict[str, Optional[Set[Any]]] = {}
+
+
+class EditSession:
+    """
+    Batched, copy-on-write field updates to the entities of an entity store.
+    
+    Updates are staged per entity and field, addressed by collection name,
+    entity ID and field name (Python name or schema alias). Nothing is
+    validated or written until commit(); used as a context manager, the
+    session commits when the block exits normally and discards its staged
+    updates when it raises.
+    """
+    
+    def __init__(self, store: Any, business_rules: Optional[BusinessRuleHook] = None):
+        """
+        Initialize an empty edit session.
+        
+        Args:
+            store: EntityStore (or SQLiteEntityStore) holding the entities to edit
+            business_rules: Called at commit with every edited entity whose
+                fields are valid; any error message it returns rejects the commit
+        """
+        self.store = store
+        self.business_rules = business_rules
+        self._staged: Dict[Tuple[str, str], _StagedEntity] = {}
+        self._field_names: Dict[type, Dict[str, str]] = {}
+    
+    def __enter__(self) -> 'EditSession':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+    
+    def __len__(self) -> int:
+        """Number of entities with staged updates."""
+        return len(self._staged)
+    
+    def _stage(self, collection_name: str, entity_id: str) -> _StagedEntity:
+        """Get the staged updates of an entity, raising KeyError if it is not stored."""
+        key = (collection_name, entity_id)
+        staged = self._staged.get(key)
+        if staged is None:
+            entity = self.store.collections[collection_name][entity_id]
+            staged = self._staged[key] = _StagedEntity(collection_name, entity_id, type(entity))
+        return staged
+    
+    def _model_field_names(self, model: type) -> Dict[str, str]:
+        """Map the Python field names and schema aliases of a model to its field names."""
+        names = self._field_names.get(model)
+        if names is None:
+            names = {}
+            for name, field in model.model_fields.items():
+                names[name] = name
+                if field.alias:
+                    names[field.alias] = name
+            self._field_names[model] = names
+        return names
+    
+    def _field_name(self, staged: _StagedEntity, field_name: str) -> str:
+        """Resolve a Python field name or schema alias to the model's field name."""
+        names = self._model_field_names(staged.model)
+        if field_name not in names:
+            raise ValueError(f"Unknown field '{field_name}' for {staged.model.__name__}")
+        return names[field_name]
+    
+    def has_field(self, collection_name: str, entity_id: str, field_name: str) -> bool:
+        """Whether a stored entity's model declares a field (Python name or schema alias)."""
+        entity = self.store.collections[collection_name][entity_id]
+        return field_name in self._model_field_names(type(entity))
+    
+    def get(self, collection_name: str, entity_id: str, field_name: str) -> Any:
+        """
+        Get a field's value as the session would commit it.
+        
+        Args:
+            collection_name: Store collection (e.g. 'transactions')
+            entity_id: ID of the entity
+            field_name: Python field name or schema alias
+        
+        Returns:
+            The staged value, or the stored entity's value if the field is untouched
+        """
+        staged = self._stage(collection_name, entity_id)
+        name = self._field_name(staged, field_name)
+        if name in staged.changes:
+            return staged.changes[name]
+        return getattr(self.store.collections[collection_name][entity_id], name)
+    
+    def touch(self, collection_name: str, entity_id: str) -> None:
+        """Stage an entity without field updates, so that commit() refreshes its lastUpdated."""
+        self._stage(collection_name, entity_id)
+    
+    def update(self, collection_name: str, entity_id: str, **fields: Any) -> None:
+        """
+        Stage new values for fields of an entity.
+        
+        Args:
+            collection_name: Store collection (e.g. 'transactions')
+            entity_id: ID of the entity
+            **fields: New values by Python field name or schema alias
+        """
+        staged = self._stage(collection_name, entity_id)
+        for field_name, value in fields.items():
+            name = self._field_name(staged, field_name)
+            staged.changes[name] = value
+            staged.members.pop(name, None)
+    
+    def working_list(self, collection_name: str, entity_id: str, field_name: str) -> List[Any]:
+        """
+        Get the session's copy of a list field, for changes made in place.
+        
+        The stored list is copied on first use (a missing or None list
+        becomes empty); changes to the returned list are committed with the
+        session.
+        
+        Args:
+            collection_name: Store collection (e.g. 'transactions')
+            entity_id: ID of the entity
+            field_name: Python field name or schema alias of a list field
+        
+        Returns:
+            The list the session will commit
+        """
+        staged = self._stage(collection_name, entity_id)
+        name = self._field_name(staged, field_name)
+        items = self._working_list(staged, name)
+        # The caller may change the list, so unique appends rebuild their item set
+        staged.members[name] = None
+        return items
+    
+    def _working_list(self, staged: _StagedEntity, name: str) -> List[Any]:
+        """Get the session's copy of a list field, copying the current value on first use."""
+        if name not in staged.members:
+            if name in staged.changes:
+                current = staged.changes[name]
+            else:
+                current = getattr(self.store.collections[staged.collection_name][staged.entity_id], name)
+            staged.changes[name] = list(current) if current is not None else []
+            staged.members[name] = None
+        return staged.changes[name]
+    
+    def extend(self, collection_name: str, entity_id: str, field_name: str,
+               values: Iterable[Any], unique: bool = True) -> int:
+        """
+        Stage items appended to a list field.
+        
+        Args:
+            collection_name: Store collection (e.g. 'transactions')
+            entity_id: ID of the entity
+            field_name: Python field name or schema alias of a list field
+            values: Items to append
+            unique: Skip (hashable) items the list already holds; an entity
+                first staged by this call stays unstaged if nothing is appended
+        
+        Returns:
+            Number of items appended
+        """
+        newly_staged = (collection_name, entity_id) not in self._staged
+        staged = self._stage(collection_name, entity_id)
+        name = self._field_name(staged, field_name)
+        items = self._working_list(staged, name)
+        if not unique:
+            count = len(items)
+            items.extend(values)
+            return len(items) - count
+        
+        members = staged.members[name]
+        if members is None:
+            members = staged.members[name] = set(items)
+        appended = 0
+        for value in values:
+            if value not in members:
+                members.add(value)
+                items.append(value)
+                appended += 1
+        if not appended and newly_staged:
+            # Nothing changed, so the entity is not written (nor its lastUpdated refreshed)
+            del self._staged[(collection_name, entity_id)]
+        return appended
+    
+    def append(self, collection_name: str, entity_id: str, field_name: str,
+               value: Any, unique: bool = True) -> bool:
+        """
+        Stage an item appended to a list field.
+        
+        Args:
+            collection_name: Store collection (e.g. 'transactions')
+            entity_id: ID of the entity
+            field_name: Python field name or schema alias of a list field
+            value: Item to append
+            unique: Skip the item if the list already holds it
+        
+        Returns:
+            True if the item was appended
+        """
+        return self.extend(collection_name, entity_id, field_name, (value,), unique) == 1
+    
+    def discard(self) -> None:
+        """Drop all staged updates."""
+        self._staged.clear()
+    
+    def commit(self, timestamp: Optional[datetime] = None) -> List[Any]:
+        """
+        Validate the touched fields and write every edited entity back to the store.
+        
+        Each edited entity is a shallow copy of the entity stored now, so
+        untouched fields are shared with it, and only the staged fields are
+        validated. The edited entities are then passed to the business_rules
+        hook, if set. lastUpdated is set to the commit timestamp unless it was
+        staged explicitly. If any field or business rule fails nothing is
+        written and the staged updates are kept.
+        
+        Args:
+            timestamp: lastUpdated of the edited entities (defaults to current time)
+        
+        Returns:
+            The edited entities as written, in the order they were first staged
+        
+        Raises:
+            ValueError: If an entity is no longer stored, a staged value is
+                invalid or an edited entity breaks a business rule
+        """
+        timestamp = timestamp or datetime.now(timezone.utc)
+        writes = []
+        errors = []
+        
+        for staged in self._staged.values():
+            label = f"{staged.collection_name} '{staged.entity_id}'"
+            entity = self.store.collections[staged.collection_name].get(staged.entity_id)
+            if entity is None:
+                errors.append(f"{label}: no longer stored")
+                continue
+            
+            changes = staged.changes
+            if 'last_updated' in staged.model.model_fields and 'last_updated' not in changes:
+                changes = dict(changes, last_updated=timestamp)
+            
+            updated = entity.model_copy()
+            validator = staged.model.__pydantic_validator__
+            for name, value in changes.items():
+                try:
+                    validator.validate_assignment(updated, name, value)
+                except ValidationError as e:
+                    errors.extend(f"{label}: {name}: {error['msg']}" for error in e.errors())
+            writes.append((staged, updated))
+        
+        if not errors and self.business_rules is not None:
+            errors = self.business_rules([
+                (staged.collection_name, staged.entity_id, updated, frozenset(staged.changes))
+                for staged, updated in writes
+            ])
+        if errors:
+            raise ValueError(f"Edit session not committed: {'; '.join(errors)}")
+        
+        transaction = getattr(self.store, 'transaction', None)
+        with transaction() if transaction is not None else nullcontext():
+            for staged, updated in writes:
+                self.store.collections[staged.collection_name][staged.entity_id] = updated
+        self._staged.clear()
+        return [updated for _, updated in writes]
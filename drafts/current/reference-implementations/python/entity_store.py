@@ -0,0 +1,213 @@
+"""
+BOOST Python Reference Implementation - Indexed Entity Store
+
+This module provides the in-memory entity storage behind BOOSTClient.
+Each entity collection is a dictionary keyed by primary key that keeps
+secondary indexes over the relationships between entities up to date on
+every write, so lineage lookups and supply chain checks cost O(related)
+instead of scanning every collection.
+"""
+
+from typing import Dict, Any, List, Callable, Tuple
+
+# Called with (collection name, entity ID, old entity, new entity) after every write;
+# old entity is None for inserts and new entity is None for deletions
+WriteListener = Callable[[str, str, Any, Any], None]
+
+
+def _attribute_keys(*attributes: str) -> Callable[[Any], List[str]]:
+    """Build a key extractor that reads single-valued and list-valued ID attributes."""
+    def extract(entity: Any) -> List[str]:
+        keys = []
+        for attribute in attributes:
+            value = getattr(entity, attribute, None)
+            if isinstance(value, (list, tuple)):
+                keys.extend(v for v in value if v)
+            elif value:
+                keys.append(value)
+        return keys
+    return extract
+
+
+# Entity collections managed by the store, in BOOSTClient order
+COLLECTIONS = (
+    'organizations',
+    'traceable_units',
+    'transactions',
+    'material_processing',
+    'claims',
+    'tracking_points'
+)
+
+# Collection names of the entity types BOOSTClient exposes as attributes;
+# any other entity type is stored in a collection named after the type
+ENTITY_COLLECTIONS = {
+    'organization': 'organizations',
+    'traceable_unit': 'traceable_units',
+    'transaction': 'transactions',
+    'material_processing': 'material_processing',
+    'claim': 'claims',
+    'tracking_point': 'tracking_points'
+}
+
+# Secondary indexes: name -> (collection, key extractor)
+INDEXES: Dict[str, Tuple[str, Callable[[Any], List[str]]]] = {
+    'processing_by_tru': ('material_processing',
+                          _attribute_keys('input_traceable_unit_id', 'output_traceable_unit_id')),
+    'transactions_by_tru': ('transactions', _attribute_keys('traceable_unit_ids', 'traceable_unit_id')),
+    'claims_by_tru': ('claims', _attribute_keys('traceable_unit_id')),
+    'trus_by_organization': ('traceable_units', _attribute_keys('harvester_id', 'operator_id')),
+    'children_by_parent': ('traceable_units', _attribute_keys('parent_traceable_unit_id'))
+}
+
+
+class IndexedCollection(dict):
+    """Dictionary of entities by ID that keeps its store's secondary indexes current."""
+    
+    def __init__(self, store: 'EntityStore', name: str):
+        super().__init__()
+        self._store = store
+        self.name = name
+    
+    def __setitem__(self, entity_id: str, entity: Any):
+        old_entity = self.get(entity_id)
+        super().__setitem__(entity_id, entity)
+        self._store._record_write(self.name, entity_id, old_entity, entity)
+    
+    def __delitem__(self, entity_id: str):
+        old_entity = self[entity_id]
+        super().__delitem__(entity_id)
+        self._store._record_write(self.name, entity_id, old_entity, None)
+    
+    def pop(self, entity_id: str, *default):
+        if entity_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(entity_id)
+        entity = self[entity_id]
+        del self[entity_id]
+        return entity
+    
+    def popitem(self):
+        entity_id = next(reversed(self))
+        return entity_id, self.pop(entity_id)
+    
+    def setdefault(self, entity_id: str, default: Any = None):
+        if entity_id not in self:
+            self[entity_id] = default
+        return self[entity_id]
+    
+    def update(self, *args, **kwargs):
+        for entity_id, entity in dict(*args, **kwargs).items():
+            self[entity_id] = entity
+    
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def clear(self):
+        for entity_id in list(self):
+            del self[entity_id]
+
+
+class EntityStore:
+    """In-memory entity collections with secondary relationship indexes."""
+    
+    def __init__(self):
+        """Initialize empty collections and indexes."""
+        # index name -> key -> entity IDs (dict used as an insertion-ordered set)
+        self._indexes: Dict[str, Dict[str, Dict[str, None]]] = {name: {} for name in INDEXES}
+        self._indexes_by_collection: Dict[str, List[str]] = {}
+        for index_name, (collection_name, _) in INDEXES.items():
+            self._indexes_by_collection.setdefault(collection_name, []).append(index_name)
+        
+        self.collections: Dict[str, IndexedCollection] = {
+            name: IndexedCollection(self, name) for name in COLLECTIONS
+        }
+        self._listeners: List[WriteListener] = []
+    
+    def collection_for(self, entity_type: str) -> IndexedCollection:
+        """
+        Get the collection that stores an entity type, creating it on first use.
+        
+        Args:
+            entity_type: Schema entity type (e.g. 'traceable_unit', 'geographic_data')
+        
+        Returns:
+            Collection of entities of that type keyed by primary key
+        """
+        name = ENTITY_COLLECTIONS.get(entity_type, entity_type)
+        if name not in self.collections:
+            self.collections[name] = IndexedCollection(self, name)
+        return self.collections[name]
+    
+    def add_listener(self, listener: WriteListener):
+        """
+        Register a callback notified after every write to any collection.
+        
+        Args:
+            listener: Called with (collection name, entity ID, old entity, new entity)
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener: WriteListener):
+        """Stop notifying a callback registered with add_listener."""
+        self._listeners.remove(listener)
+    
+    def _record_write(self, collection_name: str, entity_id: str, old_entity: Any, new_entity: Any):
+        """Update the indexes for a write and notify the listeners."""
+        self._reindex(collection_name, entity_id, old_entity, new_entity)
+        for listener in self._listeners:
+            listener(collection_name, entity_id, old_entity, new_entity)
+    
+    def _reindex(self, collection_name: str, entity_id: str, old_entity: Any, new_entity: Any):
+        """Move an entity's index entries from its old to its new version."""
+        for index_name in self._indexes_by_collection.get(collection_name, ()):
+            extract = INDEXES[index_name][1]
+            old_keys = set(extract(old_entity)) if old_entity is not None else set()
+            new_keys = set(extract(new_entity)) if new_entity is not None else set()
+            index = self._indexes[index_name]
+            
+            # Keys kept across an update keep their position in the index
+            for key in old_keys - new_keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.pop(entity_id, None)
+                    if not ids:
+                        del index[key]
+            for key in new_keys - old_keys:
+                index.setdefault(key, {})[entity_id] = None
+    
+    def related_ids(self, index_name: str, key: str) -> List[str]:
+        """
+        Get the IDs of entities related to a key through a secondary index.
+        
+        Args:
+            index_name: Name of the index (see INDEXES)
+            key: Indexed ID, e.g. a TRU ID for 'claims_by_tru'
+        
+        Returns:
+            Entity IDs in insertion order
+        """
+        if index_name not in self._indexes:
+            raise ValueError(f"Unknown index '{index_name}'. Available indexes: {list(INDEXES)}")
+        return list(self._indexes[index_name].get(key, ()))
+    
+    def related(self, index_name: str, key: str) -> List[Any]:
+        """
+        Get the entities related to a key through a secondary index.
+        
+        Args:
+            index_name: Name of the index (see INDEXES)
+            key: Indexed ID, e.g. a TRU ID for 'claims_by_tru'
+        
+        Returns:
+            Related entities in insertion order
+        """
+        entity_ids = self.related_ids(index_name, key)
+        collection = self.collections[INDEXES[index_name][0]]
+        return [collection[entity_id] for entity_id in entity_ids]
+    
+    def has_related(self, index_name: str, key: str) -> bool:
+        """Check whether any entity is related to a key through a secondary index."""
+        return key in self._indexes[index_name]
@@ -0,0 +1,157 @@
+"""
+BOOST Python Reference Implementation - Compiled Field Constraints
+
+This module compiles the top-level properties of an entity schema into
+checkers, once, when the schema is loaded. Each FieldChecker holds its
+compiled pattern, its enum as a frozenset and its length and numeric bounds.
+Each EntityChecker holds the known-property and required-field sets and the
+enum checkers by field. Checking a record is then a set of dict lookups and
+comparisons, without reading the schema dicts again.
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet
+
+# Schema keyword -> key in the constraints dict of SchemaLoader.get_field_constraints
+CONSTRAINT_KEYWORDS = (
+    ('minLength', 'min_length'), ('maxLength', 'max_length'), ('minimum', 'minimum'),
+    ('maximum', 'maximum'), ('pattern', 'pattern'), ('enum', 'enum')
+)
+
+
+class FieldChecker:
+    """Constraints of one schema property, compiled for repeated checks."""
+    
+    __slots__ = ('field_name', 'min_length', 'max_length', 'minimum', 'maximum',
+                 'pattern', 'regex', 'enum', 'enum_set', 'constraints')
+    
+    def __init__(self, field_name: str, field_schema: Dict[str, Any]):
+        """
+        Compile the constraints of a property.
+        
+        Args:
+            field_name: Name of the property
+            field_schema: The property's schema
+        """
+        self.field_name = field_name
+        self.constraints: Dict[str, Any] = {
+            name: field_schema[keyword] for keyword, name in CONSTRAINT_KEYWORDS if keyword in field_schema
+        }
+        self.min_length: Optional[int] = self.constraints.get('min_length')
+        self.max_length: Optional[int] = self.constraints.get('max_length')
+        self.minimum: Optional[float] = self.constraints.get('minimum')
+        self.maximum: Optional[float] = self.constraints.get('maximum')
+        self.pattern: Optional[str] = self.constraints.get('pattern')
+        self.regex = re.compile(self.pattern) if self.pattern is not None else None
+        self.enum: Optional[List[Any]] = self.constraints.get('enum')
+        self.enum_set: Optional[FrozenSet[Any]] = None
+        if self.enum is not None:
+            try:
+                self.enum_set = frozenset(self.enum)
+            except TypeError:
+                # Unhashable enum members (objects, arrays) keep list membership
+                pass
+    
+    def allows(self, value: Any) -> bool:
+        """Whether a value is one of the property's enum values (True without an enum)."""
+        if self.enum is None:
+            return True
+        if self.enum_set is not None:
+            try:
+                return value in self.enum_set
+            except TypeError:
+                # Unhashable values can still equal an enum member
+                pass
+        return value in self.enum
+    
+    def check(self, value: Any) -> List[str]:
+        """
+        Check a value against the property's constraints.
+        
+        Args:
+            value: Value to check
+        
+        Returns:
+            Error messages (empty if the value is valid)
+        """
+        errors = []
+        field_name = self.field_name
+        
+        # String length and pattern constraints
+        if isinstance(value, str):
+            if self.min_length is not None and len(value) < self.min_length:
+                errors.append(f"Field '{field_name}' too short (min: {self.min_length})")
+            if self.max_length is not None and len(value) > self.max_length:
+                errors.append(f"Field '{field_name}' too long (max: {self.max_length})")
+            if self.regex is not None and not self.regex.match(value):
+                errors.append(f"Field '{field_name}' doesn't match pattern: {self.pattern}")
+        
+        # Numeric constraints
+        if isinstance(value, (int, float)):
+            if self.minimum is not None and value < self.minimum:
+                errors.append(f"Field '{field_name}' below minimum: {self.minimum}")
+            if self.maximum is not None and value > self.maximum:
+                errors.append(f"Field '{field_name}' above maximum: {self.maximum}")
+        
+        # Enum constraints
+        if not self.allows(value):
+            errors.append(f"Field '{field_name}' has invalid value. Valid options: {self.enum}")
+        
+        return errors
+
+
+class EntityChecker:
+    """Field checkers and property sets of one entity schema."""
+    
+    __slots__ = ('fields', 'known_fields', 'required', 'required_set', 'enum_fields')
+    
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Compile an entity schema's top-level properties.
+        
+        Args:
+            schema: Entity JSON schema
+        """
+        properties = schema.get('properties', {})
+        self.fields: Dict[str, FieldChecker] = {
+            field_name: FieldChecker(field_name, field_schema if isinstance(field_schema, dict) else {})
+            for field_name, field_schema in properties.items()
+        }
+        self.known_fields: FrozenSet[str] = frozenset(properties)
+        self.required: Tuple[str, ...] = tuple(schema.get('required', ()))
+        self.required_set: FrozenSet[str] = frozenset(self.required)
+        self.enum_fields: Dict[str, FieldChecker] = {
+            field_name: checker for field_name, checker in self.fields.items() if checker.enum is not None
+        }
+    
+    def check_compatibility(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        """
+        Report unknown fields, missing required fields and invalid enum values.
+        
+        Args:
+            data: Entity data
+        
+        Returns:
+            Tuple of (is_compatible, errors followed by unknown-field warnings)
+        """
+        errors = []
+        warnings = []
+        
+        # Check for missing required fields (potential schema changes)
+        if not self.required_set <= data.keys():
+            errors.extend(f"Missing required field '{field_name}'"
+                          for field_name in self.required if field_name not in data)
+        
+        # Check for unknown fields (potential schema additions) and enum values
+        known_fields = self.known_fields
+        enum_fields = self.enum_fields
+        for field_name, field_value in data.items():
+            if field_name not in known_fields:
+                warnings.append(f"Unknown field '{field_name}' - may be from newer schema version")
+                continue
+            checker = enum_fields.get(field_name)
+            if checker is not None and not checker.allows(field_value):
+                errors.append(f"Invalid enum value '{field_value}' for field '{field_name}'. "
+                              f"Valid values: {checker.enum}")
+        
+        return len(errors) == 0, errors + warnings
@@ -0,0 +1,243 @@
+"""
+BOOST Python Reference Implementation - Incremental Validation
+
+This module keeps the per-entity outcomes of BOOSTClient.validate_all()
+between calls. Entity writes are recorded as dirty through an entity store
+change listener; on the next validation only the dirty entities and their
+neighbours in the reference graph (entities they reference and entities
+referencing them) are re-checked, and their outcomes are merged into running
+totals and order-preserving failure lists. A validation after a small batch
+of writes therefore costs O(changed entities + reported errors) instead of
+O(store).
+"""
+
+import time
+from bisect import bisect_left, insort
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable, Set
+
+try:
+    from .entity_store import EntityStore
+    from .instrumentation import ValidationStats
+except ImportError:
+    from entity_store import EntityStore
+    from instrumentation import ValidationStats
+
+# (passed, failed, reported items) of one check on one entity
+CheckOutcome = Tuple[int, int, Tuple[Any, ...]]
+
+# check(collection_name, entity_id, entity) -> outcome
+EntityCheck = Callable[[str, str, Any], CheckOutcome]
+
+EntityKey = Tuple[str, str]
+
+
+class ValidationCache:
+    """Per-entity check outcomes over an entity store, refreshed from its dirty entities."""
+    
+    def __init__(self, store: EntityStore, collections: Iterable[str],
+                 checks: Dict[str, Dict[str, EntityCheck]],
+                 references: Callable[[str, Any], Set[str]]):
+        """
+        Initialize the cache and start tracking writes to the store.
+        
+        Args:
+            store: Entity store to validate
+            collections: Validated collection names, in reporting order
+            checks: Check name -> {collection name: check}, in reporting order
+            references: references(collection_name, entity) -> IDs the entity refers to
+        """
+        self.store = store
+        self.collections = list(collections)
+        self.checks = checks
+        self.references = references
+        self._rank = {name: rank for rank, name in enumerate(self.collections)}
+        # collection -> checks applied to its entities, in reporting order
+        self._collection_checks = {
+            name: [(check_name, by_collection[name]) for check_name, by_collection in checks.items()
+                   if name in by_collection]
+            for name in self.collections
+        }
+        
+        self._valid = False
+        self._token: Any = None
+        self._dirty: Set[EntityKey] = set()
+        self._next_sequence = 0
+        store.add_listener(self._record_write)
+        self._reset()
+    
+    def _reset(self):
+        """Drop every cached outcome."""
+        self._sequence: Dict[EntityKey, int] = {}
+        self._outcomes: Dict[EntityKey, Tuple[Tuple[str, int, int], ...]] = {}
+        self._references: Dict[EntityKey, Set[str]] = {}
+        # Sort position of entities with reported items
+        self._orders: Dict[EntityKey, Tuple[int, int, EntityKey]] = {}
+        # referenced ID -> keys of the entities referring to it
+        self._dependents: Dict[str, Set[EntityKey]] = {}
+        self.totals: Dict[str, List[int]] = {check_name: [0, 0] for check_name in self.checks}
+        # check -> sorted (rank, sequence, key) of entities with reported items
+        self._failing: Dict[str, List[Tuple[int, int, EntityKey]]] = {check_name: [] for check_name in self.checks}
+        self._items: Dict[str, Dict[EntityKey, Tuple[Any, ...]]] = {check_name: {} for check_name in self.checks}
+    
+    def _record_write(self, collection_name: str, entity_id: str, old_entity: Any, new_entity: Any):
+        """Store listener: mark a written entity dirty, keeping its position in its collection."""
+        if not self._valid or collection_name not in self._rank:
+            return
+        key = (collection_name, entity_id)
+        self._dirty.add(key)
+        if new_entity is None:
+            self._sequence.pop(key, None)
+        elif key not in self._sequence:
+            # New keys are appended to their collection, so they sort after every cached entity
+            self._sequence[key] = self._next_sequence
+            self._next_sequence += 1
+    
+    def invalidate(self):
+        """Force the next refresh to re-check every entity."""
+        self._valid = False
+        self._dirty.clear()
+    
+    @property
+    def dirty_count(self) -> int:
+        """Number of entities written since the last refresh."""
+        return len(self._dirty)
+    
+    def refresh(self, token: Any = None, stats: Optional[ValidationStats] = None) -> int:
+        """
+        Bring the cached outcomes up to date with the store.
+        
+        Args:
+            token: Identity of the inputs the checks depend on beyond the
+                store (e.g. loaded schemas); a different token re-checks everything
+            stats: Stats to record the time and failures of every check run in,
+                per check name and collection
+        
+        Returns:
+            Number of entities re-checked
+        """
+        if not self._valid or token is not self._token:
+            return self._rebuild(token, stats)
+        if not self._dirty:
+            return 0
+        
+        changed, self._dirty = self._dirty, set()
+        to_check: Set[EntityKey] = set()
+        collections = self.store.collections
+        for key in changed:
+            collection_name, entity_id = key
+            to_check.add(key)
+            # Entities referring to this one, as of the last refresh (new referrers are dirty themselves)
+            to_check.update(self._dependents.get(entity_id, ()))
+            # Entities this one referred to before and refers to now
+            entity = collections[collection_name].get(entity_id)
+            referenced = set(self._references.get(key, ()))
+            if entity is not None:
+                referenced.update(self.references(collection_name, entity))
+            for referenced_id in referenced:
+                for name in self.collections:
+                    if referenced_id in collections[name]:
+                        to_check.add((name, referenced_id))
+        
+        try:
+            for key in to_check:
+                self._check(key, stats)
+        except Exception:
+            self.invalidate()
+            raise
+        return len(to_check)
+    
+    def _rebuild(self, token: Any, stats: Optional[ValidationStats] = None) -> int:
+        """Re-check every entity of the validated collections."""
+        self._reset()
+        self._dirty.clear()
+        checked = 0
+        try:
+            for collection_name in self.collections:
+                for entity_id in self.store.collections[collection_name]:
+                    key = (collection_name, entity_id)
+                    self._sequence[key] = self._next_sequence
+                    self._next_sequence += 1
+                    self._check(key, stats)
+                    checked += 1
+        except Exception:
+            self.invalidate()
+            raise
+        self._valid = True
+        self._token = token
+        return checked
+    
+    def _check(self, key: EntityKey, stats: Optional[ValidationStats] = None):
+        """Replace the cached outcomes of one entity with fresh ones."""
+        collection_name, entity_id = key
+        self._forget(key)
+        entity = self.store.collections[collection_name].get(entity_id)
+        if entity is None:
+            return
+        
+        references = self.references(collection_name, entity)
+        self._references[key] = references
+        for referenced_id in references:
+            self._dependents.setdefault(referenced_id, set()).add(key)
+        
+        order = (self._rank[collection_name], self._sequence[key], key)
+        outcomes = []
+        clock = time.perf_counter
+        for check_name, check in self._collection_checks[collection_name]:
+            started = clock()
+            passed, failed, items = check(collection_name, entity_id, entity)
+            if stats is not None:
+                stats.record(check_name, collection_name, clock() - started, failed)
+            if passed or failed:
+                totals = self.totals[check_name]
+                totals[0] += passed
+                totals[1] += failed
+                outcomes.append((check_name, passed, failed))
+            if items:
+                self._items[check_name][key] = items
+                insort(self._failing[check_name], order)
+                self._orders[key] = order
+        self._outcomes[key] = tuple(outcomes)
+    
+    def _forget(self, key: EntityKey):
+        """Remove the cached outcomes and references of one entity."""
+        for check_name, passed, failed in self._outcomes.pop(key, ()):
+            totals = self.totals[check_name]
+            totals[0] -= passed
+            totals[1] -= failed
+        for referenced_id in self._references.pop(key, ()):
+            dependents = self._dependents.get(referenced_id)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[referenced_id]
+        order = self._orders.pop(key, None)
+        if order is None:
+            return
+        for check_name, items_by_key in self._items.items():
+            if items_by_key.pop(key, None) is not None:
+                failing = self._failing[check_name]
+                del failing[bisect_left(failing, order)]
+    
+    def items(self, check_name: str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Get the items reported by a check, in collection and insertion order.
+        
+        Args:
+            check_name: Name of the check
+            limit: Maximum number of items to return
+        
+        Returns:
+            Reported items (copies of dicts, so callers may modify them)
+        """
+        items_by_key = self._items[check_name]
+        result = []
+        for _, _, key in self._failing[check_name]:
+            for item in items_by_key[key]:
+                result.append(dict(item) if isinstance(item, dict) else item)
+                if limit is not None and len(result) >= limit:
+                    return result
+        return result
+    
+    def failing_count(self, check_name: str) -> int:
+        """Number of entities a check reported items for."""
+        return len(self._failing[check_name])
@@ -0,0 +1,148 @@
+"""
+BOOST Python Reference Implementation - Validation Instrumentation
+
+This module collects wall time, call counts and error counts of validation
+runs per phase and entity type. Each business rule category is its own
+phase ('business_rules:<category>'). Recording is a dict lookup and three
+additions, so validators keep it on for every run; the finished stats are
+attached to the validation result and passed to an optional hook for
+external metrics collectors.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Callable
+
+# Prefix of the phases timing one business rule category
+BUSINESS_RULE_PHASE = 'business_rules'
+
+# Entity type of phases that check several entity types at once
+ALL_ENTITY_TYPES = '*'
+
+
+@dataclass
+class PhaseCounter:
+    """Counters of one phase on one entity type."""
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict of the counters."""
+        return {'calls': self.calls, 'errors': self.errors, 'seconds': self.seconds}
+
+
+class ValidationStats:
+    """Wall time, call and error counters of a validation run, keyed by (phase, entity type)."""
+    
+    def __init__(self):
+        """Initialize empty stats."""
+        self.counters: Dict[Tuple[str, str], PhaseCounter] = {}
+    
+    def record(self, phase: str, entity_type: str, seconds: float, errors: int = 0, calls: int = 1):
+        """
+        Add measured work to a phase.
+        
+        Args:
+            phase: Phase name (e.g. 'schema', 'foreign_keys')
+            entity_type: Entity type checked, or ALL_ENTITY_TYPES
+            seconds: Wall time spent
+            errors: Number of errors the work reported
+            calls: Number of calls measured
+        """
+        counter = self.counters.get((phase, entity_type))
+        if counter is None:
+            counter = self.counters[(phase, entity_type)] = PhaseCounter()
+        counter.calls += calls
+        counter.errors += errors
+        counter.seconds += seconds
+    
+    def merge(self, other: 'ValidationStats') -> 'ValidationStats':
+        """
+        Add the counters of another stats object (e.g. from a worker process).
+        
+        Args:
+            other: Stats to add
+        
+        Returns:
+            This stats object
+        """
+        for (phase, entity_type), counter in other.counters.items():
+            self.record(phase, entity_type, counter.seconds, counter.errors, counter.calls)
+        return self
+    
+    def phases(self) -> List[str]:
+        """Recorded phases, in first-recorded order."""
+        return list(dict.fromkeys(phase for phase, _ in self.counters))
+    
+    def get(self, phase: str, entity_type: Optional[str] = None) -> PhaseCounter:
+        """
+        Get the counters of a phase.
+        
+        Args:
+            phase: Phase name
+            entity_type: Entity type, or None to sum over all entity types
+        
+        Returns:
+            Counters (zero if nothing was recorded)
+        """
+        if entity_type is not None:
+            counter = self.counters.get((phase, entity_type))
+            return PhaseCounter(counter.calls, counter.errors, counter.seconds) if counter else PhaseCounter()
+        total = PhaseCounter()
+        for (counter_phase, _), counter in self.counters.items():
+            if counter_phase == phase:
+                total.calls += counter.calls
+                total.errors += counter.errors
+                total.seconds += counter.seconds
+        return total
+    
+    def business_rule_categories(self) -> List[str]:
+        """Business rule categories that ran, in first-recorded order."""
+        prefix = BUSINESS_RULE_PHASE + ':'
+        return [phase[len(prefix):] for phase in self.phases() if phase.startswith(prefix)]
+    
+    @property
+    def total_seconds(self) -> float:
+        """Wall time summed over every phase."""
+        return sum(counter.seconds for counter in self.counters.values())
+    
+    def slowest(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get the phase and entity type pairs that took the most time.
+        
+        Args:
+            limit: Maximum number of entries
+        
+        Returns:
+            Dicts with phase, entity_type, calls, errors and seconds, slowest first
+        """
+        ranked = sorted(self.counters.items(), key=lambda item: item[1].seconds, reverse=True)
+        return [{'phase': phase, 'entity_type': entity_type, **counter.as_dict()}
+                for (phase, entity_type), counter in ranked[:limit]]
+    
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Plain data, phase -> entity_type -> counters."""
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (phase, entity_type), counter in self.counters.items():
+            result.setdefault(phase, {})[entity_type] = counter.as_dict()
+        return result
+    
+    def __eq__(self, other: Any) -> bool:
+        """Stats are equal when they counted the same calls and errors; wall times always differ."""
+        if not isinstance(other, ValidationStats):
+            return NotImplemented
+        return ({key: (c.calls, c.errors) for key, c in self.counters.items()} ==
+                {key: (c.calls, c.errors) for key, c in other.counters.items()})
+    
+    def __repr__(self) -> str:
+        return f"ValidationStats({len(self.counters)} counters, {self.total_seconds:.3f}s)"
+
+
+# hook(source, stats), called once per finished validation run; source is
+# 'comprehensive_validation' or 'validate_all'
+StatsHook = Callable[[str, ValidationStats], None]
+
+
+def business_rule_phase(category: str) -> str:
+    """Phase name of a business rule category."""
+    return f"{BUSINESS_RULE_PHASE}:{category}"
@@ -0,0 +1,388 @@
+"""
+BOOST Python Reference Implementation - Streaming JSON-LD
+
+This module reads and writes BOOST JSON-LD documents incrementally, so
+large exports can be imported and exported without holding the whole
+document or its parsed form in memory. Only the text of the entity
+currently being decoded or encoded is buffered.
+"""
+
+import io
+import os
+import re
+import codecs
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Union, IO
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+JSONLDSource = Union[str, os.PathLike, IO]
+
+
+def open_jsonld_source(source: JSONLDSource) -> IO[str]:
+    """
+    Open a JSON-LD source as a text stream.
+    
+    Args:
+        source: Path to a JSON-LD file (gzip-compressed if it ends in '.gz'),
+                or a text or binary file-like object
+    
+    Returns:
+        Text stream over the JSON-LD document
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        if path.suffix == '.gz':
+            return gzip.open(path, 'rt', encoding='utf-8')
+        return open(path, 'r', encoding='utf-8')
+    
+    if isinstance(source.read(0), bytes):
+        # Unlike io.TextIOWrapper, a codecs reader never closes the caller's stream
+        return codecs.getreader('utf-8')(source)
+    return source
+
+
+class JSONLDGraphReader:
+    """
+    Incremental reader for the entities of a JSON-LD document.
+    
+    Yields the items of the top-level '@graph' array one at a time. A
+    top-level array is treated as the graph itself, and an object without
+    '@graph' is yielded as a single entity. Other top-level keys (such as
+    '@context') are collected in `header` as they are passed.
+    
+    NDJSON input (one entity per line) is also accepted; a first line that
+    holds only '@context' is taken as the shared header. Empty input, or a
+    header line with no entities after it, yields no entities.
+    
+    Example:
+        reader = JSONLDGraphReader("export.jsonld.gz")
+        for entity in reader:
+            print(entity['@type'], reader.chars_read)
+    """
+    
+    def __init__(self, source: JSONLDSource, chunk_size: int = 65536):
+        """
+        Initialize the reader.
+        
+        Args:
+            source: Path or file-like object (see open_jsonld_source)
+            chunk_size: Number of characters read from the source at a time
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self._source = source
+        self.chunk_size = chunk_size
+        self.header: Dict[str, Any] = {}
+        self.chars_read = 0
+        self._decoder = json.JSONDecoder()
+        self._stream: Optional[IO[str]] = None
+        self._buffer = ''
+        self._pos = 0
+        self._offset = 0  # document offset of self._buffer[0]
+        self._eof = False
+    
+    def __iter__(self) -> Iterator[Any]:
+        owns_stream = isinstance(self._source, (str, os.PathLike))
+        self._stream = open_jsonld_source(self._source)
+        try:
+            yield from self._read_document()
+        finally:
+            if owns_stream:
+                self._stream.close()
+    
+    def _read_document(self) -> Iterator[Any]:
+        """Dispatch on the top-level value of the document."""
+        if self._peek() == '':
+            # An empty document holds no entities
+            return
+        char = self._next_char()
+        if char == '[':
+            yield from self._read_array()
+        elif char == '{':
+            has_graph = False
+            for key in self._read_object_keys():
+                if key == '@graph':
+                    if self._next_char() != '[':
+                        raise self._error("'@graph' must be an array")
+                    has_graph = True
+                    yield from self._read_array()
+                else:
+                    self.header[key] = self._decode_value()
+            if not has_graph:
+                # NDJSON: a '@context'-only first line is the shared header, every other value an entity
+                is_header = '@context' in self.header and not set(self.header) - {'@context'}
+                if not is_header:
+                    yield self.header
+                    self.header = {}
+                while self._peek() != '':
+                    yield self._decode_value()
+                return
+        else:
+            raise self._error("expected a JSON-LD object or array")
+        
+        if self._peek() != '':
+            raise self._error("unexpected data after the JSON-LD document")
+    
+    def _read_array(self) -> Iterator[Any]:
+        """Yield the items of an array whose '[' has been consumed."""
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            char = self._next_char()
+            if char == ']':
+                return
+            if char != ',':
+                raise self._error("expected ',' or ']' in array")
+    
+    def _read_object_keys(self) -> Iterator[str]:
+        """Yield the keys of an object whose '{' has been consumed; the caller consumes each value."""
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                raise self._error("expected an object key")
+            key = self._decode_value()
+            if self._next_char() != ':':
+                raise self._error("expected ':' after object key")
+            yield key
+            char = self._next_char()
+            if char == '}':
+                return
+            if char != ',':
+                raise self._error("expected ',' or '}' in object")
+    
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input until it is buffered."""
+        self._peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number running to the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise self._error(e.msg, self._offset + e.pos) from None
+            # Grow reads geometrically so a large value is re-scanned O(log n) times
+            self._fill(read_size)
+            read_size = max(read_size, len(self._buffer) - self._pos)
+    
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it ('' at EOF)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ''
+            self._fill(self.chunk_size)
+    
+    def _next_char(self) -> str:
+        """Skip whitespace and consume the next character."""
+        char = self._peek()
+        if char == '':
+            raise self._error("unexpected end of JSON-LD document")
+        self._pos += 1
+        return char
+    
+    def _fill(self, size: int):
+        """Drop consumed input and append up to `size` more characters from the source."""
+        if self._pos:
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+            return
+        self.chars_read += len(chunk)
+        self._buffer += chunk
+    
+    def _error(self, message: str, offset: Optional[int] = None) -> ValueError:
+        """Build a ValueError pointing at a document offset."""
+        if offset is None:
+            offset = self._offset + self._pos
+        return ValueError(f"Invalid JSON-LD at character {offset}: {message}")
+
+
+def iter_jsonld_graph(source: JSONLDSource, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Iterate over the '@graph' entities of a JSON-LD document without loading it whole.
+    
+    Args:
+        source: Path or file-like object (see open_jsonld_source)
+        chunk_size: Number of characters read from the source at a time
+    
+    Returns:
+        Iterator over entity dictionaries
+    """
+    return iter(JSONLDGraphReader(source, chunk_size))
+
+
+JSONLD_FORMATS = ('json', 'ndjson')
+
+
+class JSONLDGraphWriter:
+    """
+    Incremental writer for the entities of a JSON-LD document.
+    
+    Entities are encoded and written one at a time, either as the members
+    of a '@graph' array ('json' format) or one per line after a shared
+    '@context' header line ('ndjson' format). Without a context, the 'json'
+    format writes a plain array and the 'ndjson' format omits the header.
+    
+    Example:
+        with JSONLDGraphWriter("snapshot.ndjson.gz", context, format='ndjson') as writer:
+            for entity_data in entities:
+                writer.write(entity_data)
+    """
+    
+    def __init__(self, target: JSONLDSource, context: Optional[Dict[str, Any]] = None,
+                 format: str = 'json', indent: Optional[int] = None, compress: Optional[bool] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            target: Path to write to, or a text or binary file-like object
+            context: JSON-LD '@context' value written once for all entities (optional)
+            format: 'json' for a single JSON-LD document, 'ndjson' for one entity per line
+            indent: Indentation of the 'json' format (default: compact)
+            compress: Gzip the output (default: only for paths ending in '.gz');
+                      file-like targets must be binary to be compressed
+        """
+        if format not in JSONLD_FORMATS:
+            raise ValueError(f"Unknown JSON-LD format '{format}'. Available formats: {list(JSONLD_FORMATS)}")
+        if format == 'ndjson' and indent is not None:
+            raise ValueError("NDJSON output cannot be indented")
+        
+        self.context = context
+        self.format = format
+        self.indent = indent
+        self.count = 0
+        self._closed = False
+        self._owns_stream = isinstance(target, (str, os.PathLike))
+        
+        if self._owns_stream:
+            path = Path(target)
+            if compress is None:
+                compress = path.suffix == '.gz'
+            if compress:
+                self._stream = gzip.open(path, 'wt', encoding='utf-8')
+            else:
+                self._stream = open(path, 'w', encoding='utf-8')
+        elif isinstance(target, io.TextIOBase):
+            if compress:
+                raise ValueError("Cannot gzip into a text stream; pass a binary file object")
+            self._stream = target
+        else:
+            if compress:
+                # Closing the GzipFile writes the gzip trailer but leaves the target open
+                target = gzip.GzipFile(fileobj=target, mode='wb')
+                self._owns_stream = True
+            # Unlike io.TextIOWrapper, a codecs writer never closes the caller's stream
+            self._stream = codecs.getwriter('utf-8')(target)
+        
+        if indent is None:
+            self._dumps_options = {'separators': (',', ':'), 'default': str}
+        else:
+            self._dumps_options = {'indent': indent, 'default': str}
+        self._graph_pad = ''
+        self._item_pad = ''
+        self._write_header()
+    
+    def _dumps(self, value: Any, pad: str = '') -> str:
+        """Encode a value, indenting continuation lines for its nesting level."""
+        text = json.dumps(value, **self._dumps_options)
+        if pad and self.indent is not None:
+            text = text.replace('\n', '\n' + pad)
+        return text
+    
+    def _write_header(self):
+        """Write everything that precedes the first entity."""
+        if self.format == 'ndjson':
+            if self.context is not None:
+                self._stream.write(self._dumps({'@context': self.context}) + '\n')
+            return
+        
+        pad = ' ' * self.indent if self.indent is not None else ''
+        newline = '\n' if self.indent is not None else ''
+        if self.context is not None:
+            key_separator = ': ' if self.indent is not None else ':'
+            item_separator = ',' + newline if self.indent is not None else ','
+            self._stream.write(
+                '{' + newline + pad + '"@context"' + key_separator + self._dumps(self.context, pad)
+                + item_separator + pad + '"@graph"' + key_separator + '['
+            )
+            self._graph_pad = pad
+        else:
+            self._stream.write('[')
+            self._graph_pad = ''
+        self._item_pad = self._graph_pad + pad
+    
+    def write(self, entity_data: Dict[str, Any]):
+        """
+        Write one entity.
+        
+        Args:
+            entity_data: JSON-serializable entity dictionary
+        """
+        if self._closed:
+            raise ValueError("Cannot write to a closed JSONLDGraphWriter")
+        if self.format == 'ndjson':
+            self._stream.write(self._dumps(entity_data) + '\n')
+        else:
+            # Every entity starts on its own line, also in compact output
+            separator = ',\n' if self.count else '\n'
+            self._stream.write(separator + self._item_pad + self._dumps(entity_data, self._item_pad))
+        self.count += 1
+    
+    def write_many(self, entities: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write entities from an iterable.
+        
+        Args:
+            entities: JSON-serializable entity dictionaries
+        
+        Returns:
+            Number of entities written
+        """
+        count = self.count
+        for entity_data in entities:
+            self.write(entity_data)
+        return self.count - count
+    
+    def close(self):
+        """Finish the document and flush or close the output."""
+        self._close(complete=True)
+    
+    def _close(self, complete: bool):
+        """Flush or close the output, finishing the document only if it is complete."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        if self.format == 'json' and complete:
+            closing = '\n' + self._graph_pad + ']' if self.count else ']'
+            if self.context is not None:
+                closing += '\n}' if self.indent is not None else '}'
+            self._stream.write(closing)
+        
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+    
+    def __enter__(self) -> 'JSONLDGraphWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # An export that failed part-way is left unterminated rather than passing as complete
+        self._close(complete=exc_type is None)
@@ -0,0 +1,250 @@
+"""
+BOOST Python Reference Implementation - Lineage Graph
+
+This module answers transitive lineage queries over the TraceableUnits in
+an entity store. Material flows between TRUs are collected from TRU
+parent/child links, MaterialProcessing input/output TRUs and
+ProcessingHistory inputTRUIds/outputTRUIds (chained through
+previousProcessingHistoryId/nextProcessingHistoryIds) into a compressed
+adjacency graph, built once and traversed breadth-first in both
+directions. The graph and query results are kept until a store write
+changes one of those fields.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Iterator
+
+try:
+    from .cycle_detection import ReferenceGraph, compressed_adjacency
+    from .entity_store import EntityStore
+except ImportError:
+    from cycle_detection import ReferenceGraph, compressed_adjacency
+    from entity_store import EntityStore
+
+# Entity attributes that carry lineage edges, per collection
+LINEAGE_FIELDS = {
+    'traceable_units': ('parent_traceable_unit_id', 'child_traceable_unit_ids'),
+    'material_processing': ('input_traceable_unit_id', 'output_traceable_unit_id'),
+    'processing_history': ('input_tru_ids', 'output_tru_ids',
+                           'previous_processing_history_id', 'next_processing_history_ids')
+}
+
+# Query results kept per graph version
+DEFAULT_MEMO_SIZE = 1024
+
+
+def _ids(value: Any) -> List[str]:
+    """Read a single-valued or list-valued ID attribute, skipping malformed IDs."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [v for v in value if v and isinstance(v, str)]
+    return []
+
+
+def _lineage_key(collection_name: str, entity: Any) -> Optional[Tuple[Any, ...]]:
+    """Values of an entity's lineage attributes, used to detect writes that change the graph."""
+    if entity is None:
+        return None
+    return tuple(getattr(entity, field, None) for field in LINEAGE_FIELDS[collection_name])
+
+
+class LineageGraph:
+    """Upstream/downstream lineage of the TraceableUnits in an entity store."""
+    
+    def __init__(self, store: EntityStore, memo_size: int = DEFAULT_MEMO_SIZE):
+        """
+        Initialize the graph and start tracking writes to the store.
+        
+        Args:
+            store: Entity store holding the TRUs, processing and processing history
+            memo_size: Number of query results kept until the graph changes
+        """
+        self.store = store
+        self.memo_size = memo_size
+        self.version = 0
+        self._graph: Optional[ReferenceGraph] = None
+        self._forward: Tuple[Any, Any, Any] = ()
+        self._backward: Tuple[Any, Any, Any] = ()
+        self._memo: 'OrderedDict[Tuple[Any, ...], Any]' = OrderedDict()
+        store.add_listener(self._record_write)
+    
+    def _record_write(self, collection_name: str, entity_id: str, old_entity: Any, new_entity: Any):
+        """Store listener: drop the graph when a write changes a lineage edge."""
+        if self._graph is None or collection_name not in LINEAGE_FIELDS:
+            return
+        if _lineage_key(collection_name, old_entity) != _lineage_key(collection_name, new_entity):
+            self.invalidate()
+    
+    def invalidate(self):
+        """Rebuild the graph and forget memoized results on the next query."""
+        self._graph = None
+        self._forward = self._backward = ()
+        self._memo.clear()
+        self.version += 1
+    
+    def _edges(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Upstream -> downstream TRU edges, labelled with the processing or history ID."""
+        collections = self.store.collections
+        
+        for tru_id, tru in collections['traceable_units'].items():
+            for parent_id in _ids(getattr(tru, 'parent_traceable_unit_id', None)):
+                yield parent_id, tru_id, None
+            for child_id in _ids(getattr(tru, 'child_traceable_unit_ids', None)):
+                yield tru_id, child_id, None
+        
+        for processing_id, processing in collections['material_processing'].items():
+            for input_id in _ids(getattr(processing, 'input_traceable_unit_id', None)):
+                for output_id in _ids(getattr(processing, 'output_traceable_unit_id', None)):
+                    yield input_id, output_id, processing_id
+        
+        histories = collections.get('processing_history', {})
+        # (preceding history ID, following history ID), declared from either side, in first-seen order
+        links: Dict[Tuple[str, str], None] = {}
+        for history_id, history in histories.items():
+            for input_id in _ids(getattr(history, 'input_tru_ids', None)):
+                for output_id in _ids(getattr(history, 'output_tru_ids', None)):
+                    yield input_id, output_id, history_id
+            for next_id in _ids(getattr(history, 'next_processing_history_ids', None)):
+                links[(history_id, next_id)] = None
+            for previous_id in _ids(getattr(history, 'previous_processing_history_id', None)):
+                links[(previous_id, history_id)] = None
+        
+        # Outputs of a history step feed the inputs of the step after it
+        for preceding_id, following_id in links:
+            preceding = histories.get(preceding_id)
+            following = histories.get(following_id)
+            if preceding is None or following is None:
+                continue
+            for output_id in _ids(getattr(preceding, 'output_tru_ids', None)):
+                for input_id in _ids(getattr(following, 'input_tru_ids', None)):
+                    if output_id != input_id:
+                        yield output_id, input_id, following_id
+    
+    def _build(self) -> ReferenceGraph:
+        """Build the compressed adjacency arrays in both directions, if stale."""
+        if self._graph is None:
+            graph = ReferenceGraph()
+            graph.add_edges(self._edges())
+            num_nodes = len(graph.node_ids)
+            self._forward = compressed_adjacency(num_nodes, graph.sources, graph.targets)
+            self._backward = compressed_adjacency(num_nodes, graph.targets, graph.sources)
+            self._graph = graph
+        return self._graph
+    
+    def _memoized(self, key: Tuple[Any, ...], compute):
+        """Look up a query result, computing and keeping it on a miss."""
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        result = compute()
+        self._memo[key] = result
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return result
+    
+    def _traverse(self, tru_id: str, downstream: bool, max_depth: Optional[int]) -> Dict[str, int]:
+        """Breadth-first search from a TRU, returning reached TRU IDs and their hop counts."""
+        graph = self._build()
+        start = graph.find_node(tru_id)
+        if start is None:
+            return {}
+        offsets, adjacent, _ = self._forward if downstream else self._backward
+        depths = {start: 0}
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for target in adjacent[offsets[node]:offsets[node + 1]]:
+                    if target not in depths:
+                        depths[target] = depth
+                        next_frontier.append(target)
+            frontier = next_frontier
+        del depths[start]
+        node_ids = graph.node_ids
+        return {node_ids[node]: hops for node, hops in depths.items()}
+    
+    def upstream(self, tru_id: str, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get the TRUs a TRU was derived from, directly or transitively.
+        
+        Args:
+            tru_id: TraceableUnit ID
+            max_depth: Maximum number of hops to follow (None for the full closure)
+        
+        Returns:
+            Upstream TRU IDs mapped to their distance in hops, nearest first
+        """
+        return dict(self._memoized(('upstream', tru_id, max_depth),
+                                   lambda: self._traverse(tru_id, False, max_depth)))
+    
+    def downstream(self, tru_id: str, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get the TRUs derived from a TRU, directly or transitively.
+        
+        Args:
+            tru_id: TraceableUnit ID
+            max_depth: Maximum number of hops to follow (None for the full closure)
+        
+        Returns:
+            Downstream TRU IDs mapped to their distance in hops, nearest first
+        """
+        return dict(self._memoized(('downstream', tru_id, max_depth),
+                                   lambda: self._traverse(tru_id, True, max_depth)))
+    
+    def path_to_origin(self, tru_id: str) -> Optional[List[str]]:
+        """
+        Get the shortest chain of TRUs leading back to an origin TRU.
+        
+        An origin is a TRU that was not derived from any other TRU, e.g. a
+        harvested log pile.
+        
+        Args:
+            tru_id: TraceableUnit ID
+        
+        Returns:
+            TRU IDs from tru_id back to the nearest origin, both included
+            ([tru_id] when it is an origin itself), or None when every
+            upstream path runs into a cycle
+        """
+        path = self._memoized(('origin', tru_id), lambda: self._shortest_path_to_origin(tru_id))
+        return list(path) if path is not None else None
+    
+    def _shortest_path_to_origin(self, tru_id: str) -> Optional[Tuple[str, ...]]:
+        """Breadth-first search upstream until a node without upstream edges is reached."""
+        graph = self._build()
+        start = graph.find_node(tru_id)
+        if start is None:
+            return (tru_id,)
+        offsets, adjacent, _ = self._backward
+        previous = {start: -1}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                if offsets[node] == offsets[node + 1]:
+                    # Follow the search tree from the origin back down to the start
+                    path = []
+                    while node != -1:
+                        path.append(node)
+                        node = previous[node]
+                    node_ids = graph.node_ids
+                    return tuple(node_ids[n] for n in reversed(path))
+                for source in adjacent[offsets[node]:offsets[node + 1]]:
+                    if source not in previous:
+                        previous[source] = node
+                        next_frontier.append(source)
+            frontier = next_frontier
+        return None
+    
+    @property
+    def node_count(self) -> int:
+        """Number of TRU IDs in the lineage graph."""
+        return len(self._build().node_ids)
+    
+    @property
+    def edge_count(self) -> int:
+        """Number of lineage edges, counting repeated declarations separately."""
+        return len(self._build().sources)
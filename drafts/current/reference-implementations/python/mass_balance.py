@@ -0,0 +1,358 @@
+"""
+BOOST Python Reference Implementation - Mass Balance Ledger
+
+This module computes MassBalanceAccount balances from a stream of material
+movements. Inputs (e.g. processed feedstock) and outputs (e.g. sold or
+claimed product) are booked to an account per organization and product
+group and summed per balancing period; individual events are not kept, so
+years of events per organization fit in memory proportional to the number
+of accounts and periods. Closing a period produces MassBalanceAccount
+entities and flags accounts whose outputs exceed their available balance.
+"""
+
+import re
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator, NamedTuple, Union
+
+# Balancing period granularities; March 2024 is labelled '2024-03', '2024-Q1' and '2024'
+BALANCING_PERIODS = ('month', 'quarter', 'year')
+
+INPUT = 'input'
+OUTPUT = 'output'
+
+# Balances below -BALANCE_TOLERANCE count as over-crediting (absorbs float rounding)
+BALANCE_TOLERANCE = 1e-9
+
+_ACCOUNT_ID_INVALID = re.compile(r'[^A-Z0-9_-]+')
+
+AccountKey = Tuple[str, str]
+
+
+class LedgerEvent(NamedTuple):
+    """One material movement booked to a mass balance account."""
+    organization_id: str
+    product_group_id: str
+    timestamp: Union[str, date]
+    quantity: float
+    kind: str  # INPUT or OUTPUT
+    source_id: Optional[str] = None
+
+
+def period_of(timestamp: Union[str, date], granularity: str = 'quarter') -> Optional[str]:
+    """
+    Get the balancing period label of a timestamp.
+    
+    Args:
+        timestamp: ISO 8601 date or date-time string, or a date/datetime
+        granularity: 'month', 'quarter' or 'year'
+    
+    Returns:
+        Period label (e.g. '2024-Q1'), or None if the timestamp is malformed
+    """
+    if isinstance(timestamp, date):
+        year, month = timestamp.year, timestamp.month
+    elif isinstance(timestamp, str) and len(timestamp) >= 7 and timestamp[4] == '-':
+        year_text, month_text = timestamp[:4], timestamp[5:7]
+        if not (year_text.isdigit() and month_text.isdigit()):
+            return None
+        year, month = int(year_text), int(month_text)
+        if not 1 <= month <= 12:
+            return None
+    else:
+        return None
+    
+    if granularity == 'month':
+        return f"{year:04d}-{month:02d}"
+    if granularity == 'quarter':
+        return f"{year:04d}-Q{(month - 1) // 3 + 1}"
+    if granularity == 'year':
+        return f"{year:04d}"
+    raise ValueError(f"Unknown balancing period '{granularity}'. Available: {list(BALANCING_PERIODS)}")
+
+
+def account_id_for(organization_id: str, product_group_id: str) -> str:
+    """Build the MassBalanceAccount ID (MBA-...) of an organization and product group."""
+    parts = []
+    for value, prefix in ((organization_id, 'ORG-'), (product_group_id, 'PG-')):
+        value = value[len(prefix):] if value.startswith(prefix) else value
+        parts.append(_ACCOUNT_ID_INVALID.sub('-', value.upper()).strip('-'))
+    return 'MBA-' + '-'.join(part for part in parts if part)
+
+
+def transaction_events(transactions: Iterable[Dict[str, Any]], product_group_id: Optional[str] = None,
+                       quantity_field: str = 'biomassVolume') -> Iterator[LedgerEvent]:
+    """
+    Book transactions as outputs of the selling organization.
+    
+    Cancelled transactions and transactions without a quantity are skipped.
+    
+    Args:
+        transactions: Transaction records with JSON-LD field names
+        product_group_id: Product group for records without a 'productGroupId'
+        quantity_field: Field holding the quantity sold
+    
+    Yields:
+        Output events dated on the transaction date
+    """
+    for record in transactions:
+        if record.get('transactionStatus') == 'cancelled':
+            continue
+        quantity = record.get(quantity_field)
+        organization_id = record.get('OrganizationId')
+        group_id = record.get('productGroupId', product_group_id)
+        if quantity is None or not organization_id or not group_id:
+            continue
+        yield LedgerEvent(organization_id, group_id, record.get('transactionDate'), quantity, OUTPUT,
+                          record.get('transactionId'))
+
+
+def processing_events(processing: Iterable[Dict[str, Any]], organization_id: str, product_group_id: str,
+                      quantity_field: str = 'inputVolume') -> Iterator[LedgerEvent]:
+    """
+    Book material processing as inputs of the processing organization.
+    
+    Args:
+        processing: MaterialProcessing records with JSON-LD field names
+        organization_id: Organization operating the processing
+        product_group_id: Product group the processed material is credited to
+        quantity_field: Field holding the quantity processed
+    
+    Yields:
+        Input events dated on the process timestamp
+    """
+    for record in processing:
+        quantity = record.get(quantity_field)
+        if quantity is None:
+            continue
+        yield LedgerEvent(record.get('organizationId', organization_id),
+                          record.get('productGroupId', product_group_id),
+                          record.get('processTimestamp'), quantity, INPUT, record.get('processingId'))
+
+
+class MassBalanceLedger:
+    """Running mass balances per organization and product group, summed per balancing period."""
+    
+    def __init__(self, balancing_period: str = 'quarter',
+                 conversion_factors: Optional[Dict[str, float]] = None,
+                 context: Optional[Dict[str, Any]] = None):
+        """
+        Initialize an empty ledger.
+        
+        Args:
+            balancing_period: Period granularity: 'month', 'quarter' or 'year'
+            conversion_factors: Product group ID -> factor converting input
+                quantities into output-equivalent credit (default 1.0)
+            context: JSON-LD @context for produced MassBalanceAccount entities
+        """
+        if balancing_period not in BALANCING_PERIODS:
+            raise ValueError(f"Unknown balancing period '{balancing_period}'. "
+                             f"Available: {list(BALANCING_PERIODS)}")
+        self.balancing_period = balancing_period
+        self.conversion_factors = dict(conversion_factors or {})
+        self.context = context or {"boost": "https://github.com/carbondirect/BOOST/schemas#"}
+        
+        # account -> period -> [raw inputs, outputs]
+        self._periods: Dict[AccountKey, Dict[str, List[float]]] = {}
+        # account -> [raw inputs, outputs] over all periods
+        self._totals: Dict[AccountKey, List[float]] = {}
+        self.closed_periods: set = set()
+        # Latest closed period; every period up to it is closed
+        self.closed_through: Optional[str] = None
+        # Closed period reopened by recompute_period while it rebooks the period
+        self._reopened: Optional[str] = None
+        # 'YYYY-MM' timestamp prefix -> period label
+        self._period_labels: Dict[str, str] = {}
+        self.events_recorded = 0
+        self.late_events = 0
+        self.rejected_events = 0
+    
+    def record(self, event: LedgerEvent) -> bool:
+        """
+        Book one event.
+        
+        Events dated in a closed period are not booked; use recompute_period()
+        to correct a closed period.
+        
+        Returns:
+            True if the event was booked
+        
+        Raises:
+            ValueError: If the event's quantity is not a non-negative number
+        """
+        quantity = event.quantity
+        if isinstance(quantity, bool) or not isinstance(quantity, (int, float)) or not quantity >= 0:
+            raise ValueError(f"Ledger event quantity must be a non-negative number, got {quantity!r} "
+                             f"(source {event.source_id!r})")
+        
+        timestamp = event.timestamp
+        if isinstance(timestamp, str):
+            # Period labels depend only on the year and month
+            period = self._period_labels.get(timestamp[:7])
+            if period is None:
+                period = period_of(timestamp, self.balancing_period)
+                if period is not None:
+                    self._period_labels[timestamp[:7]] = period
+        else:
+            period = period_of(timestamp, self.balancing_period)
+        if period is None or event.kind not in (INPUT, OUTPUT):
+            self.rejected_events += 1
+            return False
+        if self.closed_through is not None and period <= self.closed_through and period != self._reopened:
+            self.late_events += 1
+            return False
+        
+        account = (event.organization_id, event.product_group_id)
+        column = 0 if event.kind == INPUT else 1
+        periods = self._periods.get(account)
+        if periods is None:
+            periods = self._periods[account] = {}
+            self._totals[account] = [0.0, 0.0]
+        totals = periods.get(period)
+        if totals is None:
+            totals = periods[period] = [0.0, 0.0]
+        totals[column] += quantity
+        self._totals[account][column] += quantity
+        self.events_recorded += 1
+        return True
+    
+    def consume(self, events: Iterable[LedgerEvent]) -> int:
+        """
+        Book a stream of events.
+        
+        Args:
+            events: Events in any order (e.g. from transaction_events/processing_events)
+        
+        Returns:
+            Number of events booked
+        
+        Raises:
+            ValueError: If an event's quantity is not a non-negative number
+        """
+        record = self.record
+        return sum(1 for event in events if record(event))
+    
+    def conversion_factor(self, product_group_id: str) -> float:
+        """Factor converting input quantities of a product group into output-equivalent credit."""
+        return self.conversion_factors.get(product_group_id, 1.0)
+    
+    def balance(self, organization_id: str, product_group_id: str, period: Optional[str] = None) -> float:
+        """
+        Get an account balance: converted inputs minus outputs.
+        
+        Args:
+            organization_id: Organization ID
+            product_group_id: Product group ID
+            period: Balance at the end of this period (None for all booked events)
+        
+        Returns:
+            Available balance; negative when more was claimed than came in
+        """
+        account = (organization_id, product_group_id)
+        factor = self.conversion_factor(product_group_id)
+        if period is None:
+            inputs, outputs = self._totals.get(account, (0.0, 0.0))
+            return inputs * factor - outputs
+        balance = 0.0
+        for label, (inputs, outputs) in self._periods.get(account, {}).items():
+            if label <= period:
+                balance += inputs * factor - outputs
+        return balance
+    
+    def period_totals(self, organization_id: str, product_group_id: str, period: str) -> Dict[str, float]:
+        """
+        Get the converted inputs and the outputs booked to an account in one period.
+        
+        Returns:
+            {'inputs': ..., 'outputs': ...}
+        """
+        inputs, outputs = self._periods.get((organization_id, product_group_id), {}).get(period, (0.0, 0.0))
+        return {'inputs': inputs * self.conversion_factor(product_group_id), 'outputs': outputs}
+    
+    def close_period(self, period: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Close a balancing period.
+        
+        Produces a MassBalanceAccount for every account with events up to
+        the period. The period and every earlier period are closed: later
+        events dated in any of them are counted as late instead of being
+        booked.
+        
+        Args:
+            period: Period label, e.g. '2024-Q1'
+        
+        Returns:
+            (MassBalanceAccount entities with JSON-LD field names, over-crediting errors)
+        """
+        self.closed_periods.add(period)
+        for periods in self._periods.values():
+            self.closed_periods.update(label for label in periods if label <= period)
+        if self.closed_through is None or period > self.closed_through:
+            self.closed_through = period
+        accounts = []
+        errors = []
+        for (organization_id, product_group_id), periods in self._periods.items():
+            if not any(label <= period for label in periods):
+                continue
+            factor = self.conversion_factor(product_group_id)
+            totals = self.period_totals(organization_id, product_group_id, period)
+            balance = self.balance(organization_id, product_group_id, period)
+            account_id = account_id_for(organization_id, product_group_id)
+            
+            accounts.append({
+                "@context": self.context,
+                "@type": "MassBalanceAccount",
+                "@id": f"https://github.com/carbondirect/BOOST/schemas/mass-balance-account/{account_id}",
+                "accountId": account_id,
+                "organizationId": organization_id,
+                "productGroupId": product_group_id,
+                "periodInputs": totals['inputs'],
+                "periodOutputs": totals['outputs'],
+                "currentBalance": balance,
+                "balancingPeriod": period,
+                "conversionFactors": factor
+            })
+            if balance < -BALANCE_TOLERANCE:
+                errors.append(
+                    f"Over-crediting in {account_id} for {period}: outputs exceed available "
+                    f"balance by {-balance:.3f} (period inputs {totals['inputs']:.3f}, "
+                    f"period outputs {totals['outputs']:.3f})"
+                )
+        return accounts, errors
+    
+    def recompute_period(self, period: str, events: Iterable[LedgerEvent]) -> int:
+        """
+        Replace the totals of one period with those of a corrected set of events.
+        
+        Only the period's totals are swapped; balances of later periods follow
+        without replaying their events. The period stays closed if it was.
+        
+        Args:
+            period: Period label, e.g. '2024-Q1'
+            events: Every event of the period (events of other periods are rejected)
+        
+        Returns:
+            Number of events booked
+        """
+        for account, periods in self._periods.items():
+            old = periods.pop(period, None)
+            if old is not None:
+                totals = self._totals[account]
+                totals[0] -= old[0]
+                totals[1] -= old[1]
+        
+        self._reopened = period
+        booked = 0
+        try:
+            for event in events:
+                if period_of(event.timestamp, self.balancing_period) != period:
+                    self.rejected_events += 1
+                elif self.record(event):
+                    booked += 1
+        finally:
+            self._reopened = None
+        return booked
+    
+    @property
+    def accounts(self) -> List[AccountKey]:
+        """(organization ID, product group ID) of every account with booked events."""
+        return list(self._periods)
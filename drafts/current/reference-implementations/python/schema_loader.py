@@ -6,14 +6,36 @@ making the implementation robust to schema changes by generating
 models and validation rules directly from JSON schemas.
 """
 
+import hashlib
+import io
 import json
+import os
+import pickle
 import re
+import threading
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Type, Union, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type, Union, Tuple, Callable
 from pathlib import Path
 from pydantic import BaseModel, Field, create_model, field_validator, model_validator
 from pydantic.fields import FieldInfo
 from enum import Enum
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import SchemaError
+
+try:
+    from .field_constraints import EntityChecker, FieldChecker
+except ImportError:
+    from field_constraints import EntityChecker, FieldChecker
+
+try:
+    # jsonschema >= 4.18 resolves $ref through the referencing library
+    from referencing import Registry
+    from referencing.exceptions import NoSuchResource
+    from referencing.jsonschema import DRAFT7
+except ImportError:
+    Registry = None
+    from jsonschema import RefResolver
 
 try:
     # Try importing Pydantic v2 (proper V2 imports)
@@ -30,92 +52,298 @@ except ImportError:
         raise ImportError("Pydantic v1 or v2 is required")
 
 
+# Bump when the layout of cached loader state changes
+SCHEMA_CACHE_FORMAT = 1
+
+# Cache entries kept per entity; older schema versions are evicted least recently used first
+SCHEMA_CACHE_ENTRIES_PER_ENTITY = 4
+
+
+def default_schema_cache_dir() -> Path:
+    """Get the schema cache directory ($BOOST_SCHEMA_CACHE_DIR or ~/.cache/boost)."""
+    cache_dir = os.environ.get('BOOST_SCHEMA_CACHE_DIR')
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "boost"
+
+
+def _is_private(stat_result: os.stat_result) -> bool:
+    """Whether a file or directory belongs to the current user and nobody else can write to it."""
+    if not hasattr(os, 'getuid'):
+        # No POSIX ownership (Windows); the default cache lives in the user's profile
+        return True
+    return stat_result.st_uid == os.getuid() and not stat_result.st_mode & 0o022
+
+
+@lru_cache(maxsize=None)
+def _loader_source_digest() -> str:
+    """Hash of this module's source, so cached model definitions follow loader changes."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+class _EnumRefPickler(pickle.Pickler):
+    """Pickler that stores dynamic enums by key, since they cannot be pickled by reference."""
+    
+    def __init__(self, file, enums: Dict[str, Type[Enum]]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._enum_keys = {id(enum_class): key for key, enum_class in enums.items()}
+    
+    def persistent_id(self, obj):
+        if isinstance(obj, type) and id(obj) in self._enum_keys:
+            return ('enum', self._enum_keys[id(obj)])
+        return None
+
+
+class _EnumRefUnpickler(pickle.Unpickler):
+    """Unpickler that resolves enum keys written by _EnumRefPickler."""
+    
+    def __init__(self, file, enums: Dict[str, Type[Enum]]):
+        super().__init__(file)
+        self._enums = enums
+    
+    def persistent_load(self, pid):
+        kind, key = pid
+        if kind != 'enum':
+            raise pickle.UnpicklingError(f"Unsupported persistent id: {pid}")
+        return self._enums[key]
+
+
+def build_entity_validators(schemas: Dict[str, Dict[str, Any]], check_schemas: bool = True,
+                            retrieve: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None
+                            ) -> Dict[str, Draft7Validator]:
+    """
+    Compile one reusable Draft 7 validator per entity schema.
+    
+    Meta-schema checking, format checker setup and $ref resolution happen
+    here once, instead of on every ``jsonschema.validate`` call. Every
+    entity schema is registered under its ``$id`` so references between
+    schema files resolve as well as local ``#/definitions`` references.
+    
+    Args:
+        schemas: Dictionary of entity_name -> JSON schema
+        check_schemas: Run the meta-schema check (skipped for schemas
+            already checked, e.g. when restored from the schema cache)
+        retrieve: Look up a schema by ``$id`` for references to schemas not
+            in ``schemas`` (returns None if there is none)
+    
+    Returns:
+        Dictionary of entity_name -> compiled validator
+    """
+    format_checker = getattr(Draft7Validator, 'FORMAT_CHECKER', None)
+    if format_checker is None:
+        from jsonschema import draft7_format_checker as format_checker
+    
+    if Registry is not None:
+        registry_kwargs = {}
+        if retrieve is not None:
+            def retrieve_resource(uri: str):
+                schema = retrieve(uri)
+                if schema is None:
+                    raise NoSuchResource(ref=uri)
+                return DRAFT7.create_resource(schema)
+            registry_kwargs['retrieve'] = retrieve_resource
+        registry = Registry(**registry_kwargs).with_resources(
+            (schema['$id'], DRAFT7.create_resource(schema))
+            for schema in schemas.values() if '$id' in schema
+        )
+    else:
+        store = {schema['$id']: schema for schema in schemas.values() if '$id' in schema}
+        handlers = {}
+        if retrieve is not None:
+            def retrieve_schema(uri: str):
+                schema = retrieve(uri)
+                if schema is None:
+                    raise LookupError(f"No schema with $id {uri}")
+                return schema
+            handlers = {'http': retrieve_schema, 'https': retrieve_schema}
+    
+    validators = {}
+    for entity_name, schema in schemas.items():
+        if check_schemas:
+            try:
+                Draft7Validator.check_schema(schema)
+            except SchemaError as e:
+                print(f"Warning: Schema for {entity_name} is not valid Draft 7: {e.message}")
+                continue
+        
+        if Registry is not None:
+            ref_kwargs = {'registry': registry}
+        else:
+            ref_kwargs = {'resolver': RefResolver.from_schema(schema, store=store, handlers=handlers)}
+        validators[entity_name] = Draft7Validator(schema, format_checker=format_checker, **ref_kwargs)
+    
+    return validators
+
+
+def resolve_schema_path(schema_base_path: Optional[str] = None) -> Path:
+    """Resolve a schema directory, defaulting to the schema directory in the repository."""
+    if schema_base_path is None:
+        return Path(__file__).parent.parent.parent / "schema"
+    return Path(schema_base_path)
+
+
+class _LoaderState:
+    """Everything a SchemaLoader has loaded; replaced as a whole on refresh."""
+    
+    def __init__(self):
+        # Populated on demand, one entity at a time
+        self.schemas: Dict[str, Dict] = {}
+        self.entity_metadata: Dict[str, Dict] = {}
+        self.relationships: Dict[str, List[Dict[str, Any]]] = {}
+        self.primary_keys: Dict[str, str] = {}
+        self.dynamic_models: Dict[str, Type[BaseModel]] = {}
+        self.enums: Dict[str, Type[Enum]] = {}
+        self.validators: Dict[str, Draft7Validator] = {}
+        self.cross_entity_rules: Dict = {}
+        self.business_logic_rules: Dict = {}
+        self.entity_types: Optional[List[str]] = None
+        self.schema_digests: Dict[str, str] = {}
+        self.compiled: set = set()
+        self.enum_specs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.model_specs: Dict[str, Dict[str, Tuple[Any, Any, Dict[str, Any]]]] = {}
+        self.jsonld_types: Optional[Dict[str, str]] = None
+        # Schema $id -> entity name, built from all schema files on the first cross-file $ref
+        self.schema_ids: Optional[Dict[str, str]] = None
+        # Compiled field constraints, built when an entity schema is parsed
+        self.entity_checkers: Dict[str, EntityChecker] = {}
+
+
+def _state_property(name: str) -> property:
+    """Read-only view of one attribute of the loader's current state."""
+    return property(lambda self: getattr(self._state, name))
+
+
 class SchemaLoader:
     """Dynamic schema loader that generates models and validation from JSON schemas."""
     
-    def __init__(self, schema_base_path: Optional[str] = None):
+    schemas = _state_property('schemas')
+    entity_metadata = _state_property('entity_metadata')
+    relationships = _state_property('relationships')
+    primary_keys = _state_property('primary_keys')
+    dynamic_models = _state_property('dynamic_models')
+    enums = _state_property('enums')
+    validators = _state_property('validators')
+    cross_entity_rules = _state_property('cross_entity_rules')
+    business_logic_rules = _state_property('business_logic_rules')
+    
+    def __init__(self, schema_base_path: Optional[str] = None, cache_dir: Optional[str] = None,
+                 use_cache: bool = True):
         """
         Initialize schema loader.
         
+        Entity schemas are loaded lazily: a schema file is parsed the first
+        time the entity is asked for, and its enums, Pydantic model and
+        JSON Schema validator are generated the first time a model or
+        validator is requested. Use preload() to generate everything up front.
+        
+        Generated model definitions are cached on disk per entity, keyed by
+        a content hash of the entity's schema file, so later processes skip
+        re-deriving them; editing a schema file invalidates its entry. Cache
+        entries are unpickled, so the cache is only used when the directory
+        and its files belong to the current user and nobody else can write
+        to them; only the most recently used entries of each entity are kept.
+        
         Args:
             schema_base_path: Path to BOOST schema directory
+            cache_dir: Directory for the schema cache (default: $BOOST_SCHEMA_CACHE_DIR or ~/.cache/boost)
+            use_cache: Whether to read and write the on-disk schema cache
         """
-        if schema_base_path is None:
-            current_dir = Path(__file__).parent
-            self.schema_base_path = current_dir.parent.parent / "schema"
-        else:
-            self.schema_base_path = Path(schema_base_path)
-        
-        self.schemas: Dict[str, Dict] = {}
-        self.cross_entity_rules: Dict = {}
-        self.business_logic_rules: Dict = {}
-        self.entity_metadata: Dict[str, Dict] = {}
-        self.dynamic_models: Dict[str, Type[BaseModel]] = {}
-        self.enums: Dict[str, Type[Enum]] = {}
-        
-        self._load_schemas()
-        self._discover_relationships()
-        self._generate_dynamic_models()
+        self.schema_base_path = resolve_schema_path(schema_base_path)
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else default_schema_cache_dir()
+        self._cache_dir_checked = False
+        
+        # Guards lazy generation and the state swap in refresh_schemas()
+        self._lock = threading.RLock()
+        self._state = self._new_state()
     
-    def _load_schemas(self):
-        """Load all schemas and extract metadata."""
+    def _new_state(self) -> _LoaderState:
+        """Create a fresh loader state with the rule files loaded."""
+        state = _LoaderState()
+        self._load_rules(state)
+        return state
+    
+    def _load_rules(self, state: _LoaderState):
+        """Load the cross-entity and business logic rule files."""
         try:
-            # Load individual entity schemas
-            for entity_dir in self.schema_base_path.iterdir():
-                if entity_dir.is_dir() and (entity_dir / "validation_schema.json").exists():
-                    schema_file = entity_dir / "validation_schema.json"
-                    with open(schema_file, 'r') as f:
-                        schema_data = json.load(f)
-                        
-                        # Extract schema and metadata
-                        if 'schema' in schema_data:
-                            self.schemas[entity_dir.name] = schema_data['schema']
-                            if 'boost_metadata' in schema_data:
-                                self.entity_metadata[entity_dir.name] = schema_data['boost_metadata']
-                        else:
-                            self.schemas[entity_dir.name] = schema_data
-            
             # Load cross-entity validation rules
             cross_entity_file = self.schema_base_path / "cross_entity_validation.json"
             if cross_entity_file.exists():
                 with open(cross_entity_file, 'r') as f:
-                    self.cross_entity_rules = json.load(f)
+                    state.cross_entity_rules = json.load(f)
             
             # Load business logic validation rules
             business_logic_file = self.schema_base_path / "business_logic_validation.json"
             if business_logic_file.exists():
                 with open(business_logic_file, 'r') as f:
-                    self.business_logic_rules = json.load(f)
-                    
+                    state.business_logic_rules = json.load(f)
+        
         except Exception as e:
-            print(f"Warning: Could not load all schemas: {e}")
+            print(f"Warning: Could not load validation rules: {e}")
+    
+    def _schema_file(self, entity_name: str) -> Path:
+        """Path of the validation schema file for an entity."""
+        return self.schema_base_path / entity_name / "validation_schema.json"
     
-    def _discover_relationships(self):
-        """Discover entity relationships from schemas and metadata."""
-        self.relationships = {}
-        self.primary_keys = {}
+    def _load_entity_schema(self, entity_name: str) -> Optional[Dict[str, Any]]:
+        """Parse one entity schema file and extract its metadata (memoized)."""
+        schema = self.schemas.get(entity_name)
+        if schema is not None:
+            return schema
+        with self._lock:
+            if entity_name in self.schemas:
+                return self.schemas[entity_name]
+            return self._parse_entity_schema(entity_name)
+    
+    def _parse_entity_schema(self, entity_name: str) -> Optional[Dict[str, Any]]:
+        """Parse an entity schema file into the current state. Callers hold the lock."""
+        if entity_name not in self.get_all_entity_types():
+            return None
         
-        # Extract primary keys from metadata
-        for entity_name, metadata in self.entity_metadata.items():
-            if 'entity' in metadata and 'primaryKey' in metadata['entity']:
-                self.primary_keys[entity_name] = metadata['entity']['primaryKey']
-            else:
-                # Fallback: infer from schema properties
-                schema = self.schemas.get(entity_name, {})
-                properties = schema.get('properties', {})
-                # Look for fields ending with 'Id' that are required
-                required_fields = schema.get('required', [])
-                for field_name, field_schema in properties.items():
-                    if field_name.endswith('Id') and field_name in required_fields:
-                        # Check if it's likely a primary key (not foreign key)
-                        if not self._is_foreign_key(field_name, entity_name):
-                            self.primary_keys[entity_name] = field_name
-                            break
+        try:
+            raw = self._schema_file(entity_name).read_bytes()
+            schema_data = json.loads(raw)
+        except Exception as e:
+            print(f"Warning: Could not load schema for {entity_name}: {e}")
+            return None
+        
+        # Extract schema and metadata
+        if 'schema' in schema_data:
+            schema = schema_data['schema']
+            if 'boost_metadata' in schema_data:
+                self.entity_metadata[entity_name] = schema_data['boost_metadata']
+        else:
+            schema = schema_data
+        
+        self._state.schema_digests[entity_name] = hashlib.sha256(raw).hexdigest()
+        self._state.entity_checkers[entity_name] = EntityChecker(schema)
+        self.schemas[entity_name] = schema
+        self._discover_relationships(entity_name)
+        return schema
+    
+    def _discover_relationships(self, entity_name: str):
+        """Discover primary key and relationships of a loaded entity from its schema and metadata."""
+        metadata = self.entity_metadata.get(entity_name, {})
+        
+        # Extract primary key from metadata
+        if 'entity' in metadata and 'primaryKey' in metadata['entity']:
+            self.primary_keys[entity_name] = metadata['entity']['primaryKey']
+        else:
+            # Fallback: infer from schema properties
+            schema = self.schemas.get(entity_name, {})
+            properties = schema.get('properties', {})
+            # Look for fields ending with 'Id' that are required
+            required_fields = schema.get('required', [])
+            for field_name, field_schema in properties.items():
+                if field_name.endswith('Id') and field_name in required_fields:
+                    # Check if it's likely a primary key (not foreign key)
+                    if not self._is_foreign_key(field_name, entity_name):
+                        self.primary_keys[entity_name] = field_name
+                        break
         
         # Extract relationships from metadata
-        for entity_name, metadata in self.entity_metadata.items():
-            if 'relationships' in metadata:
-                self.relationships[entity_name] = metadata['relationships']
+        if 'relationships' in metadata:
+            self.relationships[entity_name] = metadata['relationships']
     
     def _is_foreign_key(self, field_name: str, entity_name: str) -> bool:
         """Check if a field is likely a foreign key."""
@@ -124,15 +352,145 @@ class SchemaLoader:
         field_base = field_name.replace('_', '').lower().replace('id', '')
         return not field_base.startswith(entity_base)
     
-    def _generate_dynamic_models(self):
-        """Generate Pydantic models dynamically from schemas."""
-        # First pass: create enums
-        for entity_name, schema in self.schemas.items():
-            self._create_enums_for_entity(entity_name, schema)
+    def _compile_entity(self, entity_name: str) -> bool:
+        """Generate enums, model and validator for one entity (memoized). Returns False if unknown."""
+        if entity_name in self._state.compiled:
+            return True
+        with self._lock:
+            if entity_name in self._state.compiled:
+                return True
+            return self._compile_entity_locked(entity_name)
+    
+    def _compile_entity_locked(self, entity_name: str) -> bool:
+        """Generate enums, model and validator for one entity. Callers hold the lock."""
+        schema = self._load_entity_schema(entity_name)
+        if schema is None:
+            return False
+        
+        cache_file = None
+        if self.use_cache and self._cache_dir_usable():
+            cache_file = self.cache_dir / f"{entity_name}-{self._cache_key(entity_name)}.pickle"
+            if self._load_from_cache(entity_name, schema, cache_file):
+                self._state.compiled.add(entity_name)
+                return True
+        
+        self._create_enums_for_entity(entity_name, schema)
+        self._create_model_for_entity(entity_name, schema)
+        self.validators.update(build_entity_validators({entity_name: schema}, retrieve=self.get_schema_by_id))
+        self._state.compiled.add(entity_name)
+        
+        if cache_file is not None:
+            self._save_to_cache(entity_name, cache_file)
+        return True
+    
+    def preload(self, entity_names: Optional[List[str]] = None):
+        """
+        Generate models and validators ahead of first use.
+        
+        Args:
+            entity_names: Entities to generate (default: all entity types)
+        """
+        for entity_name in entity_names or self.get_all_entity_types():
+            self._compile_entity(entity_name)
+    
+    def _cache_key(self, entity_name: str) -> str:
+        """Hash an entity's schema file content together with this module's source."""
+        digest = hashlib.sha256(f"format-{SCHEMA_CACHE_FORMAT}".encode())
+        digest.update(_loader_source_digest().encode())
+        digest.update(self._state.schema_digests[entity_name].encode())
+        return digest.hexdigest()
+    
+    def _cache_dir_usable(self) -> bool:
+        """
+        Create the cache directory if needed and check that it is private to this user.
         
-        # Second pass: create models
-        for entity_name, schema in self.schemas.items():
-            self._create_model_for_entity(entity_name, schema)
+        Cache files are unpickled, which can run arbitrary code, so a
+        directory that another user owns or can write to disables the cache
+        for this loader (checked once). Callers hold the lock.
+        """
+        if not self._cache_dir_checked:
+            self._cache_dir_checked = True
+            try:
+                self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                private = _is_private(self.cache_dir.stat())
+            except OSError as e:
+                print(f"Warning: Schema cache disabled, cannot use {self.cache_dir}: {e}")
+                private = False
+            else:
+                if not private:
+                    print(f"Warning: Schema cache disabled, {self.cache_dir} is not private to the current user")
+            self.use_cache = private
+        return self.use_cache
+    
+    def _evict_stale_entries(self, entity_name: str):
+        """Remove all but the most recently used cache entries of an entity (best effort)."""
+        entries = []
+        for cache_file in self.cache_dir.glob(f"{entity_name}-*.pickle"):
+            try:
+                entries.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        for _, cache_file in entries[SCHEMA_CACHE_ENTRIES_PER_ENTITY:]:
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+    
+    def _entity_enum_keys(self, entity_name: str) -> List[str]:
+        """Keys of the dynamic enums generated for an entity."""
+        return [key for key in self._state.enum_specs if key.split('.', 1)[0] == entity_name]
+    
+    def _load_from_cache(self, entity_name: str, schema: Dict[str, Any], cache_file: Path) -> bool:
+        """Restore an entity's enums, model and validator from a cache file. Returns False on a cache miss."""
+        try:
+            with open(cache_file, 'rb') as f:
+                if not _is_private(os.fstat(f.fileno())):
+                    print(f"Warning: Ignoring schema cache {cache_file}, it is not private to the current user")
+                    return False
+                cached = pickle.load(f)
+            # Mark the entry as recently used for eviction
+            os.utime(cache_file)
+            
+            enums = {key: Enum(enum_name, enum_values)
+                     for key, (enum_name, enum_values) in cached['enum_specs'].items()}
+            field_specs = _EnumRefUnpickler(io.BytesIO(cached['model_specs']), enums).load()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable schema cache {cache_file}: {e}")
+            return False
+        
+        self._state.enum_specs.update(cached['enum_specs'])
+        self.enums.update(enums)
+        self._state.model_specs[entity_name] = field_specs
+        self._create_model_from_specs(entity_name, schema, field_specs)
+        if cached['schema_valid']:
+            self.validators.update(build_entity_validators({entity_name: schema}, check_schemas=False,
+                                                           retrieve=self.get_schema_by_id))
+        return True
+    
+    def _save_to_cache(self, entity_name: str, cache_file: Path):
+        """Write an entity's generated definitions to a cache file (best effort)."""
+        try:
+            enum_keys = self._entity_enum_keys(entity_name)
+            model_specs = io.BytesIO()
+            _EnumRefPickler(model_specs, {key: self.enums[key] for key in enum_keys}).dump(
+                self._state.model_specs[entity_name]
+            )
+            cached = {
+                'enum_specs': {key: self._state.enum_specs[key] for key in enum_keys},
+                'model_specs': model_specs.getvalue(),
+                'schema_valid': entity_name in self.validators
+            }
+            
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+            self._evict_stale_entries(entity_name)
+        except Exception as e:
+            print(f"Warning: Could not write schema cache {cache_file}: {e}")
     
     def _create_enums_for_entity(self, entity_name: str, schema: Dict[str, Any]):
         """Create dynamic enums for entity schema."""
@@ -147,50 +505,61 @@ class SchemaLoader:
                 # Create dynamic enum
                 dynamic_enum = Enum(enum_name, enum_values)
                 self.enums[f"{entity_name}.{field_name}"] = dynamic_enum
+                self._state.enum_specs[f"{entity_name}.{field_name}"] = (enum_name, enum_values)
     
     def _create_model_for_entity(self, entity_name: str, schema: Dict[str, Any]):
         """Create a dynamic Pydantic model for an entity."""
+        field_specs = self._build_model_field_specs(entity_name, schema)
+        self._state.model_specs[entity_name] = field_specs
+        self._create_model_from_specs(entity_name, schema, field_specs)
+    
+    def _build_model_field_specs(self, entity_name: str,
+                                 schema: Dict[str, Any]) -> Dict[str, Tuple[Any, Any, Dict[str, Any]]]:
+        """Derive (type, default, Field kwargs) for every model field of an entity."""
         properties = schema.get('properties', {})
         required_fields = schema.get('required', [])
         
-        # Add serialization methods that work in both v1 and v2
-        def model_to_dict(self, by_alias: bool = True):
-            if hasattr(self, 'model_dump'):  # v2
-                return self.model_dump(by_alias=by_alias)
-            return self.dict(by_alias=by_alias)  # v1
-        
         # Base model fields
-        model_fields = {}
+        field_specs = {}
         
         # Add JSON-LD context fields
         if '@context' in properties:
-            model_fields['context'] = (Optional[Dict[str, Any]], Field(None, alias="@context"))
+            field_specs['context'] = (Optional[Dict[str, Any]], None, {'alias': "@context"})
         
         if '@type' in properties:
             type_schema = properties.get('@type', {})
             if 'const' in type_schema:
                 # Fixed type value
-                model_fields['type'] = (str, Field(type_schema['const'], alias="@type"))
+                field_specs['type'] = (str, type_schema['const'], {'alias': "@type"})
             else:
-                model_fields['type'] = (str, Field(..., alias="@type"))
+                field_specs['type'] = (str, ..., {'alias': "@type"})
         
         if '@id' in properties:
-            model_fields['id'] = (str, Field(..., alias="@id"))
+            field_specs['id'] = (str, ..., {'alias': "@id"})
         
         # Process other properties
         for field_name, field_schema in properties.items():
             if field_name.startswith('@'):
                 continue  # Already handled above
-                
+            
             python_field_name = self._to_python_field_name(field_name)
-            field_type, field_info = self._create_field_from_schema(
+            field_specs[python_field_name] = self._field_spec_from_schema(
                 entity_name, field_name, field_schema, field_name in required_fields
             )
-            model_fields[python_field_name] = (field_type, field_info)
         
         # Add lastUpdated if not present
-        if 'lastUpdated' not in properties and 'last_updated' not in model_fields:
-            model_fields['last_updated'] = (Optional[datetime], Field(None, alias="lastUpdated"))
+        if 'lastUpdated' not in properties and 'last_updated' not in field_specs:
+            field_specs['last_updated'] = (Optional[datetime], None, {'alias': "lastUpdated"})
+        
+        return field_specs
+    
+    def _create_model_from_specs(self, entity_name: str, schema: Dict[str, Any],
+                                 field_specs: Dict[str, Tuple[Any, Any, Dict[str, Any]]]):
+        """Create and register the Pydantic model for prepared field specs."""
+        model_fields = {
+            name: (field_type, Field(default, **field_kwargs))
+            for name, (field_type, default, field_kwargs) in field_specs.items()
+        }
         
         # Create model class name
         model_name = entity_name.title().replace('_', '')
@@ -231,9 +600,17 @@ class SchemaLoader:
         result = re.sub('([a-z\\d])([A-Z])', r'\1_\2', result)
         return result.lower()
     
-    def _create_field_from_schema(self, entity_name: str, field_name: str, 
+    def _create_field_from_schema(self, entity_name: str, field_name: str,
                                 field_schema: Dict[str, Any], required: bool) -> Tuple[Type, FieldInfo]:
         """Create a Pydantic field from JSON schema definition."""
+        field_type, default, field_kwargs = self._field_spec_from_schema(
+            entity_name, field_name, field_schema, required
+        )
+        return field_type, Field(default, **field_kwargs)
+    
+    def _field_spec_from_schema(self, entity_name: str, field_name: str,
+                                field_schema: Dict[str, Any], required: bool) -> Tuple[Any, Any, Dict[str, Any]]:
+        """Derive the (type, default, Field kwargs) of a field from its JSON schema definition."""
         field_type = self._get_python_type_from_schema(entity_name, field_name, field_schema)
         
         # Build field constraints
@@ -256,14 +633,14 @@ class SchemaLoader:
         
         # Handle required vs optional
         if required:
-            field_info = Field(..., **field_kwargs)
+            default = ...
         else:
-            field_info = Field(None, **field_kwargs)
+            default = None
             # Make type optional if not required
             if hasattr(field_type, '__origin__') and field_type.__origin__ is not Union:
                 field_type = Optional[field_type]
         
-        return field_type, field_info
+        return field_type, default, field_kwargs
     
     def _get_python_type_from_schema(self, entity_name: str, field_name: str, 
                                    field_schema: Dict[str, Any]) -> Type:
@@ -355,106 +732,211 @@ class SchemaLoader:
 
     
     def get_model(self, entity_name: str) -> Optional[Type[BaseModel]]:
-        """Get dynamic model for entity type."""
-        return self.dynamic_models.get(entity_name)
+        """Get dynamic model for entity type, generating it on first access."""
+        with self._lock:
+            self._compile_entity(entity_name)
+            return self.dynamic_models.get(entity_name)
+    
+    def get_validator(self, entity_name: str) -> Optional[Draft7Validator]:
+        """Get compiled JSON Schema validator for entity type, building it on first access."""
+        with self._lock:
+            self._compile_entity(entity_name)
+            return self.validators.get(entity_name)
     
     def get_enum(self, entity_name: str, field_name: str) -> Optional[Type[Enum]]:
         """Get dynamic enum for entity field."""
-        return self.enums.get(f"{entity_name}.{field_name}")
+        with self._lock:
+            self._compile_entity(entity_name)
+            return self.enums.get(f"{entity_name}.{field_name}")
+    
+    def get_all_enums(self) -> Dict[str, Type[Enum]]:
+        """Get dynamic enums of all entity types, keyed by 'entity.field'."""
+        with self._lock:
+            self.preload()
+            return dict(self.enums)
     
     def get_primary_key(self, entity_name: str) -> Optional[str]:
         """Get primary key field name for entity."""
-        return self.primary_keys.get(entity_name)
+        with self._lock:
+            self._load_entity_schema(entity_name)
+            return self.primary_keys.get(entity_name)
     
     def get_relationships(self, entity_name: str) -> List[Dict[str, Any]]:
         """Get relationship definitions for entity."""
-        return self.relationships.get(entity_name, [])
+        with self._lock:
+            self._load_entity_schema(entity_name)
+            return self.relationships.get(entity_name, [])
     
     def get_schema(self, entity_name: str) -> Optional[Dict[str, Any]]:
-        """Get JSON schema for entity."""
-        return self.schemas.get(entity_name)
+        """Get JSON schema for entity, parsing only that entity's schema file."""
+        return self._load_entity_schema(entity_name)
+    
+    def get_schema_by_id(self, schema_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the entity schema declaring a ``$id``.
+        
+        Compiled validators resolve ``$ref``s to other schema files through
+        this lookup, so references resolve across the whole schema directory
+        while validators are still compiled one entity at a time. The
+        ``$id`` table is built from every schema file on the first lookup
+        and kept until the schemas are refreshed.
+        
+        Args:
+            schema_id: ``$id`` URI (without fragment)
+        
+        Returns:
+            The schema, or None if no schema file declares the ``$id``
+        """
+        state = self._state
+        if state.schema_ids is None:
+            with self._lock:
+                if state.schema_ids is None:
+                    schema_ids = {}
+                    for entity_name in self.get_all_entity_types():
+                        schema = self._load_entity_schema(entity_name)
+                        if schema is not None and '$id' in schema:
+                            schema_ids.setdefault(schema['$id'], entity_name)
+                    state.schema_ids = schema_ids
+        entity_name = state.schema_ids.get(schema_id.rstrip('#'))
+        return state.schemas.get(entity_name) if entity_name is not None else None
     
     def get_all_entity_types(self) -> List[str]:
-        """Get list of all available entity types."""
-        return list(self.schemas.keys())
+        """Get list of all available entity types from the schema directory listing."""
+        if self._state.entity_types is None:
+            try:
+                self._state.entity_types = sorted(
+                    entry.name for entry in self.schema_base_path.iterdir()
+                    if (entry / "validation_schema.json").is_file()
+                )
+            except OSError as e:
+                print(f"Warning: Could not list schema directory: {e}")
+                self._state.entity_types = []
+        return list(self._state.entity_types)
+    
+    def get_entity_type_for_jsonld(self, jsonld_type: str) -> Optional[str]:
+        """
+        Get the entity type whose schema declares a JSON-LD @type.
+        
+        The @type table is built from the '@type' const/enum of every entity
+        schema on first use and kept until the schemas are refreshed.
+        
+        Args:
+            jsonld_type: JSON-LD @type value, matched case-insensitively (e.g. 'TraceableUnit')
+        
+        Returns:
+            Entity type (e.g. 'traceable_unit'), or None if no schema declares the @type
+        """
+        jsonld_types = self._state.jsonld_types
+        if jsonld_types is None:
+            with self._lock:
+                if self._state.jsonld_types is None:
+                    jsonld_types = {}
+                    for entity_name in self.get_all_entity_types():
+                        schema = self._load_entity_schema(entity_name) or {}
+                        type_schema = schema.get('properties', {}).get('@type', {})
+                        if 'const' in type_schema:
+                            values = [type_schema['const']]
+                        else:
+                            values = type_schema.get('enum', [])
+                        for value in values:
+                            jsonld_types.setdefault(str(value).lower(), entity_name)
+                    self._state.jsonld_types = jsonld_types
+                jsonld_types = self._state.jsonld_types
+        return jsonld_types.get(str(jsonld_type).lower())
     
     def get_field_enum_values(self, entity_name: str, field_name: str) -> List[str]:
         """Get enum values for a field from schema."""
-        schema = self.schemas.get(entity_name, {})
+        schema = self.get_schema(entity_name) or {}
         field_schema = schema.get('properties', {}).get(field_name, {})
         return field_schema.get('enum', [])
     
     def is_field_required(self, entity_name: str, field_name: str) -> bool:
         """Check if field is required for entity."""
-        schema = self.schemas.get(entity_name, {})
+        schema = self.get_schema(entity_name) or {}
         required_fields = schema.get('required', [])
         return field_name in required_fields
     
+    def get_entity_checker(self, entity_name: str) -> Optional[EntityChecker]:
+        """
+        Get the compiled field constraints of an entity, built when its schema was parsed.
+        
+        Args:
+            entity_name: Entity type
+        
+        Returns:
+            EntityChecker, or None if the entity type is unknown
+        """
+        checker = self._state.entity_checkers.get(entity_name)
+        if checker is None and self._load_entity_schema(entity_name):
+            checker = self._state.entity_checkers.get(entity_name)
+        return checker
+    
+    def get_field_checker(self, entity_name: str, field_name: str) -> Optional[FieldChecker]:
+        """Get the compiled constraints of one field, or None if the entity or field is unknown."""
+        entity_checker = self.get_entity_checker(entity_name)
+        return entity_checker.fields.get(field_name) if entity_checker is not None else None
+    
     def get_field_constraints(self, entity_name: str, field_name: str) -> Dict[str, Any]:
         """Get validation constraints for a field."""
-        schema = self.schemas.get(entity_name, {})
-        field_schema = schema.get('properties', {}).get(field_name, {})
-        
-        constraints = {}
-        if 'minLength' in field_schema:
-            constraints['min_length'] = field_schema['minLength']
-        if 'maxLength' in field_schema:
-            constraints['max_length'] = field_schema['maxLength']
-        if 'minimum' in field_schema:
-            constraints['minimum'] = field_schema['minimum']
-        if 'maximum' in field_schema:
-            constraints['maximum'] = field_schema['maximum']
-        if 'pattern' in field_schema:
-            constraints['pattern'] = field_schema['pattern']
-        if 'enum' in field_schema:
-            constraints['enum'] = field_schema['enum']
-            
-        return constraints
+        field_checker = self.get_field_checker(entity_name, field_name)
+        return dict(field_checker.constraints) if field_checker is not None else {}
     
     def validate_schema_compatibility(self, entity_name: str, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate data against current schema, reporting compatibility issues."""
-        schema = self.get_schema(entity_name)
-        if not schema:
+        checker = self.get_entity_checker(entity_name)
+        if checker is None or not self.get_schema(entity_name):
             return False, [f"Unknown entity type: {entity_name}"]
-        
-        errors = []
-        warnings = []
-        
-        # Check for unknown fields (potential schema additions)
-        schema_properties = schema.get('properties', {})
-        for field_name in data.keys():
-            if field_name not in schema_properties:
-                warnings.append(f"Unknown field '{field_name}' - may be from newer schema version")
-        
-        # Check for missing required fields (potential schema changes)
-        required_fields = schema.get('required', [])
-        for field_name in required_fields:
-            if field_name not in data:
-                errors.append(f"Missing required field '{field_name}'")
-        
-        # Check enum values
-        for field_name, field_value in data.items():
-            if field_name in schema_properties:
-                field_schema = schema_properties[field_name]
-                if 'enum' in field_schema and field_value not in field_schema['enum']:
-                    errors.append(f"Invalid enum value '{field_value}' for field '{field_name}'. Valid values: {field_schema['enum']}")
-        
-        return len(errors) == 0, errors + warnings
+        return checker.check_compatibility(data)
     
     def refresh_schemas(self):
-        """Reload schemas from disk and regenerate models."""
-        self.schemas.clear()
-        self.cross_entity_rules.clear()
-        self.business_logic_rules.clear()
-        self.entity_metadata.clear()
-        self.dynamic_models.clear()
-        self.enums.clear()
-        
-        self._load_schemas()
-        self._discover_relationships()
-        self._generate_dynamic_models()
-
-
-def create_schema_loader(schema_path: Optional[str] = None) -> SchemaLoader:
-    """Factory function to create a schema loader."""
-    return SchemaLoader(schema_path)
\ No newline at end of file
+        """
+        Reload schemas from disk; models are regenerated on next access.
+        
+        The new state is built separately and swapped in with a single
+        assignment, so concurrent readers see either the old or the new
+        schemas, never a partially cleared loader.
+        """
+        new_state = self._new_state()
+        with self._lock:
+            self._state = new_state
+
+
+# Process-wide loaders, keyed by resolved schema directory
+_shared_loaders: Dict[Path, SchemaLoader] = {}
+_shared_loaders_lock = threading.Lock()
+
+
+def get_shared_loader(schema_path: Optional[str] = None) -> SchemaLoader:
+    """
+    Get the process-wide schema loader for a schema directory.
+    
+    Every BOOST entry point goes through this registry, so a process
+    parses each schema tree once no matter how many clients and
+    validators it creates.
+    
+    Args:
+        schema_path: Path to BOOST schema directory (default: repository schemas)
+    
+    Returns:
+        Shared SchemaLoader instance
+    """
+    key = resolve_schema_path(schema_path).resolve()
+    with _shared_loaders_lock:
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            loader = SchemaLoader(str(key))
+            _shared_loaders[key] = loader
+        return loader
+
+
+def create_schema_loader(schema_path: Optional[str] = None, shared: bool = True) -> SchemaLoader:
+    """
+    Factory function to create a schema loader.
+    
+    Args:
+        schema_path: Path to BOOST schema directory
+        shared: Return the process-wide loader for the path instead of a private one
+    """
+    if shared:
+        return get_shared_loader(schema_path)
+    return SchemaLoader(schema_path)
@@ -0,0 +1,481 @@
+"""
+BOOST Python Reference Implementation - SQLite Entity Store
+
+This module provides a persistent storage backend for BOOSTClient on the
+standard-library sqlite3 module. Every entity type gets its own table,
+generated from its JSON schema: the full entity is kept as JSON next to
+one column per top-level scalar property, and every foreign key field
+declared in boost_metadata.relationships is indexed (list-valued keys in
+a link table). Foreign key integrity and orphan detection run as SQL
+anti-joins. The database uses WAL mode, so other connections can read
+while the client writes.
+
+SQLiteEntityStore offers the same collections, listeners and secondary
+indexes as EntityStore, so BOOSTClient works on it unchanged.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Union
+
+from pydantic import BaseModel, ValidationError
+
+try:
+    from .entity_store import EntityStore, COLLECTIONS, ENTITY_COLLECTIONS, INDEXES
+except ImportError:
+    from entity_store import EntityStore, COLLECTIONS, ENTITY_COLLECTIONS, INDEXES
+
+# Deserialized entities kept per collection
+DEFAULT_CACHE_SIZE = 10000
+
+# Rows fetched per query when iterating a collection
+_PAGE_SIZE = 1000
+
+# SQLite column affinity per JSON schema type
+_COLUMN_TYPES = {'string': 'TEXT', 'number': 'REAL', 'integer': 'INTEGER', 'boolean': 'INTEGER'}
+
+# Entity type of each collection named after BOOSTClient attributes
+_COLLECTION_ENTITY_TYPES = {collection: entity_type for entity_type, collection in ENTITY_COLLECTIONS.items()}
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier (schema field names may contain '@' or mixed case)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _scalar_type(field_schema: Dict[str, Any]) -> Optional[str]:
+    """JSON schema type of a scalar field, or None for arrays, objects and unions."""
+    schema_type = field_schema.get('type')
+    if isinstance(schema_type, list):
+        types = [t for t in schema_type if t != 'null']
+        schema_type = types[0] if len(types) == 1 else None
+    elif schema_type is None and ('enum' in field_schema or 'const' in field_schema):
+        schema_type = 'string'
+    return schema_type if schema_type in _COLUMN_TYPES else None
+
+
+class _EntityTable:
+    """Column layout of one entity type's table, derived from its schema."""
+    
+    def __init__(self, entity_type: str, schema_loader: Any):
+        self.entity_type = entity_type
+        self.name = entity_type
+        properties = (schema_loader.get_schema(entity_type) or {}).get('properties', {})
+        
+        # Field -> SQLite type of every top-level scalar property
+        self.columns: Dict[str, str] = {}
+        for field_name, field_schema in properties.items():
+            scalar_type = _scalar_type(field_schema)
+            if scalar_type is not None and field_name not in ('id', 'data'):
+                self.columns[field_name] = _COLUMN_TYPES[scalar_type]
+        
+        # Foreign keys: single-valued ones are indexed columns, list-valued ones get a link table
+        self.foreign_keys: Dict[str, Dict[str, Any]] = {}
+        self.link_tables: Dict[str, str] = {}
+        for relationship in schema_loader.get_relationships(entity_type):
+            field_name = relationship.get('field')
+            if not field_name or field_name in ('id', 'data'):
+                continue
+            self.foreign_keys[field_name] = relationship
+            if properties.get(field_name, {}).get('type') == 'array':
+                self.link_tables[field_name] = f"{entity_type}__{field_name}"
+            else:
+                self.columns.setdefault(field_name, 'TEXT')
+    
+    def create(self, connection: sqlite3.Connection):
+        """Create the table, its link tables and FK indexes, adding columns new to the schema."""
+        table = _quote(self.name)
+        columns = ''.join(f", {_quote(name)} {column_type}" for name, column_type in self.columns.items())
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, data TEXT NOT NULL{columns})")
+        
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        for name, column_type in self.columns.items():
+            if name not in existing:
+                # A schema gained a field: add and backfill its column from the stored JSON
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(name)} {column_type}")
+                connection.execute(f"UPDATE {table} SET {_quote(name)} = json_extract(data, ?)",
+                                   (f'$."{name}"',))
+        
+        for field_name in self.foreign_keys:
+            if field_name in self.link_tables:
+                link = self.link_tables[field_name]
+                connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(link)} "
+                                   f"(entity_id TEXT NOT NULL, target_id TEXT NOT NULL)")
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote('idx_' + link)} "
+                                   f"ON {_quote(link)} (target_id)")
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote('idx_' + link + '_entity')} "
+                                   f"ON {_quote(link)} (entity_id)")
+            else:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{self.name}_{field_name}')} "
+                                   f"ON {table} ({_quote(field_name)})")
+    
+    def row(self, entity_id: str, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Values of (id, data, *columns) for an entity's JSON record."""
+        values = [entity_id, json.dumps(data, separators=(',', ':'))]
+        for name in self.columns:
+            value = data.get(name)
+            values.append(value if isinstance(value, (str, int, float)) or value is None else json.dumps(value))
+        return tuple(values)
+    
+    def upsert_sql(self) -> str:
+        names = ['id', 'data'] + list(self.columns)
+        assignments = ', '.join(f"{_quote(name)} = excluded.{_quote(name)}" for name in names[1:])
+        return (f"INSERT INTO {_quote(self.name)} ({', '.join(_quote(name) for name in names)}) "
+                f"VALUES ({', '.join('?' * len(names))}) ON CONFLICT(id) DO UPDATE SET {assignments}")
+
+
+class SQLiteCollection:
+    """Dictionary-like view of one entity table, keyed by primary key in insertion order."""
+    
+    def __init__(self, store: 'SQLiteEntityStore', name: str, entity_type: str):
+        self._store = store
+        self.name = name
+        self.entity_type = entity_type
+        self._table = store._table(entity_type)
+        self._model = None
+        # Recently used entities by ID
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+    
+    def _remember(self, entity_id: str, entity: Any):
+        self._cache[entity_id] = entity
+        self._cache.move_to_end(entity_id)
+        if len(self._cache) > self._store.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _load(self, entity_id: str, data_text: str) -> Any:
+        """Rebuild an entity from its JSON record; entities that never validated are rebuilt unvalidated."""
+        if self._model is None:
+            self._model = self._store.schema_loader.get_model(self.entity_type)
+        data = json.loads(data_text)
+        try:
+            entity = self._model.model_validate(data)
+        except ValidationError:
+            entity = self._model.model_construct(**data)
+        self._remember(entity_id, entity)
+        return entity
+    
+    def __getitem__(self, entity_id: str) -> Any:
+        entity = self._cache.get(entity_id)
+        if entity is not None:
+            self._cache.move_to_end(entity_id)
+            return entity
+        row = self._store._connection.execute(
+            f"SELECT data FROM {_quote(self._table.name)} WHERE id = ?", (entity_id,)).fetchone()
+        if row is None:
+            raise KeyError(entity_id)
+        return self._load(entity_id, row[0])
+    
+    def get(self, entity_id: str, default: Any = None) -> Any:
+        try:
+            return self[entity_id]
+        except KeyError:
+            return default
+    
+    def __contains__(self, entity_id: object) -> bool:
+        if entity_id in self._cache:
+            return True
+        return self._store._connection.execute(
+            f"SELECT 1 FROM {_quote(self._table.name)} WHERE id = ?", (entity_id,)).fetchone() is not None
+    
+    def __setitem__(self, entity_id: str, entity: Any):
+        if not isinstance(entity, BaseModel):
+            raise TypeError(f"SQLiteEntityStore stores Pydantic models, got {type(entity).__name__}")
+        old_entity = self.get(entity_id)
+        data = entity.model_dump(by_alias=True, mode='json', exclude_unset=True, warnings=False)
+        connection = self._store._connection
+        with self._store.transaction():
+            connection.execute(self._table.upsert_sql(), self._table.row(entity_id, data))
+            self._write_links(entity_id, data)
+        self._remember(entity_id, entity)
+        self._store._record_write(self.name, entity_id, old_entity, entity)
+    
+    def _write_links(self, entity_id: str, data: Optional[Dict[str, Any]]):
+        connection = self._store._connection
+        for field_name, link in self._table.link_tables.items():
+            connection.execute(f"DELETE FROM {_quote(link)} WHERE entity_id = ?", (entity_id,))
+            targets = data.get(field_name) if data is not None else None
+            if isinstance(targets, list):
+                connection.executemany(f"INSERT INTO {_quote(link)} (entity_id, target_id) VALUES (?, ?)",
+                                       [(entity_id, target) for target in targets if isinstance(target, str)])
+    
+    def __delitem__(self, entity_id: str):
+        old_entity = self[entity_id]
+        with self._store.transaction():
+            self._store._connection.execute(f"DELETE FROM {_quote(self._table.name)} WHERE id = ?", (entity_id,))
+            self._write_links(entity_id, None)
+        self._cache.pop(entity_id, None)
+        self._store._record_write(self.name, entity_id, old_entity, None)
+    
+    def pop(self, entity_id: str, *default):
+        if entity_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(entity_id)
+        entity = self[entity_id]
+        del self[entity_id]
+        return entity
+    
+    def setdefault(self, entity_id: str, default: Any = None):
+        if entity_id not in self:
+            self[entity_id] = default
+        return self[entity_id]
+    
+    def update(self, *args, **kwargs):
+        with self._store.transaction():
+            for entity_id, entity in dict(*args, **kwargs).items():
+                self[entity_id] = entity
+    
+    def clear(self):
+        for entity_id in list(self):
+            del self[entity_id]
+    
+    def __len__(self) -> int:
+        return self._store._connection.execute(f"SELECT COUNT(*) FROM {_quote(self._table.name)}").fetchone()[0]
+    
+    def __bool__(self) -> bool:
+        return self._store._connection.execute(
+            f"SELECT 1 FROM {_quote(self._table.name)} LIMIT 1").fetchone() is not None
+    
+    def _rows(self, columns: str) -> Iterator[Tuple[Any, ...]]:
+        """Yield the requested columns of every row in rowid order, one page at a time."""
+        query = (f"SELECT rowid, {columns} FROM {_quote(self._table.name)} "
+                 f"WHERE rowid > ? ORDER BY rowid LIMIT {_PAGE_SIZE}")
+        last_rowid = 0
+        while True:
+            page = self._store._connection.execute(query, (last_rowid,)).fetchall()
+            for row in page:
+                yield row[1:]
+            if len(page) < _PAGE_SIZE:
+                return
+            last_rowid = page[-1][0]
+    
+    def __iter__(self) -> Iterator[str]:
+        return (row[0] for row in self._rows("id"))
+    
+    def keys(self) -> List[str]:
+        return list(self)
+    
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for entity_id, data_text in self._rows("id, data"):
+            entity = self._cache.get(entity_id)
+            yield entity_id, entity if entity is not None else self._load(entity_id, data_text)
+    
+    def values(self) -> Iterator[Any]:
+        return (entity for _, entity in self.items())
+    
+    def __repr__(self) -> str:
+        return f"SQLiteCollection({self.name!r}, {len(self)} entities)"
+
+
+class SQLiteEntityStore(EntityStore):
+    """Entity collections persisted in an SQLite database, one table per entity type."""
+    
+    def __init__(self, path: Union[str, Path], schema_loader: Any, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Open (or create) a database.
+        
+        Tables are created for every entity type the schemas declare;
+        entities already stored are available immediately.
+        
+        Args:
+            path: Database file, or ':memory:'
+            schema_loader: SchemaLoader providing the entity schemas and relationships
+            cache_size: Deserialized entities kept per collection. Cached entities only
+                follow this store's own writes; use 0 to read a database another process writes to
+        """
+        self.path = str(path)
+        self.schema_loader = schema_loader
+        self.cache_size = cache_size
+        self._connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._transaction_depth = 0
+        
+        self._tables: Dict[str, _EntityTable] = {}
+        with self.transaction():
+            for entity_type in schema_loader.get_all_entity_types():
+                self._table(entity_type)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entity_index "
+                "(seq INTEGER PRIMARY KEY, index_name TEXT NOT NULL, key TEXT NOT NULL, entity_id TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entity_index ON entity_index (index_name, key, entity_id)"
+            )
+        
+        self._indexes_by_collection: Dict[str, List[str]] = {}
+        for index_name, (collection_name, _) in INDEXES.items():
+            self._indexes_by_collection.setdefault(collection_name, []).append(index_name)
+        self._listeners = []
+        
+        self.collections: Dict[str, SQLiteCollection] = {}
+        for name in COLLECTIONS:
+            self.collections[name] = SQLiteCollection(self, name, _COLLECTION_ENTITY_TYPES[name])
+        for entity_type in self._tables:
+            if entity_type not in ENTITY_COLLECTIONS:
+                collection = SQLiteCollection(self, entity_type, entity_type)
+                if collection:
+                    self.collections[entity_type] = collection
+    
+    def _table(self, entity_type: str) -> _EntityTable:
+        """Get the table layout of an entity type, creating the table on first use."""
+        table = self._tables.get(entity_type)
+        if table is None:
+            table = _EntityTable(entity_type, self.schema_loader)
+            table.create(self._connection)
+            self._tables[entity_type] = table
+        return table
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one SQLite transaction, committed when the outermost block exits.
+        
+        Each write commits on its own outside a transaction block; bulk loads
+        are much faster inside one.
+        """
+        if self._transaction_depth == 0:
+            self._connection.execute("BEGIN")
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self._connection.execute("ROLLBACK")
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self._connection.execute("COMMIT")
+    
+    def close(self):
+        """Close the database connection."""
+        self._connection.close()
+    
+    def collection_for(self, entity_type: str) -> SQLiteCollection:
+        """
+        Get the collection that stores an entity type, creating it on first use.
+        
+        Args:
+            entity_type: Schema entity type (e.g. 'traceable_unit', 'geographic_data')
+        
+        Returns:
+            Collection of entities of that type keyed by primary key
+        """
+        name = ENTITY_COLLECTIONS.get(entity_type, entity_type)
+        if name not in self.collections:
+            self.collections[name] = SQLiteCollection(self, name, entity_type)
+        return self.collections[name]
+    
+    def _reindex(self, collection_name: str, entity_id: str, old_entity: Any, new_entity: Any):
+        """Move an entity's index rows from its old to its new version."""
+        index_names = self._indexes_by_collection.get(collection_name, ())
+        if not index_names:
+            return
+        with self.transaction():
+            for index_name in index_names:
+                extract = INDEXES[index_name][1]
+                old_keys = set(extract(old_entity)) if old_entity is not None else set()
+                new_keys = set(extract(new_entity)) if new_entity is not None else set()
+                
+                # Keys kept across an update keep their position in the index
+                self._connection.executemany(
+                    "DELETE FROM entity_index WHERE index_name = ? AND key = ? AND entity_id = ?",
+                    [(index_name, key, entity_id) for key in old_keys - new_keys]
+                )
+                self._connection.executemany(
+                    "INSERT INTO entity_index (index_name, key, entity_id) VALUES (?, ?, ?)",
+                    [(index_name, key, entity_id) for key in new_keys - old_keys]
+                )
+    
+    def related_ids(self, index_name: str, key: str) -> List[str]:
+        """
+        Get the IDs of entities related to a key through a secondary index.
+        
+        Args:
+            index_name: Name of the index (see INDEXES)
+            key: Indexed ID, e.g. a TRU ID for 'claims_by_tru'
+        
+        Returns:
+            Entity IDs in insertion order
+        """
+        if index_name not in INDEXES:
+            raise ValueError(f"Unknown index '{index_name}'. Available indexes: {list(INDEXES)}")
+        rows = self._connection.execute(
+            "SELECT entity_id FROM entity_index WHERE index_name = ? AND key = ? ORDER BY seq", (index_name, key))
+        return [row[0] for row in rows]
+    
+    def has_related(self, index_name: str, key: str) -> bool:
+        """Check whether any entity is related to a key through a secondary index."""
+        return self._connection.execute(
+            "SELECT 1 FROM entity_index WHERE index_name = ? AND key = ? LIMIT 1", (index_name, key)
+        ).fetchone() is not None
+    
+    def _foreign_key_targets(self) -> Iterator[Tuple[_EntityTable, str, str]]:
+        """(table, FK field, target entity type) of every relationship whose target has a table."""
+        for table in self._tables.values():
+            for field_name, relationship in table.foreign_keys.items():
+                target_type = self.schema_loader.get_entity_type_for_jsonld(relationship.get('targetEntity', ''))
+                if target_type in self._tables:
+                    yield table, field_name, target_type
+    
+    def foreign_key_violations(self) -> List[Dict[str, Any]]:
+        """
+        Find foreign keys that reference entities not in the database.
+        
+        Each relationship is checked with one anti-join against the target
+        entity table, using the FK index.
+        
+        Returns:
+            Violations with 'entity_type', 'entity_id', 'field', 'target_type' and 'target_id'
+        """
+        violations = []
+        for table, field_name, target_type in self._foreign_key_targets():
+            if field_name in table.link_tables:
+                query = (f"SELECT s.entity_id, s.target_id FROM {_quote(table.link_tables[field_name])} s "
+                         f"LEFT JOIN {_quote(target_type)} t ON t.id = s.target_id "
+                         f"WHERE t.id IS NULL ORDER BY s.rowid")
+            else:
+                query = (f"SELECT s.id, s.{_quote(field_name)} FROM {_quote(table.name)} s "
+                         f"LEFT JOIN {_quote(target_type)} t ON t.id = s.{_quote(field_name)} "
+                         f"WHERE s.{_quote(field_name)} IS NOT NULL AND t.id IS NULL ORDER BY s.rowid")
+            for entity_id, target_id in self._connection.execute(query):
+                violations.append({
+                    'entity_type': table.entity_type,
+                    'entity_id': entity_id,
+                    'field': field_name,
+                    'target_type': target_type,
+                    'target_id': target_id
+                })
+        return violations
+    
+    def find_orphans(self, entity_type: str) -> List[str]:
+        """
+        Find entities no other entity references through a declared relationship.
+        
+        For example, find_orphans('traceable_unit') lists TRUs that no
+        transaction, processing operation, claim or child TRU points to.
+        
+        Args:
+            entity_type: Schema entity type
+        
+        Returns:
+            IDs of unreferenced entities, in insertion order
+        """
+        table = self._table(entity_type)
+        conditions = []
+        for source, field_name, target_type in self._foreign_key_targets():
+            if target_type != entity_type:
+                continue
+            if field_name in source.link_tables:
+                conditions.append(f"NOT EXISTS (SELECT 1 FROM {_quote(source.link_tables[field_name])} r "
+                                  f"WHERE r.target_id = e.id)")
+            else:
+                conditions.append(f"NOT EXISTS (SELECT 1 FROM {_quote(source.name)} r "
+                                  f"WHERE r.{_quote(field_name)} = e.id AND r.id != e.id)")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        rows = self._connection.execute(f"SELECT e.id FROM {_quote(table.name)} e{where} ORDER BY e.rowid")
+        return [row[0] for row in rows]
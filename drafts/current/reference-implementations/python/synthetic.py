@@ -0,0 +1,658 @@
+#!/usr/bin/env python3
+"""
+BOOST Python Reference Implementation - Synthetic Supply Chain Generator
+
+This module generates referentially consistent supply chains for load
+testing: organizations → harvest TRUs → processing chains → transactions →
+claims. Field values come from the entity schemas (enums, ID patterns,
+formats and ranges) and references follow boost_metadata.relationships,
+with shared pools for referenced entity types outside the chain (materials,
+geographic data, customers, ...). Output is streamed entity by entity,
+every entity is emitted after the entities it references, and the stream
+is deterministic for a given seed, so datasets from 10^3 to 10^7 entities
+can be written to disk without holding them in memory.
+
+A configurable fraction of chain entities gets one injected error (missing
+required field, invalid enum value, pattern mismatch, dangling reference,
+out-of-range number or processing before harvest); every injection is
+recorded so validators can be checked against it.
+
+Usage:
+    python synthetic.py --entities 1000000 --seed 42 --error-rate 0.01 --output chain.ndjson.gz
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Union
+
+try:
+    from .schema_loader import SchemaLoader, get_shared_loader
+    from .jsonld_stream import JSONLDGraphWriter, JSONLDSource
+except ImportError:
+    from schema_loader import SchemaLoader, get_shared_loader
+    from jsonld_stream import JSONLDGraphWriter, JSONLDSource
+
+# Kinds of errors that can be injected into chain entities
+ERROR_KINDS = ('missing_required', 'invalid_enum', 'pattern_mismatch',
+               'dangling_reference', 'out_of_range', 'temporal')
+
+# Context written into every generated entity
+DEFAULT_CONTEXT = {"@vocab": "https://github.com/carbondirect/BOOST/schemas/"}
+
+# First harvest of every generated dataset
+_START_TIME = datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+
+# Chain entity types in the order a chain is emitted
+CHAIN_ENTITY_TYPES = ('organization', 'traceable_unit', 'material_processing', 'transaction', 'claim')
+
+# Longest string generated for an open-ended pattern repetition
+_MAX_REPEAT = 8
+
+
+@dataclass
+class GeneratorConfig:
+    """Shape of a generated supply chain."""
+    entities: int = 1000                    # Total entities to generate, pools included
+    seed: int = 0                           # Random seed; equal seeds give equal output
+    trus_per_organization: int = 20         # Harvest TRUs per harvesting organization
+    processing_depth: int = 2               # Split-and-process levels between harvest and sale
+    fan_out: int = 2                        # Child TRUs split from every TRU at each processing level
+    trus_per_transaction: int = 4           # Final TRUs sold per transaction
+    claim_rate: float = 0.5                 # Probability that a final TRU carries a claim
+    reference_pool_size: int = 50           # Entities per referenced type outside the chain
+    error_rate: float = 0.0                 # Probability that a chain entity gets one injected error
+    error_kinds: Tuple[str, ...] = ERROR_KINDS
+    volume_loss: Tuple[float, float] = (0.005, 0.015)  # Volume lost per processing step (within every process tolerance)
+    
+    def __post_init__(self):
+        unknown = set(self.error_kinds) - set(ERROR_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown error kinds {sorted(unknown)}. Available kinds: {list(ERROR_KINDS)}")
+        if self.entities < 0:
+            raise ValueError("entities must not be negative")
+        if min(self.trus_per_organization, self.fan_out, self.trus_per_transaction) < 1:
+            raise ValueError("trus_per_organization, fan_out and trus_per_transaction must be at least 1")
+        if not 0.0 <= self.error_rate <= 1.0 or not 0.0 <= self.claim_rate <= 1.0:
+            raise ValueError("error_rate and claim_rate must be between 0 and 1")
+
+
+class PatternSampler:
+    """
+    Generate strings matching the regular expressions used in the BOOST schemas.
+    
+    Supports literals, escapes (\\d, \\w, \\.), character classes with
+    ranges, groups with alternation, and the ?, *, + and {n,m} quantifiers,
+    which covers every pattern in the schemas.
+    """
+    
+    _CLASS_SHORTHANDS = {'d': '0123456789', 'w': 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_'}
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._regex = re.compile(pattern)
+        self._position = 0
+        self._tree = self._parse_alternation()
+        if self._position != len(pattern):
+            raise ValueError(f"Unsupported pattern: {pattern}")
+    
+    def sample(self, rng: random.Random) -> str:
+        """Generate one matching string."""
+        return ''.join(self._emit(self._tree, rng))
+    
+    def matches(self, value: str) -> bool:
+        return self._regex.search(value) is not None
+    
+    def literal_prefix(self) -> str:
+        """Literal text every match starts with (e.g. 'TRU-' for '^TRU-[A-Z0-9-_]+$')."""
+        sequences = self._tree[1]
+        if len(sequences) != 1:
+            return ''
+        prefix = []
+        for node in sequences[0]:
+            if node[0] != 'chars' or len(node[1]) != 1 or node[2] != (1, 1):
+                break
+            prefix.append(node[1])
+        return ''.join(prefix)
+    
+    # Parsing: ('alt', [sequence, ...]) where a sequence is a list of
+    # ('chars', alphabet, (min, max)) and ('group', alt, (min, max)) nodes
+    
+    def _peek(self) -> Optional[str]:
+        return self.pattern[self._position] if self._position < len(self.pattern) else None
+    
+    def _next(self) -> str:
+        char = self.pattern[self._position]
+        self._position += 1
+        return char
+    
+    def _parse_alternation(self):
+        sequences = [self._parse_sequence()]
+        while self._peek() == '|':
+            self._next()
+            sequences.append(self._parse_sequence())
+        return ('alt', sequences)
+    
+    def _parse_sequence(self) -> list:
+        sequence = []
+        while self._peek() not in (None, '|', ')'):
+            char = self._next()
+            if char in '^$':
+                continue
+            if char == '(':
+                if self.pattern.startswith('?:', self._position):
+                    self._position += 2
+                node = ('group', self._parse_alternation())
+                if self._next() != ')':
+                    raise ValueError(f"Unsupported pattern: {self.pattern}")
+            elif char == '[':
+                node = ('chars', self._parse_class())
+            elif char == '\\':
+                escaped = self._next()
+                node = ('chars', self._CLASS_SHORTHANDS.get(escaped, escaped))
+            elif char == '.':
+                node = ('chars', self._CLASS_SHORTHANDS['w'])
+            else:
+                node = ('chars', char)
+            sequence.append(node + (self._parse_quantifier(),))
+        return sequence
+    
+    def _parse_class(self) -> str:
+        if self._peek() == '^':
+            raise ValueError(f"Unsupported negated class in pattern: {self.pattern}")
+        members = []
+        while self._peek() != ']':
+            char = self._next()
+            if char == '\\':
+                escaped = self._next()
+                members.extend(self._CLASS_SHORTHANDS.get(escaped, escaped))
+            elif self._peek() == '-' and self.pattern[self._position + 1] != ']':
+                self._next()
+                end = self._next()
+                members.extend(chr(code) for code in range(ord(char), ord(end) + 1))
+            else:
+                members.append(char)
+        self._next()
+        return ''.join(dict.fromkeys(members))
+    
+    def _parse_quantifier(self) -> Tuple[int, int]:
+        char = self._peek()
+        if char == '?':
+            self._next()
+            return 0, 1
+        if char == '*':
+            self._next()
+            return 0, _MAX_REPEAT
+        if char == '+':
+            self._next()
+            return 1, _MAX_REPEAT
+        if char == '{':
+            end = self.pattern.index('}', self._position)
+            bounds = self.pattern[self._position + 1:end].split(',')
+            self._position = end + 1
+            low = int(bounds[0])
+            high = low if len(bounds) == 1 else (int(bounds[1]) if bounds[1] else low + _MAX_REPEAT)
+            return low, high
+        return 1, 1
+    
+    def _emit(self, node, rng: random.Random) -> Iterator[str]:
+        if node[0] == 'alt':
+            for child in rng.choice(node[1]):
+                yield from self._emit(child, rng)
+            return
+        low, high = node[2]
+        for _ in range(rng.randint(low, high)):
+            if node[0] == 'chars':
+                yield rng.choice(node[1])
+            else:
+                yield from self._emit(node[1], rng)
+
+
+class SupplyChainGenerator:
+    """
+    Streaming generator of synthetic BOOST supply chains.
+    
+    Example:
+        generator = SupplyChainGenerator(GeneratorConfig(entities=100000, seed=7, error_rate=0.01))
+        for entity_type, entity_data in generator:
+            ...
+        print(generator.counts, len(generator.injected))
+    """
+    
+    def __init__(self, config: Optional[GeneratorConfig] = None, schema_loader: Optional[SchemaLoader] = None):
+        """
+        Initialize the generator.
+        
+        Args:
+            config: Shape of the supply chain (default: GeneratorConfig())
+            schema_loader: SchemaLoader providing schemas and relationships (default: shared loader)
+        """
+        self.config = config or GeneratorConfig()
+        self.schema_loader = schema_loader or get_shared_loader()
+        # Entities generated per type, and the errors injected so far
+        self.counts: Dict[str, int] = {}
+        self.injected: List[Dict[str, Any]] = []
+        self._samplers: Dict[str, PatternSampler] = {}
+        self._references: Dict[str, Dict[str, str]] = {}
+        self._plans: Dict[str, Dict[str, Any]] = {}
+        self._pools: Dict[str, List[str]] = {}
+    
+    def __iter__(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return self.generate()
+    
+    def generate(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Generate the supply chain.
+        
+        Yields exactly config.entities (entity_type, entity_data) pairs.
+        Every reference points to an entity yielded earlier, so any prefix
+        of the stream is referentially consistent apart from injected errors.
+        """
+        self.counts = {}
+        self.injected = []
+        self._pools = {}
+        self._rng = random.Random(self.config.seed)
+        remaining = self.config.entities
+        for entity_type, entity_data in self._stream():
+            if remaining == 0:
+                return
+            remaining -= 1
+            self.counts[entity_type] = self.counts.get(entity_type, 0) + 1
+            yield entity_type, entity_data
+    
+    # Schema-driven values
+    
+    def _sampler(self, pattern: str) -> PatternSampler:
+        sampler = self._samplers.get(pattern)
+        if sampler is None:
+            sampler = self._samplers[pattern] = PatternSampler(pattern)
+        return sampler
+    
+    def _properties(self, entity_type: str) -> Dict[str, Any]:
+        return (self.schema_loader.get_schema(entity_type) or {}).get('properties', {})
+    
+    def _required(self, entity_type: str) -> List[str]:
+        return (self.schema_loader.get_schema(entity_type) or {}).get('required', [])
+    
+    def _reference_targets(self, entity_type: str) -> Dict[str, str]:
+        """FK field -> target entity type for the relationships of an entity type."""
+        targets = self._references.get(entity_type)
+        if targets is None:
+            targets = {}
+            for relationship in self.schema_loader.get_relationships(entity_type):
+                target_type = self.schema_loader.get_entity_type_for_jsonld(relationship.get('targetEntity', ''))
+                if relationship.get('field') and target_type:
+                    targets[relationship['field']] = target_type
+            self._references[entity_type] = targets
+        return targets
+    
+    def _value(self, field_schema: Dict[str, Any], sequence: int = 0) -> Any:
+        """Generate a value satisfying a field schema."""
+        rng = self._rng
+        if 'const' in field_schema:
+            return field_schema['const']
+        if 'enum' in field_schema:
+            return rng.choice(field_schema['enum'])
+        for keyword in ('oneOf', 'anyOf'):
+            if keyword in field_schema:
+                return self._value(field_schema[keyword][0], sequence)
+        
+        schema_type = field_schema.get('type', 'string')
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != 'null'), 'null')
+        
+        if schema_type == 'string':
+            if 'pattern' in field_schema:
+                return self._sampler(field_schema['pattern']).sample(rng)
+            value_format = field_schema.get('format')
+            if value_format == 'date-time':
+                return _timestamp(_START_TIME + timedelta(minutes=sequence))
+            if value_format == 'date':
+                return (_START_TIME + timedelta(minutes=sequence)).date().isoformat()
+            if value_format == 'email':
+                return f"synthetic-{sequence}@example.com"
+            if value_format in ('uri', 'iri'):
+                return f"https://example.com/boost/{sequence}"
+            text = f"Synthetic value {sequence}"
+            min_length = field_schema.get('minLength', 0)
+            if len(text) < min_length:
+                text += 'x' * (min_length - len(text))
+            return text[:field_schema.get('maxLength', len(text))]
+        if schema_type in ('number', 'integer'):
+            low = field_schema.get('minimum', field_schema.get('exclusiveMinimum', 0))
+            high = field_schema.get('maximum', field_schema.get('exclusiveMaximum', low + 1000))
+            if 'exclusiveMinimum' in field_schema:
+                low += 1
+            if 'exclusiveMaximum' in field_schema:
+                high -= 1
+            if schema_type == 'integer' or 'multipleOf' in field_schema:
+                step = field_schema.get('multipleOf', 1)
+                # Whole multiples avoid floating point remainders in multipleOf checks
+                step = step if step >= 1 else 1
+                value = rng.randint(int(-(-low // step)), int(high // step)) * step
+                return int(value) if schema_type == 'integer' else float(value)
+            return round(rng.uniform(low, high), 2)
+        if schema_type == 'boolean':
+            return rng.random() < 0.5
+        if schema_type == 'array':
+            items = field_schema.get('items', {})
+            count = max(field_schema.get('minItems', 1), 1)
+            if 'enum' in items:
+                return rng.sample(items['enum'], min(count, len(items['enum'])))
+            return [self._value(items, sequence) for _ in range(count)]
+        if schema_type == 'object':
+            properties = field_schema.get('properties', {})
+            return {name: self._value(properties.get(name, {}), sequence)
+                    for name in field_schema.get('required', [])}
+        return None
+    
+    def _plan(self, entity_type: str) -> Dict[str, Any]:
+        """Schema facts used for every entity of a type, derived once."""
+        plan = self._plans.get(entity_type)
+        if plan is None:
+            properties = self._properties(entity_type)
+            primary_key = self.schema_loader.get_primary_key(entity_type)
+            type_schema = properties.get('@type', {})
+            targets = self._reference_targets(entity_type)
+            
+            # Primary keys are '<pattern prefix>SYN-<sequence>' when that matches the ID pattern
+            id_prefix = f"{entity_type.upper().replace('_', '-')}-"
+            id_sampler = None
+            if 'pattern' in properties.get(primary_key, {}):
+                id_sampler = self._sampler(properties[primary_key]['pattern'])
+                id_prefix = id_sampler.literal_prefix()
+                if id_sampler.matches(f"{id_prefix}SYN-00000000"):
+                    id_sampler = None
+            
+            plan = self._plans[entity_type] = {
+                'primary_key': primary_key,
+                'properties': properties,
+                'required': set(self._required(entity_type)),
+                'type': type_schema.get('const') or (type_schema.get('enum') or [entity_type])[0],
+                'id_base': f"https://github.com/carbondirect/BOOST/{entity_type.replace('_', '-')}/",
+                'id_prefix': id_prefix + 'SYN-',
+                'id_sampler': id_sampler,
+                'fields': [(name, targets.get(name), properties.get(name, {}))
+                           for name in self._required(entity_type)
+                           if not name.startswith('@') and name != primary_key]
+            }
+        return plan
+    
+    def _entity(self, entity_type: str, sequence: int, **fields) -> Dict[str, Any]:
+        """Build an entity with every required field, references drawn from the pools."""
+        plan = self._plan(entity_type)
+        if plan['id_sampler'] is None:
+            entity_id = f"{plan['id_prefix']}{sequence:08d}"
+        else:
+            entity_id = plan['id_sampler'].sample(self._rng)
+        entity = {
+            '@context': DEFAULT_CONTEXT,
+            '@type': plan['type'],
+            '@id': plan['id_base'] + entity_id,
+            plan['primary_key']: entity_id
+        }
+        for field_name, target_type, field_schema in plan['fields']:
+            if field_name in fields:
+                continue
+            pool = self._pools.get(target_type) if target_type is not None else None
+            if pool:
+                entity[field_name] = pool[self._rng.randrange(len(pool))]
+            else:
+                entity[field_name] = self._value(field_schema, sequence)
+        entity.update(fields)
+        return entity
+    
+    # Chain layout
+    
+    def _pool_types(self) -> List[str]:
+        """Referenced entity types outside the chain, ordered so referenced pools come first."""
+        ordered: List[str] = []
+        visiting = set()
+        
+        def visit(entity_type: str):
+            if entity_type in ordered or entity_type in visiting:
+                return
+            visiting.add(entity_type)
+            required = set(self._required(entity_type))
+            for field_name, target_type in self._reference_targets(entity_type).items():
+                if field_name in required and target_type not in CHAIN_ENTITY_TYPES:
+                    visit(target_type)
+            visiting.discard(entity_type)
+            if entity_type not in CHAIN_ENTITY_TYPES:
+                ordered.append(entity_type)
+        
+        for entity_type in CHAIN_ENTITY_TYPES:
+            visit(entity_type)
+        return ordered
+    
+    def _stream(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        config = self.config
+        rng = self._rng
+        for entity_type in self._pool_types():
+            pool = self._pools[entity_type] = []
+            for sequence in range(1, config.reference_pool_size + 1):
+                entity = self._entity(entity_type, sequence)
+                pool.append(entity[self._plan(entity_type)['primary_key']])
+                yield entity_type, entity
+        
+        tru_key = self._plan('traceable_unit')['primary_key']
+        sequences = dict.fromkeys(CHAIN_ENTITY_TYPES, 0)
+        organization_id = None
+        final_trus: List[str] = []
+        
+        def next_sequence(entity_type: str) -> int:
+            sequences[entity_type] += 1
+            return sequences[entity_type]
+        
+        def emit(entity_type: str, entity: Dict[str, Any], context: Dict[str, Any]):
+            if config.error_rate and rng.random() < config.error_rate:
+                self._inject(entity_type, entity, context)
+            return entity_type, entity
+        
+        for harvest in range(sys.maxsize):
+            harvest_time = _START_TIME + timedelta(minutes=harvest)
+            if harvest % config.trus_per_organization == 0:
+                organization = self._entity('organization', next_sequence('organization'),
+                                            organizationType='harvester')
+                organization_id = organization[self._plan('organization')['primary_key']]
+                yield emit('organization', organization, {})
+            
+            volume = round(rng.uniform(20.0, 120.0), 2)
+            tru = self._entity('traceable_unit', next_sequence('traceable_unit'),
+                               harvesterId=organization_id, totalVolumeM3=volume,
+                               createdTimestamp=_timestamp(harvest_time))
+            yield emit('traceable_unit', tru, {})
+            
+            # Each level splits every TRU into fan_out child TRUs, then processes each child 1:1
+            frontier = [(tru[tru_key], volume, harvest_time)]
+            for depth in range(config.processing_depth):
+                next_frontier = []
+                for parent_id, parent_volume, parent_time in frontier:
+                    share = round(parent_volume / config.fan_out, 3)
+                    for _ in range(config.fan_out):
+                        split_time = parent_time + timedelta(hours=rng.randint(1, 24))
+                        child = self._entity('traceable_unit', next_sequence('traceable_unit'),
+                                             harvesterId=organization_id, totalVolumeM3=share,
+                                             createdTimestamp=_timestamp(split_time),
+                                             parentTraceableUnitId=parent_id)
+                        yield emit('traceable_unit', child, {})
+                        
+                        process_time = split_time + timedelta(hours=rng.randint(1, 48))
+                        output_volume = round(share * (1 - rng.uniform(*config.volume_loss)), 3)
+                        output = self._entity('traceable_unit', next_sequence('traceable_unit'),
+                                              harvesterId=organization_id, totalVolumeM3=output_volume,
+                                              createdTimestamp=_timestamp(process_time))
+                        yield emit('traceable_unit', output, {})
+                        processing = self._entity('material_processing', next_sequence('material_processing'),
+                                                  inputTraceableUnitId=child[tru_key],
+                                                  outputTraceableUnitId=output[tru_key],
+                                                  processTimestamp=_timestamp(process_time),
+                                                  inputVolume=share, outputVolume=output_volume)
+                        yield emit('material_processing', processing, {'input_time': split_time})
+                        next_frontier.append((output[tru_key], output_volume, process_time))
+                frontier = next_frontier
+            
+            for tru_id, _, _ in frontier:
+                if rng.random() < config.claim_rate:
+                    claim = self._entity('claim', next_sequence('claim'), TraceableUnitId=tru_id)
+                    yield emit('claim', claim, {})
+                final_trus.append(tru_id)
+                if len(final_trus) == config.trus_per_transaction:
+                    sale_date = max(time for _, _, time in frontier) + timedelta(days=1)
+                    transaction = self._entity('transaction', next_sequence('transaction'),
+                                               OrganizationId=organization_id, traceableUnitIds=final_trus,
+                                               transactionDate=sale_date.date().isoformat())
+                    yield emit('transaction', transaction, {})
+                    final_trus = []
+    
+    # Error injection
+    
+    def _inject(self, entity_type: str, entity: Dict[str, Any], context: Dict[str, Any]):
+        """Apply one error of a randomly chosen kind, falling back to missing_required."""
+        rng = self._rng
+        plan = self._plan(entity_type)
+        properties, primary_key = plan['properties'], plan['primary_key']
+        editable = [name for name in entity if not name.startswith('@') and name != primary_key]
+        kind = rng.choice(self.config.error_kinds)
+        field_name = None
+        
+        if kind == 'invalid_enum':
+            candidates = [name for name in editable if 'enum' in properties.get(name, {})]
+            if candidates:
+                field_name = rng.choice(candidates)
+                entity[field_name] = 'INVALID-SYNTHETIC-VALUE'
+        elif kind == 'pattern_mismatch':
+            candidates = [name for name in editable if 'pattern' in properties.get(name, {})]
+            if candidates:
+                field_name = rng.choice(candidates)
+                entity[field_name] = 'invalid synthetic id'
+        elif kind == 'dangling_reference':
+            targets = self._reference_targets(entity_type)
+            candidates = [name for name in editable if name in targets and isinstance(entity[name], str)]
+            if candidates:
+                field_name = rng.choice(candidates)
+                prefix = self._sampler(properties[field_name]['pattern']).literal_prefix() \
+                    if 'pattern' in properties.get(field_name, {}) else ''
+                entity[field_name] = f"{prefix}MISSING-{rng.randrange(10 ** 8):08d}"
+        elif kind == 'out_of_range':
+            candidates = [name for name in editable if 'minimum' in properties.get(name, {})
+                          and isinstance(entity[name], (int, float)) and not isinstance(entity[name], bool)]
+            if candidates:
+                field_name = rng.choice(candidates)
+                entity[field_name] = properties[field_name]['minimum'] - 1
+        elif kind == 'temporal' and 'input_time' in context:
+            field_name = 'processTimestamp'
+            entity[field_name] = _timestamp(context['input_time'] - timedelta(days=1))
+        
+        if field_name is None:
+            kind = 'missing_required'
+            candidates = [name for name in editable if name in plan['required']]
+            field_name = rng.choice(candidates)
+            del entity[field_name]
+        
+        self.injected.append({'entity_type': entity_type, 'entity_id': entity[primary_key],
+                              'kind': kind, 'field': field_name})
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def generate_supply_chain(config: Optional[GeneratorConfig] = None,
+                          schema_loader: Optional[SchemaLoader] = None, **options) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Generate a supply chain in memory, grouped the way comprehensive_validation() expects.
+    
+    Args:
+        config: Shape of the supply chain (default: GeneratorConfig(**options))
+        schema_loader: SchemaLoader providing schemas and relationships (optional)
+        **options: GeneratorConfig fields, used when no config is given
+    
+    Returns:
+        Dictionary with entity_type -> list of entities
+    """
+    generator = SupplyChainGenerator(config or GeneratorConfig(**options), schema_loader)
+    entities: Dict[str, List[Dict[str, Any]]] = {}
+    for entity_type, entity_data in generator:
+        entities.setdefault(entity_type, []).append(entity_data)
+    return entities
+
+
+def write_supply_chain(target: JSONLDSource, config: Optional[GeneratorConfig] = None,
+                       schema_loader: Optional[SchemaLoader] = None, format: str = 'ndjson',
+                       compress: Optional[bool] = None,
+                       manifest: Optional[Union[str, Path]] = None, **options) -> Dict[str, Any]:
+    """
+    Stream a generated supply chain to a JSON-LD or NDJSON file.
+    
+    Memory use stays flat whatever the size: entities are written as they
+    are generated.
+    
+    Args:
+        target: Path (gzipped if it ends in '.gz') or file-like object
+        config: Shape of the supply chain (default: GeneratorConfig(**options))
+        schema_loader: SchemaLoader providing schemas and relationships (optional)
+        format: 'ndjson' (one entity per line) or 'json' (a single JSON-LD document)
+        compress: Gzip the output (default: only for paths ending in '.gz')
+        manifest: Path to write the seed, configuration, counts and injected errors to as JSON (optional)
+        **options: GeneratorConfig fields, used when no config is given
+    
+    Returns:
+        Summary with 'entities', 'counts' and 'injected' (list of injected errors)
+    """
+    generator = SupplyChainGenerator(config or GeneratorConfig(**options), schema_loader)
+    with JSONLDGraphWriter(target, format=format, compress=compress) as writer:
+        for _, entity_data in generator:
+            writer.write(entity_data)
+    
+    summary = {
+        'entities': sum(generator.counts.values()),
+        'counts': generator.counts,
+        'injected': generator.injected
+    }
+    if manifest is not None:
+        with open(manifest, 'w') as f:
+            json.dump({'config': asdict(generator.config), **summary}, f, indent=2)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = GeneratorConfig()
+    parser = argparse.ArgumentParser(description="Generate a synthetic BOOST supply chain.")
+    parser.add_argument('--output', required=True, help="file to write (.ndjson, .json, optionally .gz)")
+    parser.add_argument('--entities', type=int, default=defaults.entities)
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    parser.add_argument('--trus-per-organization', type=int, default=defaults.trus_per_organization)
+    parser.add_argument('--processing-depth', type=int, default=defaults.processing_depth)
+    parser.add_argument('--fan-out', type=int, default=defaults.fan_out)
+    parser.add_argument('--trus-per-transaction', type=int, default=defaults.trus_per_transaction)
+    parser.add_argument('--claim-rate', type=float, default=defaults.claim_rate)
+    parser.add_argument('--reference-pool-size', type=int, default=defaults.reference_pool_size)
+    parser.add_argument('--error-rate', type=float, default=defaults.error_rate)
+    parser.add_argument('--error-kinds', nargs='+', default=list(defaults.error_kinds), choices=ERROR_KINDS)
+    parser.add_argument('--manifest', help="write counts and injected errors to this JSON file")
+    parser.add_argument('--schema-path', help="path to the BOOST schema directory")
+    args = parser.parse_args(argv)
+    
+    config = GeneratorConfig(
+        entities=args.entities, seed=args.seed, trus_per_organization=args.trus_per_organization,
+        processing_depth=args.processing_depth, fan_out=args.fan_out,
+        trus_per_transaction=args.trus_per_transaction, claim_rate=args.claim_rate,
+        reference_pool_size=args.reference_pool_size, error_rate=args.error_rate,
+        error_kinds=tuple(args.error_kinds)
+    )
+    output_format = 'json' if Path(args.output.removesuffix('.gz')).suffix in ('.json', '.jsonld') else 'ndjson'
+    summary = write_supply_chain(args.output, config, get_shared_loader(args.schema_path),
+                                 format=output_format, manifest=args.manifest)
+    print(f"Wrote {summary['entities']} entities to {args.output}: {summary['counts']}")
+    print(f"Injected {len(summary['injected'])} errors")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+BOOST Python Reference Implementation - Timestamp Columns
+
+Temporal checks compare the same timestamps many times over: a TRU's
+createdTimestamp is compared with every processing operation consuming
+it. This module parses each distinct timestamp string once and stores a
+timestamp field of many entities as a column of int64 epoch microseconds,
+so temporal checks become element-wise comparisons over joined columns,
+vectorized with NumPy when it is installed. Values that cannot be parsed
+are collected while the column is built.
+"""
+
+from array import array
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Tuple
+
+try:
+    # NumPy vectorizes the column comparisons; they fall back to pure Python without it
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Distinct timestamp strings kept parsed
+PARSE_CACHE_SIZE = 65536
+
+# Kinds of column entries; only entries of the same parsed kind compare element-wise
+MISSING = 0
+AWARE = 1
+NAIVE = 2
+INVALID = 3
+
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_string(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def parse_timestamp(value: Any) -> Any:
+    """
+    Parse an ISO 8601 timestamp string, accepting a trailing 'Z'.
+    
+    Each distinct string is parsed once; other values are returned unchanged.
+    
+    Raises:
+        ValueError: If the string is not an ISO 8601 timestamp
+    """
+    if isinstance(value, str):
+        return _parse_string(value)
+    return value
+
+
+def _to_array(values: List[int]):
+    return np.array(values, dtype=np.int64) if NUMPY_AVAILABLE else array('q', values)
+
+
+def _datetime_entry(parsed: datetime) -> Tuple[int, int, int, None]:
+    """Column entry (kind, epoch microseconds, date ordinal, error) of a datetime."""
+    if parsed.tzinfo is None or parsed.utcoffset() is None:
+        return NAIVE, (parsed - _NAIVE_EPOCH) // _MICROSECOND, parsed.toordinal(), None
+    # Calendar date in the timestamp's own offset
+    return AWARE, (parsed - _AWARE_EPOCH) // _MICROSECOND, parsed.toordinal(), None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _string_entry(value: str) -> Tuple[int, int, int, Any]:
+    try:
+        return _datetime_entry(_parse_string(value))
+    except ValueError as e:
+        return INVALID, 0, 0, e
+
+
+_MISSING_ENTRY = (MISSING, 0, 0, None)
+_INVALID_ENTRY = (INVALID, 0, 0, None)
+
+
+def _entry(value: Any) -> Tuple[int, int, int, Any]:
+    if not value:
+        return _MISSING_ENTRY
+    if isinstance(value, str):
+        return _string_entry(value)
+    if isinstance(value, datetime):
+        return _datetime_entry(value)
+    return _INVALID_ENTRY
+
+
+class TimestampColumn:
+    """Parsed values of one timestamp field across many entities."""
+    
+    def __init__(self, values: Sequence[Any]):
+        """
+        Parse a column of raw timestamp values.
+        
+        Args:
+            values: ISO 8601 strings or datetimes; falsy values count as missing
+        """
+        self.values = values
+        string_entry = _string_entry
+        entries = [string_entry(value) if value.__class__ is str and value else _entry(value) for value in values]
+        self.kinds = bytearray([entry[0] for entry in entries])
+        self.epochs = _to_array([entry[1] for entry in entries])
+        self.dates = _to_array([entry[2] for entry in entries])
+        # Row -> ValueError raised while parsing it
+        self.errors: Dict[int, ValueError] = {}
+        if INVALID in self.kinds:
+            self.errors = {row: entry[3] for row, entry in enumerate(entries) if entry[3] is not None}
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def compare_joined(left: TimestampColumn, left_rows: Sequence[int],
+                   right: TimestampColumn, right_rows: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """
+    Find joined pairs whose left timestamp is earlier than their right timestamp.
+    
+    Args:
+        left: Column of the left side of the join
+        left_rows: Left row of each joined pair
+        right: Column of the right side of the join
+        right_rows: Right row of each joined pair
+    
+    Returns:
+        (positions of pairs with left < right, positions of pairs whose
+        values are not both parsed timestamps of the same kind), in order
+    """
+    if NUMPY_AVAILABLE:
+        left_index = np.asarray(left_rows, dtype=np.int64)
+        right_index = np.asarray(right_rows, dtype=np.int64)
+        left_kinds = np.frombuffer(bytes(left.kinds), dtype=np.uint8)[left_index]
+        right_kinds = np.frombuffer(bytes(right.kinds), dtype=np.uint8)[right_index]
+        comparable = (left_kinds == right_kinds) & ((left_kinds == AWARE) | (left_kinds == NAIVE))
+        before = comparable & (left.epochs[left_index] < right.epochs[right_index])
+        return np.flatnonzero(before).tolist(), np.flatnonzero(~comparable).tolist()
+    
+    before = []
+    incomparable = []
+    left_kinds, right_kinds = left.kinds, right.kinds
+    left_epochs, right_epochs = left.epochs, right.epochs
+    for position, (left_row, right_row) in enumerate(zip(left_rows, right_rows)):
+        kind = left_kinds[left_row]
+        if kind != right_kinds[right_row] or kind not in (AWARE, NAIVE):
+            incomparable.append(position)
+        elif left_epochs[left_row] < right_epochs[right_row]:
+            before.append(position)
+    return before, incomparable
+
+
+def adjacent_before(column: TimestampColumn, offsets: Sequence[int]) -> List[int]:
+    """
+    Find entries earlier than the entry before them within each group of a column.
+    
+    Args:
+        column: Column whose groups are stored back to back
+        offsets: Group g spans rows offsets[g]:offsets[g + 1]
+    
+    Returns:
+        Rows (never the first of a group) earlier than the previous row
+    """
+    size = len(column)
+    if size < 2:
+        return []
+    if NUMPY_AVAILABLE:
+        earlier = column.epochs[1:] < column.epochs[:-1]
+        starts = np.asarray(offsets[1:-1], dtype=np.int64)
+        earlier[starts[(starts > 0) & (starts < size)] - 1] = False
+        return (np.flatnonzero(earlier) + 1).tolist()
+    
+    epochs = column.epochs
+    rows = []
+    for group in range(len(offsets) - 1):
+        for row in range(offsets[group] + 1, offsets[group + 1]):
+            if epochs[row] < epochs[row - 1]:
+                rows.append(row)
+    return rows
+
+
+def dates_before(column: TimestampColumn, group_dates: Sequence[int], offsets: Sequence[int]) -> List[int]:
+    """
+    Find entries whose calendar date precedes the date of their group.
+    
+    Args:
+        column: Column whose groups are stored back to back
+        group_dates: Date ordinal per group
+        offsets: Group g spans rows offsets[g]:offsets[g + 1]
+    
+    Returns:
+        Rows dated before their group's date
+    """
+    if NUMPY_AVAILABLE:
+        counts = np.diff(np.asarray(offsets, dtype=np.int64))
+        limits = np.repeat(np.asarray(group_dates, dtype=np.int64), counts)
+        return np.flatnonzero(column.dates < limits).tolist()
+    
+    dates = column.dates
+    rows = []
+    for group, limit in enumerate(group_dates):
+        for row in range(offsets[group], offsets[group + 1]):
+            if dates[row] < limit:
+                rows.append(row)
+    return rows
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test Scale Benchmarks
+
+This script tests the benchmark suite at toy sizes:
+- Linked supply chain datasets of an exact size that pass comprehensive validation
+- Benchmark cases run in their own interpreter with timings and peak RSS
+- Baseline comparison flagging slower or larger results beyond the tolerance
+"""
+
+import sys
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmarks import build_dataset, run_benchmarks, compare_to_baseline
+from dynamic_validation import create_dynamic_validator
+
+
+def test_build_dataset():
+    """Test the synthetic supply chain built from the schema examples."""
+    print("🏭 Testing Benchmark Datasets")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    for size in (1, 7, 205):
+        dataset = build_dataset(validator.schema_loader, size)
+        assert sum(len(records) for records in dataset.values()) == size
+    assert {entity_type: len(records) for entity_type, records in dataset.items()} == {
+        'organization': 6, 'traceable_unit': 50, 'transaction': 50, 'material_processing': 49, 'claim': 50}
+    print("✓ Datasets have exactly the requested number of entities: PASSED")
+    
+    results = validator.comprehensive_validation(dataset)
+    assert results['valid'], results['errors'][:3]
+    assert dataset['material_processing'][0]['outputTraceableUnitId'] == dataset['traceable_unit'][1]['traceableUnitId']
+    print("✓ Generated entities are valid and linked: PASSED")
+
+
+def test_run_benchmarks():
+    """Test running cases in subprocesses and reading back their results."""
+    print("\n⏱️  Testing Benchmark Runs")
+    print("=" * 50)
+    
+    report = run_benchmarks(sizes=[50], cases=['client'])
+    assert set(report['results']) == {'jsonld_import[50]', 'validate_all[50]',
+                                      'get_supply_chain[50]', 'jsonld_export[50]'}
+    assert report['results']['jsonld_import[50]']['items'] == 50
+    assert report['results']['get_supply_chain[50]']['items'] == 13
+    for result in report['results'].values():
+        assert result['seconds'] > 0
+        assert result['peak_rss_mb'] is None or result['peak_rss_mb'] > 0
+    assert report['environment']['python']
+    print("✓ Client cases report time, throughput and peak RSS: PASSED")
+    
+    try:
+        run_benchmarks(sizes=[50], cases=['nonexistent'])
+        assert False, "Unknown case should be rejected"
+    except ValueError:
+        pass
+    print("✓ Unknown cases rejected: PASSED")
+
+
+def test_compare_to_baseline():
+    """Test regression detection against a stored report."""
+    print("\n📉 Testing Baseline Comparison")
+    print("=" * 50)
+    
+    baseline = {'results': {
+        'validate_all[10000]': {'seconds': 2.0, 'peak_rss_mb': 100.0},
+        'get_supply_chain[10000]': {'seconds': 0.01, 'peak_rss_mb': 100.0},
+        'retired[10000]': {'seconds': 1.0}
+    }}
+    report = {'results': {
+        'validate_all[10000]': {'seconds': 3.0, 'peak_rss_mb': 110.0},
+        'get_supply_chain[10000]': {'seconds': 0.03, 'peak_rss_mb': 140.0},
+        'jsonld_export[10000]': {'seconds': 5.0}
+    }}
+    regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+    assert [(r['name'], r['metric'], r['ratio']) for r in regressions] == [
+        ('validate_all[10000]', 'seconds', 1.5),
+        ('get_supply_chain[10000]', 'peak_rss_mb', 1.4)
+    ]
+    assert compare_to_baseline(report, baseline, tolerance=0.5) == []
+    print("✓ Regressions beyond tolerance and noise flagged: PASSED")
+
+
+def main():
+    """Run all benchmark suite tests."""
+    print("🚀 BOOST Benchmark Suite Testing")
+    print("\n")
+    
+    try:
+        test_build_dataset()
+        test_run_benchmarks()
+        test_compare_to_baseline()
+        print("\n✅ ALL BENCHMARK SUITE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
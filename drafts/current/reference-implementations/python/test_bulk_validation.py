@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test Bulk Validation
+
+This script tests the high-volume validation paths of DynamicBOOSTValidator:
+- Streaming validate_many with all-errors reporting per record
+- Structured per-record results (index, primary key, JSON pointer, rule, severity)
+- Process-pool comprehensive_validation matching serial output exactly
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dynamic_validation import create_dynamic_validator
+
+
+def _load_example(validator, entity_type):
+    """Load the example record shipped with an entity schema."""
+    example_file = validator.schema_loader.schema_base_path / entity_type / f"{entity_type}_example.json"
+    with open(example_file, 'r') as f:
+        return json.load(f)
+
+
+def test_validate_many_reports_all_errors():
+    """Test that every error on a record is reported in one pass."""
+    print("📦 Testing validate_many All-Errors Reporting")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    organization = _load_example(validator, 'organization')
+    
+    broken = dict(organization)
+    broken.pop('organizationName')
+    broken['organizationType'] = 'not_a_type'
+    broken['futureField'] = 'from a newer schema'
+    
+    results = list(validator.validate_many('organization', [organization, broken]))
+    assert [r['index'] for r in results] == [0, 1]
+    assert results[1]['primary_key'] == organization['organizationId']
+    assert not results[1]['valid']
+    
+    rules = {(e['path'], e['rule'], e['severity']) for e in results[1]['errors']}
+    assert ('', 'schema.required', 'error') in rules
+    assert ('/organizationType', 'schema.enum', 'error') in rules
+    assert ('/futureField', 'compatibility.unknownField', 'warning') in rules
+    print(f"✓ Broken record reported {len(results[1]['errors'])} issues in one pass: PASSED")
+    
+    # Warnings alone do not make a record invalid
+    flagged = dict(organization, futureField='from a newer schema')
+    result = next(validator.validate_many('organization', [flagged]))
+    schema_errors = [e for e in result['errors'] if e['severity'] == 'error']
+    assert result['valid'] == (not schema_errors)
+    print("✓ Unknown fields reported as warnings: PASSED")
+
+
+def test_validate_many_streams_generator():
+    """Test that validate_many consumes generators lazily."""
+    print("\n🌊 Testing validate_many Streaming")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    organization = _load_example(validator, 'organization')
+    pulled = []
+    
+    def records():
+        for i in range(1000):
+            pulled.append(i)
+            yield dict(organization, organizationId=f"ORG-STREAM-{i:04d}")
+    
+    results = validator.validate_many('organization', records())
+    first = next(results)
+    assert first['primary_key'] == 'ORG-STREAM-0000'
+    assert len(pulled) == 1
+    print("✓ Records pulled one at a time: PASSED")
+    
+    remaining = sum(1 for _ in results)
+    assert remaining == 999
+    print("✓ Full stream validated: PASSED")
+    
+    errors_only = list(validator.validate_many(
+        'organization', [organization, dict(organization, organizationType='bogus')], errors_only=True
+    ))
+    assert 1 in [r['index'] for r in errors_only]
+    print("✓ errors_only filter: PASSED")
+    
+    try:
+        validator.validate_many('not_an_entity', [])
+        assert False, "Unknown entity type should raise"
+    except ValueError:
+        print("✓ Unknown entity type rejected: PASSED")
+
+
+def test_parallel_comprehensive_validation_matches_serial():
+    """Test that process-pool validation produces exactly the serial results."""
+    print("\n⚙️  Testing Parallel comprehensive_validation")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    entities = {}
+    for entity_type in ['organization', 'traceable_unit', 'transaction']:
+        example = _load_example(validator, entity_type)
+        primary_key = validator.schema_loader.get_primary_key(entity_type)
+        entities[entity_type] = [
+            dict(example, **{primary_key: f"{example[primary_key]}-{i}"}) for i in range(9)
+        ]
+    # Inject a mix of errors and warnings at different chunk positions
+    entities['organization'][4]['organizationType'] = 'bogus'
+    entities['traceable_unit'][7]['futureField'] = True
+    
+    serial = validator.comprehensive_validation(entities)
+    parallel = validator.comprehensive_validation(entities, workers=2, chunk_size=2)
+    for results in (serial, parallel):
+        results['schema_info'].pop('validation_timestamp')
+        # Phase wall times differ between runs; counts are compared in test_instrumentation
+        results.pop('stats')
+    
+    assert parallel == serial
+    assert any(error.startswith('Entity 4:') for error in parallel['entity_results']['organization']['errors'])
+    print(f"✓ Parallel output identical to serial ({len(serial['errors'])} errors): PASSED")
+    
+    for chunk_size in (0, -5):
+        try:
+            validator.comprehensive_validation(entities, workers=2, chunk_size=chunk_size)
+            assert False, f"chunk_size={chunk_size} accepted"
+        except ValueError as e:
+            assert "chunk_size must be at least 1" in str(e)
+    print("✓ chunk_size below 1 rejected: PASSED")
+
+
+def main():
+    """Run all bulk validation tests."""
+    print("🚀 BOOST Bulk Validation Testing")
+    print("\n")
+    
+    try:
+        test_validate_many_reports_all_errors()
+        test_validate_many_streams_generator()
+        test_parallel_comprehensive_validation_matches_serial()
+        print("\n✅ ALL BULK VALIDATION TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test Compiled Business Rules
+
+This script tests the per-entity-type business rule plan:
+- The shipped business_logic_validation.json keeps validate_business_logic a no-op
+- Flat rule configuration compiles to bound checks for the entity types it covers
+- Thresholds are read from the rules at compile time
+- The plan is rebuilt only when the schema loader reloads its rules
+"""
+
+import sys
+import copy
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from business_rules import compile_business_rule_plan
+from dynamic_validation import create_dynamic_validator
+
+
+def _flatten_rules(node):
+    """Lift each 'properties' block into its parent, giving the flat rule layout."""
+    if isinstance(node, dict):
+        flat = {key: _flatten_rules(value) for key, value in node.items() if key not in ('properties', 'type')}
+        if isinstance(node.get('properties'), dict):
+            flat.update((key, _flatten_rules(value)) for key, value in node['properties'].items())
+        return flat
+    if isinstance(node, list):
+        return [_flatten_rules(value) for value in node]
+    return node
+
+
+def test_shipped_configuration():
+    """Test that the shipped JSON Schema layout compiles to an empty plan."""
+    print("📋 Testing Shipped Business Rule Configuration")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    assert validator.get_business_rule_plan() == {}
+    assert validator.validate_business_logic('material_processing', {'inputVolume': 1, 'outputVolume': 100}) == (True, [])
+    print("✓ Rules under 'properties' compile to no checks: PASSED")
+    
+    plan = validator.get_business_rule_plan()
+    assert validator.get_business_rule_plan() is plan
+    validator.refresh_schemas()
+    assert validator.get_business_rule_plan() is not plan
+    print("✓ Plan compiled once, rebuilt after refresh_schemas: PASSED")
+
+
+def test_flat_configuration():
+    """Test the checks compiled from flat rule configuration."""
+    print("\n⚙️  Testing Flat Business Rule Configuration")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    rules = _flatten_rules(validator.schema_loader.business_logic_rules)
+    rules['validationExecution']['executionOrder'] = (
+        rules['validationExecution']['executionOrder']['default'] + ['organizationalConsistency']
+    )
+    rules['organizationalConsistency'] = {}
+    
+    plan = compile_business_rule_plan(rules, {'organizationalConsistency': {'organization': lambda data: ['checked']}})
+    assert {entity_type: len(checks) for entity_type, checks in plan.items()} == {
+        'material_processing': 4, 'transaction': 2, 'traceable_unit': 3, 'claim': 1, 'organization': 1
+    }
+    assert 'equipment' not in plan
+    print("✓ Checks compiled only for entity types with applicable rules: PASSED")
+    
+    def run(entity_type, data):
+        return [error for check in plan[entity_type] for error in check(data)]
+    
+    assert run('material_processing', {'inputVolume': 10, 'outputVolume': 20, 'processType': 'chipping'}) == [
+        "Volume conservation violation: input (10) < output (20) + loss (0)",
+        "Volume increase exceeds limit for chipping: max 1.3x allowed"
+    ]
+    assert run('material_processing', {'inputMass': 10, 'outputMass': 8, 'processType': 'chipping'}) == [
+        "Mass loss rate 0.200 outside typical range for chipping: [0.02, 0.08]"
+    ]
+    assert run('traceable_unit', {'speciesComposition': [{'speciesName': 'Pine', 'percentage': 60}]}) == [
+        "Species composition percentages sum to 60%, must equal 100.0% (tolerance: ±0.01%)"
+    ]
+    assert run('organization', {}) == ['checked']
+    print("✓ Compiled checks report the rule violations: PASSED")
+    
+    # Thresholds are bound when the plan is compiled
+    tightened = copy.deepcopy(rules)
+    tightened['volumeMassConservation']['materialProcessing']['volumeConservation']['exceptions'][0]['maxVolumeIncrease'] = 3.0
+    chipping = {'inputVolume': 10, 'outputVolume': 20, 'volumeLoss': -10, 'processType': 'chipping'}
+    assert compile_business_rule_plan(tightened)['material_processing'][0](chipping) == []
+    assert plan['material_processing'][0](chipping) == ["Volume increase exceeds limit for chipping: max 1.3x allowed"]
+    print("✓ Thresholds bound at compile time: PASSED")
+
+
+def main():
+    """Run all compiled business rule tests."""
+    print("🚀 BOOST Compiled Business Rule Testing")
+    print("\n")
+    
+    try:
+        test_shipped_configuration()
+        test_flat_configuration()
+        print("\n✅ ALL COMPILED BUSINESS RULE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test Cardinality Constraint Validation
+
+This script tests enforcement of the cardinalityConstraints:
+- oneToMany and manyToOne pairs read from cross_entity_validation.json
+- Children grouped and counted per parent key in one hash join
+- Duplicate parent keys, multi-parent children and orphans reported
+- Large collections joined in linear time
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cardinality import cardinality_constraints, entity_type_key, join_cardinality, evaluate_cardinality
+from dynamic_validation import create_dynamic_validator
+
+
+def test_constraint_discovery():
+    """Test reading the declared parent/child pairs."""
+    print("🔗 Testing Cardinality Constraint Discovery")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    constraints = cardinality_constraints(validator.schema_loader.cross_entity_rules)
+    pairs = {(c['kind'], c['parentEntity'], c['childEntity'], c['childField']) for c in constraints}
+    assert ('oneToMany', 'Organization', 'TraceableUnit', 'harvesterId') in pairs
+    assert ('manyToOne', 'TraceableUnit', 'MaterialProcessing', 'outputTraceableUnitId') in pairs
+    assert len(constraints) == 9
+    print(f"✓ {len(constraints)} declared pairs discovered: PASSED")
+    
+    assert entity_type_key('TraceableUnit') == 'traceable_unit'
+    assert entity_type_key('CertificationScheme') == 'certification_scheme'
+    assert entity_type_key('Organization') == 'organization'
+    print("✓ Entity names mapped to entity type keys: PASSED")
+
+
+def test_hash_join():
+    """Test child counts and the three kinds of violation."""
+    print("\n🧮 Testing Hash Join")
+    print("=" * 50)
+    
+    parents = [{'organizationId': 'ORG-A'}, {'organizationId': 'ORG-B'},
+               {'organizationId': 'ORG-B'}, {'organizationId': 'ORG-C'}, {}]
+    children = [
+        {'harvesterId': 'ORG-A'}, {'harvesterId': 'ORG-A'}, {'harvesterId': 'ORG-B'},
+        {'harvesterId': ['ORG-C']}, {'harvesterId': ['ORG-A', 'ORG-C']},
+        {'harvesterId': 'ORG-X'}, {'harvesterId': 'ORG-X'}, {}
+    ]
+    result = join_cardinality(parents, 'organizationId', children, 'harvesterId')
+    assert result['parent_count'] == 4 and result['child_count'] == 7
+    assert result['child_counts'] == {'ORG-A': 2, 'ORG-B': 1, 'ORG-C': 1, 'ORG-X': 2}
+    assert result['duplicate_parents'] == {'ORG-B': 2}
+    assert result['multi_parent_children'] == [(4, ['ORG-A', 'ORG-C'])]
+    assert result['orphans'] == {'ORG-X': 2}
+    print("✓ Children counted per parent, violations found: PASSED")
+    
+    result = join_cardinality(None, 'organizationId', children, 'harvesterId')
+    assert result['orphans'] is None and result['child_counts']['ORG-X'] == 2
+    print("✓ Orphans not checked without the parent collection: PASSED")
+
+
+def test_cardinality_validation():
+    """Test validate_cardinality and its place in comprehensive_validation."""
+    print("\n📋 Testing validate_cardinality")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    entities = {
+        'organization': [{'organizationId': 'ORG-001'}, {'organizationId': 'ORG-001'}],
+        'traceable_unit': [
+            {'traceableUnitId': 'TRU-001', 'harvesterId': 'ORG-001'},
+            {'traceableUnitId': 'TRU-002', 'harvesterId': 'ORG-404'}
+        ],
+        'material_processing': [
+            {'processingId': 'MP-001', 'inputTraceableUnitId': 'TRU-001', 'outputTraceableUnitId': 'TRU-002'},
+            {'processingId': 'MP-002', 'inputTraceableUnitId': ['TRU-001', 'TRU-002'],
+             'outputTraceableUnitId': 'TRU-003'}
+        ]
+    }
+    is_valid, errors = validator.validate_cardinality(entities)
+    assert not is_valid
+    assert errors == [
+        "Cardinality violation (Organization 1:N TraceableUnit): Organization.organizationId ORG-001 is shared by 2 Organization records",
+        "Cardinality violation (Organization 1:N TraceableUnit): TraceableUnit.harvesterId references non-existent Organization: ORG-404 (1 records)",
+        "Cardinality violation (TraceableUnit 1:N MaterialProcessing): MaterialProcessing[1].inputTraceableUnitId references 2 TraceableUnit records: ['TRU-001', 'TRU-002']",
+        "Cardinality violation (TraceableUnit N:1 MaterialProcessing): MaterialProcessing.outputTraceableUnitId references non-existent TraceableUnit: TRU-003 (1 records)"
+    ], errors
+    print("✓ Duplicate parents, multi-parent children and orphans reported: PASSED")
+    
+    results = validator.comprehensive_validation(entities)
+    assert all(error in results['errors'] for error in errors)
+    print("✓ comprehensive_validation reports cardinality violations: PASSED")
+
+
+def test_join_scale():
+    """Test that a large join runs in linear time."""
+    print("\n⏱️  Testing Join Scale")
+    print("=" * 50)
+    
+    size = 1000000
+    parents = [{'organizationId': f'ORG-{i:06d}'} for i in range(size // 10)]
+    children = [{'traceableUnitId': f'TRU-{i:07d}', 'harvesterId': f'ORG-{i % (size // 10):06d}'}
+                for i in range(size)]
+    
+    cross_entity_rules = create_dynamic_validator().schema_loader.cross_entity_rules
+    
+    start = time.perf_counter()
+    reports = evaluate_cardinality({'organization': parents, 'traceable_unit': children}, cross_entity_rules)
+    elapsed = time.perf_counter() - start
+    report = next(r for r in reports if r['childEntity'] == 'TraceableUnit')
+    assert report['child_count'] == size and not report['orphans'] and not report['duplicate_parents']
+    assert set(report['child_counts'].values()) == {10}
+    assert elapsed < 10.0, f"Join took {elapsed:.2f}s"
+    print(f"✓ {len(parents):,} parents x {size:,} children joined in {elapsed * 1000:.0f}ms: PASSED")
+
+
+def main():
+    """Run all cardinality tests."""
+    print("🚀 BOOST Cardinality Constraint Testing")
+    print("\n")
+    
+    try:
+        test_constraint_discovery()
+        test_hash_join()
+        test_cardinality_validation()
+        test_join_scale()
+        print("\n✅ ALL CARDINALITY TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test Circular Reference Detection
+
+This script tests enforcement of the circularReferenceRules:
+- TraceableUnit parent/child cycles, declared from either side
+- MaterialProcessing input -> output chain cycles, labelled by processing ID
+- One reported cycle per strongly connected component
+- Deep chains checked without recursion, plugged into comprehensive_validation
+"""
+
+import sys
+import time
+import random
+from array import array
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cycle_detection import ReferenceGraph, find_cycles, enabled_cycle_rules, _find_component_cycles
+from dynamic_validation import create_dynamic_validator
+
+
+def _has_cycle(num_nodes, edges):
+    """Reference check: does a small graph contain any cycle?"""
+    adjacency = {node: [] for node in range(num_nodes)}
+    for source, target in edges:
+        adjacency[source].append(target)
+    state = [0] * num_nodes
+    
+    def visit(node):
+        state[node] = 1
+        for target in adjacency[node]:
+            if state[target] == 1 or (state[target] == 0 and visit(target)):
+                return True
+        state[node] = 2
+        return False
+    
+    return any(state[node] == 0 and visit(node) for node in range(num_nodes))
+
+
+def test_cycle_engine():
+    """Test cycle finding against a reference check on random graphs."""
+    print("🔁 Testing Cycle Detection Engine")
+    print("=" * 50)
+    
+    graph = ReferenceGraph()
+    for source, target in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E"), ("E", "E"), ("F", "G")]:
+        graph.add_edge(source, target, f"MP-{source}")
+    assert [graph.describe_cycle(cycle) for cycle in graph.find_cycles()] == [
+        "A -[MP-A]-> B -[MP-B]-> C -[MP-C]-> A",
+        "E -[MP-E]-> E"
+    ]
+    print("✓ One labelled cycle per strongly connected component: PASSED")
+    
+    rng = random.Random(11)
+    for trial in range(3000):
+        num_nodes = rng.randint(1, 9)
+        if trial % 2:
+            edges = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(rng.randint(0, 12))]
+        else:
+            # Single-parent graphs, with repeated parent links, take the parent-pointer path
+            edges = [(rng.randrange(num_nodes), node) for node in range(num_nodes) if rng.random() < 0.8]
+            edges += edges[:rng.randint(0, len(edges))]
+            rng.shuffle(edges)
+        sources = array('q', [source for source, _ in edges])
+        targets = array('q', [target for _, target in edges])
+        
+        cycles = find_cycles(num_nodes, sources, targets)
+        assert bool(cycles) == _has_cycle(num_nodes, edges), edges
+        for cycle in cycles:
+            nodes = [sources[edge] for edge in cycle]
+            assert len(set(nodes)) == len(nodes)
+            assert all(targets[edge] == sources[cycle[(i + 1) % len(cycle)]] for i, edge in enumerate(cycle))
+        assert len(cycles) == len(_find_component_cycles(num_nodes, sources, targets))
+    print("✓ Random graphs agree with a reference check: PASSED")
+
+
+def test_circular_reference_rules():
+    """Test the TraceableUnit and MaterialProcessing rules through comprehensive_validation."""
+    print("\n🌳 Testing circularReferenceRules Validation")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    rules = {(entity, rule) for entity, rule, _ in enabled_cycle_rules(validator.schema_loader.cross_entity_rules)}
+    assert rules == {('TraceableUnit', 'parentChildCycles'), ('MaterialProcessing', 'processingChainCycles')}
+    print("✓ Enforceable no_cycles rules read from cross_entity_validation.json: PASSED")
+    
+    entities = {
+        'traceable_unit': [
+            {'traceableUnitId': 'TRU-A', 'parentTraceableUnitId': 'TRU-C'},
+            {'traceableUnitId': 'TRU-B', 'parentTraceableUnitId': 'TRU-A'},
+            {'traceableUnitId': 'TRU-C', 'parentTraceableUnitId': 'TRU-B', 'childTraceableUnitIds': ['TRU-A']},
+            {'traceableUnitId': 'TRU-D', 'parentTraceableUnitId': 'TRU-B'}
+        ],
+        'material_processing': [
+            {'processingId': 'MP-1', 'inputTraceableUnitId': 'TRU-X', 'outputTraceableUnitId': 'TRU-Y'},
+            {'processingId': 'MP-2', 'inputTraceableUnitId': 'TRU-Y', 'outputTraceableUnitId': 'TRU-X'}
+        ]
+    }
+    is_valid, errors = validator.validate_circular_references(entities)
+    assert not is_valid
+    assert errors == [
+        "Circular reference violation (TraceableUnit.parentChildCycles): TRU-C -> TRU-A -> TRU-B -> TRU-C",
+        "Circular reference violation (MaterialProcessing.processingChainCycles): TRU-X -[MP-1]-> TRU-Y -[MP-2]-> TRU-X"
+    ], errors
+    print("✓ Parent/child and processing chain cycles reported: PASSED")
+    
+    results = validator.comprehensive_validation(entities)
+    assert not results['valid']
+    assert all(error in results['errors'] for error in errors)
+    print("✓ comprehensive_validation reports circular references: PASSED")
+
+
+def test_deep_lineage_chain():
+    """Test that a very deep parent chain is checked quickly and without recursion."""
+    print("\n📏 Testing Deep Lineage Chains")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    depth = 200000
+    trus = [{'traceableUnitId': f'TRU-{i:06d}', 'parentTraceableUnitId': f'TRU-{i - 1:06d}' if i else None}
+            for i in range(depth)]
+    
+    start = time.perf_counter()
+    is_valid, errors = validator.validate_circular_references({'traceable_unit': trus})
+    elapsed = time.perf_counter() - start
+    assert is_valid and not errors
+    assert elapsed < 5.0, f"Cycle check took {elapsed:.2f}s"
+    print(f"✓ {depth:,}-deep acyclic chain checked in {elapsed * 1000:.0f}ms: PASSED")
+    
+    trus[0]['parentTraceableUnitId'] = f'TRU-{depth - 1:06d}'
+    is_valid, errors = validator.validate_circular_references({'traceable_unit': trus})
+    assert not is_valid and len(errors) == 1
+    assert errors[0].endswith(f"({depth} references in cycle)")
+    print("✓ Chain-length cycle reported once with a truncated path: PASSED")
+
+
+def main():
+    """Run all cycle detection tests."""
+    print("🚀 BOOST Circular Reference Detection Testing")
+    print("\n")
+    
+    try:
+        test_cycle_engine()
+        test_circular_reference_rules()
+        test_deep_lineage_chain()
+        print("\n✅ ALL CYCLE DETECTION TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Test Entity Edit Sessions
+
+This script tests copy-on-write edit sessions for BOOSTClient entities:
+- Staged updates invisible until commit, untouched fields shared with the stored model
+- Only touched fields validated at commit, with nothing written if any is invalid
+- Business rules reading a touched field rerun at commit, rejecting entities that break them
+- Mutation helpers batched in a session, one store write per edited entity
+- Indexes and incremental validation following committed sessions, in memory and in SQLite
+"""
+
+import sys
+import copy
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+from schema_loader import SchemaLoader
+from dynamic_validation import DynamicBOOSTValidator
+from test_entity_store import _create_tru, _build_supply_chain
+from test_business_rules import _flatten_rules
+
+
+def _count_writes(client):
+    """Count store writes per (collection, entity ID)."""
+    writes = {}
+    client.store.add_listener(
+        lambda collection_name, entity_id, old, new: writes.__setitem__(
+            (collection_name, entity_id), writes.get((collection_name, entity_id), 0) + 1))
+    return writes
+
+
+def test_copy_on_write():
+    """Test staging, structural sharing and commit of field updates."""
+    print("✏️  Testing Copy-on-Write Updates")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    original = client.transactions["TXN-STORE-001"]
+    
+    session = client.edit()
+    session.update('transactions', "TXN-STORE-001", reconciliationStatus='disputed', contract_value=2500.0)
+    assert session.append('transactions', "TXN-STORE-001", 'traceableUnitIds', "TRU-STORE-PARENT")
+    assert not session.append('transactions', "TXN-STORE-001", 'traceable_unit_ids', "TRU-STORE-PARENT")
+    assert session.extend('transactions', "TXN-STORE-001", 'traceable_unit_ids',
+                          ["TRU-STORE-CHILD", "TRU-STORE-PARENT"]) == 1
+    assert session.get('transactions', "TXN-STORE-001", 'contractValue') == 2500.0
+    assert len(session) == 1
+    assert client.transactions["TXN-STORE-001"] is original and original.traceable_unit_ids is None
+    print("✓ Updates staged by field name or alias, invisible until commit: PASSED")
+    
+    timestamp = datetime(2025, 2, 1, tzinfo=timezone.utc)
+    [updated] = session.commit(timestamp)
+    assert client.transactions["TXN-STORE-001"] is updated and len(session) == 0
+    assert updated.reconciliation_status.value == 'disputed' and updated.contract_value == 2500.0
+    assert updated.traceable_unit_ids == ["TRU-STORE-PARENT", "TRU-STORE-CHILD"]
+    assert updated.last_updated == timestamp
+    assert updated.context is original.context and updated.transaction_id is original.transaction_id
+    assert original.reconciliation_status is None and original.contract_value == 1000.0
+    print("✓ Committed copy shares untouched fields and leaves the original unchanged: PASSED")
+    
+    assert client.store.related_ids('transactions_by_tru', "TRU-STORE-CHILD") == ["TXN-STORE-001"]
+    print("✓ Relationship indexes follow the committed entity: PASSED")
+
+
+def test_commit_validation():
+    """Test that touched fields are validated at commit and invalid sessions write nothing."""
+    print("\n🛡️  Testing Commit Validation")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    original = client.transactions["TXN-STORE-001"]
+    
+    session = client.edit()
+    session.update('transactions', "TXN-STORE-001", reconciliation_status='lost')
+    session.append('traceable_units', "TRU-STORE-PARENT", 'childTraceableUnitIds', "TRU-STORE-CHILD")
+    try:
+        session.commit()
+        assert False, "Invalid enum value committed"
+    except ValueError as e:
+        assert "transactions 'TXN-STORE-001': reconciliation_status:" in str(e)
+    assert client.transactions["TXN-STORE-001"] is original
+    assert client.traceable_units["TRU-STORE-PARENT"].child_traceable_unit_ids is None
+    assert len(session) == 2
+    print("✓ Invalid field rejected at commit, nothing written: PASSED")
+    
+    session.update('transactions', "TXN-STORE-001", reconciliation_status='resolved')
+    session.commit()
+    assert client.transactions["TXN-STORE-001"].reconciliation_status.value == 'resolved'
+    assert client.traceable_units["TRU-STORE-PARENT"].child_traceable_unit_ids == ["TRU-STORE-CHILD"]
+    print("✓ Corrected session commits every staged entity: PASSED")
+    
+    try:
+        session.update('transactions', "TXN-STORE-001", not_a_field=1)
+        assert False, "Unknown field staged"
+    except ValueError as e:
+        assert "Unknown field 'not_a_field'" in str(e)
+    try:
+        session.touch('transactions', "TXN-MISSING")
+        assert False, "Missing entity staged"
+    except KeyError:
+        pass
+    
+    updated = client.transactions["TXN-STORE-001"]
+    try:
+        with client.edit() as session:
+            session.update('transactions', "TXN-STORE-001", contract_value=1.0)
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert client.transactions["TXN-STORE-001"] is updated and len(session) == 0
+    print("✓ Unknown fields and entities refused, failed blocks discarded: PASSED")
+
+
+def test_business_rules_at_commit():
+    """Test that business rules reading a touched field are rerun at commit."""
+    print("\n📏 Testing Business Rules at Commit")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    stored = dict(client.traceable_units)
+    
+    session = client.edit()
+    session.update('traceable_units', "TRU-STORE-CHILD", totalVolumeM3=5.0)
+    try:
+        session.commit()
+        assert False, "Volume conservation violation committed"
+    except ValueError as e:
+        assert "material_processing 'MP-STORE-001': volume_conservation: Volume change (50.0%) exceeds tolerance" in str(e)
+    assert client.traceable_units == stored
+    print("✓ TRU volume breaking its processing's volume conservation rejected: PASSED")
+    
+    session.update('traceable_units', "TRU-STORE-PARENT", total_volume_m3=5.2)
+    session.commit()
+    assert client.traceable_units["TRU-STORE-CHILD"].total_volume_m3 == 5.0
+    print("✓ Rule checked against the session's edited TRUs, consistent edits committed: PASSED")
+    
+    created = client.traceable_units["TRU-STORE-PARENT"].created_timestamp
+    session.update('material_processing', "MP-STORE-001", process_timestamp=created.replace(year=created.year - 1))
+    try:
+        session.commit()
+        assert False, "Processing before its input TRU committed"
+    except ValueError as e:
+        assert "temporal_consistency: Processing timestamp precedes input TRU creation" in str(e)
+    session.discard()
+    
+    # Fields no rule reads commit without running any check
+    calls = []
+    client._edit_rule_checks = {name: lambda *args: calls.append(args) for name in client._edit_rule_checks}
+    client.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-CHILD")
+    client.set_reconciliation_status("TXN-STORE-001", "resolved")
+    assert calls == []
+    print("✓ Processing timestamp before its input TRU rejected, unrelated fields skip the rules: PASSED")
+    
+    # Business logic rules of the loaded configuration, selected by the fields they read
+    loader = SchemaLoader()
+    rules = _flatten_rules(copy.deepcopy(loader.business_logic_rules))
+    rules['validationExecution']['executionOrder'] = rules['validationExecution']['executionOrder']['default']
+    loader._state.business_logic_rules = rules
+    client = create_client()
+    _build_supply_chain(client)
+    client.validator = DynamicBOOSTValidator(loader)
+    try:
+        with client.edit() as session:
+            session.update('material_processing', "MP-STORE-001", outputVolume=12.0)
+        assert False, "Volume conservation violation committed"
+    except ValueError as e:
+        assert str(e) == ("Edit session not committed: material_processing 'MP-STORE-001': volumeMassConservation: "
+                          "Volume conservation violation: input (10.0) < output (12.0) + loss (0)")
+    assert client.material_processing["MP-STORE-001"].output_volume == 9.0
+    with client.edit() as session:
+        session.update('material_processing', "MP-STORE-001", output_volume=8.0, volume_loss=2.0)
+    assert client.material_processing["MP-STORE-001"].output_volume == 8.0
+    print("✓ Configured business logic rules reading a touched field rerun at commit: PASSED")
+
+
+def test_batched_mutations():
+    """Test the mutation helpers staged in one session."""
+    print("\n📦 Testing Batched Mutation Helpers")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    writes = _count_writes(client)
+    tru_ids = [f"TRU-BATCH-{i:05d}" for i in range(10000)]
+    
+    start = time.perf_counter()
+    with client.edit() as session:
+        for tru_id in tru_ids:
+            assert client.add_tru_to_transaction("TXN-STORE-001", tru_id, session=session)
+        client.add_tru_to_transaction("TXN-STORE-001", tru_ids[0], session=session)
+        client.set_reconciliation_status("TXN-STORE-001", "resolved", session=session)
+        for hours in (6, 2, 4):
+            client.add_manipulation_timestamp("TXN-STORE-001", datetime(2025, 1, 15, hours, tzinfo=timezone.utc),
+                                              session=session)
+        client.add_tru_to_organization("ORG-STORE-001", "TRU-STORE-PARENT", session=session)
+        assert not client.add_tru_to_transaction("TXN-MISSING", tru_ids[0], session=session)
+    elapsed = time.perf_counter() - start
+    
+    transaction = client.transactions["TXN-STORE-001"]
+    assert transaction.traceable_unit_ids == tru_ids
+    assert transaction.reconciliation_status.value == 'resolved'
+    assert [ts.hour for ts in transaction.manipulation_timestamps] == [2, 4, 6]
+    assert writes == {('transactions', "TXN-STORE-001"): 1, ('organizations', "ORG-STORE-001"): 1}
+    assert elapsed < 2.0, f"10k staged appends took {elapsed:.2f}s"
+    print(f"✓ 10k TRUs appended with one write per entity in {elapsed * 1000:.0f}ms: PASSED")
+    
+    writes.clear()
+    client.add_tru_to_transaction("TXN-STORE-001", tru_ids[-1])
+    assert writes == {}
+    client.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-CHILD")
+    assert writes == {('transactions', "TXN-STORE-001"): 1}
+    assert client.transactions["TXN-STORE-001"].traceable_unit_ids[-1] == "TRU-STORE-CHILD"
+    print("✓ Helpers without a session commit immediately, skipping unchanged entities: PASSED")
+
+
+def test_revalidation_after_commit():
+    """Test that committed sessions are revalidated like any other write."""
+    print("\n🔄 Testing Revalidation After Commit")
+    print("=" * 50)
+    
+    for database in (None, ':memory:'):
+        client = create_client(database=database)
+        _build_supply_chain(client)
+        _create_tru(client, "TRU-STORE-EXTRA", "ORG-STORE-001")
+        before = client.validate_all()
+        assert before['business_rules']['supply_chain_continuity']['issues'][0]['tru_ids'] == ["TRU-STORE-EXTRA"]
+        
+        with client.edit() as session:
+            client.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-EXTRA", session=session)
+            client.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-404", session=session)
+        incremental = client.validate_all()
+        full = client.validate_all(full=True)
+        incremental.pop('stats'), full.pop('stats')
+        assert json.dumps(incremental, sort_keys=True, default=str) == json.dumps(full, sort_keys=True, default=str)
+        assert incremental['validation_checks']['foreign_key_integrity']['failed'] == 1
+        assert incremental['business_rules']['supply_chain_continuity']['valid']
+        assert client.transactions["TXN-STORE-001"].traceable_unit_ids == ["TRU-STORE-EXTRA", "TRU-STORE-404"]
+    print("✓ Incremental validate_all() matches a full pass, in memory and in SQLite: PASSED")
+
+
+def main():
+    """Run all edit session tests."""
+    print("🚀 BOOST Edit Session Testing")
+    print("\n")
+    
+    try:
+        test_copy_on_write()
+        test_commit_validation()
+        test_business_rules_at_commit()
+        test_batched_mutations()
+        test_revalidation_after_commit()
+        print("\n✅ ALL EDIT SESSION TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
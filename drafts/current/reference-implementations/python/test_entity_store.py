@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test Indexed Entity Store
+
+This script tests the secondary indexes kept behind BOOSTClient:
+- TRU -> processing, transactions and claims, org -> TRUs, parent -> children
+- Index maintenance on create_*, add_tru_to_* and import_from_jsonld
+- Indexed supply chain lookups and orphan/missing-claim checks
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+
+
+def _create_tru(client, tru_id, harvester_id, **kwargs):
+    """Create a TRU with the fields its schema requires."""
+    return client.create_traceable_unit(
+        traceable_unit_id=tru_id,
+        unit_type="pile",
+        harvester_id=harvester_id,
+        harvest_geographic_data_id="GEO-HARVEST-001",
+        uniqueIdentifier=f"UNIQUE-{tru_id}",
+        totalVolumeM3=10.0,
+        materialTypeId="MAT-DOUGLAS-FIR-001",
+        isMultiSpecies=False,
+        **kwargs
+    )
+
+
+def _build_supply_chain(client):
+    """Create an organization, a parent/child pair of TRUs and their related entities."""
+    client.create_organization(organization_id="ORG-STORE-001", name="Store Test Forestry", org_type="harvester")
+    _create_tru(client, "TRU-STORE-PARENT", "ORG-STORE-001")
+    _create_tru(client, "TRU-STORE-CHILD", "ORG-STORE-001", parentTraceableUnitId="TRU-STORE-PARENT")
+    client.create_material_processing(
+        processing_id="MP-STORE-001",
+        input_tru_id="TRU-STORE-PARENT",
+        output_tru_id="TRU-STORE-CHILD",
+        process_type="chipping",
+        input_volume=10.0,
+        output_volume=9.0
+    )
+    client.create_claim(
+        claim_id="CLA-STORE-001",
+        traceable_unit_id="TRU-STORE-CHILD",
+        claim_type="FSC Mix",
+        statement="FSC Mix Credit",
+        TraceableUnitId="TRU-STORE-CHILD"  # schema field name differs from create_claim's key
+    )
+    client.create_transaction(
+        transaction_id="TXN-STORE-001",
+        organization_id="ORG-STORE-001",
+        customer_id="CUST-STORE-001",
+        transaction_date="2025-01-15",
+        contractValue=1000.00,
+        contractCurrency="USD",
+        transactionStatus="pending"
+    )
+
+
+def test_indexes_follow_writes():
+    """Test that indexes are updated by create_*, add_tru_to_* and direct writes."""
+    print("🗂️  Testing Entity Store Index Maintenance")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    store = client.store
+    
+    assert store.related_ids('processing_by_tru', 'TRU-STORE-PARENT') == ['MP-STORE-001']
+    assert store.related_ids('processing_by_tru', 'TRU-STORE-CHILD') == ['MP-STORE-001']
+    assert store.related_ids('claims_by_tru', 'TRU-STORE-CHILD') == ['CLA-STORE-001']
+    assert store.related_ids('trus_by_organization', 'ORG-STORE-001') == ['TRU-STORE-PARENT', 'TRU-STORE-CHILD']
+    assert store.related_ids('children_by_parent', 'TRU-STORE-PARENT') == ['TRU-STORE-CHILD']
+    assert store.related_ids('transactions_by_tru', 'TRU-STORE-PARENT') == []
+    print("✓ create_* populated all indexes: PASSED")
+    
+    # add_tru_to_transaction replaces the stored model; the index must follow
+    client.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-PARENT")
+    assert store.related_ids('transactions_by_tru', 'TRU-STORE-PARENT') == ['TXN-STORE-001']
+    print("✓ add_tru_to_transaction updated the TRU -> transactions index: PASSED")
+    
+    del client.claims["CLA-STORE-001"]
+    assert not store.has_related('claims_by_tru', 'TRU-STORE-CHILD')
+    client.material_processing.pop("MP-STORE-001")
+    assert store.related_ids('processing_by_tru', 'TRU-STORE-PARENT') == []
+    print("✓ Deleting entities removed their index entries: PASSED")
+    
+    try:
+        store.related_ids('not_an_index', 'TRU-STORE-PARENT')
+        assert False, "Unknown index should raise"
+    except ValueError:
+        print("✓ Unknown index rejected: PASSED")
+
+
+def test_supply_chain_and_import_use_indexes():
+    """Test indexed supply chain lookups, including entities added by import_from_jsonld."""
+    print("\n🔗 Testing Indexed Supply Chain Lookups")
+    print("=" * 50)
+    
+    source = create_client()
+    _build_supply_chain(source)
+    source.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-CHILD")
+    
+    client = create_client()
+    results = client.import_from_jsonld(source.export_to_jsonld())
+    assert not results['errors'], results['errors']
+    
+    chain = client.get_supply_chain("TRU-STORE-CHILD")
+    assert [p.processing_id for p in chain['processing_history']] == ['MP-STORE-001']
+    assert [c.claim_id for c in chain['claims']] == ['CLA-STORE-001']
+    assert [t.transaction_id for t in chain['transactions']] == ['TXN-STORE-001']
+    assert [u.traceable_unit_id for u in chain['parent_units']] == ['TRU-STORE-PARENT']
+    
+    parent_chain = client.get_supply_chain("TRU-STORE-PARENT")
+    assert [u.traceable_unit_id for u in parent_chain['child_units']] == ['TRU-STORE-CHILD']
+    print("✓ Imported entities reachable through the indexes: PASSED")
+    
+    rules = client.validate_all()['business_rules']
+    assert rules['supply_chain_continuity']['valid']
+    missing = rules['regulatory_compliance']['issues'][0]
+    assert missing['tru_ids'] == ['TRU-STORE-PARENT']
+    print("✓ Orphan and missing-claim checks use the indexes: PASSED")
+
+
+def test_business_rules_scale():
+    """Test that business rule checks stay fast with many TRUs."""
+    print("\n⏱️  Testing Business Rule Check Scaling")
+    print("=" * 50)
+    
+    client = create_client()
+    ClaimModel = client.schema_loader.get_model('claim')
+    tru = _create_tru(create_client(), "TRU-SCALE-TEMPLATE", "ORG-SCALE-001")
+    for i in range(20000):
+        tru_id = f"TRU-SCALE-{i:05d}"
+        client.traceable_units[tru_id] = tru.model_copy(update={'traceable_unit_id': tru_id})
+        if i % 2:
+            client.claims[f"CLAIM-SCALE-{i:05d}"] = ClaimModel.model_construct(traceable_unit_id=tru_id)
+    
+    results = {'business_rules': {
+        'supply_chain_continuity': {'valid': True, 'issues': []},
+        'regulatory_compliance': {'valid': True, 'issues': []}
+    }}
+    start = time.perf_counter()
+    client._validate_business_rules(results)
+    elapsed = time.perf_counter() - start
+    
+    assert results['business_rules']['supply_chain_continuity']['issues'][0]['count'] == 20000
+    assert results['business_rules']['regulatory_compliance']['issues'][0]['count'] == 10000
+    assert elapsed < 1.0, f"Business rule checks took {elapsed:.2f}s"
+    print(f"✓ 20,000 TRUs checked in {elapsed * 1000:.0f}ms: PASSED")
+
+
+def main():
+    """Run all entity store tests."""
+    print("🚀 BOOST Entity Store Testing")
+    print("\n")
+    
+    try:
+        test_indexes_follow_writes()
+        test_supply_chain_and_import_use_indexes()
+        test_business_rules_scale()
+        print("\n✅ ALL ENTITY STORE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
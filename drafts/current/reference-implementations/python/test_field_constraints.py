@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test Compiled Field Constraints
+
+This script tests the field constraint checkers compiled from the schemas:
+- Checkers built when an entity schema is parsed, and rebuilt after a refresh
+- Compiled patterns, frozenset enums and numeric bounds per field
+- validate_field_constraints and validate_schema_compatibility messages
+- Unhashable values and enum members compared like list membership
+"""
+
+import sys
+import re
+import json
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from field_constraints import FieldChecker, EntityChecker
+from schema_loader import SchemaLoader
+from dynamic_validation import create_dynamic_validator
+
+
+def test_compiled_checkers():
+    """Test the checkers compiled for an entity schema."""
+    print("🧩 Testing Compiled Checkers")
+    print("=" * 50)
+    
+    loader = SchemaLoader()
+    assert 'traceable_unit' not in loader._state.entity_checkers
+    loader.get_schema('traceable_unit')
+    checker = loader._state.entity_checkers['traceable_unit']
+    assert loader.get_entity_checker('traceable_unit') is checker
+    assert loader.get_entity_checker('nonexistent') is None
+    print("✓ Checker built when the schema is parsed: PASSED")
+    
+    tru_id = checker.fields['traceableUnitId']
+    assert isinstance(tru_id.regex, re.Pattern) and tru_id.regex.pattern == '^TRU-[A-Z0-9-_]+$'
+    assert checker.fields['currentStatus'].enum_set == frozenset(['active', 'processed', 'delivered', 'consumed'])
+    confidence = loader.get_field_checker('traceable_unit', 'identificationConfidence')
+    assert (confidence.minimum, confidence.maximum) == (0, 100)
+    assert 'traceableUnitId' in checker.known_fields and 'harvesterId' in checker.required_set
+    assert set(checker.enum_fields) >= {'unitType', 'currentStatus', '@type'}
+    assert loader.get_field_constraints('traceable_unit', 'identificationConfidence') == {'minimum': 0, 'maximum': 100}
+    assert loader.get_field_constraints('traceable_unit', 'nonexistent') == {}
+    print("✓ Compiled patterns, frozenset enums, bounds and property sets: PASSED")
+    
+    loader.refresh_schemas()
+    assert loader.get_entity_checker('traceable_unit') is not checker
+    print("✓ Checkers rebuilt after refresh_schemas: PASSED")
+
+
+def test_constraint_messages():
+    """Test the messages of both rewritten validation methods."""
+    print("\n📝 Testing Constraint Messages")
+    print("=" * 50)
+    
+    validator = create_dynamic_validator()
+    assert validator.validate_field_constraints('traceable_unit', 'traceableUnitId', 'TRU-001') == (True, [])
+    assert validator.validate_field_constraints('traceable_unit', 'traceableUnitId', 'X-001') == (
+        False, ["Field 'traceableUnitId' doesn't match pattern: ^TRU-[A-Z0-9-_]+$"])
+    assert validator.validate_field_constraints('traceable_unit', 'identificationConfidence', 101) == (
+        False, ["Field 'identificationConfidence' above maximum: 100"])
+    assert validator.validate_field_constraints('traceable_unit', 'currentStatus', 'lost') == (
+        False, ["Field 'currentStatus' has invalid value. Valid options: "
+                "['active', 'processed', 'delivered', 'consumed']"])
+    assert validator.validate_field_constraints('traceable_unit', 'nonexistent', 'anything') == (True, [])
+    print("✓ validate_field_constraints reports patterns, bounds and enums: PASSED")
+    
+    loader = validator.schema_loader
+    with open(Path(loader.schema_base_path) / 'traceable_unit' / 'traceable_unit_example.json') as f:
+        example = json.load(f)
+    example['qualityGrade'] = 'Grade-A'
+    assert loader.validate_schema_compatibility('traceable_unit', example)[0]
+    broken = dict(example, currentStatus='lost', newField=1)
+    del broken['harvesterId']
+    assert loader.validate_schema_compatibility('traceable_unit', broken) == (False, [
+        "Missing required field 'harvesterId'",
+        "Invalid enum value 'lost' for field 'currentStatus'. Valid values: "
+        "['active', 'processed', 'delivered', 'consumed']",
+        "Unknown field 'newField' - may be from newer schema version"
+    ])
+    assert loader.validate_schema_compatibility('nonexistent', {}) == (False, ["Unknown entity type: nonexistent"])
+    print("✓ validate_schema_compatibility reports missing, enum and unknown fields in order: PASSED")
+
+
+def test_unhashable_values():
+    """Test enum membership for values and members that cannot be hashed."""
+    print("\n🧮 Testing Unhashable Values")
+    print("=" * 50)
+    
+    status = FieldChecker('status', {'enum': ['open', 'closed']})
+    assert status.allows('open') and not status.allows(['open']) and not status.allows({'a': 1})
+    assert status.check(['open']) == ["Field 'status' has invalid value. Valid options: ['open', 'closed']"]
+    
+    shape = FieldChecker('shape', {'enum': [[1, 2], {'kind': 'box'}]})
+    assert shape.enum_set is None
+    assert shape.allows([1, 2]) and shape.allows({'kind': 'box'}) and not shape.allows([2, 1])
+    
+    checker = EntityChecker({'properties': {'status': {'enum': ['open', 1]}}, 'required': ['status']})
+    assert checker.check_compatibility({'status': True}) == (True, [])
+    assert checker.check_compatibility({'status': ['open']})[0] is False
+    print("✓ Unhashable values and enum members compared by equality: PASSED")
+
+
+def main():
+    """Run all compiled field constraint tests."""
+    print("🚀 BOOST Compiled Field Constraint Testing")
+    print("\n")
+    
+    try:
+        test_compiled_checkers()
+        test_constraint_messages()
+        test_unhashable_values()
+        print("\n✅ ALL FIELD CONSTRAINT TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
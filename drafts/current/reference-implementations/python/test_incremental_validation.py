@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test Incremental Revalidation
+
+This script tests the per-entity outcome cache behind BOOSTClient.validate_all():
+- Results after add_tru_to_transaction, set_reconciliation_status and deletions match a full pass
+- Only written entities and their reference-graph neighbours are re-checked
+- validate_all(full=True) picks up entities modified in place
+- A small change to a large store is revalidated in O(changes)
+"""
+
+import sys
+import time
+import json
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+from test_entity_store import _create_tru, _build_supply_chain
+
+
+def _assert_matches_full_pass(client):
+    """Assert that an incremental validate_all() equals a full one, apart from the work it did."""
+    incremental = client.validate_all()
+    full = client.validate_all(full=True)
+    def schema_calls(stats):
+        return sum(counter['calls'] for counter in stats.get('schema_validation', {}).values())
+    
+    assert schema_calls(incremental.pop('stats')) <= schema_calls(full.pop('stats'))
+    assert json.dumps(incremental, sort_keys=True, default=str) == json.dumps(full, sort_keys=True, default=str)
+
+
+def test_incremental_matches_full():
+    """Test that incremental results track the mutation helpers and deletions."""
+    print("🔄 Testing Incremental Results Against Full Validation")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    results = client.validate_all()
+    assert results['business_rules']['supply_chain_continuity']['valid']
+    assert results['business_rules']['regulatory_compliance']['issues'][0]['tru_ids'] == ['TRU-STORE-PARENT']
+    
+    client.add_tru_to_transaction("TXN-STORE-001", "TRU-INC-404")
+    errors = client.validate_all()['validation_checks']['foreign_key_integrity']['errors']
+    assert [e['referenced_id'] for e in errors] == ['TRU-INC-404']
+    _assert_matches_full_pass(client)
+    print("✓ add_tru_to_transaction revalidated: PASSED")
+    
+    client.set_reconciliation_status("TXN-STORE-001", "disputed")
+    _assert_matches_full_pass(client)
+    print("✓ set_reconciliation_status revalidated: PASSED")
+    
+    # Deleting an organization breaks the references of the TRUs that name it
+    del client.organizations["ORG-STORE-001"]
+    results = client.validate_all()
+    fk = results['validation_checks']['foreign_key_integrity']
+    assert [(e['entity_id'], e['referenced_id']) for e in fk['errors']] == [
+        ('TRU-STORE-PARENT', 'ORG-STORE-001'), ('TRU-STORE-CHILD', 'ORG-STORE-001'), ('TXN-STORE-001', 'TRU-INC-404')
+    ]
+    _assert_matches_full_pass(client)
+    
+    # Re-adding it and the missing TRU repairs them
+    client.create_organization(organization_id="ORG-STORE-001", name="Store Test Forestry", org_type="harvester")
+    _create_tru(client, "TRU-INC-404", "ORG-STORE-001")
+    assert client.validate_all()['validation_checks']['foreign_key_integrity']['failed'] == 0
+    _assert_matches_full_pass(client)
+    print("✓ Deleted and re-added references revalidated: PASSED")
+    
+    del client.material_processing["MP-STORE-001"]
+    orphans = client.validate_all()['business_rules']['supply_chain_continuity']['issues'][0]
+    assert orphans['tru_ids'] == ['TRU-STORE-PARENT', 'TRU-STORE-CHILD']
+    _assert_matches_full_pass(client)
+    print("✓ Orphaned TRUs follow deleted processing: PASSED")
+
+
+def test_only_neighbours_rechecked():
+    """Test that a write re-checks the entity and its reference-graph neighbours."""
+    print("\n🕸️  Testing Dependency-Driven Re-Checks")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    _create_tru(client, "TRU-INC-003", "ORG-INC-002")
+    client.validate_all()
+    cache = client._validation_cache
+    
+    client.add_tru_to_transaction("TXN-STORE-001", "TRU-INC-003")
+    assert cache.dirty_count == 1
+    # The transaction, its seller organization and the TRU it now references
+    assert cache.refresh(token=client.schema_loader.schemas) == 3
+    
+    client.create_organization(organization_id="ORG-INC-002", name="Late Harvester", org_type="harvester")
+    # The organization and the TRU naming it
+    assert cache.refresh(token=client.schema_loader.schemas) == 2
+    assert cache.refresh(token=client.schema_loader.schemas) == 0
+    print("✓ Writes re-check only their neighbours: PASSED")
+    
+    # In-place edits are invisible to the cache until a full pass
+    client.traceable_units["TRU-STORE-CHILD"].total_volume_m3 = 100.0
+    assert client.validate_all()['validation_checks']['volume_conservation']['failed'] == 0
+    assert client.validate_all(full=True)['validation_checks']['volume_conservation']['failed'] == 1
+    print("✓ validate_all(full=True) picks up in-place edits: PASSED")
+
+
+def test_incremental_scale():
+    """Test that revalidating a small change is independent of the store size."""
+    print("\n⏱️  Testing Incremental Revalidation Scaling")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_supply_chain(client)
+    tru = client.traceable_units["TRU-STORE-PARENT"]
+    for i in range(5000):
+        tru_id = f"TRU-SCALE-{i:05d}"
+        client.traceable_units[tru_id] = tru.model_copy(update={'traceable_unit_id': tru_id})
+    
+    start = time.perf_counter()
+    client.validate_all()
+    full_elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for i in range(10):
+        client.add_tru_to_transaction("TXN-STORE-001", f"TRU-SCALE-{i:05d}")
+        results = client.validate_all()
+    elapsed = (time.perf_counter() - start) / 10
+    
+    assert results['business_rules']['supply_chain_continuity']['issues'][0]['count'] == 4990
+    assert elapsed < full_elapsed / 10, f"Incremental pass took {elapsed:.3f}s, full pass {full_elapsed:.3f}s"
+    print(f"✓ Full pass {full_elapsed * 1000:.0f}ms, incremental pass {elapsed * 1000:.1f}ms: PASSED")
+
+
+def main():
+    """Run all incremental validation tests."""
+    print("🚀 BOOST Incremental Validation Testing")
+    print("\n")
+    
+    try:
+        test_incremental_matches_full()
+        test_only_neighbours_rechecked()
+        test_incremental_scale()
+        print("\n✅ ALL INCREMENTAL VALIDATION TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
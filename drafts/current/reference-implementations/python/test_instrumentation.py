@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test Validation Instrumentation
+
+This script tests the timing and counters collected by validation runs:
+- Schema, compatibility and cross-entity phases of comprehensive_validation
+- Business rule categories timed per entity type
+- Worker process stats merged into the same totals as serial mode
+- validate_all checks counted per collection, for full and incremental runs
+- Stats hooks called once per run for external metrics collectors
+- Results carrying the stats as plain, JSON-serializable data
+"""
+
+import sys
+import copy
+import json
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from instrumentation import ValidationStats, ALL_ENTITY_TYPES, business_rule_phase
+from dynamic_validation import create_dynamic_validator
+from boost_client import create_client
+from benchmarks import build_dataset
+from test_business_rules import _flatten_rules
+from test_entity_store import _build_supply_chain
+
+
+def test_stats_object():
+    """Test recording, merging and reporting counters."""
+    print("📊 Testing ValidationStats")
+    print("=" * 50)
+    
+    stats = ValidationStats()
+    stats.record('schema', 'organization', 0.5, errors=2, calls=10)
+    stats.record('schema', 'claim', 0.25, calls=4)
+    stats.record(business_rule_phase('economicLogicRules'), 'transaction', 1.0, errors=1)
+    other = ValidationStats()
+    other.record('schema', 'organization', 0.25, errors=1, calls=5)
+    stats.merge(other)
+    
+    assert stats.get('schema', 'organization').as_dict() == {'calls': 15, 'errors': 3, 'seconds': 0.75}
+    assert stats.get('schema').calls == 19
+    assert stats.get('foreign_keys').calls == 0
+    assert stats.phases() == ['schema', 'business_rules:economicLogicRules']
+    assert stats.business_rule_categories() == ['economicLogicRules']
+    assert stats.total_seconds == 2.0
+    assert [entry['entity_type'] for entry in stats.slowest(2)] == ['transaction', 'organization']
+    assert stats.as_dict()['schema']['claim'] == {'calls': 4, 'errors': 0, 'seconds': 0.25}
+    print("✓ Counters recorded, merged and summed per phase: PASSED")
+    
+    again = ValidationStats()
+    again.record('schema', 'organization', 9.0, errors=3, calls=15)
+    again.record('schema', 'claim', 9.0, calls=4)
+    again.record(business_rule_phase('economicLogicRules'), 'transaction', 9.0, errors=1)
+    assert again == stats
+    again.record('schema', 'claim', 0.0)
+    assert again != stats
+    print("✓ Stats compare by counts, not wall time: PASSED")
+
+
+def test_comprehensive_validation_stats():
+    """Test the phases recorded by comprehensive_validation."""
+    print("\n⏱️  Testing comprehensive_validation Stats")
+    print("=" * 50)
+    
+    runs = []
+    validator = create_dynamic_validator(stats_hook=lambda source, stats: runs.append((source, stats)))
+    dataset = build_dataset(validator.schema_loader, 60)
+    dataset['organization'][0] = dict(dataset['organization'][0], organizationType='not-a-type')
+    results = validator.comprehensive_validation(dataset)
+    [(source, stats)] = runs
+    
+    for entity_type, records in dataset.items():
+        assert stats.get('schema', entity_type).calls == len(records)
+        assert stats.get('schema_compatibility', entity_type).calls == len(records)
+    assert stats.get('schema', 'organization').errors == 1
+    assert stats.get('schema', 'claim').errors == 0
+    for phase in ('foreign_keys', 'circular_references', 'cardinality', 'temporal_consistency',
+                  'tru_transaction_consistency'):
+        assert stats.get(phase, ALL_ENTITY_TYPES).calls == 1
+    assert stats.total_seconds > 0
+    print("✓ Per-entity and cross-entity phases timed and counted: PASSED")
+    
+    assert source == 'comprehensive_validation'
+    assert results['stats'] == stats.as_dict()
+    assert json.loads(json.dumps(results))['stats'] == stats.as_dict()
+    print("✓ Stats hook called once, results carry the stats as JSON-serializable data: PASSED")
+    
+    validator.comprehensive_validation(dataset, workers=2, chunk_size=7)
+    parallel = runs[-1][1]
+    assert parallel == stats
+    print("✓ Worker process stats merged into the serial totals: PASSED")
+
+
+def test_business_rule_categories():
+    """Test business rule checks timed per category and entity type."""
+    print("\n📐 Testing Business Rule Category Stats")
+    print("=" * 50)
+    
+    runs = []
+    validator = create_dynamic_validator(stats_hook=lambda source, stats: runs.append(stats))
+    rules = _flatten_rules(copy.deepcopy(validator.schema_loader.business_logic_rules))
+    rules['validationExecution']['executionOrder'] = rules['validationExecution']['executionOrder']['default']
+    validator.schema_loader._state.business_logic_rules = rules
+    
+    categories = {category for checks in validator.get_categorized_business_rule_plan().values()
+                  for category, _ in checks}
+    assert categories == {'volumeMassConservation', 'speciesCompositionRules', 'certificationLogicRules',
+                          'economicLogicRules', 'qualityAssuranceRules'}
+    
+    entities = {
+        'material_processing': [{'inputVolume': 10, 'outputVolume': 20, 'processType': 'chipping'},
+                                {'inputVolume': 20, 'outputVolume': 10, 'processType': 'chipping'}],
+        'traceable_unit': [{'speciesComposition': [{'speciesName': 'Pine', 'percentage': 60}]}]
+    }
+    results = validator.comprehensive_validation(entities)
+    stats = runs[-1]
+    assert results['stats'][business_rule_phase('volumeMassConservation')]['material_processing'] == \
+        stats.get(business_rule_phase('volumeMassConservation'), 'material_processing').as_dict()
+    conservation = stats.get(business_rule_phase('volumeMassConservation'), 'material_processing')
+    assert conservation.calls == 6 and conservation.errors == 2
+    assert stats.get(business_rule_phase('speciesCompositionRules'), 'traceable_unit').errors == 1
+    assert stats.get(business_rule_phase('qualityAssuranceRules')).calls == 3
+    assert set(stats.business_rule_categories()) == {'volumeMassConservation', 'speciesCompositionRules',
+                                                     'qualityAssuranceRules'}
+    print("✓ Calls and errors of each rule category per entity type: PASSED")
+    
+    assert validator.validate_business_logic('material_processing', entities['material_processing'][0]) == \
+        validator.validate_business_logic('material_processing', entities['material_processing'][0], ValidationStats())
+    print("✓ Instrumented and plain business logic checks agree: PASSED")
+
+
+def test_validate_all_stats():
+    """Test the checks recorded by BOOSTClient.validate_all."""
+    print("\n🔎 Testing validate_all Stats")
+    print("=" * 50)
+    
+    runs = []
+    client = create_client(stats_hook=lambda source, stats: runs.append((source, stats)))
+    _build_supply_chain(client)
+    results = client.validate_all()
+    stats = runs[-1][1]
+    assert json.loads(json.dumps(results))['stats'] == stats.as_dict()
+    
+    assert stats.get('schema_validation', 'traceable_units').calls == len(client.traceable_units)
+    assert stats.get('volume_conservation', 'material_processing').calls == len(client.material_processing)
+    for check_name, check_results in results['validation_checks'].items():
+        assert stats.get(check_name).errors == check_results['failed'], check_name
+    assert stats.get('supply_chain_continuity', 'traceable_units').calls == len(client.traceable_units)
+    print("✓ Every check timed and counted per collection: PASSED")
+    
+    assert client.validate_all()['stats'] == {}
+    client.traceable_units['TRU-STORE-CHILD'] = client.traceable_units['TRU-STORE-CHILD']
+    client.validate_all()
+    assert 0 < runs[-1][1].get('schema_validation').calls < stats.get('schema_validation').calls
+    assert [source for source, _ in runs] == ['validate_all'] * 3
+    print("✓ Incremental runs count only the re-checked entities: PASSED")
+
+
+def main():
+    """Run all validation instrumentation tests."""
+    print("🚀 BOOST Validation Instrumentation Testing")
+    print("\n")
+    
+    try:
+        test_stats_object()
+        test_comprehensive_validation_stats()
+        test_business_rule_categories()
+        test_validate_all_stats()
+        print("\n✅ ALL INSTRUMENTATION TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Test Streaming JSON-LD Import and Export
+
+This script tests incremental JSON-LD reading and writing in BOOSTClient:
+- '@graph' items are decoded one at a time across arbitrary chunk boundaries
+- Paths, gzip files, text and binary streams are accepted
+- Import dispatches on the schema-declared @type of every entity type
+- Progress callbacks report processed, imported and error counts
+- Export writes compact, indented and NDJSON documents, optionally gzipped
+- Caller-owned binary streams stay open after reading and writing
+"""
+
+import gc
+import io
+import sys
+import gzip
+import json
+import tempfile
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+from jsonld_stream import JSONLDGraphReader, JSONLDGraphWriter, iter_jsonld_graph
+
+
+def _customer(customer_id):
+    """Build a Customer entity, a type without a dedicated BOOSTClient collection."""
+    return {
+        "@context": {"@vocab": "https://github.com/carbondirect/BOOST/schemas/"},
+        "@type": "Customer",
+        "@id": f"https://github.com/carbondirect/BOOST/customers/{customer_id}",
+        "customerId": customer_id,
+        "customerName": f"Customer {customer_id}"
+    }
+
+
+def test_incremental_reader():
+    """Test that the reader yields graph items regardless of chunk boundaries and source kind."""
+    print("📖 Testing Incremental JSON-LD Reader")
+    print("=" * 50)
+    
+    document = {
+        "@context": {"boost": "https://github.com/carbondirect/BOOST/schemas#"},
+        "@graph": [{"@type": "Example", "index": i, "name": "é" * i, "volume": 12.345} for i in range(50)]
+    }
+    text = json.dumps(document, indent=2)
+    
+    for chunk_size in (1, 7, 100, 65536):
+        reader = JSONLDGraphReader(io.StringIO(text), chunk_size=chunk_size)
+        assert list(reader) == document["@graph"]
+        assert reader.header == {"@context": document["@context"]}
+        assert reader.chars_read == len(text)
+    print("✓ Graph items decoded across chunk boundaries: PASSED")
+    
+    assert list(iter_jsonld_graph(io.BytesIO(text.encode('utf-8')), chunk_size=5)) == document["@graph"]
+    assert list(iter_jsonld_graph(io.StringIO('[1, 22, 333]'), chunk_size=1)) == [1, 22, 333]
+    assert list(iter_jsonld_graph(io.StringIO('{"@type": "Customer"}'))) == [{"@type": "Customer"}]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.jsonld.gz"
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        assert list(iter_jsonld_graph(path)) == document["@graph"]
+    print("✓ Binary streams, top-level arrays, single entities and gzip files: PASSED")
+    
+    for malformed in ('{"@graph": [{"a": 1},', '{"@graph": [{"a": 1} {"b": 2}]}', '{"@graph": {}}', '{'):
+        try:
+            list(iter_jsonld_graph(io.StringIO(malformed), chunk_size=4))
+            assert False, f"Malformed document accepted: {malformed!r}"
+        except ValueError as e:
+            assert "Invalid JSON-LD at character" in str(e)
+    print("✓ Malformed documents rejected with their position: PASSED")
+
+
+def test_streaming_import():
+    """Test streaming import with table-driven type dispatch and progress reporting."""
+    print("\n📥 Testing Streaming JSON-LD Import")
+    print("=" * 50)
+    
+    source = create_client()
+    source.create_organization(organization_id="ORG-STREAM-001", name="Stream Test Forestry", org_type="harvester")
+    document = json.loads(source.export_to_jsonld())
+    document["@graph"].extend(_customer(f"CUST-STREAM-{i:03d}") for i in range(5))
+    document["@graph"].append({"@type": "NotABoostType", "@id": "urn:unknown"})
+    document["@graph"].append(dict(_customer("CUST-STREAM-BAD"), customerId="bad id"))
+    
+    client = create_client()
+    progress = []
+    results = client.import_from_jsonld_stream(
+        io.StringIO(json.dumps(document)), progress_callback=progress.append, progress_every=3
+    )
+    assert results['imported']['organizations'] == 1
+    assert results['imported']['customer'] == 5
+    assert results['skipped'] == 1
+    assert len(results['errors']) == 1 and results['errors'][0].startswith("Error importing customer:")
+    assert "CUST-STREAM-004" in client.store.collections['customer']
+    assert "ORG-STREAM-001" in client.organizations
+    print("✓ Schema-declared @types dispatched to their collections: PASSED")
+    
+    assert [p['processed'] for p in progress] == [3, 6, 8]
+    assert progress[-1] == {'processed': 8, 'imported': 6, 'errors': 1, 'chars_read': len(json.dumps(document))}
+    print("✓ Progress reported every 3 entities and at the end: PASSED")
+    
+    # String, dict and list inputs all go through the same dispatch
+    for data in (json.dumps(document), document, document["@graph"]):
+        assert create_client().import_from_jsonld(data)['imported']['customer'] == 5
+    print("✓ import_from_jsonld accepts strings, dicts and lists: PASSED")
+
+
+def test_streaming_export():
+    """Test compact, indented and NDJSON export and their round trips through import."""
+    print("\n📤 Testing Streaming JSON-LD Export")
+    print("=" * 50)
+    
+    context = {"boost": "https://github.com/carbondirect/BOOST/schemas#"}
+    entities = [{"@type": "Example", "values": [1, {"nested": "a\nb"}]}, {"@type": "Example"}]
+    for document_context, expected in ((context, {"@context": context, "@graph": entities}), (None, entities)):
+        for indent in (None, 2):
+            output = io.StringIO()
+            with JSONLDGraphWriter(output, document_context, indent=indent) as writer:
+                assert writer.write_many(entities) == 2
+            assert json.loads(output.getvalue()) == expected
+            if indent:
+                assert output.getvalue() == json.dumps(expected, indent=indent)
+    print("✓ Compact and indented documents match json.dumps: PASSED")
+    
+    output = io.BytesIO()
+    with JSONLDGraphWriter(output, context, format='ndjson', compress=True) as writer:
+        writer.write_many(entities)
+    lines = gzip.decompress(output.getvalue()).decode('utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [{"@context": context}] + entities
+    reader = JSONLDGraphReader(io.BytesIO(gzip.decompress(output.getvalue())))
+    assert list(reader) == entities and reader.header == {"@context": context}
+    print("✓ Gzipped NDJSON has one context line and one line per entity: PASSED")
+    
+    # A failed export must not look like a complete document
+    output = io.StringIO()
+    try:
+        with JSONLDGraphWriter(output, context) as writer:
+            writer.write(entities[0])
+            raise RuntimeError("export interrupted")
+    except RuntimeError:
+        pass
+    try:
+        json.loads(output.getvalue())
+        assert False, "Interrupted export parsed as complete JSON"
+    except json.JSONDecodeError:
+        print("✓ Interrupted export left unterminated: PASSED")
+    
+    source = create_client()
+    source.create_organization(organization_id="ORG-STREAM-001", name="Stream Test Forestry", org_type="harvester")
+    source.import_from_jsonld([_customer("CUST-STREAM-001")])
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, format in (("snapshot.jsonld.gz", 'json'), ("snapshot.ndjson", 'ndjson')):
+            path = Path(tmp) / name
+            assert source.export_to_jsonld_stream(path, format=format) == 2
+            client = create_client()
+            results = client.import_from_jsonld_stream(path)
+            assert results['imported']['organizations'] == 1 and results['imported']['customer'] == 1
+            assert not results['errors'] and not results['skipped']
+        assert (Path(tmp) / "snapshot.jsonld.gz").read_bytes()[:2] == b'\x1f\x8b'
+    print("✓ Exported files round-trip through streaming import: PASSED")
+    
+    empty = create_client()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, format in (("empty.jsonld", 'json'), ("empty.ndjson", 'ndjson')):
+            path = Path(tmp) / name
+            assert empty.export_to_jsonld_stream(path, format=format) == 0
+            results = create_client().import_from_jsonld_stream(path)
+            assert not results['errors'] and not results['skipped']
+            assert sum(results['imported'].values()) == 0
+        assert json.loads((Path(tmp) / "empty.ndjson").read_text()) == {'@context': empty.default_context['@context']}
+    assert list(JSONLDGraphReader(io.StringIO(''))) == [] and list(JSONLDGraphReader(io.StringIO(' \n'))) == []
+    header = JSONLDGraphReader(io.StringIO('{"@context": {"@vocab": "https://example.org/"}}\n'))
+    assert list(header) == [] and header.header == {'@context': {'@vocab': 'https://example.org/'}}
+    print("✓ Empty store round-trips, empty input and a lone header read as no entities: PASSED")
+
+
+def test_caller_streams_stay_open():
+    """Test that binary streams passed in by the caller are usable after streaming."""
+    print("\n🔓 Testing Caller-Owned Streams")
+    print("=" * 50)
+    
+    entities = [{"@type": "Example", "name": "é"}, {"@type": "Example"}]
+    for compress in (False, True):
+        output = io.BytesIO()
+        writer = JSONLDGraphWriter(output, compress=compress)
+        writer.write_many(entities)
+        writer.close()
+        del writer
+        gc.collect()
+        assert not output.closed
+        output.write(b'')
+        data = output.getvalue()
+        assert json.loads(gzip.decompress(data) if compress else data) == entities
+    
+    # A writer dropped without close() must not close the stream either
+    output = io.BytesIO()
+    JSONLDGraphWriter(output).write(entities[0])
+    gc.collect()
+    assert not output.closed
+    print("✓ Writer leaves binary targets open, also when garbage-collected: PASSED")
+    
+    # A reader abandoned part-way through the document
+    source = io.BytesIO(json.dumps({"@graph": entities}).encode('utf-8'))
+    items = iter(JSONLDGraphReader(source, chunk_size=4))
+    assert next(items) == entities[0]
+    del items
+    gc.collect()
+    assert not source.closed
+    source.seek(0)
+    assert source.read(1) == b'{'
+    
+    source = io.BytesIO(json.dumps(entities).encode('utf-8'))
+    assert list(iter_jsonld_graph(source)) == entities
+    gc.collect()
+    source.seek(0)
+    assert json.loads(source.read()) == entities
+    print("✓ Reader leaves binary sources open and readable: PASSED")
+
+
+def main():
+    """Run all streaming JSON-LD tests."""
+    print("🚀 BOOST Streaming JSON-LD Testing")
+    print("\n")
+    
+    try:
+        test_incremental_reader()
+        test_streaming_import()
+        test_streaming_export()
+        test_caller_streams_stay_open()
+        print("\n✅ ALL STREAMING JSON-LD TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
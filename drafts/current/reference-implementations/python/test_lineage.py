@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test Lineage Graph
+
+This script tests transitive TRU lineage queries:
+- Edges from TRU parent/child links, MaterialProcessing and ProcessingHistory
+- Upstream/downstream closure with hop counts and depth limits
+- Shortest path back to an origin TRU
+- Memoized results dropped only when a write changes a lineage edge
+- Deep chains traversed in linear time
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+
+
+def _build_pellet_chain(client):
+    """Log -> chips -> chip lot -> pellets -> blend (+ additive) -> bags."""
+    TRU = client.schema_loader.get_model('traceable_unit')
+    MP = client.schema_loader.get_model('material_processing')
+    PH = client.schema_loader.get_model('processing_history')
+    
+    for tru_id in ['TRU-LOG', 'TRU-CHIPS', 'TRU-ADDITIVE', 'TRU-PELLETS', 'TRU-BLEND', 'TRU-BAGS']:
+        client.traceable_units[tru_id] = TRU.model_construct(traceable_unit_id=tru_id)
+    client.traceable_units['TRU-CHIP-LOT'] = TRU.model_construct(
+        traceable_unit_id='TRU-CHIP-LOT', parent_traceable_unit_id='TRU-CHIPS')
+    
+    client.material_processing['MP-CHIP'] = MP.model_construct(
+        processing_id='MP-CHIP', input_traceable_unit_id='TRU-LOG', output_traceable_unit_id='TRU-CHIPS')
+    client.material_processing['MP-MIX'] = MP.model_construct(
+        processing_id='MP-MIX', input_traceable_unit_id='TRU-ADDITIVE', output_traceable_unit_id='TRU-BLEND')
+    
+    histories = client.store.collection_for('processing_history')
+    histories['PH-PELLETIZE'] = PH.model_construct(
+        processing_history_id='PH-PELLETIZE', input_tru_ids=['TRU-CHIP-LOT'], output_tru_ids=['TRU-PELLETS'])
+    # Pellets feed the bagging step through the history chain
+    histories['PH-BAG'] = PH.model_construct(
+        processing_history_id='PH-BAG', input_tru_ids=['TRU-BLEND'], output_tru_ids=['TRU-BAGS'],
+        previous_processing_history_id='PH-PELLETIZE')
+
+
+def test_lineage_queries():
+    """Test closure, depth limits and paths over every kind of lineage edge."""
+    print("🧬 Testing Lineage Queries")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_pellet_chain(client)
+    lineage = client.lineage
+    
+    assert lineage.upstream('TRU-BAGS') == {
+        'TRU-BLEND': 1, 'TRU-PELLETS': 2, 'TRU-ADDITIVE': 2, 'TRU-CHIP-LOT': 3, 'TRU-CHIPS': 4, 'TRU-LOG': 5
+    }
+    assert list(lineage.downstream('TRU-LOG')) == [
+        'TRU-CHIPS', 'TRU-CHIP-LOT', 'TRU-PELLETS', 'TRU-BLEND', 'TRU-BAGS'
+    ]
+    print("✓ Upstream and downstream closure across all edge types: PASSED")
+    
+    assert lineage.downstream('TRU-LOG', max_depth=2) == {'TRU-CHIPS': 1, 'TRU-CHIP-LOT': 2}
+    assert lineage.upstream('TRU-BAGS', max_depth=0) == {}
+    print("✓ Depth-limited traversal: PASSED")
+    
+    assert lineage.path_to_origin('TRU-BAGS') == ['TRU-BAGS', 'TRU-BLEND', 'TRU-ADDITIVE']
+    assert lineage.path_to_origin('TRU-PELLETS') == ['TRU-PELLETS', 'TRU-CHIP-LOT', 'TRU-CHIPS', 'TRU-LOG']
+    assert lineage.path_to_origin('TRU-LOG') == ['TRU-LOG']
+    print("✓ Shortest path to origin: PASSED")
+    
+    result = client.get_lineage('TRU-PELLETS', max_depth=1)
+    assert result['upstream'] == {'TRU-CHIP-LOT': 1} and result['downstream'] == {'TRU-BLEND': 1}
+    assert result['path_to_origin'][-1] == 'TRU-LOG'
+    assert 'error' in client.get_lineage('TRU-MISSING')
+    print("✓ BOOSTClient.get_lineage: PASSED")
+
+
+def test_memoization():
+    """Test that results are kept until a write changes a lineage edge."""
+    print("\n🧠 Testing Lineage Memoization")
+    print("=" * 50)
+    
+    client = create_client()
+    _build_pellet_chain(client)
+    lineage = client.lineage
+    lineage.upstream('TRU-BAGS')
+    version = lineage.version
+    
+    # Writes that leave the lineage fields alone keep the graph
+    bags = client.traceable_units['TRU-BAGS']
+    client.traceable_units['TRU-BAGS'] = bags.model_copy(update={'total_volume_m3': 12.0})
+    client.claims['CLAIM-1'] = client.schema_loader.get_model('claim').model_construct(traceable_unit_id='TRU-BAGS')
+    assert lineage.version == version
+    print("✓ Unrelated writes keep memoized results: PASSED")
+    
+    del client.material_processing['MP-MIX']
+    assert lineage.version == version + 1
+    assert 'TRU-ADDITIVE' not in lineage.upstream('TRU-BAGS')
+    assert lineage.path_to_origin('TRU-BAGS')[-1] == 'TRU-LOG'
+    print("✓ Lineage edge changes rebuild the graph: PASSED")
+    
+    client.traceable_units['TRU-LOG'] = client.traceable_units['TRU-LOG'].model_copy(
+        update={'parent_traceable_unit_id': 'TRU-BAGS'})
+    assert lineage.path_to_origin('TRU-BAGS') is None
+    assert len(lineage.upstream('TRU-BAGS')) == 5
+    print("✓ Cycles terminate traversal, no origin reported: PASSED")
+
+
+def test_deep_lineage():
+    """Test closure and origin queries on a long processing chain."""
+    print("\n⏱️  Testing Deep Lineage Traversal")
+    print("=" * 50)
+    
+    client = create_client()
+    TRU = client.schema_loader.get_model('traceable_unit')
+    MP = client.schema_loader.get_model('material_processing')
+    size = 200000
+    for i in range(size):
+        tru_id = f'TRU-{i:06d}'
+        client.traceable_units[tru_id] = TRU.model_construct(traceable_unit_id=tru_id)
+        if i:
+            client.material_processing[f'MP-{i:06d}'] = MP.model_construct(
+                input_traceable_unit_id=f'TRU-{i - 1:06d}', output_traceable_unit_id=tru_id)
+    
+    start = time.perf_counter()
+    upstream = client.lineage.upstream(f'TRU-{size - 1:06d}')
+    path = client.lineage.path_to_origin(f'TRU-{size - 1:06d}')
+    elapsed = time.perf_counter() - start
+    assert len(upstream) == size - 1 and upstream['TRU-000000'] == size - 1
+    assert len(path) == size and path[-1] == 'TRU-000000'
+    assert elapsed < 10.0, f"Lineage queries took {elapsed:.2f}s"
+    
+    start = time.perf_counter()
+    assert client.lineage.downstream('TRU-000100', max_depth=25)['TRU-000125'] == 25
+    client.lineage.upstream(f'TRU-{size - 1:06d}')
+    memo_elapsed = time.perf_counter() - start
+    assert memo_elapsed < elapsed
+    print(f"✓ {size:,}-hop chain built and traversed in {elapsed * 1000:.0f}ms, "
+          f"memoized in {memo_elapsed * 1000:.0f}ms: PASSED")
+
+
+def main():
+    """Run all lineage tests."""
+    print("🚀 BOOST Lineage Graph Testing")
+    print("\n")
+    
+    try:
+        test_lineage_queries()
+        test_memoization()
+        test_deep_lineage()
+        print("\n✅ ALL LINEAGE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test Mass Balance Ledger
+
+This script tests the streaming MassBalanceAccount ledger:
+- Period labels and account IDs
+- Transactions and processing booked as outputs and inputs, with conversion factors
+- Closed periods produce schema-valid MassBalanceAccount entities and flag over-crediting
+- Closing a period closes every earlier period; invalid quantities refused
+- A single period recomputed without replaying the others
+- Years of events booked in memory proportional to accounts x periods
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mass_balance import (
+    MassBalanceLedger, LedgerEvent, INPUT, OUTPUT, period_of, account_id_for,
+    transaction_events, processing_events
+)
+from boost_client import create_client
+
+
+def test_periods_and_accounts():
+    """Test period labels and MassBalanceAccount IDs."""
+    print("📅 Testing Periods and Account IDs")
+    print("=" * 50)
+    
+    assert period_of('2024-03-15') == '2024-Q1'
+    assert period_of('2024-11-02T10:00:00Z', 'month') == '2024-11'
+    assert period_of('2024-07-01', 'year') == '2024'
+    assert period_of('not a date') is None and period_of(None) is None and period_of('2024-13-01') is None
+    print("✓ Period labels from dates and date-times: PASSED")
+    
+    assert account_id_for('ORG-MILL-001', 'PG-PELLETS') == 'MBA-MILL-001-PELLETS'
+    assert account_id_for('ORG-mill 2', 'PG-WOOD.CHIPS') == 'MBA-MILL-2-WOOD-CHIPS'
+    print("✓ Account IDs follow the MBA- pattern: PASSED")
+
+
+def _book_year(ledger):
+    """Processing inputs and sales for one mill over two quarters."""
+    processing = [
+        {'processingId': 'MP-1', 'processTimestamp': '2024-01-10T08:00:00Z', 'inputVolume': 100.0},
+        {'processingId': 'MP-2', 'processTimestamp': '2024-02-10T08:00:00Z', 'inputVolume': 50.0},
+        {'processingId': 'MP-3', 'processTimestamp': '2024-04-10T08:00:00Z', 'inputVolume': 20.0}
+    ]
+    transactions = [
+        {'transactionId': 'TXN-1', 'OrganizationId': 'ORG-MILL-001', 'transactionDate': '2024-03-01',
+         'biomassVolume': 90.0, 'transactionStatus': 'completed'},
+        {'transactionId': 'TXN-2', 'OrganizationId': 'ORG-MILL-001', 'transactionDate': '2024-03-20',
+         'biomassVolume': 500.0, 'transactionStatus': 'cancelled'},
+        {'transactionId': 'TXN-3', 'OrganizationId': 'ORG-MILL-001', 'transactionDate': '2024-05-01',
+         'biomassVolume': 60.0, 'transactionStatus': 'completed'}
+    ]
+    booked = ledger.consume(processing_events(processing, 'ORG-MILL-001', 'PG-PELLETS'))
+    booked += ledger.consume(transaction_events(transactions, 'PG-PELLETS'))
+    return booked
+
+
+def test_ledger_periods():
+    """Test running balances, period closing and over-crediting."""
+    print("\n⚖️  Testing Ledger Balances")
+    print("=" * 50)
+    
+    ledger = MassBalanceLedger('quarter', conversion_factors={'PG-PELLETS': 0.8})
+    assert _book_year(ledger) == 5
+    assert ledger.period_totals('ORG-MILL-001', 'PG-PELLETS', '2024-Q1') == {'inputs': 120.0, 'outputs': 90.0}
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS', '2024-Q1') == 30.0
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS') == 30.0 + 16.0 - 60.0
+    print("✓ Inputs converted, cancelled sales skipped: PASSED")
+    
+    accounts, errors = ledger.close_period('2024-Q1')
+    assert errors == []
+    account = accounts[0]
+    assert account['accountId'] == 'MBA-MILL-001-PELLETS'
+    assert (account['periodInputs'], account['periodOutputs'], account['currentBalance']) == (120.0, 90.0, 30.0)
+    validator = create_client().validator
+    is_valid, schema_errors = validator.validate_entity('mass_balance_account', account)
+    assert is_valid, schema_errors
+    print("✓ Closed period produces a schema-valid MassBalanceAccount: PASSED")
+    
+    late = LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-02-01', 5.0, INPUT)
+    assert not ledger.record(late) and ledger.late_events == 1
+    print("✓ Events for a closed period are not booked: PASSED")
+    
+    accounts, errors = ledger.close_period('2024-Q2')
+    assert accounts[0]['currentBalance'] == -14.0
+    assert errors == [
+        "Over-crediting in MBA-MILL-001-PELLETS for 2024-Q2: outputs exceed available balance by 14.000 "
+        "(period inputs 16.000, period outputs 60.000)"
+    ]
+    print("✓ Over-crediting flagged at period close: PASSED")
+
+
+def test_closing_and_quantities():
+    """Test out-of-order closing and quantity checks."""
+    print("\n🔒 Testing Period Closing and Quantities")
+    print("=" * 50)
+    
+    ledger = MassBalanceLedger('quarter', conversion_factors={'PG-PELLETS': 0.8})
+    _book_year(ledger)
+    ledger.close_period('2024-Q2')
+    assert ledger.closed_through == '2024-Q2' and {'2024-Q1', '2024-Q2'} <= ledger.closed_periods
+    for timestamp in ('2024-02-01', '2023-11-01', '2024-06-30'):
+        assert not ledger.record(LedgerEvent('ORG-MILL-001', 'PG-PELLETS', timestamp, 5.0, OUTPUT))
+    assert ledger.late_events == 3
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS', '2024-Q1') == 30.0
+    assert ledger.record(LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-07-01', 5.0, OUTPUT))
+    ledger.close_period('2024-Q1')
+    assert ledger.closed_through == '2024-Q2'
+    assert not ledger.record(LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-05-01', 5.0, OUTPUT))
+    print("✓ Closing a period closes every earlier period: PASSED")
+    
+    recorded = ledger.events_recorded
+    for quantity in (True, -1.0, '5', None, float('nan')):
+        try:
+            ledger.record(LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-08-01', quantity, INPUT, 'MP-BAD'))
+            assert False, f"Quantity {quantity!r} booked"
+        except ValueError as e:
+            assert "non-negative number" in str(e) and "'MP-BAD'" in str(e)
+    try:
+        ledger.consume(transaction_events([{'OrganizationId': 'ORG-MILL-001', 'transactionDate': '2024-08-01',
+                                            'biomassVolume': -10.0}], 'PG-PELLETS'))
+        assert False, "Negative sale booked"
+    except ValueError:
+        pass
+    assert ledger.events_recorded == recorded
+    assert ledger.record(LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-08-01', 0, INPUT))
+    print("✓ Boolean, negative and non-numeric quantities refused: PASSED")
+
+
+def test_recompute_period():
+    """Test replacing one period's totals without replaying history."""
+    print("\n🔁 Testing Single-Period Recompute")
+    print("=" * 50)
+    
+    ledger = MassBalanceLedger('quarter', conversion_factors={'PG-PELLETS': 0.8})
+    _book_year(ledger)
+    ledger.close_period('2024-Q1')
+    
+    corrected = [
+        LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-01-10', 200.0, INPUT, 'MP-1'),
+        LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-03-01', 90.0, OUTPUT, 'TXN-1'),
+        LedgerEvent('ORG-MILL-001', 'PG-PELLETS', '2024-04-01', 1.0, OUTPUT, 'TXN-OTHER')
+    ]
+    assert ledger.recompute_period('2024-Q1', corrected) == 2
+    assert '2024-Q1' in ledger.closed_periods
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS', '2024-Q1') == 70.0
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS', '2024-Q2') == 70.0 + 16.0 - 60.0
+    assert ledger.balance('ORG-MILL-001', 'PG-PELLETS') == 26.0
+    print("✓ Later balances follow a recomputed period: PASSED")
+    
+    client = create_client()
+    results = client.close_mass_balance_period(ledger, '2024-Q2')
+    assert results['accounts'] == ['MBA-MILL-001-PELLETS'] and not results['errors']
+    assert not results['over_crediting']
+    stored = client.store.collection_for('mass_balance_account')['MBA-MILL-001-PELLETS']
+    assert stored.current_balance == 26.0
+    print("✓ BOOSTClient stores the closed accounts: PASSED")
+
+
+def test_ledger_scale():
+    """Test booking years of events for many accounts."""
+    print("\n⏱️  Testing Ledger Scale")
+    print("=" * 50)
+    
+    size = 500000
+    organizations = [f'ORG-MILL-{i:03d}' for i in range(20)]
+    
+    def events():
+        for i in range(size):
+            day = i % 1800
+            timestamp = f"{2020 + day // 360}-{day % 360 // 30 + 1:02d}-{day % 30 + 1:02d}"
+            kind = OUTPUT if i % 3 == 0 else INPUT
+            yield LedgerEvent(organizations[i % 20], 'PG-CHIPS', timestamp, 1.0, kind)
+    
+    ledger = MassBalanceLedger('month')
+    start = time.perf_counter()
+    assert ledger.consume(events()) == size
+    elapsed = time.perf_counter() - start
+    
+    assert sum(len(periods) for periods in ledger._periods.values()) == 20 * 60
+    balance = sum(ledger.balance(org, 'PG-CHIPS') for org in organizations)
+    assert balance == size - 2 * len(range(0, size, 3))
+    assert elapsed < 10.0, f"Booking took {elapsed:.2f}s"
+    print(f"✓ {size:,} events over 5 years booked in {elapsed * 1000:.0f}ms "
+          f"into {20 * 60} period totals: PASSED")
+
+
+def main():
+    """Run all mass balance tests."""
+    print("🚀 BOOST Mass Balance Ledger Testing")
+    print("\n")
+    
+    try:
+        test_periods_and_accounts()
+        test_ledger_periods()
+        test_closing_and_quantities()
+        test_recompute_period()
+        test_ledger_scale()
+        print("\n✅ ALL MASS BALANCE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
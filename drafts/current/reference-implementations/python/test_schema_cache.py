@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Test Schema Cache
+
+This script tests lazy loading and the on-disk SchemaLoader cache:
+- Models are generated only for the entities that are used
+- Cold start writes one cache file per entity, keyed by its schema content hash
+- Warm start restores identical models, relationships and validators
+- Editing a schema file invalidates its cache entry, and old entries are evicted
+- Cache directories and files other users can write to are never unpickled
+- Lazily compiled validators still resolve $refs to other schema files
+- BOOSTValidator.schemas/.validators views compile entities only when looked up
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from schema_loader import SchemaLoader, get_shared_loader, SCHEMA_CACHE_ENTRIES_PER_ENTITY
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "schema"
+
+
+def test_lazy_loading():
+    """Test that models are generated only for the entities that are used."""
+    print("💤 Testing Lazy Model Generation")
+    print("=" * 50)
+    
+    loader = SchemaLoader(str(SCHEMA_PATH), use_cache=False)
+    entity_types = loader.get_all_entity_types()
+    assert 'organization' in entity_types and 'transaction' in entity_types
+    assert not loader.schemas and not loader.dynamic_models
+    print(f"✓ Listed {len(entity_types)} entity types without parsing schemas: PASSED")
+    
+    assert loader.get_primary_key('transaction') == 'transactionId'
+    assert list(loader.schemas) == ['transaction'] and not loader.dynamic_models
+    print("✓ get_primary_key parsed only one schema file: PASSED")
+    
+    Organization = loader.get_model('organization')
+    assert loader.get_model('organization') is Organization
+    assert set(loader.dynamic_models) == {'organization'}
+    assert set(loader.validators) == {'organization'}
+    assert all(key.startswith('organization.') for key in loader.enums)
+    print("✓ get_model generated and memoized a single model: PASSED")
+    
+    assert loader.get_model('not_an_entity') is None
+    loader.preload()
+    assert set(loader.dynamic_models) == set(entity_types)
+    print("✓ preload generated all remaining models: PASSED")
+
+
+def test_schema_cache_round_trip():
+    """Test that a warm start restores the same models as a cold start."""
+    print("\n💾 Testing Schema Cache Round Trip")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = SchemaLoader(str(SCHEMA_PATH), cache_dir=cache_dir)
+        cold.preload()
+        cache_files = list(Path(cache_dir).glob("organization-*.pickle"))
+        assert len(cache_files) == 1
+        print(f"✓ Cold start wrote {len(list(Path(cache_dir).iterdir()))} entity cache files: PASSED")
+        
+        # A warm start must not re-derive model definitions
+        def fail_build(self, entity_name, schema):
+            raise AssertionError(f"model for {entity_name} rebuilt on warm start")
+        
+        original_build = SchemaLoader._build_model_field_specs
+        SchemaLoader._build_model_field_specs = fail_build
+        try:
+            warm = SchemaLoader(str(SCHEMA_PATH), cache_dir=cache_dir)
+            warm.preload()
+        finally:
+            SchemaLoader._build_model_field_specs = original_build
+        
+        assert warm.relationships == cold.relationships
+        assert warm.primary_keys == cold.primary_keys
+        assert set(warm.validators) == set(cold.validators)
+        for entity_name, model in cold.dynamic_models.items():
+            assert warm.dynamic_models[entity_name].model_json_schema() == model.model_json_schema()
+        print(f"✓ Warm start restored {len(warm.dynamic_models)} models from cache: PASSED")
+        
+        Organization = warm.get_model('organization')
+        organization = Organization(**{
+            '@id': 'https://example.com/organizations/ORG-CACHE-001',
+            'organizationId': 'ORG-CACHE-001',
+            'organizationName': 'Cache Test Forestry',
+            'organizationType': 'harvester'
+        })
+        assert organization.organization_type.value == 'harvester'
+        print("✓ Restored models accept data with cached enums: PASSED")
+
+
+def test_schema_cache_invalidation():
+    """Test that editing a schema file produces a new cache entry."""
+    print("\n♻️  Testing Schema Cache Invalidation")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_copy = Path(tmp) / "schema"
+        cache_dir = Path(tmp) / "cache"
+        shutil.copytree(SCHEMA_PATH, schema_copy)
+        
+        SchemaLoader(str(schema_copy), cache_dir=str(cache_dir)).get_model('organization')
+        
+        schema_file = schema_copy / "organization" / "validation_schema.json"
+        with open(schema_file, 'r') as f:
+            schema_data = json.load(f)
+        org_type = schema_data['schema']['properties']['organizationType']
+        org_type['enum'].append('cache_test_type')
+        with open(schema_file, 'w') as f:
+            json.dump(schema_data, f, indent=2)
+        
+        loader = SchemaLoader(str(schema_copy), cache_dir=str(cache_dir))
+        enum_values = [e.value for e in loader.get_enum('organization', 'organizationType')]
+        assert 'cache_test_type' in enum_values
+        assert len(list(cache_dir.glob("organization-*.pickle"))) == 2
+        print("✓ Edited schema invalidated the cache: PASSED")
+        
+        SchemaLoader(str(schema_copy), cache_dir=str(Path(tmp) / "unused"), use_cache=False).preload()
+        assert not (Path(tmp) / "unused").exists()
+        print("✓ use_cache=False leaves no cache behind: PASSED")
+
+
+def _add_enum_value(schema_copy, value):
+    """Append a value to the organizationType enum of a copied schema directory."""
+    schema_file = schema_copy / "organization" / "validation_schema.json"
+    with open(schema_file, 'r') as f:
+        schema_data = json.load(f)
+    schema_data['schema']['properties']['organizationType']['enum'].append(value)
+    with open(schema_file, 'w') as f:
+        json.dump(schema_data, f, indent=2)
+
+
+def test_schema_cache_eviction():
+    """Test that only the most recently used entries of an entity are kept."""
+    print("\n🧹 Testing Schema Cache Eviction")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_copy = Path(tmp) / "schema"
+        cache_dir = Path(tmp) / "cache"
+        shutil.copytree(SCHEMA_PATH, schema_copy)
+        
+        for version in range(SCHEMA_CACHE_ENTRIES_PER_ENTITY + 2):
+            _add_enum_value(schema_copy, f"cache_version_{version}")
+            SchemaLoader(str(schema_copy), cache_dir=str(cache_dir)).get_model('organization')
+        assert len(list(cache_dir.glob("organization-*.pickle"))) == SCHEMA_CACHE_ENTRIES_PER_ENTITY
+        assert oct(cache_dir.stat().st_mode & 0o777) == oct(0o700)
+        
+        # The newest schema version is still served from the cache
+        def fail_build(entity_name, schema):
+            raise AssertionError("newest cache entry evicted")
+        
+        loader = SchemaLoader(str(schema_copy), cache_dir=str(cache_dir))
+        loader._build_model_field_specs = fail_build
+        assert loader.get_model('organization') is not None
+    print(f"✓ Entries beyond {SCHEMA_CACHE_ENTRIES_PER_ENTITY} per entity evicted: PASSED")
+
+
+def test_schema_cache_permissions():
+    """Test that caches other users could write to are not unpickled."""
+    print("\n🔒 Testing Schema Cache Permissions")
+    print("=" * 50)
+    
+    if not hasattr(os, 'getuid'):
+        print("⚠️  No POSIX file ownership on this platform - skipping")
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        shared_dir = Path(tmp) / "shared"
+        shared_dir.mkdir()
+        shared_dir.chmod(0o777)
+        loader = SchemaLoader(str(SCHEMA_PATH), cache_dir=str(shared_dir))
+        assert loader.get_model('organization') is not None
+        assert not loader.use_cache and not list(shared_dir.iterdir())
+        print("✓ World-writable cache directory disabled the cache: PASSED")
+        
+        cache_dir = Path(tmp) / "cache"
+        SchemaLoader(str(SCHEMA_PATH), cache_dir=str(cache_dir)).get_model('organization')
+        [cache_file] = cache_dir.glob("organization-*.pickle")
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        cache_file.write_bytes(b"tampered")
+        cache_file.chmod(0o666)
+        
+        loader = SchemaLoader(str(SCHEMA_PATH), cache_dir=str(cache_dir))
+        assert loader.get_model('organization') is not None
+        assert cache_file.stat().st_mode & 0o777 == 0o600 and cache_file.read_bytes() != b"tampered"
+    print("✓ Writable cache file ignored and rewritten privately: PASSED")
+
+
+def test_cross_file_refs():
+    """Test that a lazily compiled validator resolves a $ref into another schema file."""
+    print("\n🔗 Testing Cross-File $ref Resolution")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_copy = Path(tmp) / "schema"
+        shutil.copytree(SCHEMA_PATH, schema_copy)
+        schema_file = schema_copy / "organization" / "validation_schema.json"
+        with open(schema_file, 'r') as f:
+            schema_data = json.load(f)
+        schema_data['schema']['properties']['managedTraceableUnitId'] = {
+            '$ref': 'https://github.com/carbondirect/BOOST/schemas/traceable-unit#/properties/traceableUnitId'
+        }
+        with open(schema_file, 'w') as f:
+            json.dump(schema_data, f, indent=2)
+        
+        loader = SchemaLoader(str(schema_copy), use_cache=False)
+        validator = loader.get_validator('organization')
+        assert set(loader.validators) == {'organization'}
+        organization = {
+            '@context': {}, '@type': 'Organization', '@id': 'https://example.com/organizations/ORG-REF-001',
+            'organizationId': 'ORG-REF-001', 'organizationName': 'Ref Test Forestry',
+            'organizationType': 'harvester'
+        }
+        
+        def ref_errors(value):
+            entity = dict(organization, managedTraceableUnitId=value)
+            return [error for error in validator.iter_errors(entity) if list(error.path) == ['managedTraceableUnitId']]
+        
+        assert not ref_errors('TRU-REF-001')
+        assert ref_errors('not-a-tru-id')
+        assert loader.get_schema_by_id('https://github.com/carbondirect/BOOST/schemas/traceable-unit') is \
+            loader.get_schema('traceable_unit')
+        assert loader.get_schema_by_id('https://example.com/unknown') is None
+    print("✓ $ref to another schema file resolved by a lazily compiled validator: PASSED")
+
+
+def test_validator_views_stay_lazy():
+    """Test that BOOSTValidator.schemas and .validators compile entities only on lookup."""
+    print("\n👀 Testing Lazy BOOSTValidator Views")
+    print("=" * 50)
+    
+    from validation import BOOSTValidator
+    
+    validator = BOOSTValidator()
+    loader = validator.schema_loader
+    loader.refresh_schemas()
+    entity_types = loader.get_all_entity_types()
+    assert list(validator.validators) == entity_types and len(validator.schemas) == len(entity_types)
+    assert 'organization' in validator.validators and 'not_an_entity' not in validator.schemas
+    assert not loader.validators and not loader.schemas
+    print(f"✓ Iterating {len(entity_types)} entity types compiled nothing: PASSED")
+    
+    assert validator.validators['organization'] is loader.get_validator('organization')
+    assert validator.schemas['organization'] is loader.get_schema('organization')
+    assert set(loader.validators) == {'organization'}
+    assert validator.validators.get('not_an_entity') is None
+    print("✓ Lookups compile and memoize a single entity: PASSED")
+
+
+def test_shared_loader_registry():
+    """Test that all entry points share one loader per schema directory."""
+    print("\n🔗 Testing Shared Loader Registry")
+    print("=" * 50)
+    
+    from boost_client import create_client
+    from validation import BOOSTValidator
+    from dynamic_models import get_models
+    from dynamic_validation import create_dynamic_validator
+    
+    loader = get_shared_loader()
+    assert get_shared_loader(str(SCHEMA_PATH / ".." / "schema")) is loader
+    assert create_client().schema_loader is loader
+    assert BOOSTValidator().schema_loader is loader
+    assert get_models().schema_loader is loader
+    assert create_dynamic_validator().schema_loader is loader
+    print("✓ Client, validators and model facade share one loader: PASSED")
+    
+    # Readers holding the old state keep a complete snapshot across a refresh
+    Organization = loader.get_model('organization')
+    old_models = loader.dynamic_models
+    loader.refresh_schemas()
+    assert old_models['organization'] is Organization
+    assert loader.dynamic_models is not old_models
+    assert 'organization' not in loader.dynamic_models
+    assert loader.get_model('organization') is not None
+    assert loader.business_logic_rules
+    print("✓ refresh_schemas swapped in new state without clearing the old: PASSED")
+
+
+def main():
+    """Run all schema cache tests."""
+    print("🚀 BOOST Schema Loading and Cache Testing")
+    print("\n")
+    
+    try:
+        test_lazy_loading()
+        test_schema_cache_round_trip()
+        test_schema_cache_invalidation()
+        test_schema_cache_eviction()
+        test_schema_cache_permissions()
+        test_cross_file_refs()
+        test_validator_views_stay_lazy()
+        test_shared_loader_registry()
+        print("\n✅ ALL SCHEMA CACHE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Test SQLite Entity Store
+
+This script tests the SQLite-backed persistent store for BOOSTClient:
+- One table per entity type with indexed foreign key columns and link tables
+- The create_*/get_supply_chain/validate_all API unchanged on the database
+- Entities and relationship indexes persisted across reopening the database
+- Foreign key integrity and orphan detection as SQL anti-joins
+- WAL mode, with a second connection reading while the client writes
+- Collections iterated a page of rows at a time
+"""
+
+import sys
+import json
+import tempfile
+import sqlite_store
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boost_client import create_client
+from sqlite_store import SQLiteEntityStore
+from test_entity_store import _create_tru, _build_supply_chain
+
+
+def _dump(value):
+    """Plain data of a get_supply_chain() result for comparison."""
+    if isinstance(value, dict):
+        return {key: _dump(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    return value
+
+
+def _validation_results(client, full=False):
+    """validate_all() results without the phase stats, whose wall times differ between runs."""
+    results = client.validate_all(full=full)
+    results.pop('stats')
+    return results
+
+
+def test_schema_tables():
+    """Test tables and foreign key indexes generated from the schemas."""
+    print("🗄️  Testing Schema-Generated Tables")
+    print("=" * 50)
+    
+    client = create_client(database=':memory:')
+    connection = client.store._connection
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert set(client.schema_loader.get_all_entity_types()) <= tables
+    
+    columns = {row[1] for row in connection.execute('PRAGMA table_info("transaction")')}
+    assert {'id', 'data', 'transactionId', 'OrganizationId', 'contractValue'} <= columns
+    print("✓ One table per entity type with a column per scalar field: PASSED")
+    
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    for entity_type in client.schema_loader.get_all_entity_types():
+        table = client.store._table(entity_type)
+        for field_name in table.foreign_keys:
+            if field_name in table.link_tables:
+                assert f"idx_{table.link_tables[field_name]}" in indexes
+            else:
+                assert f"idx_{entity_type}_{field_name}" in indexes
+    plan = ' '.join(row[3] for row in connection.execute(
+        'EXPLAIN QUERY PLAN SELECT id FROM "transaction" WHERE OrganizationId = ?', ('ORG-1',)))
+    assert 'idx_transaction_OrganizationId' in plan
+    print("✓ Every relationship field indexed: PASSED")
+
+
+def test_client_api_on_database():
+    """Test that the client behaves the same on SQLite as in memory."""
+    print("\n🔁 Testing Client API on SQLite")
+    print("=" * 50)
+    
+    source = create_client()
+    _build_supply_chain(source)
+    graph = json.loads(source.export_to_jsonld())['@graph']
+    memory = create_client()
+    memory.import_from_jsonld(graph)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "boost.db"
+        client = create_client(database=database)
+        assert isinstance(client.store, SQLiteEntityStore)
+        assert not client.import_from_jsonld(graph)['errors']
+        
+        assert client.export_to_jsonld() == memory.export_to_jsonld()
+        for tru_id in memory.traceable_units:
+            assert _dump(client.get_supply_chain(tru_id)) == _dump(memory.get_supply_chain(tru_id))
+        assert _validation_results(client) == _validation_results(memory)
+        print("✓ Import, export, supply chain and validation match the in-memory store: PASSED")
+        
+        client.store.close()
+        reopened = create_client(database=database)
+        assert len(reopened.traceable_units) == 2
+        assert reopened.store.related_ids('children_by_parent', 'TRU-STORE-PARENT') == ['TRU-STORE-CHILD']
+        for tru_id in memory.traceable_units:
+            assert _dump(reopened.get_supply_chain(tru_id)) == _dump(memory.get_supply_chain(tru_id))
+        assert _validation_results(reopened) == _validation_results(memory, full=True)
+        print("✓ Entities and indexes persisted across reopening: PASSED")
+        
+        _create_tru(reopened, "TRU-STORE-003", "ORG-STORE-001")
+        reopened.add_tru_to_transaction("TXN-STORE-001", "TRU-STORE-003")
+        assert reopened.store.related_ids('transactions_by_tru', 'TRU-STORE-003') == ['TXN-STORE-001']
+        del reopened.traceable_units["TRU-STORE-003"]
+        assert "TRU-STORE-003" not in reopened.traceable_units
+        assert reopened.store.related_ids('trus_by_organization', 'ORG-STORE-001') == [
+            'TRU-STORE-PARENT', 'TRU-STORE-CHILD']
+        reopened.store.close()
+        print("✓ Updates and deletes maintain the indexes: PASSED")
+
+
+def test_anti_joins():
+    """Test foreign key integrity and orphan detection in SQL."""
+    print("\n🔍 Testing Foreign Key and Orphan Anti-Joins")
+    print("=" * 50)
+    
+    client = create_client(database=':memory:')
+    _build_supply_chain(client)
+    violations = client.store.foreign_key_violations()
+    assert {'entity_type': 'transaction', 'entity_id': 'TXN-STORE-001', 'field': 'CustomerId',
+            'target_type': 'customer', 'target_id': 'CUST-STORE-001'} in violations
+    assert not any(v['target_type'] in ('organization', 'traceable_unit') for v in violations)
+    
+    client.transactions["TXN-STORE-001"] = client.transactions["TXN-STORE-001"].model_copy(
+        update={'traceable_unit_ids': ['TRU-STORE-PARENT', 'TRU-MISSING']})
+    violations = client.store.foreign_key_violations()
+    assert {'entity_type': 'transaction', 'entity_id': 'TXN-STORE-001', 'field': 'traceableUnitIds',
+            'target_type': 'traceable_unit', 'target_id': 'TRU-MISSING'} in violations
+    print("✓ Dangling single and list-valued foreign keys found: PASSED")
+    
+    assert client.store.find_orphans('traceable_unit') == []
+    _create_tru(client, "TRU-STORE-003", "ORG-STORE-001")
+    assert client.store.find_orphans('traceable_unit') == ['TRU-STORE-003']
+    assert client.store.find_orphans('organization') == []
+    print("✓ Unreferenced entities found: PASSED")
+
+
+def test_wal_concurrent_reader():
+    """Test a second connection reading while the client writes."""
+    print("\n📖 Testing WAL Concurrent Reads")
+    print("=" * 50)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "boost.db"
+        client = create_client(database=database)
+        assert client.store._connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        _build_supply_chain(client)
+        
+        reader = SQLiteEntityStore(database, client.schema_loader, cache_size=0)
+        with client.store.transaction():
+            _create_tru(client, "TRU-STORE-003", "ORG-STORE-001")
+            assert len(reader.collections['traceable_units']) == 2
+        assert len(reader.collections['traceable_units']) == 3
+        assert reader.collections['traceable_units']["TRU-STORE-003"].traceable_unit_id == "TRU-STORE-003"
+        reader.close()
+        client.store.close()
+    print("✓ Readers see committed writes only, without blocking the writer: PASSED")
+
+
+def test_paged_iteration():
+    """Test that iterating a collection reads its rows page by page, in insertion order."""
+    print("\n📄 Testing Paged Collection Iteration")
+    print("=" * 50)
+    
+    client = create_client(database=':memory:')
+    _build_supply_chain(client)
+    tru_ids = ['TRU-STORE-PARENT', 'TRU-STORE-CHILD'] + [f"TRU-PAGE-{i}" for i in range(5)]
+    for tru_id in tru_ids[2:]:
+        _create_tru(client, tru_id, "ORG-STORE-001")
+    
+    page_size = sqlite_store._PAGE_SIZE
+    sqlite_store._PAGE_SIZE = 2
+    try:
+        trus = client.traceable_units
+        assert list(trus) == tru_ids
+        assert [tru_id for tru_id, _ in trus.items()] == tru_ids
+        assert [tru.traceable_unit_id for tru in trus.values()] == tru_ids
+        
+        # Each page is a fresh query, so writes between pages are allowed
+        iterator = iter(trus)
+        assert [next(iterator), next(iterator)] == tru_ids[:2]
+        del trus["TRU-PAGE-0"]
+        assert list(iterator) == tru_ids[3:]
+    finally:
+        sqlite_store._PAGE_SIZE = page_size
+    client.store.close()
+    print("✓ Every row visited once across pages: PASSED")
+
+
+def main():
+    """Run all SQLite store tests."""
+    print("🚀 BOOST SQLite Entity Store Testing")
+    print("\n")
+    
+    try:
+        test_schema_tables()
+        test_client_api_on_database()
+        test_anti_joins()
+        test_wal_concurrent_reader()
+        test_paged_iteration()
+        print("\n✅ ALL SQLITE STORE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test Timestamp Columns
+
+This script tests the parse-once timestamp columns behind temporal validation:
+- Each distinct timestamp string parsed once; unparseable values collected per column
+- Processing vs harvest timestamps compared over joined columns
+- Batch manipulation timestamp chronology matching the per-transaction check
+- Naive, timezone-aware and malformed timestamps reported as before
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from temporal import TimestampColumn, parse_timestamp, compare_joined, AWARE, NAIVE, INVALID, MISSING
+from boost_client import create_client
+
+
+def test_timestamp_columns():
+    """Test parsing a column of timestamps."""
+    print("🕒 Testing Timestamp Columns")
+    print("=" * 50)
+    
+    assert parse_timestamp('2024-03-01T10:00:00Z') is parse_timestamp('2024-03-01T10:00:00Z')
+    print("✓ Distinct timestamp strings parsed once: PASSED")
+    
+    column = TimestampColumn(['2024-03-01T10:00:00Z', '2024-03-01T12:00:00+02:00', '2024-03-01T10:00:00',
+                              'not a timestamp', None, 5])
+    assert list(column.kinds) == [AWARE, AWARE, NAIVE, INVALID, MISSING, INVALID]
+    assert column.epochs[0] == column.epochs[1] == 1709287200 * 1000000
+    assert list(column.errors) == [3] and 'not a timestamp' in str(column.errors[3])
+    print("✓ Epoch column with unparseable values collected: PASSED")
+    
+    before, incomparable = compare_joined(column, [0, 1, 0, 2], column, [1, 0, 2, 3])
+    assert before == [] and incomparable == [2, 3]
+    later = TimestampColumn(['2024-03-02T00:00:00Z'])
+    assert compare_joined(column, [0, 1], later, [0, 0]) == ([0, 1], [])
+    print("✓ Joined comparisons, naive vs aware left to the caller: PASSED")
+
+
+def _enable_chronological_order(validator):
+    """Turn on the processing timeframe rule, which the shipped rules leave unset."""
+    rules = validator.schema_loader.business_logic_rules
+    rules.setdefault('temporalLogicRules', {})['processingTimeframes'] = {'chronologicalOrder': {'enabled': True}}
+
+
+def test_processing_after_harvest():
+    """Test processing vs harvest timestamps over joined columns."""
+    print("\n🌲 Testing Processing After Harvest")
+    print("=" * 50)
+    
+    validator = create_client().validator
+    _enable_chronological_order(validator)
+    entities = {
+        'traceable_unit': [
+            {'traceableUnitId': 'TRU-1', 'createdTimestamp': '2024-03-01T10:00:00Z'},
+            {'traceableUnitId': 'TRU-2', 'createdTimestamp': '2024-03-05T10:00:00Z'},
+            {'traceableUnitId': 'TRU-3', 'createdTimestamp': 'yesterday'}
+        ],
+        'material_processing': [
+            {'inputTraceableUnitId': 'TRU-1', 'processTimestamp': '2024-03-02T10:00:00Z'},
+            {'inputTraceableUnitId': 'TRU-2', 'processTimestamp': '2024-03-04T10:00:00Z'},
+            {'inputTraceableUnitId': 'TRU-3', 'processTimestamp': '2024-03-04T10:00:00Z'},
+            {'inputTraceableUnitId': 'TRU-1', 'processTimestamp': '2024-03-01T09:00:00'},
+            {'inputTraceableUnitId': 'TRU-MISSING', 'processTimestamp': '2024-01-01T00:00:00Z'}
+        ]
+    }
+    is_valid, errors = validator.validate_temporal_consistency(entities)
+    assert not is_valid
+    assert errors[0] == ("Processing timestamp (2024-03-04T10:00:00Z) is before harvest timestamp "
+                         "(2024-03-05T10:00:00Z) for TRU TRU-2")
+    assert errors[1] == "Invalid timestamp format: Invalid isoformat string: 'yesterday'"
+    assert errors[2] == "Invalid timestamp format: can't compare offset-naive and offset-aware datetimes"
+    assert len(errors) == 3
+    print("✓ Late harvests, malformed and mixed timestamps reported in order: PASSED")
+    
+    size = 100000
+    entities = {
+        'traceable_unit': [
+            {'traceableUnitId': f'TRU-{i}', 'createdTimestamp': f'2024-{i % 12 + 1:02d}-01T00:00:00Z'}
+            for i in range(1000)
+        ],
+        'material_processing': [
+            {'inputTraceableUnitId': f'TRU-{i % 1000}', 'processTimestamp': f'2024-{i % 1000 % 12 + 1:02d}-02T00:00:00Z'}
+            for i in range(size)
+        ]
+    }
+    start = time.perf_counter()
+    is_valid, errors = validator.validate_temporal_consistency(entities)
+    elapsed = time.perf_counter() - start
+    assert is_valid and not errors
+    assert elapsed < 10.0, f"Temporal validation took {elapsed:.2f}s"
+    print(f"✓ {size:,} processing operations checked in {elapsed * 1000:.0f}ms: PASSED")
+
+
+def test_chronology_batch():
+    """Test batch manipulation timestamp chronology against the per-transaction check."""
+    print("\n📜 Testing Manipulation Timestamp Chronology")
+    print("=" * 50)
+    
+    validator = create_client().validator
+    transactions = [
+        {'transactionDate': '2024-03-02',
+         'manipulationTimestamps': ['2024-03-02T10:00:00Z', '2024-03-02T12:00:00Z']},
+        {'transactionDate': '2024-03-02',
+         'manipulationTimestamps': ['2024-03-03T10:00:00Z', '2024-03-01T12:00:00Z']},
+        {'manipulationTimestamps': ['2024-03-03T10:00:00Z', 'soon']},
+        {'manipulationTimestamps': ['2024-03-03T10:00:00', '2024-03-02T10:00:00Z']},
+        {'transactionDate': 'unknown', 'manipulationTimestamps': ['2024-03-03T10:00:00', '2024-03-02T10:00:00']},
+        {'transactionDate': '2024-03-02'}
+    ]
+    results = validator.validate_timestamp_chronology_batch(transactions)
+    assert results == [validator.validate_timestamp_chronology('transaction', t)[1] for t in transactions]
+    assert results[0] == [] and results[5] == []
+    assert results[1] == [
+        "Manipulation timestamps not in chronological order: 2024-03-01T12:00:00Z is before 2024-03-03T10:00:00Z",
+        "Manipulation timestamp 2024-03-01T12:00:00Z is before transaction date 2024-03-02"
+    ]
+    assert results[2] == ["Invalid timestamp format in manipulation timestamps: Invalid isoformat string: 'soon'"]
+    assert results[3][0].startswith("Invalid timestamp format in manipulation timestamps: can't compare")
+    assert results[4] == [
+        "Manipulation timestamps not in chronological order: 2024-03-02T10:00:00 is before 2024-03-03T10:00:00"
+    ]
+    print("✓ Batch results match the per-transaction check: PASSED")
+
+
+def main():
+    """Run all timestamp column tests."""
+    print("🚀 BOOST Timestamp Column Testing")
+    print("\n")
+    
+    try:
+        test_timestamp_columns()
+        test_processing_after_harvest()
+        test_chronology_batch()
+        print("\n✅ ALL TIMESTAMP COLUMN TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test Batch Tolerance Validation
+
+This script tests the columnar tolerance validation engines:
+- Equipment accuracy, process loss and regulatory compliance batches
+- Every batch row equals the scalar validator's result, including messages
+- The pure-Python and NumPy engines agree (NumPy only when installed)
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tolerance_validation import (
+    EquipmentAccuracyValidator, ProcessLossValidator, RegulatoryComplianceValidator, NUMPY_AVAILABLE
+)
+
+# Pure Python always; NumPy too when it is installed
+ENGINES = [False, True] if NUMPY_AVAILABLE else [False]
+
+
+def _assert_matches_scalar(batch, scalar_results):
+    """Assert that every row of a batch result equals the scalar validator's result."""
+    assert len(batch) == len(scalar_results)
+    for i, expected in enumerate(scalar_results):
+        actual = batch.result(i)
+        assert actual == expected, f"row {i}: {actual} != {expected}"
+
+
+def test_equipment_accuracy_batch():
+    """Test that measurement batches match validate_measurement_accuracy row by row."""
+    print("📏 Testing Equipment Accuracy Batch")
+    print("=" * 50)
+    
+    validator = EquipmentAccuracyValidator()
+    rng = random.Random(42)
+    records = []
+    for _ in range(2000):
+        volume = rng.choice([100, 0, round(rng.uniform(1, 500), 3)])
+        method = rng.choice(["harvester", "mill", "manual", "optical", "unknown", None])
+        accuracy = rng.choice([None, 0, 0.01])
+        record = {"measurementMethod": method, "measuredVolume": volume, "expectedAccuracy": accuracy}
+        resolved = accuracy or validator.EQUIPMENT_ACCURACY.get(method, 0.05)
+        if rng.random() < 0.7:
+            offset = rng.choice([0, 0.0005, 0.5])
+            record["accuracyValidation"] = {
+                "minAcceptable": volume - volume * resolved + offset,
+                "maxAcceptable": volume + volume * resolved,
+                "withinTolerance": rng.choice([True, False])
+            }
+        records.append(record)
+    
+    scalar_results = [validator.validate_measurement_accuracy(record) for record in records]
+    for use_numpy in ENGINES:
+        batch = validator.validate_measurements_batch(
+            [r["measuredVolume"] for r in records],
+            [r["measurementMethod"] for r in records],
+            expected_accuracies=[r["expectedAccuracy"] for r in records],
+            min_acceptable=[r.get("accuracyValidation", {}).get("minAcceptable") for r in records],
+            max_acceptable=[r.get("accuracyValidation", {}).get("maxAcceptable") for r in records],
+            within_tolerance=[r.get("accuracyValidation", {}).get("withinTolerance") for r in records],
+            use_numpy=use_numpy
+        )
+        _assert_matches_scalar(batch, scalar_results)
+        assert batch.valid_count == sum(r.is_valid for r in scalar_results)
+        assert set(batch.status) == {0, 1}
+    print(f"✓ {len(records)} measurements match the scalar validator: PASSED")
+
+
+def test_process_loss_batch():
+    """Test that processing batches match validate_process_loss row by row."""
+    print("\n⚙️  Testing Process Loss Batch")
+    print("=" * 50)
+    
+    validator = ProcessLossValidator()
+    rng = random.Random(7)
+    records = []
+    for _ in range(2000):
+        input_volume = rng.choice([0, 100, round(rng.uniform(10, 1000), 2)])
+        loss = round(input_volume * rng.uniform(0, 0.2), 3)
+        record = {
+            "processType": rng.choice(list(validator.PROCESS_TOLERANCES) + ["unknown"]),
+            "inputVolume": input_volume,
+            "volumeLoss": loss
+        }
+        if rng.random() < 0.6 and input_volume:
+            record["toleranceValidation"] = {
+                "actualLossRate": rng.choice([None, loss / input_volume, loss / input_volume + 0.01]),
+                "withinTolerance": rng.choice([None, True, False])
+            }
+        records.append(record)
+    
+    scalar_results = [validator.validate_process_loss(record) for record in records]
+    for use_numpy in ENGINES:
+        batch = validator.validate_process_losses_batch(
+            [r["processType"] for r in records],
+            [r["inputVolume"] for r in records],
+            [r["volumeLoss"] for r in records],
+            actual_loss_rates=[r.get("toleranceValidation", {}).get("actualLossRate") for r in records],
+            within_tolerance=[r.get("toleranceValidation", {}).get("withinTolerance") for r in records],
+            use_numpy=use_numpy
+        )
+        _assert_matches_scalar(batch, scalar_results)
+        assert set(batch.status) == set(range(len(validator.BATCH_STATUSES)))
+    print(f"✓ {len(records)} processing records match the scalar validator: PASSED")
+
+
+def test_compliance_batch():
+    """Test that compliance batches match validate_regulatory_compliance row by row."""
+    print("\n📜 Testing Regulatory Compliance Batch")
+    print("=" * 50)
+    
+    validator = RegulatoryComplianceValidator()
+    rng = random.Random(3)
+    chains = []
+    for _ in range(1000):
+        scheme = rng.choice(["CARB LCFS Compliance", "EU RED II", "RFS Program", "Voluntary Scheme"])
+        standard = rng.choice([None, None, "CARB_LCFS", "EU_RED", "UNKNOWN_STD"])
+        initial = rng.choice([0, 100.0, round(rng.uniform(50, 500), 2)])
+        final = round(initial * rng.uniform(0.98, 1.0), 3)
+        chains.append((scheme, standard, initial, final))
+    
+    scalar_results = [
+        validator.validate_regulatory_compliance(
+            {"schemeName": scheme, "complianceTolerances": {"reportingStandard": standard}},
+            [{"inputVolume": initial, "outputVolume": final}]
+        )
+        for scheme, standard, initial, final in chains
+    ]
+    for use_numpy in ENGINES:
+        batch = validator.validate_compliance_batch(
+            [c[2] for c in chains], [c[3] for c in chains],
+            scheme_names=[c[0] for c in chains], reporting_standards=[c[1] for c in chains],
+            use_numpy=use_numpy
+        )
+        _assert_matches_scalar(batch, scalar_results)
+    print(f"✓ {len(chains)} measurement chains match the scalar validator: PASSED")
+    
+    try:
+        validator.validate_compliance_batch([100.0], [99.0, 98.0], scheme_names=["EU RED"])
+        assert False, "Mismatched column lengths should raise"
+    except ValueError:
+        print("✓ Mismatched column lengths rejected: PASSED")
+
+
+def test_batch_throughput():
+    """Test that batch validation outpaces per-record scalar validation."""
+    print("\n⏱️  Testing Batch Throughput")
+    print("=" * 50)
+    
+    validator = ProcessLossValidator()
+    size = 100000
+    process_types = ["pelletizing", "chipping", "drying", "sizing"] * (size // 4)
+    input_volumes = [100.0 + i % 50 for i in range(size)]
+    volume_losses = [2.0 + (i % 7) * 0.1 for i in range(size)]
+    
+    start = time.perf_counter()
+    for process_type, input_volume, loss in zip(process_types, input_volumes, volume_losses):
+        validator.validate_process_loss({"processType": process_type, "inputVolume": input_volume, "volumeLoss": loss})
+    scalar_elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = validator.validate_process_losses_batch(process_types, input_volumes, volume_losses)
+    batch_elapsed = time.perf_counter() - start
+    
+    assert len(batch) == size
+    assert batch_elapsed < scalar_elapsed, f"batch {batch_elapsed:.2f}s vs scalar {scalar_elapsed:.2f}s"
+    engine = "NumPy" if NUMPY_AVAILABLE else "pure Python"
+    print(f"✓ {size:,} records: batch ({engine}) {batch_elapsed * 1000:.0f}ms vs scalar {scalar_elapsed * 1000:.0f}ms: PASSED")
+
+
+def main():
+    """Run all batch tolerance tests."""
+    print("🚀 BOOST Batch Tolerance Validation Testing")
+    print("\n")
+    
+    try:
+        test_equipment_accuracy_batch()
+        test_process_loss_batch()
+        test_compliance_batch()
+        test_batch_throughput()
+        print("\n✅ ALL BATCH TOLERANCE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
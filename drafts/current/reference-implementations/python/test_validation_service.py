@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Test Validation Service
+
+This script tests the local asyncio HTTP validation service:
+- Single-entity requests answered like DynamicBOOSTValidator.validate_record
+- Request errors mapped to 400, 404 and 405 responses
+- Concurrent requests coalesced into micro-batches, in-process and in worker processes
+- Bounded queue rejecting requests with 503 under load
+- Throughput, latency and validation phase stats from GET /stats
+- Failing entities answered with 500 alone, and a dead worker process replaced
+"""
+
+import os
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# Add the current directory to the path to import BOOST modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from validation_service import (
+    ValidationService, ServiceOverloadedError, send_request, load_test, _validate_batch_in_worker
+)
+from synthetic import GeneratorConfig, SupplyChainGenerator
+
+
+def _entities(count, error_rate=0.0):
+    """(entity_type, entity) pairs of a generated supply chain."""
+    return list(SupplyChainGenerator(GeneratorConfig(entities=count, seed=4, error_rate=error_rate)))
+
+
+def _exit_on_marked_entity(batch):
+    """Worker batch function that kills its process on an entity marked 'crashWorker'."""
+    if any(entity.get('crashWorker') for _, entity in batch):
+        os._exit(1)
+    return _validate_batch_in_worker(batch)
+
+
+def test_requests():
+    """Test validation results and error responses over HTTP."""
+    print("🌐 Testing Validation Requests")
+    print("=" * 50)
+    
+    entities = _entities(300, error_rate=0.3)
+    
+    async def run():
+        async with ValidationService(port=0, workers=0) as service:
+            reader, writer = await asyncio.open_connection('127.0.0.1', service.port)
+            for entity_type, entity in entities[:80]:
+                status, response = await send_request(reader, writer, 'POST', '/validate',
+                                                      {'entity_type': entity_type, 'entity': entity})
+                errors, warnings = service.validator.validate_record(entity_type, entity)
+                assert status == 200
+                assert response == {'entity_type': entity_type, 'valid': not errors,
+                                    'errors': errors, 'warnings': warnings}
+            
+            tru = next(entity for entity_type, entity in entities if entity_type == 'traceable_unit')
+            status, response = await send_request(reader, writer, 'POST', '/validate', tru)
+            assert (status, response['entity_type'], response['valid']) == (200, 'traceable_unit', True)
+            
+            assert (await send_request(reader, writer, 'POST', '/validate',
+                                       {'entity_type': 'nonexistent', 'entity': {}}))[0] == 400
+            assert (await send_request(reader, writer, 'POST', '/validate', {'@type': 'Nonexistent'}))[0] == 400
+            assert (await send_request(reader, writer, 'POST', '/validate', [1, 2]))[0] == 400
+            assert (await send_request(reader, writer, 'GET', '/validate'))[0] == 405
+            assert (await send_request(reader, writer, 'GET', '/missing'))[0] == 404
+            assert await send_request(reader, writer, 'GET', '/health') == (
+                200, {'status': 'ok', 'entity_types': len(service.entity_types)})
+            writer.close()
+            await writer.wait_closed()
+    
+    asyncio.run(run())
+    print("✓ Entities validated as by the in-process validator: PASSED")
+    print("✓ Bad requests answered with 400, 404 and 405 on the same connection: PASSED")
+
+
+def test_micro_batching():
+    """Test coalescing of concurrent requests into batches."""
+    print("\n📦 Testing Micro-Batching")
+    print("=" * 50)
+    
+    entities = _entities(400, error_rate=0.1)
+    expected_invalid = None
+    
+    async def run(workers):
+        async with ValidationService(port=0, workers=workers, batch_size=16) as service:
+            report = await load_test(entities, port=service.port, concurrency=32)
+            reader, writer = await asyncio.open_connection('127.0.0.1', service.port)
+            status, stats = await send_request(reader, writer, 'GET', '/stats')
+            writer.close()
+            await writer.wait_closed()
+            invalid = sum(1 for entity_type, entity in entities
+                          if service.validator.validate_record(entity_type, entity)[0])
+        return report, stats, invalid
+    
+    for workers in (0, 1):
+        report, stats, expected_invalid = asyncio.run(run(workers))
+        assert report['statuses'] == {200: 400} and report['invalid'] == expected_invalid
+        assert stats['requests'] == {'accepted': 400, 'completed': 400, 'failed': 0, 'rejected': 0}
+        assert stats['batches']['count'] < 100 and stats['batches']['max_size'] == 16
+        assert stats['validation']['schema']['traceable_unit']['calls'] == sum(
+            1 for entity_type, _ in entities if entity_type == 'traceable_unit')
+        assert stats['latency_ms']['p99'] >= stats['latency_ms']['p50'] > 0
+        assert stats['throughput']['overall_per_second'] > 0
+    print(f"✓ 400 requests in {stats['batches']['count']} batches, in-process and in a worker pool: PASSED")
+    print("✓ Throughput, latency and validation phase stats reported: PASSED")
+
+
+def test_backpressure():
+    """Test rejecting requests when the queue is full."""
+    print("\n🚦 Testing Backpressure")
+    print("=" * 50)
+    
+    entity_type, entity = _entities(100)[-1]
+    
+    async def run():
+        async with ValidationService(port=0, workers=0, batch_size=1, queue_size=2,
+                                     max_inflight_batches=1) as service:
+            # Hold the only batch in the pool until released
+            release = threading.Event()
+            run_batch = service._run
+            service._run = lambda batch: release.wait() and run_batch(batch)
+            
+            requests = [asyncio.create_task(service.validate(entity_type, entity)) for _ in range(10)]
+            await asyncio.sleep(0.05)
+            rejected = [task for task in requests if task.done()]
+            assert len(rejected) == 8
+            assert all(isinstance(task.exception(), ServiceOverloadedError) for task in rejected)
+            
+            # The first request went to the pool; one more fills the queue again
+            requests.append(asyncio.create_task(service.validate(entity_type, entity)))
+            await asyncio.sleep(0)
+            assert service.snapshot()['queue']['depth'] == 2
+            reader, writer = await asyncio.open_connection('127.0.0.1', service.port)
+            status, response = await send_request(reader, writer, 'POST', '/validate',
+                                                  {'entity_type': entity_type, 'entity': entity})
+            assert status == 503 and response == {'error': 'Validation queue full'}
+            writer.close()
+            await writer.wait_closed()
+            
+            release.set()
+            accepted = [task for task in requests if task not in rejected]
+            assert [result['valid'] for result in await asyncio.gather(*accepted)] == [True, True, True]
+            assert service.snapshot()['requests'] == {'accepted': 3, 'completed': 3, 'failed': 0, 'rejected': 9}
+    
+    asyncio.run(run())
+    print("✓ Requests beyond the queue bound rejected with 503: PASSED")
+    print("✓ Queued requests complete once the pool has capacity: PASSED")
+
+
+def test_failures():
+    """Test that validation errors and dead workers fail only their requests."""
+    print("\n💥 Testing Failure Handling")
+    print("=" * 50)
+    
+    entity_type, entity = _entities(100)[-1]
+    
+    async def validate(port, document):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        try:
+            return await send_request(reader, writer, 'POST', '/validate', document)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    
+    async def run_in_process():
+        async with ValidationService(port=0, workers=0, batch_size=2, max_batch_delay=0.2) as service:
+            validate_record = service.validator.validate_record
+            
+            def failing_validate_record(entity_type, entity, stats=None):
+                if entity.get('failValidation'):
+                    raise KeyError('failValidation')
+                return validate_record(entity_type, entity, stats)
+            
+            service.validator.validate_record = failing_validate_record
+            (bad_status, bad), (good_status, good) = await asyncio.gather(
+                validate(service.port, {'entity_type': entity_type, 'entity': dict(entity, failValidation=True)}),
+                validate(service.port, {'entity_type': entity_type, 'entity': entity}))
+            assert service.snapshot()['batches']['count'] == 1
+            assert bad_status == 500 and bad['error'] == f"Validating {entity_type} failed: KeyError: 'failValidation'"
+            assert good_status == 200 and good['valid']
+            print("✓ Entity whose validation raises answered with 500, rest of its batch with 200: PASSED")
+            
+            reader, writer = await asyncio.open_connection('127.0.0.1', service.port)
+            service.snapshot = lambda: 1 / 0
+            assert await send_request(reader, writer, 'GET', '/stats') == (500, {'error': 'Internal server error'})
+            assert (await send_request(reader, writer, 'GET', '/health'))[0] == 200
+            writer.close()
+            await writer.wait_closed()
+            print("✓ Unexpected handler errors answered with 500, connection kept: PASSED")
+    
+    async def run_in_workers():
+        async with ValidationService(port=0, workers=1, batch_size=1) as service:
+            service._run = _exit_on_marked_entity
+            status, response = await validate(service.port, {'entity_type': entity_type,
+                                                             'entity': dict(entity, crashWorker=True)})
+            assert status == 500 and response['error'].startswith("Validation worker process died")
+            results = [await validate(service.port, {'entity_type': entity_type, 'entity': entity})
+                       for _ in range(3)]
+            assert [(status, response['valid']) for status, response in results] == [(200, True)] * 3
+            snapshot = service.snapshot()
+            assert snapshot['worker_restarts'] == 1
+            assert snapshot['requests'] == {'accepted': 4, 'completed': 3, 'failed': 1, 'rejected': 0}
+    
+    asyncio.run(run_in_process())
+    asyncio.run(run_in_workers())
+    print("✓ Dead worker process fails its batch with 500 and the pool is replaced: PASSED")
+
+
+def main():
+    """Run all validation service tests."""
+    print("🚀 BOOST Validation Service Testing")
+    print("\n")
+    
+    try:
+        test_requests()
+        test_micro_batching()
+        test_backpressure()
+        test_failures()
+        print("\n✅ ALL VALIDATION SERVICE TESTS PASSED!")
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
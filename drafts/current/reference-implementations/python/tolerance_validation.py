@@ -12,11 +12,72 @@ Addresses Colin's feedback about "within tolerance for pelletizing" by providing
 explicit validation logic with clear governance model.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Sequence, Callable
+from dataclasses import dataclass, field
 from decimal import Decimal
 import math
 
+try:
+    # NumPy vectorizes the batch validators; they fall back to pure Python without it
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_ZERO_INPUT_MESSAGE = "Invalid input volume: cannot be zero"
+_ZERO_INITIAL_VOLUME_MESSAGE = "Invalid initial volume for compliance calculation"
+
+
+def _measurement_message(measured_volume, method, expected_accuracy) -> str:
+    return f"Measurement of {measured_volume} m³ using {method} equipment (±{expected_accuracy*100:.1f}% accuracy)"
+
+
+def _accuracy_range_message(min_acceptable, max_acceptable, provided_min, provided_max) -> str:
+    return f"Accuracy validation range incorrect. Expected: [{min_acceptable:.3f}, {max_acceptable:.3f}], Got: [{provided_min}, {provided_max}]"
+
+
+def _process_loss_message(process_type, actual_loss_rate, within_tolerance, min_acceptable, max_acceptable) -> str:
+    return f"{process_type} loss of {actual_loss_rate*100:.2f}% {'within' if within_tolerance else 'exceeds'} acceptable range {min_acceptable*100:.1f}%-{max_acceptable*100:.1f}%"
+
+
+def _unknown_process_message(process_type) -> str:
+    return f"No tolerance specification found for process type: {process_type}"
+
+
+def _loss_rate_mismatch_message(actual_loss_rate, provided_actual) -> str:
+    return f"Tolerance validation actualLossRate incorrect: expected {actual_loss_rate:.4f}, got {provided_actual}"
+
+
+def _within_mismatch_message(within_tolerance, provided_within) -> str:
+    return f"Tolerance validation withinTolerance incorrect: expected {within_tolerance}, got {provided_within}"
+
+
+def _compliance_message(reporting_standard, volume_deviation, within_compliance, max_allowed_deviation) -> str:
+    return f"{reporting_standard} compliance: {volume_deviation*100:.2f}% volume deviation {'within' if within_compliance else 'exceeds'} ±{max_allowed_deviation*100:.1f}% limit"
+
+
+def _unknown_scheme_message(scheme_name) -> str:
+    return f"Cannot determine regulatory standard for scheme: {scheme_name}"
+
+
+def _unknown_standard_message(reporting_standard) -> str:
+    return f"No regulatory tolerances defined for standard: {reporting_standard}"
+
+
+def _resolve_reporting_standard(scheme_name: str, reporting_standard: Optional[str]) -> Optional[str]:
+    """Use the declared reporting standard, or infer it from the scheme name."""
+    if reporting_standard:
+        return reporting_standard
+    if "CARB" in scheme_name or "LCFS" in scheme_name:
+        return "CARB_LCFS"
+    elif "RED" in scheme_name or "EU" in scheme_name:
+        return "EU_RED"
+    elif "RFS" in scheme_name:
+        return "RFS2"
+    return None
+
+
 @dataclass
 class ToleranceValidationResult:
     """Result of tolerance validation with detailed feedback."""
@@ -30,6 +91,97 @@ class ToleranceValidationResult:
     message: str = ""
 
 
+@dataclass
+class ToleranceBatchResult:
+    """
+    Columnar result of validating many records in one pass.
+    
+    Columns are NumPy arrays when NumPy is used and lists otherwise. Values
+    a scalar ToleranceValidationResult leaves as None are NaN. `status`
+    indexes into `statuses`, naming the check that decided each row
+    ('ok' when the tolerance check itself ran). Messages are only formatted
+    when a row is converted back with result() or to_results().
+    """
+    entity_type: str
+    tolerance_type: str
+    statuses: Tuple[str, ...]
+    status: Sequence[int]
+    is_valid: Sequence[bool]
+    actual_value: Sequence[float]
+    expected_value: Sequence[float]
+    range_min: Sequence[float]
+    range_max: Sequence[float]
+    deviation: Sequence[float]
+    message_for: Callable[[int], str] = field(repr=False)
+    
+    def __len__(self) -> int:
+        return len(self.status)
+    
+    @property
+    def valid_count(self) -> int:
+        """Number of rows that passed validation."""
+        return int(sum(self.is_valid))
+    
+    def result(self, index: int) -> ToleranceValidationResult:
+        """Build the scalar validation result of one row."""
+        range_min = self.range_min[index]
+        return ToleranceValidationResult(
+            is_valid=bool(self.is_valid[index]),
+            entity_type=self.entity_type,
+            tolerance_type=self.tolerance_type,
+            actual_value=float(self.actual_value[index]),
+            expected_value=_nan_to_none(self.expected_value[index]),
+            acceptable_range=None if math.isnan(range_min) else (float(range_min), float(self.range_max[index])),
+            deviation=_nan_to_none(self.deviation[index]),
+            message=self.message_for(index)
+        )
+    
+    def to_results(self) -> List[ToleranceValidationResult]:
+        """Build the scalar validation results of all rows."""
+        return [self.result(index) for index in range(len(self))]
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+def _resolve_use_numpy(use_numpy: Optional[bool]) -> bool:
+    """Use NumPy when available unless told otherwise."""
+    if use_numpy is None:
+        return NUMPY_AVAILABLE
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for use_numpy=True")
+    return use_numpy
+
+
+def _float_column(values: Optional[Sequence], size: int, use_numpy: bool, missing: float = math.nan):
+    """Convert an input column to floats, mapping None (or an omitted column) to `missing`."""
+    if values is None:
+        return np.full(size, missing) if use_numpy else [missing] * size
+    if len(values) != size:
+        raise ValueError(f"Column has {len(values)} values, expected {size}")
+    if use_numpy:
+        column = np.asarray(values, dtype=np.float64)
+        if not math.isnan(missing):
+            column = np.where(np.isnan(column), missing, column)
+        return column
+    return [missing if value is None else float(value) for value in values]
+
+
+def _lookup_column(keys: Sequence, table: Dict[Any, float], default: float, use_numpy: bool):
+    """Map each key of a column through a lookup table."""
+    if use_numpy:
+        return np.fromiter((table.get(key, default) for key in keys), dtype=np.float64, count=len(keys))
+    return [table.get(key, default) for key in keys]
+
+
+def _raw_value(values: Optional[Sequence], index: int, default: Any = None) -> Any:
+    """Original input value of a row, as a scalar validator would have read it."""
+    if values is None or values[index] is None:
+        return default
+    return values[index]
+
+
 class EquipmentAccuracyValidator:
     """Validates measurements against equipment accuracy specifications."""
     
@@ -41,6 +193,9 @@ class EquipmentAccuracyValidator:
         "optical": 0.015        # ±1.5% for 3D scanning systems
     }
     
+    # Checks that can decide a row of validate_measurements_batch()
+    BATCH_STATUSES = ('ok', 'range_mismatch')
+    
     def validate_measurement_accuracy(self, measurement_data: Dict[str, Any]) -> ToleranceValidationResult:
         """
         Validate measurement against equipment accuracy specifications.
@@ -74,7 +229,7 @@ class EquipmentAccuracyValidator:
                     tolerance_type="equipment_accuracy",
                     actual_value=measured_volume,
                     acceptable_range=(min_acceptable, max_acceptable),
-                    message=f"Accuracy validation range incorrect. Expected: [{min_acceptable:.3f}, {max_acceptable:.3f}], Got: [{provided_min}, {provided_max}]"
+                    message=_accuracy_range_message(min_acceptable, max_acceptable, provided_min, provided_max)
                 )
             
             within_tolerance = accuracy_validation.get("withinTolerance", True)
@@ -89,7 +244,99 @@ class EquipmentAccuracyValidator:
             expected_value=measured_volume,
             acceptable_range=(min_acceptable, max_acceptable),
             deviation=0,  # Self-validation for single measurement
-            message=f"Measurement of {measured_volume} m³ using {method} equipment (±{expected_accuracy*100:.1f}% accuracy)"
+            message=_measurement_message(measured_volume, method, expected_accuracy)
+        )
+    
+    def validate_measurements_batch(self, measured_volumes: Sequence[float], methods: Sequence[str],
+                                    expected_accuracies: Optional[Sequence[Optional[float]]] = None,
+                                    min_acceptable: Optional[Sequence[Optional[float]]] = None,
+                                    max_acceptable: Optional[Sequence[Optional[float]]] = None,
+                                    within_tolerance: Optional[Sequence[Optional[bool]]] = None,
+                                    use_numpy: Optional[bool] = None) -> ToleranceBatchResult:
+        """
+        Validate many measurements given as columns, equivalent to calling
+        validate_measurement_accuracy() on each record.
+        
+        Args:
+            measured_volumes: measuredVolume of each record
+            methods: measurementMethod of each record
+            expected_accuracies: expectedAccuracy of each record (None: equipment default)
+            min_acceptable: accuracyValidation.minAcceptable of each record (None: not provided)
+            max_acceptable: accuracyValidation.maxAcceptable of each record (None: not provided)
+            within_tolerance: accuracyValidation.withinTolerance of each record (None: True)
+            use_numpy: Vectorize with NumPy (default: when NumPy is installed)
+        
+        Returns:
+            Columnar results with the same values as the scalar validator
+        """
+        use_numpy = _resolve_use_numpy(use_numpy)
+        size = len(measured_volumes)
+        if len(methods) != size:
+            raise ValueError(f"Column has {len(methods)} values, expected {size}")
+        measured = _float_column(measured_volumes, size, use_numpy, missing=0.0)
+        accuracy = _float_column(expected_accuracies, size, use_numpy)
+        default_accuracy = _lookup_column(methods, self.EQUIPMENT_ACCURACY, 0.05, use_numpy)
+        provided_min = _float_column(min_acceptable, size, use_numpy)
+        provided_max = _float_column(max_acceptable, size, use_numpy)
+        provided_within = _float_column(within_tolerance, size, use_numpy)
+        
+        if use_numpy:
+            accuracy = np.where(np.isnan(accuracy) | (accuracy == 0), default_accuracy, accuracy)
+            tolerance_range = measured * accuracy
+            range_min = measured - tolerance_range
+            range_max = measured + tolerance_range
+            
+            provided = ~np.isnan(provided_min) & ~np.isnan(provided_max)
+            range_correct = (np.abs(provided_min - range_min) < 0.001) & (np.abs(provided_max - range_max) < 0.001)
+            mismatch = provided & ~range_correct
+            within = np.isnan(provided_within) | (provided_within != 0)
+            
+            status = mismatch.astype(np.int8)
+            is_valid = ~mismatch & (~provided | within)
+            expected_value = np.where(mismatch, np.nan, measured)
+            deviation = np.where(mismatch, np.nan, 0.0)
+        else:
+            status, is_valid, expected_value, deviation = [], [], [], []
+            range_min, range_max = [], []
+            for i in range(size):
+                if math.isnan(accuracy[i]) or accuracy[i] == 0:
+                    accuracy[i] = default_accuracy[i]
+                tolerance_range = measured[i] * accuracy[i]
+                row_min = measured[i] - tolerance_range
+                row_max = measured[i] + tolerance_range
+                range_min.append(row_min)
+                range_max.append(row_max)
+                
+                provided = not math.isnan(provided_min[i]) and not math.isnan(provided_max[i])
+                if provided and not (abs(provided_min[i] - row_min) < 0.001 and abs(provided_max[i] - row_max) < 0.001):
+                    status.append(1)
+                    is_valid.append(False)
+                    expected_value.append(math.nan)
+                    deviation.append(math.nan)
+                else:
+                    status.append(0)
+                    is_valid.append(not provided or math.isnan(provided_within[i]) or provided_within[i] != 0)
+                    expected_value.append(measured[i])
+                    deviation.append(0.0)
+        
+        def message_for(i: int) -> str:
+            if status[i]:
+                return _accuracy_range_message(range_min[i], range_max[i],
+                                               _raw_value(min_acceptable, i), _raw_value(max_acceptable, i))
+            return _measurement_message(_raw_value(measured_volumes, i, 0), methods[i], accuracy[i])
+        
+        return ToleranceBatchResult(
+            entity_type="MeasurementRecord",
+            tolerance_type="equipment_accuracy",
+            statuses=self.BATCH_STATUSES,
+            status=status,
+            is_valid=is_valid,
+            actual_value=measured,
+            expected_value=expected_value,
+            range_min=range_min,
+            range_max=range_max,
+            deviation=deviation,
+            message_for=message_for
         )
 
 
@@ -106,6 +353,9 @@ class ProcessLossValidator:
         "sizing": {"expected": 0.015, "range": (0.005, 0.025)}        # 0.5-2.5%
     }
     
+    # Checks that can decide a row of validate_process_losses_batch()
+    BATCH_STATUSES = ('ok', 'zero_input', 'unknown_process', 'loss_rate_mismatch', 'within_tolerance_mismatch')
+    
     def validate_process_loss(self, processing_data: Dict[str, Any]) -> ToleranceValidationResult:
         """
         Validate processing loss against process-specific tolerances.
@@ -124,7 +374,7 @@ class ProcessLossValidator:
                 entity_type="MaterialProcessing",
                 tolerance_type="process_loss",
                 actual_value=0,
-                message="Invalid input volume: cannot be zero"
+                message=_ZERO_INPUT_MESSAGE
             )
         
         # Calculate actual loss rate
@@ -138,7 +388,7 @@ class ProcessLossValidator:
                 entity_type="MaterialProcessing", 
                 tolerance_type="process_loss",
                 actual_value=actual_loss_rate,
-                message=f"No tolerance specification found for process type: {process_type}"
+                message=_unknown_process_message(process_type)
             )
         
         expected_loss = tolerances["expected"]
@@ -162,7 +412,7 @@ class ProcessLossValidator:
                     entity_type="MaterialProcessing",
                     tolerance_type="process_loss", 
                     actual_value=actual_loss_rate,
-                    message=f"Tolerance validation actualLossRate incorrect: expected {actual_loss_rate:.4f}, got {provided_actual}"
+                    message=_loss_rate_mismatch_message(actual_loss_rate, provided_actual)
                 )
             
             if provided_within is not None and provided_within != within_tolerance:
@@ -171,7 +421,7 @@ class ProcessLossValidator:
                     entity_type="MaterialProcessing",
                     tolerance_type="process_loss",
                     actual_value=actual_loss_rate,
-                    message=f"Tolerance validation withinTolerance incorrect: expected {within_tolerance}, got {provided_within}"
+                    message=_within_mismatch_message(within_tolerance, provided_within)
                 )
         
         return ToleranceValidationResult(
@@ -182,7 +432,115 @@ class ProcessLossValidator:
             expected_value=expected_loss,
             acceptable_range=(min_acceptable, max_acceptable),
             deviation=deviation,
-            message=f"{process_type} loss of {actual_loss_rate*100:.2f}% {'within' if within_tolerance else 'exceeds'} acceptable range {min_acceptable*100:.1f}%-{max_acceptable*100:.1f}%"
+            message=_process_loss_message(process_type, actual_loss_rate, within_tolerance, min_acceptable, max_acceptable)
+        )
+    
+    def validate_process_losses_batch(self, process_types: Sequence[str], input_volumes: Sequence[float],
+                                      volume_losses: Sequence[float],
+                                      actual_loss_rates: Optional[Sequence[Optional[float]]] = None,
+                                      within_tolerance: Optional[Sequence[Optional[bool]]] = None,
+                                      use_numpy: Optional[bool] = None) -> ToleranceBatchResult:
+        """
+        Validate many processing records given as columns, equivalent to
+        calling validate_process_loss() on each record.
+        
+        Args:
+            process_types: processType of each record
+            input_volumes: inputVolume of each record
+            volume_losses: volumeLoss of each record
+            actual_loss_rates: toleranceValidation.actualLossRate of each record (None: not provided)
+            within_tolerance: toleranceValidation.withinTolerance of each record (None: not provided)
+            use_numpy: Vectorize with NumPy (default: when NumPy is installed)
+        
+        Returns:
+            Columnar results with the same values as the scalar validator
+        """
+        use_numpy = _resolve_use_numpy(use_numpy)
+        size = len(process_types)
+        inputs = _float_column(input_volumes, size, use_numpy, missing=0.0)
+        losses = _float_column(volume_losses, size, use_numpy, missing=0.0)
+        provided_rate = _float_column(actual_loss_rates, size, use_numpy)
+        provided_within = _float_column(within_tolerance, size, use_numpy)
+        expected_loss = _lookup_column(
+            process_types, {name: spec["expected"] for name, spec in self.PROCESS_TOLERANCES.items()}, math.nan, use_numpy)
+        min_loss = _lookup_column(
+            process_types, {name: spec["range"][0] for name, spec in self.PROCESS_TOLERANCES.items()}, math.nan, use_numpy)
+        max_loss = _lookup_column(
+            process_types, {name: spec["range"][1] for name, spec in self.PROCESS_TOLERANCES.items()}, math.nan, use_numpy)
+        
+        if use_numpy:
+            zero_input = inputs == 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rate = np.where(zero_input, 0.0, losses / np.where(zero_input, 1.0, inputs))
+            unknown_process = np.isnan(expected_loss)
+            within = (min_loss <= rate) & (rate <= max_loss)
+            rate_mismatch = ~np.isnan(provided_rate) & (np.abs(provided_rate - rate) > 0.001)
+            within_mismatch = ~np.isnan(provided_within) & ((provided_within != 0) != within)
+            
+            status = np.select([zero_input, unknown_process, rate_mismatch, within_mismatch],
+                               [1, 2, 3, 4], default=0).astype(np.int8)
+            checked = status == 0
+            is_valid = checked & within
+            expected_value = np.where(checked, expected_loss, np.nan)
+            range_min = np.where(checked, min_loss, np.nan)
+            range_max = np.where(checked, max_loss, np.nan)
+            deviation = np.where(checked, rate - expected_loss, np.nan)
+        else:
+            status, is_valid, rate, within = [], [], [], []
+            expected_value, range_min, range_max, deviation = [], [], [], []
+            for i in range(size):
+                row_rate = 0.0 if inputs[i] == 0 else losses[i] / inputs[i]
+                row_within = min_loss[i] <= row_rate <= max_loss[i]
+                if inputs[i] == 0:
+                    row_status = 1
+                elif math.isnan(expected_loss[i]):
+                    row_status = 2
+                elif not math.isnan(provided_rate[i]) and abs(provided_rate[i] - row_rate) > 0.001:
+                    row_status = 3
+                elif not math.isnan(provided_within[i]) and (provided_within[i] != 0) != row_within:
+                    row_status = 4
+                else:
+                    row_status = 0
+                
+                status.append(row_status)
+                rate.append(row_rate)
+                within.append(row_within)
+                is_valid.append(row_status == 0 and row_within)
+                if row_status == 0:
+                    expected_value.append(expected_loss[i])
+                    range_min.append(min_loss[i])
+                    range_max.append(max_loss[i])
+                    deviation.append(row_rate - expected_loss[i])
+                else:
+                    expected_value.append(math.nan)
+                    range_min.append(math.nan)
+                    range_max.append(math.nan)
+                    deviation.append(math.nan)
+        
+        def message_for(i: int) -> str:
+            row_status = status[i]
+            if row_status == 1:
+                return _ZERO_INPUT_MESSAGE
+            if row_status == 2:
+                return _unknown_process_message(process_types[i])
+            if row_status == 3:
+                return _loss_rate_mismatch_message(rate[i], _raw_value(actual_loss_rates, i))
+            if row_status == 4:
+                return _within_mismatch_message(bool(within[i]), _raw_value(within_tolerance, i))
+            return _process_loss_message(process_types[i], rate[i], bool(within[i]), min_loss[i], max_loss[i])
+        
+        return ToleranceBatchResult(
+            entity_type="MaterialProcessing",
+            tolerance_type="process_loss",
+            statuses=self.BATCH_STATUSES,
+            status=status,
+            is_valid=is_valid,
+            actual_value=rate,
+            expected_value=expected_value,
+            range_min=range_min,
+            range_max=range_max,
+            deviation=deviation,
+            message_for=message_for
         )
 
 
@@ -196,6 +554,9 @@ class RegulatoryComplianceValidator:
         "RFS2": {"volume_deviation": 0.0075, "mass_deviation": 0.0075}      # ±0.75%
     }
     
+    # Checks that can decide a row of validate_compliance_batch()
+    BATCH_STATUSES = ('ok', 'unknown_scheme', 'unknown_standard', 'zero_initial_volume')
+    
     def validate_regulatory_compliance(self, certification_data: Dict[str, Any], 
                                      measurement_chain: List[Dict[str, Any]]) -> ToleranceValidationResult:
         """
@@ -208,22 +569,15 @@ class RegulatoryComplianceValidator:
         compliance_tolerances = certification_data.get("complianceTolerances", {})
         
         # Extract or infer regulatory standard
-        reporting_standard = compliance_tolerances.get("reportingStandard")
+        reporting_standard = _resolve_reporting_standard(scheme_name, compliance_tolerances.get("reportingStandard"))
         if not reporting_standard:
-            if "CARB" in scheme_name or "LCFS" in scheme_name:
-                reporting_standard = "CARB_LCFS"
-            elif "RED" in scheme_name or "EU" in scheme_name:
-                reporting_standard = "EU_RED"
-            elif "RFS" in scheme_name:
-                reporting_standard = "RFS2"
-            else:
-                return ToleranceValidationResult(
-                    is_valid=False,
-                    entity_type="CertificationScheme",
-                    tolerance_type="regulatory_compliance", 
-                    actual_value=0,
-                    message=f"Cannot determine regulatory standard for scheme: {scheme_name}"
-                )
+            return ToleranceValidationResult(
+                is_valid=False,
+                entity_type="CertificationScheme",
+                tolerance_type="regulatory_compliance", 
+                actual_value=0,
+                message=_unknown_scheme_message(scheme_name)
+            )
         
         # Get regulatory tolerance specifications
         reg_tolerances = self.REGULATORY_TOLERANCES.get(reporting_standard)
@@ -233,7 +587,7 @@ class RegulatoryComplianceValidator:
                 entity_type="CertificationScheme",
                 tolerance_type="regulatory_compliance",
                 actual_value=0, 
-                message=f"No regulatory tolerances defined for standard: {reporting_standard}"
+                message=_unknown_standard_message(reporting_standard)
             )
         
         # Calculate end-to-end volume conservation across measurement chain
@@ -255,7 +609,7 @@ class RegulatoryComplianceValidator:
                 entity_type="CertificationScheme",
                 tolerance_type="regulatory_compliance", 
                 actual_value=0,
-                message="Invalid initial volume for compliance calculation"
+                message=_ZERO_INITIAL_VOLUME_MESSAGE
             )
         
         # Calculate total volume conservation deviation
@@ -272,7 +626,115 @@ class RegulatoryComplianceValidator:
             expected_value=0.0,
             acceptable_range=(0.0, max_allowed_deviation), 
             deviation=volume_deviation,
-            message=f"{reporting_standard} compliance: {volume_deviation*100:.2f}% volume deviation {'within' if within_compliance else 'exceeds'} ±{max_allowed_deviation*100:.1f}% limit"
+            message=_compliance_message(reporting_standard, volume_deviation, within_compliance, max_allowed_deviation)
+        )
+    
+    def validate_compliance_batch(self, initial_volumes: Sequence[float], final_volumes: Sequence[float],
+                                  scheme_names: Optional[Sequence[str]] = None,
+                                  reporting_standards: Optional[Sequence[Optional[str]]] = None,
+                                  use_numpy: Optional[bool] = None) -> ToleranceBatchResult:
+        """
+        Validate many measurement chains given as columns, equivalent to
+        calling validate_regulatory_compliance() on each chain.
+        
+        Args:
+            initial_volumes: inputVolume of the first record of each chain
+            final_volumes: outputVolume of the last record of each chain
+            scheme_names: schemeName of each chain's certification scheme
+            reporting_standards: complianceTolerances.reportingStandard of each chain
+                                 (None: inferred from the scheme name)
+            use_numpy: Vectorize with NumPy (default: when NumPy is installed)
+        
+        Returns:
+            Columnar results with the same values as the scalar validator
+        """
+        use_numpy = _resolve_use_numpy(use_numpy)
+        size = len(initial_volumes)
+        for column in (final_volumes, scheme_names, reporting_standards):
+            if column is not None and len(column) != size:
+                raise ValueError(f"Column has {len(column)} values, expected {size}")
+        
+        # Resolve each distinct (scheme, declared standard) pair once
+        resolved: Dict[Tuple[str, Optional[str]], Optional[str]] = {}
+        standards = []
+        for i in range(size):
+            key = (_raw_value(scheme_names, i, ""), _raw_value(reporting_standards, i))
+            if key not in resolved:
+                resolved[key] = _resolve_reporting_standard(*key)
+            standards.append(resolved[key])
+        
+        initial = _float_column(initial_volumes, size, use_numpy, missing=0.0)
+        final = _float_column(final_volumes, size, use_numpy, missing=0.0)
+        max_deviation = _lookup_column(
+            standards, {name: spec["volume_deviation"] for name, spec in self.REGULATORY_TOLERANCES.items()},
+            math.nan, use_numpy)
+        
+        if use_numpy:
+            unknown_scheme = np.fromiter((standard is None for standard in standards), dtype=bool, count=size)
+            unknown_standard = np.isnan(max_deviation)
+            zero_initial = initial == 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volume_deviation = np.abs(1 - (final / np.where(zero_initial, 1.0, initial)))
+            
+            status = np.select([unknown_scheme, unknown_standard, zero_initial], [1, 2, 3], default=0).astype(np.int8)
+            checked = status == 0
+            is_valid = checked & (volume_deviation <= max_deviation)
+            actual_value = np.where(checked, volume_deviation, 0.0)
+            expected_value = np.where(checked, 0.0, np.nan)
+            range_min = expected_value
+            range_max = np.where(checked, max_deviation, np.nan)
+            deviation = np.where(checked, volume_deviation, np.nan)
+        else:
+            status, is_valid, actual_value = [], [], []
+            expected_value, range_max, deviation = [], [], []
+            for i in range(size):
+                if standards[i] is None:
+                    row_status = 1
+                elif math.isnan(max_deviation[i]):
+                    row_status = 2
+                elif initial[i] == 0:
+                    row_status = 3
+                else:
+                    row_status = 0
+                status.append(row_status)
+                
+                if row_status == 0:
+                    volume_deviation = abs(1 - (final[i] / initial[i]))
+                    is_valid.append(volume_deviation <= max_deviation[i])
+                    actual_value.append(volume_deviation)
+                    expected_value.append(0.0)
+                    range_max.append(max_deviation[i])
+                    deviation.append(volume_deviation)
+                else:
+                    is_valid.append(False)
+                    actual_value.append(0.0)
+                    expected_value.append(math.nan)
+                    range_max.append(math.nan)
+                    deviation.append(math.nan)
+            range_min = expected_value
+        
+        def message_for(i: int) -> str:
+            row_status = status[i]
+            if row_status == 1:
+                return _unknown_scheme_message(_raw_value(scheme_names, i, ""))
+            if row_status == 2:
+                return _unknown_standard_message(standards[i])
+            if row_status == 3:
+                return _ZERO_INITIAL_VOLUME_MESSAGE
+            return _compliance_message(standards[i], actual_value[i], bool(is_valid[i]), max_deviation[i])
+        
+        return ToleranceBatchResult(
+            entity_type="CertificationScheme",
+            tolerance_type="regulatory_compliance",
+            statuses=self.BATCH_STATUSES,
+            status=status,
+            is_valid=is_valid,
+            actual_value=actual_value,
+            expected_value=expected_value,
+            range_min=range_min,
+            range_max=range_max,
+            deviation=deviation,
+            message_for=message_for
         )
 
 
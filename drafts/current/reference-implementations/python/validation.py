@@ -5,14 +5,46 @@ This module provides JSON Schema validation utilities for BOOST entities,
 cross-entity relationship validation, and business logic validation.
 """
 
-import json
-import os
-from typing import Dict, Any, List, Optional, Tuple
-from pathlib import Path
-import jsonschema
-from jsonschema import validate, ValidationError
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterator
+from jsonschema.exceptions import best_match
 from datetime import datetime
 
+try:
+    from .schema_loader import get_shared_loader
+except ImportError:
+    from schema_loader import get_shared_loader
+
+
+class _LazyEntityMapping(Mapping):
+    """
+    Read-only mapping of entity type -> loader value, fetched on first access.
+    
+    Keys are the loader's entity types, so iterating or counting the mapping
+    parses and compiles nothing; looking an entity up goes through the
+    loader, which generates and memoizes that entity alone. Entities whose
+    value cannot be built raise KeyError.
+    """
+    
+    def __init__(self, schema_loader: Any, getter: Callable[[str], Any]):
+        self._schema_loader = schema_loader
+        self._getter = getter
+    
+    def __getitem__(self, entity_type: str) -> Any:
+        value = self._getter(entity_type)
+        if value is None:
+            raise KeyError(entity_type)
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema_loader.get_all_entity_types())
+    
+    def __len__(self) -> int:
+        return len(self._schema_loader.get_all_entity_types())
+    
+    def __contains__(self, entity_type: object) -> bool:
+        return entity_type in self._schema_loader.get_all_entity_types()
+
 
 class BOOSTValidator:
     """Main validation class for BOOST entities."""
@@ -24,48 +56,30 @@ class BOOSTValidator:
         Args:
             schema_base_path: Path to BOOST schema directory. If None, uses relative path.
         """
-        if schema_base_path is None:
-            # Default to the schema directory in the repository
-            current_dir = Path(__file__).parent
-            self.schema_base_path = current_dir.parent.parent / "schema"
-        else:
-            self.schema_base_path = Path(schema_base_path)
-        
-        self.schemas: Dict[str, Dict] = {}
-        self.cross_entity_rules: Dict = {}
-        self.business_logic_rules: Dict = {}
-        
-        self._load_schemas()
+        self.schema_loader = get_shared_loader(schema_base_path)
+        self.schema_base_path = self.schema_loader.schema_base_path
+        self._schemas = _LazyEntityMapping(self.schema_loader, self.schema_loader.get_schema)
+        self._validators = _LazyEntityMapping(self.schema_loader, self.schema_loader.get_validator)
     
-    def _load_schemas(self):
-        """Load all JSON schemas from the schema directory."""
-        try:
-            # Load individual entity schemas
-            for entity_dir in self.schema_base_path.iterdir():
-                if entity_dir.is_dir() and (entity_dir / "validation_schema.json").exists():
-                    schema_file = entity_dir / "validation_schema.json"
-                    with open(schema_file, 'r') as f:
-                        schema_data = json.load(f)
-                        # Extract the actual schema from the wrapper structure
-                        if 'schema' in schema_data:
-                            self.schemas[entity_dir.name] = schema_data['schema']
-                        else:
-                            self.schemas[entity_dir.name] = schema_data
-            
-            # Load cross-entity validation rules
-            cross_entity_file = self.schema_base_path / "cross_entity_validation.json"
-            if cross_entity_file.exists():
-                with open(cross_entity_file, 'r') as f:
-                    self.cross_entity_rules = json.load(f)
-            
-            # Load business logic validation rules
-            business_logic_file = self.schema_base_path / "business_logic_validation.json"
-            if business_logic_file.exists():
-                with open(business_logic_file, 'r') as f:
-                    self.business_logic_rules = json.load(f)
-                    
-        except Exception as e:
-            print(f"Warning: Could not load all schemas: {e}")
+    @property
+    def schemas(self) -> Mapping:
+        """JSON schemas by entity type, parsed from the shared schema loader on first access."""
+        return self._schemas
+    
+    @property
+    def validators(self) -> Mapping:
+        """Compiled validators by entity type, built by the shared schema loader on first access."""
+        return self._validators
+    
+    @property
+    def cross_entity_rules(self) -> Dict:
+        """Cross-entity validation rules from the shared schema loader."""
+        return self.schema_loader.cross_entity_rules
+    
+    @property
+    def business_logic_rules(self) -> Dict:
+        """Business logic validation rules from the shared schema loader."""
+        return self.schema_loader.business_logic_rules
     
     def validate_entity(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -78,14 +92,17 @@ class BOOSTValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        if entity_type not in self.schemas:
+        if self.schema_loader.get_schema(entity_type) is None:
             return False, [f"Unknown entity type: {entity_type}"]
         
-        try:
-            validate(instance=entity_data, schema=self.schemas[entity_type])
+        validator = self.schema_loader.get_validator(entity_type)
+        if validator is None:
+            return False, [f"No valid schema validator for {entity_type}"]
+        
+        error = best_match(validator.iter_errors(entity_data))
+        if error is None:
             return True, []
-        except ValidationError as e:
-            return False, [str(e)]
+        return False, [str(error)]
     
     def validate_required_fields(self, entity_type: str, entity_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -98,10 +115,10 @@ class BOOSTValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        if entity_type not in self.schemas:
+        schema = self.schema_loader.get_schema(entity_type)
+        if schema is None:
             return False, [f"Unknown entity type: {entity_type}"]
         
-        schema = self.schemas[entity_type]
         required_fields = schema.get('required', [])
         errors = []
         
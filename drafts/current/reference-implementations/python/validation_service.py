@@ -0,0 +1,667 @@
+"""
+BOOST Python Reference Implementation - Validation Service
+
+This module runs DynamicBOOSTValidator as a long-running local HTTP service,
+so callers no longer start an interpreter and load every schema per entity.
+Schemas are loaded once, in the service and in each worker process.
+Concurrent single-entity requests are coalesced into micro-batches: the
+batcher waits at most max_batch_delay for a batch to fill, and sends it to a
+worker pool. At most max_inflight_batches batches are in the pool at once.
+Requests arriving while the bounded queue is full are rejected with
+503 Service Unavailable and a Retry-After header, instead of piling up.
+An entity whose validation raises is answered with 500 Internal Server
+Error without failing the rest of its batch, and a worker pool broken by a
+dying worker process is replaced.
+GET /stats reports throughput, latency percentiles, queue depth, batch sizes
+and the validation phase timings of the processed batches.
+
+Endpoints:
+    POST /validate  {"entity_type": ..., "entity": {...}} or a JSON-LD entity with @type
+    GET  /stats     Throughput, latency, queue and validation stats
+    GET  /health    Liveness check
+
+Only the standard library is used (asyncio streams speaking HTTP/1.1 with
+keep-alive), and load_test() drives a running service from a local client.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Sequence, Union
+
+try:
+    from .dynamic_validation import DynamicBOOSTValidator
+    from .instrumentation import ValidationStats
+    from .synthetic import GeneratorConfig, SupplyChainGenerator
+except ImportError:
+    from dynamic_validation import DynamicBOOSTValidator
+    from instrumentation import ValidationStats
+    from synthetic import GeneratorConfig, SupplyChainGenerator
+
+# (entity_type, entity) pairs of one micro-batch
+Batch = List[Tuple[str, Dict[str, Any]]]
+
+# (errors, warnings) per entity of a batch, or the error validating it raised,
+# and the batch's phase timings
+BatchResult = Tuple[List[Union[Tuple[List[str], List[str]], 'ValidationFailedError']], ValidationStats]
+
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'
+}
+
+# Window of recent completions used for the recent throughput figure
+_RECENT_SECONDS = 10.0
+
+
+@dataclass
+class ServiceConfig:
+    """Listening address, batching and backpressure settings of a validation service."""
+    host: str = '127.0.0.1'
+    port: int = 8765                              # 0 picks a free port
+    workers: Optional[int] = None                 # Worker processes (None = all CPU cores, 0 = one thread in the service)
+    batch_size: int = 64                          # Most entities per micro-batch
+    max_batch_delay: float = 0.002                # Seconds to wait for a batch to fill
+    queue_size: int = 1024                        # Queued entities before requests are rejected
+    max_inflight_batches: Optional[int] = None    # Batches in the pool at once (None = workers + 1)
+    max_body_bytes: int = 1 << 20                 # Largest accepted request body
+    latency_window: int = 10000                   # Recent requests kept for latency percentiles
+    schema_path: Optional[str] = None             # Path to the BOOST schema directory
+    
+    def __post_init__(self):
+        if self.workers is None:
+            self.workers = os.cpu_count() or 1
+        if self.max_inflight_batches is None:
+            self.max_inflight_batches = max(self.workers, 1) + 1
+        if self.workers < 0:
+            raise ValueError("workers must not be negative")
+        if min(self.batch_size, self.queue_size, self.max_inflight_batches, self.max_body_bytes) < 1:
+            raise ValueError("batch_size, queue_size, max_inflight_batches and max_body_bytes must be at least 1")
+        if self.max_batch_delay < 0:
+            raise ValueError("max_batch_delay must not be negative")
+
+
+class ServiceOverloadedError(RuntimeError):
+    """Raised when the validation queue is full."""
+
+
+class ValidationFailedError(RuntimeError):
+    """Raised when validating an entity fails with an error, rather than reporting it invalid."""
+
+
+class _HTTPError(Exception):
+    """Request that cannot be served, answered with an error status."""
+    
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def latency_percentiles(samples: Sequence[float]) -> Dict[str, Optional[float]]:
+    """
+    Summarize latencies in milliseconds.
+    
+    Args:
+        samples: Latencies in seconds
+    
+    Returns:
+        Dictionary with mean, p50, p90, p99 and max in milliseconds (None without samples)
+    """
+    if not samples:
+        return {'mean': None, 'p50': None, 'p90': None, 'p99': None, 'max': None}
+    ordered = sorted(samples)
+    
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000.0
+    
+    return {
+        'mean': sum(ordered) / len(ordered) * 1000.0,
+        'p50': percentile(0.50),
+        'p90': percentile(0.90),
+        'p99': percentile(0.99),
+        'max': ordered[-1] * 1000.0
+    }
+
+
+class ServiceStats:
+    """Request, batch, throughput and latency counters of a running service."""
+    
+    def __init__(self, latency_window: int = 10000):
+        self.started = time.monotonic()
+        self.accepted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.worker_restarts = 0
+        self.batches = 0
+        self.max_batch_size = 0
+        self.latencies: deque = deque(maxlen=latency_window)
+        self._completion_times: deque = deque(maxlen=latency_window)
+        self.validation = ValidationStats()
+    
+    def record_batch(self, size: int):
+        """Count one dispatched batch."""
+        self.batches += 1
+        self.max_batch_size = max(self.max_batch_size, size)
+    
+    def record_completion(self, latency: float, now: float):
+        """Count one answered request and its latency."""
+        self.completed += 1
+        self.latencies.append(latency)
+        self._completion_times.append(now)
+    
+    def snapshot(self, queue_depth: int = 0, queue_capacity: int = 0,
+                 inflight_batches: int = 0, max_inflight_batches: int = 0) -> Dict[str, Any]:
+        """
+        Get the current stats as plain data.
+        
+        Args:
+            queue_depth: Entities waiting in the queue
+            queue_capacity: Size of the queue
+            inflight_batches: Batches in the worker pool
+            max_inflight_batches: Most batches allowed in the pool
+        
+        Returns:
+            Dictionary with uptime, request counts, queue, worker pool restarts,
+            batch, throughput, latency (ms) and validation phase stats
+        """
+        now = time.monotonic()
+        uptime = now - self.started
+        recent_window = min(_RECENT_SECONDS, uptime)
+        recent = sum(1 for completed_at in self._completion_times if completed_at >= now - recent_window)
+        processed = self.completed + self.failed
+        return {
+            'uptime_seconds': uptime,
+            'requests': {'accepted': self.accepted, 'completed': self.completed,
+                         'failed': self.failed, 'rejected': self.rejected},
+            'queue': {'depth': queue_depth, 'capacity': queue_capacity,
+                      'inflight_batches': inflight_batches, 'max_inflight_batches': max_inflight_batches},
+            'worker_restarts': self.worker_restarts,
+            'batches': {'count': self.batches, 'max_size': self.max_batch_size,
+                        'mean_size': processed / self.batches if self.batches else 0.0},
+            'throughput': {'overall_per_second': self.completed / uptime if uptime > 0 else 0.0,
+                           'recent_per_second': recent / recent_window if recent_window > 0 else 0.0},
+            'latency_ms': latency_percentiles(self.latencies),
+            'validation': self.validation.as_dict()
+        }
+
+
+def _validate_batch(validator: DynamicBOOSTValidator, batch: Batch) -> BatchResult:
+    """Validate the entities of one micro-batch; an entity whose validation raises gets the error."""
+    stats = ValidationStats()
+    results = []
+    for entity_type, entity in batch:
+        try:
+            results.append(validator.validate_record(entity_type, entity, stats))
+        except Exception as e:
+            # Sent back in place of the entity's result, so keep it picklable
+            results.append(ValidationFailedError(f"Validating {entity_type} failed: {type(e).__name__}: {e}"))
+    return results, stats
+
+
+_worker_validator: Optional[DynamicBOOSTValidator] = None
+
+
+def _init_service_worker(schema_path: str):
+    """Build the worker's validator, with every schema loaded, when the pool process starts."""
+    global _worker_validator
+    _worker_validator = DynamicBOOSTValidator(schema_path=schema_path)
+    _worker_validator.schema_loader.preload()
+
+
+def _validate_batch_in_worker(batch: Batch) -> BatchResult:
+    """Validate one micro-batch in a worker process."""
+    return _validate_batch(_worker_validator, batch)
+
+
+class ValidationService:
+    """Local asyncio HTTP service validating entities in micro-batches."""
+    
+    def __init__(self, config: Optional[ServiceConfig] = None,
+                 validator: Optional[DynamicBOOSTValidator] = None, **options):
+        """
+        Initialize the service and load the schemas.
+        
+        Args:
+            config: Service settings (default: ServiceConfig(**options))
+            validator: Validator used in the service (default: one for config.schema_path)
+            **options: ServiceConfig fields, when config is not given
+        """
+        self.config = config or ServiceConfig(**options)
+        self.validator = validator or DynamicBOOSTValidator(schema_path=self.config.schema_path)
+        self.schema_loader = self.validator.schema_loader
+        self.schema_loader.preload()
+        self.entity_types = frozenset(self.schema_loader.get_all_entity_types())
+        self.stats = ServiceStats(self.config.latency_window)
+        if self.config.workers > 0:
+            self._run = _validate_batch_in_worker
+        else:
+            self._run = functools.partial(_validate_batch, self.validator)
+        self.port: Optional[int] = None
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[Executor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+    
+    async def start(self):
+        """Start the worker pool, the batcher and the HTTP listener."""
+        config = self.config
+        self.stats = ServiceStats(config.latency_window)
+        self._queue = asyncio.Queue(maxsize=config.queue_size)
+        self._inflight = asyncio.Semaphore(config.max_inflight_batches)
+        self._executor = self._create_executor()
+        self._batcher = asyncio.create_task(self._run_batcher())
+        self._server = await asyncio.start_server(self._handle_connection, config.host, config.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    def _create_executor(self) -> Executor:
+        """Create the worker pool, or the service thread when workers is 0."""
+        if self.config.workers > 0:
+            return ProcessPoolExecutor(max_workers=self.config.workers,
+                                       initializer=_init_service_worker,
+                                       initargs=(str(self.schema_loader.schema_base_path),))
+        return ThreadPoolExecutor(max_workers=1)
+    
+    def _replace_broken_executor(self, broken: Executor):
+        """Replace a worker pool broken by a dying worker, once however many batches it failed."""
+        if self._executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            self.stats.worker_restarts += 1
+    
+    async def stop(self):
+        """Stop accepting requests, finish the batches in the pool and fail the queued requests."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Closing the sockets ends the connection handlers at their next read
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            _, _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ServiceOverloadedError("Validation service stopped"))
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._server = self._batcher = self._executor = None
+    
+    async def __aenter__(self) -> 'ValidationService':
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+    
+    async def serve_forever(self):
+        """Start the service and serve until cancelled."""
+        async with self:
+            await self._server.serve_forever()
+    
+    async def validate(self, entity_type: str, entity: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue one entity for validation and wait for its micro-batch.
+        
+        Args:
+            entity_type: Type of entity
+            entity: Entity data
+        
+        Returns:
+            Dictionary with entity_type, valid, errors and warnings
+        
+        Raises:
+            ValueError: If the entity type is unknown or the entity is not an object
+            ServiceOverloadedError: If the queue is full
+            ValidationFailedError: If validating the entity raised, or its worker process died
+            RuntimeError: If the service is not started
+        """
+        if self._batcher is None:
+            raise RuntimeError("Validation service is not started")
+        if entity_type not in self.entity_types:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+        if not isinstance(entity, dict):
+            raise ValueError("Entity must be a JSON object")
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((entity_type, entity, future, time.monotonic()))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise ServiceOverloadedError("Validation queue full") from None
+        self.stats.accepted += 1
+        errors, warnings = await future
+        return {'entity_type': entity_type, 'valid': not errors, 'errors': errors, 'warnings': warnings}
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current service stats (see ServiceStats.snapshot)."""
+        return self.stats.snapshot(
+            queue_depth=self._queue.qsize() if self._queue is not None else 0,
+            queue_capacity=self.config.queue_size,
+            inflight_batches=len(self._batch_tasks),
+            max_inflight_batches=self.config.max_inflight_batches
+        )
+    
+    async def _run_batcher(self):
+        """Collect queued entities into micro-batches and dispatch them to the pool."""
+        queue = self._queue
+        batch_size = self.config.batch_size
+        while True:
+            # Wait for pool capacity first, so entities queue up into fuller batches meanwhile
+            await self._inflight.acquire()
+            try:
+                batch = [await queue.get()]
+                if queue.qsize() < batch_size - 1 and self.config.max_batch_delay > 0:
+                    await asyncio.sleep(self.config.max_batch_delay)
+                while len(batch) < batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+            except BaseException:
+                self._inflight.release()
+                raise
+            self.stats.record_batch(len(batch))
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future, float]]):
+        """Validate one micro-batch in the pool and resolve its requests."""
+        executor = self._executor
+        try:
+            loop = asyncio.get_running_loop()
+            results, stats = await loop.run_in_executor(
+                executor, self._run, [(entity_type, entity) for entity_type, entity, _, _ in batch])
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._replace_broken_executor(executor)
+                error = ValidationFailedError(f"Validation worker process died: {e}")
+            else:
+                error = ValidationFailedError(f"Validating the batch failed: {type(e).__name__}: {e}")
+            for _, _, future, _ in batch:
+                if not future.done():
+                    self.stats.failed += 1
+                    future.set_exception(error)
+        else:
+            self.stats.validation.merge(stats)
+            now = time.monotonic()
+            for (_, _, future, enqueued), result in zip(batch, results):
+                if isinstance(result, ValidationFailedError):
+                    self.stats.failed += 1
+                    if not future.done():
+                        future.set_exception(result)
+                    continue
+                if not future.done():
+                    future.set_result(result)
+                self.stats.record_completion(now - enqueued, now)
+        finally:
+            self._inflight.release()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve the requests of one keep-alive connection."""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader, self.config.max_body_bytes)
+                except _HTTPError as e:
+                    await _write_response(writer, e.status, {'error': str(e)}, False, e.headers)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                try:
+                    payload = await self._dispatch(method, path, body)
+                    status, extra_headers = 200, {}
+                except _HTTPError as e:
+                    status, payload, extra_headers = e.status, {'error': str(e)}, e.headers
+                except Exception as e:
+                    # A bug must not take the connection down with it
+                    print(f"Error: {method} {path} failed: {type(e).__name__}: {e}")
+                    status, payload, extra_headers = 500, {'error': 'Internal server error'}, {}
+                await _write_response(writer, status, payload, keep_alive, extra_headers)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        """Route one request; errors are raised as _HTTPError."""
+        routes = {'/validate': 'POST', '/stats': 'GET', '/health': 'GET'}
+        if path not in routes:
+            raise _HTTPError(404, f"Unknown path: {path}")
+        if method != routes[path]:
+            raise _HTTPError(405, f"{path} only accepts {routes[path]}", {'Allow': routes[path]})
+        
+        if path == '/health':
+            return {'status': 'ok', 'entity_types': len(self.entity_types)}
+        if path == '/stats':
+            return self.snapshot()
+        
+        try:
+            document = json.loads(body)
+        except ValueError as e:
+            raise _HTTPError(400, f"Invalid JSON: {e}")
+        entity_type, entity = self._resolve_entity(document)
+        try:
+            return await self.validate(entity_type, entity)
+        except ValueError as e:
+            raise _HTTPError(400, str(e))
+        except ServiceOverloadedError as e:
+            raise _HTTPError(503, str(e), {'Retry-After': '1'})
+        except ValidationFailedError as e:
+            raise _HTTPError(500, str(e))
+    
+    def _resolve_entity(self, document: Any) -> Tuple[Optional[str], Any]:
+        """Get the entity type and entity of a /validate request body."""
+        if not isinstance(document, dict):
+            raise _HTTPError(400, "Request body must be a JSON object")
+        if 'entity' in document:
+            entity_type, entity = document.get('entity_type'), document['entity']
+        else:
+            entity_type, entity = None, document
+        if entity_type is None and isinstance(entity, dict) and isinstance(entity.get('@type'), str):
+            entity_type = self.schema_loader.get_entity_type_for_jsonld(entity['@type'])
+            if entity_type is None:
+                raise _HTTPError(400, f"Unknown JSON-LD @type: {entity['@type']}")
+        if entity_type is None:
+            raise _HTTPError(400, "Request needs 'entity_type' and 'entity', or a JSON-LD entity with @type")
+        return entity_type, entity
+
+
+async def _read_request(reader: asyncio.StreamReader,
+                        max_body_bytes: int) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Read one HTTP/1.1 request; None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise _HTTPError(400, "Malformed request line")
+    headers = await _read_headers(reader)
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise _HTTPError(400, "Invalid Content-Length")
+    if length > max_body_bytes:
+        raise _HTTPError(413, f"Request body larger than {max_body_bytes} bytes")
+    body = await reader.readexactly(length) if length > 0 else b''
+    return method.upper(), target.split('?', 1)[0], headers, body
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    """Read header lines up to the blank line, with lowercase names."""
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any],
+                          keep_alive: bool, extra_headers: Optional[Dict[str, str]] = None):
+    """Write a JSON response."""
+    body = json.dumps(payload).encode('utf-8')
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+             "Content-Type: application/json",
+             f"Content-Length: {len(body)}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    lines.extend(f"{name}: {value}" for name, value in (extra_headers or {}).items())
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+
+
+async def send_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                       payload: Any = None) -> Tuple[int, Dict[str, Any]]:
+    """
+    Send one request over an open keep-alive connection and read the JSON response.
+    
+    Args:
+        reader: Stream reader of the connection (from asyncio.open_connection)
+        writer: Stream writer of the connection
+        method: HTTP method
+        path: Request path
+        payload: JSON body (optional)
+    
+    Returns:
+        Tuple of (status, response JSON)
+    """
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n" \
+           f"Content-Length: {len(body)}\r\n\r\n"
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by the service")
+    status = int(status_line.split()[1])
+    headers = await _read_headers(reader)
+    response = await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, json.loads(response) if response else {}
+
+
+async def load_test(entities: Sequence[Tuple[str, Dict[str, Any]]], host: str = '127.0.0.1', port: int = 8765,
+                    concurrency: int = 32) -> Dict[str, Any]:
+    """
+    Send every entity to a running service as its own request, over concurrent connections.
+    
+    Args:
+        entities: (entity_type, entity) pairs to validate
+        host: Service host
+        port: Service port
+        concurrency: Number of keep-alive connections sending requests in parallel
+    
+    Returns:
+        Dictionary with requests, seconds, throughput per second, latency (ms),
+        response counts per HTTP status and the number of invalid entities
+    """
+    statuses: Counter = Counter()
+    latencies: List[float] = []
+    invalid = 0
+    pending = iter(entities)
+    
+    async def connection():
+        nonlocal invalid
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for entity_type, entity in pending:
+                started = time.monotonic()
+                status, response = await send_request(reader, writer, 'POST', '/validate',
+                                                      {'entity_type': entity_type, 'entity': entity})
+                latencies.append(time.monotonic() - started)
+                statuses[status] += 1
+                if status == 200 and not response['valid']:
+                    invalid += 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    
+    started = time.monotonic()
+    await asyncio.gather(*(connection() for _ in range(max(1, concurrency))))
+    seconds = time.monotonic() - started
+    return {
+        'requests': len(latencies),
+        'seconds': seconds,
+        'throughput_per_second': len(latencies) / seconds if seconds > 0 else 0.0,
+        'latency_ms': latency_percentiles(latencies),
+        'statuses': dict(sorted(statuses.items())),
+        'invalid': invalid
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = ServiceConfig(workers=0)
+    parser = argparse.ArgumentParser(description="Run or load-test the local BOOST validation service.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    serve = commands.add_parser('serve', help="run the validation service")
+    serve.add_argument('--host', default=defaults.host)
+    serve.add_argument('--port', type=int, default=defaults.port)
+    serve.add_argument('--workers', type=int, help="worker processes (default: all CPU cores, 0: in-process thread)")
+    serve.add_argument('--batch-size', type=int, default=defaults.batch_size)
+    serve.add_argument('--max-batch-delay-ms', type=float, default=defaults.max_batch_delay * 1000)
+    serve.add_argument('--queue-size', type=int, default=defaults.queue_size)
+    serve.add_argument('--max-inflight-batches', type=int)
+    serve.add_argument('--schema-path', help="path to the BOOST schema directory")
+    
+    load = commands.add_parser('load', help="send synthetic entities to a running service")
+    load.add_argument('--host', default=defaults.host)
+    load.add_argument('--port', type=int, default=defaults.port)
+    load.add_argument('--requests', type=int, default=10000)
+    load.add_argument('--concurrency', type=int, default=32)
+    load.add_argument('--seed', type=int, default=0)
+    load.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args(argv)
+    
+    if args.command == 'serve':
+        service = ValidationService(ServiceConfig(
+            host=args.host, port=args.port, workers=args.workers, batch_size=args.batch_size,
+            max_batch_delay=args.max_batch_delay_ms / 1000, queue_size=args.queue_size,
+            max_inflight_batches=args.max_inflight_batches, schema_path=args.schema_path
+        ))
+        print(f"Serving BOOST validation on http://{args.host}:{args.port} ({service.config.workers} workers)")
+        try:
+            asyncio.run(service.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+    
+    generator = SupplyChainGenerator(GeneratorConfig(entities=args.requests, seed=args.seed,
+                                                     error_rate=args.error_rate))
+    report = asyncio.run(load_test(list(generator), args.host, args.port, args.concurrency))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())